@@ -1,14 +1,30 @@
-"""Configuration management for the Genonaut API."""
+"""Configuration management for the Genonaut API.
 
+Settings are loaded once per process into an immutable snapshot that
+``get_settings()`` returns. ``reload_settings()`` builds a new snapshot and
+swaps it in atomically; it runs on SIGHUP, from the admin reload endpoint,
+and when ``config-watch-interval-seconds`` is set and a config or ``.env``
+file has changed.
+"""
+
+import logging
 import os
 import re
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from pydantic import BaseModel, Field, field_validator
 
+from genonaut.api.context import get_request_context
+from genonaut import config_loader
 from genonaut.config_loader import construct_database_url, load_config
 
+logger = logging.getLogger(__name__)
+
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 
@@ -66,6 +82,30 @@ class Settings(BaseModel):
     redis_ns: str = "genonaut_dev"
     redis_url: Optional[str] = None
 
+    # Rate limiting: 'redis' (shared across workers) or 'memory' (per process)
+    rate_limit_backend: str = "redis"
+    rate_limit_max_identifiers: int = 10000
+
+    # Max pending job status updates per streaming client before dropping the oldest
+    job_status_queue_size: int = 100
+    # Per-job update history kept in Redis streams for SSE Last-Event-ID resumption
+    job_status_history_length: int = 50
+    job_status_history_ttl_seconds: int = 3600
+
+    # Content similarity ("more like this") index location and IVF buckets scanned per query
+    similarity_index_dir: Optional[str] = None
+    similarity_index_n_probe: int = 8
+
+    # How long a fitted recommendation model is reused for single-user requests
+    recommendation_model_ttl_seconds: int = 3600
+
+    # Buffered view/like ingestion: 'redis' (stream shared by all workers) or 'memory' (per process)
+    interaction_ingest_backend: str = "redis"
+    interaction_ingest_batch_size: int = 1000
+    interaction_ingest_flush_interval_seconds: float = 2.0
+    interaction_ingest_dedupe_window_seconds: int = 30
+    interaction_ingest_max_pending: int = 1000000
+
     # ComfyUI integration settings
     comfyui_url: str = "http://localhost:8000"
     comfyui_timeout: int = 30
@@ -82,6 +122,16 @@ class Settings(BaseModel):
     comfyui_mock_output_dir: str = "test/_infra/mock_services/comfyui/output"
     comfyui_mock_models_dir: str = "test/_infra/mock_services/comfyui/models"
     comfyui_mock_port: int = 8189
+    # Keep-alive connection pool size per backend, and circuit breaker thresholds
+    comfyui_max_connections: int = 20
+    comfyui_circuit_failure_threshold: int = 5
+    comfyui_circuit_reset_seconds: float = 30.0
+
+    # Model file hashing: persistent digest cache, hashing threads, and the
+    # full-file algorithm used by model discovery ('blake2b', 'sha256' or 'md5')
+    file_hash_cache_path: Optional[str] = None
+    file_hash_workers: int = 4
+    model_hash_algorithm: str = "blake2b"
 
     # Celery settings
     celery_result_backend: Optional[str] = None
@@ -95,6 +145,18 @@ class Settings(BaseModel):
     db_max_overflow: int = 20
     db_pool_recycle: int = 1800  # 30 minutes in seconds
     db_pool_pre_ping: bool = True
+    db_async_reads: bool = Field(
+        default=False,
+        description="Serve hot read routes through an asyncpg session (falls back to the sync session if asyncpg is missing)"
+    )
+    # Read replicas (see genonaut/api/db_routing.py)
+    db_read_replicas: List[Any] = Field(
+        default_factory=list,
+        description="Read replica URLs or {host, port, name} objects (DATABASE_REPLICA_URLS overrides)"
+    )
+    db_replica_max_lag_seconds: float = 5.0
+    db_replica_lag_check_interval_seconds: float = 2.0
+    db_read_your_writes_seconds: float = 5.0
     lock_timeout: str = "5s"
     idle_in_transaction_session_timeout: str = "30s"
 
@@ -112,18 +174,49 @@ class Settings(BaseModel):
     # Performance configuration
     performance: Optional[Dict[str, Any]] = None
 
+    # Route analytics cache planning / response cache warmer
+    cache_planning: Optional[Dict[str, Any]] = None
+
+    # Request-scoped SQL profiler (see genonaut/api/utils/query_profiler.py)
+    sql_profiler: Optional[Dict[str, Any]] = None
+
+    # Materialized first pages of the default gallery views (see genonaut/api/services/hot_feed.py)
+    hot_feed: Optional[Dict[str, Any]] = None
+
+    # Storage index, file moves and cleanup (see genonaut/api/services/file_storage_service.py)
+    file_storage: Optional[Dict[str, Any]] = None
+
+    # Where generated images and thumbnails are kept and served from (see genonaut/api/services/object_storage.py)
+    object_storage: Optional[Dict[str, Any]] = None
+
     # Query strategy configuration
     content_query_strategy: str = Field(
         default="raw_sql",
         description="Query execution strategy for unified content queries: 'orm' or 'raw_sql'"
     )
+    content_json_in_db: bool = Field(
+        default=False,
+        description="With the raw_sql strategy, build unified content pages as JSON in PostgreSQL"
+    )
+    content_query_prepared_statements: bool = Field(
+        default=True,
+        description="Run raw_sql unified content queries as server-side prepared statements (psycopg2)"
+    )
 
     # Celery configuration
     celery: Optional[Dict[str, Any]] = None
 
+    # Settings reload
+    config_watch_interval_seconds: float = Field(
+        default=0,
+        ge=0,
+        description="Seconds between checks of config/.env file mtimes for automatic reload (0 disables)"
+    )
+
     class Config:
         case_sensitive = False
         extra = "ignore"
+        frozen = True
 
     @field_validator("database_url", mode="before")
     @classmethod
@@ -184,20 +277,24 @@ class Settings(BaseModel):
         return cleaned_value
 
 
-_LAST_SETTINGS: Optional[Settings] = None
+@dataclass
+class _SettingsSnapshot:
+    """A loaded ``Settings`` plus what is needed to tell whether it is stale."""
 
+    key: Tuple[Optional[str], Optional[str]]
+    settings: Settings
+    files: Tuple[Path, ...]
+    mtimes: Tuple[Optional[float], ...]
+    next_check: float
 
-def get_settings() -> Settings:
-    """Get settings instance.
 
-    Loads configuration from:
-    1. JSON config files (base.json + environment-specific)
-    2. Environment variables (including from .env files)
+_SNAPSHOT: Optional[_SettingsSnapshot] = None
+_SNAPSHOT_LOCK = threading.Lock()
+_CONFIG_LOADS = 0
 
-    Returns:
-        Settings instance with complete configuration
-    """
-    global _LAST_SETTINGS
+
+def _config_sources() -> Tuple[str, Optional[str], Optional[str]]:
+    """Resolve (config path, ENV_TARGET, env file) from the environment."""
     # Get config path from environment (set by CLI)
     config_path = os.getenv("APP_CONFIG_PATH")
     env_target = os.getenv("ENV_TARGET")
@@ -212,6 +309,34 @@ def get_settings() -> Settings:
     if env_target:
         env_file = f"env/.env.{env_target}"
 
+    return config_path, env_target, env_file
+
+
+def _snapshot_key() -> Tuple[Optional[str], Optional[str]]:
+    return os.getenv("APP_CONFIG_PATH"), os.getenv("ENV_TARGET")
+
+
+def _watched_files(config_path: str, env_file: Optional[str]) -> Tuple[Path, ...]:
+    root = config_loader.PROJECT_ROOT
+    paths = [root / "config" / "base.json", Path(config_path), root / "env" / ".env.shared"]
+    if env_file:
+        paths.append(Path(env_file))
+    paths.append(root / "env" / ".env")
+    return tuple(path if path.is_absolute() else root / path for path in paths)
+
+
+def _mtimes(paths: Tuple[Path, ...]) -> Tuple[Optional[float], ...]:
+    mtimes = []
+    for path in paths:
+        try:
+            mtimes.append(path.stat().st_mtime)
+        except OSError:
+            mtimes.append(None)
+    return tuple(mtimes)
+
+
+def _load_settings(config_path: str, env_target: Optional[str], env_file: Optional[str]) -> Settings:
+    """Load configuration from JSON config files and environment variables (including .env files)."""
     # Load configuration (this also loads .env files)
     config = load_config(config_path, env_file=env_file)
 
@@ -256,15 +381,92 @@ def get_settings() -> Settings:
                 "db-name": settings.db_name,
                 "db-user-admin": settings.db_user_admin,
             }
-            settings.database_url = construct_database_url(db_config)
+            settings = settings.model_copy(update={"database_url": construct_database_url(db_config)})
         except ValueError:
             pass  # Database URL will remain None if password not available
 
-    _LAST_SETTINGS = settings
     return settings
 
 
+def reload_settings() -> Settings:
+    """Load settings from the config sources and atomically replace the current snapshot.
+
+    Returns:
+        The newly loaded settings
+    """
+    global _SNAPSHOT, _CONFIG_LOADS
+    with _SNAPSHOT_LOCK:
+        config_path, env_target, env_file = _config_sources()
+        settings = _load_settings(config_path, env_target, env_file)
+        files = _watched_files(config_path, env_file)
+        # Keyed after loading: .env files may themselves set ENV_TARGET
+        _SNAPSHOT = _SettingsSnapshot(
+            key=_snapshot_key(),
+            settings=settings,
+            files=files,
+            mtimes=_mtimes(files),
+            next_check=time.monotonic() + settings.config_watch_interval_seconds,
+        )
+        _CONFIG_LOADS += 1
+
+    context = get_request_context()
+    if context is not None:
+        context.config_loads += 1
+    return settings
+
+
+def get_settings() -> Settings:
+    """Get settings instance.
+
+    Returns the process-wide snapshot, loading it on first use or when
+    ``APP_CONFIG_PATH``/``ENV_TARGET`` changed since it was loaded. With
+    ``config_watch_interval_seconds`` set, config and ``.env`` file mtimes are
+    checked at most that often and a change triggers a reload.
+
+    Returns:
+        Settings instance with complete configuration
+    """
+    snapshot = _SNAPSHOT
+    if snapshot is None or snapshot.key != _snapshot_key():
+        return reload_settings()
+
+    interval = snapshot.settings.config_watch_interval_seconds
+    if interval and time.monotonic() >= snapshot.next_check:
+        if _mtimes(snapshot.files) != snapshot.mtimes:
+            logger.info("Configuration files changed; reloading settings")
+            return reload_settings()
+        snapshot.next_check = time.monotonic() + interval
+
+    return snapshot.settings
+
+
 def get_cached_settings() -> Optional[Settings]:
-    """Return the most recently loaded settings instance if available."""
+    """Return the current settings snapshot if one has been loaded."""
+
+    snapshot = _SNAPSHOT
+    return snapshot.settings if snapshot is not None else None
 
-    return _LAST_SETTINGS
+
+def config_load_count() -> int:
+    """Number of times settings have been loaded from the config sources in this process."""
+
+    return _CONFIG_LOADS
+
+
+@contextmanager
+def override_settings(**updates: Any) -> Iterator[Settings]:
+    """Temporarily replace the settings snapshot with a copy that has ``updates`` applied.
+
+    Settings are immutable, so tests and tools use this instead of assigning
+    attributes. The previous snapshot is restored on exit.
+    """
+    global _SNAPSHOT
+    settings = get_settings().model_copy(update=updates)
+    current = _SNAPSHOT
+    _SNAPSHOT = _SettingsSnapshot(
+        key=current.key, settings=settings, files=current.files, mtimes=current.mtimes, next_check=float("inf")
+    )
+    try:
+        yield settings
+    finally:
+        _SNAPSHOT = current
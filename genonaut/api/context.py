@@ -15,6 +15,7 @@ class RequestContext:
     method: str
     endpoint: Optional[str]
     user_id: Optional[str]
+    config_loads: int = 0
 
 
 _request_context: ContextVar[Optional[RequestContext]] = ContextVar(
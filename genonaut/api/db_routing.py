@@ -0,0 +1,240 @@
+"""Read-replica routing for API database sessions.
+
+``DatabaseManager`` builds every API session as a :class:`RoutingSession`.
+Nothing changes until a replica is attached to the session: ``get_read_session``
+and ``get_read_only_session`` do that for read-only routes, and services can
+call ``DatabaseManager.use_read_replica``. With a replica attached, SELECTs go to
+the replica, while flushes, DML, ``SELECT ... FOR UPDATE`` and anything that is
+not recognizably a read go to the primary. From then on the session stays on
+the primary.
+
+A replica is only used when:
+
+- it answered the lag probe within ``db-replica-max-lag-seconds``. Probes
+  run at most every ``db-replica-lag-check-interval-seconds``; a replica
+  that fails the probe is skipped until the next one.
+- the requesting user has not written within ``db-read-your-writes-seconds``.
+  Commits that wrote rows record the writing users (from the request context
+  and the ``user_id`` / ``creator_id`` of flushed objects) in Redis, shared by
+  all API workers, or in process when Redis is unavailable.
+
+Any other case falls back to the primary.
+"""
+
+import itertools
+import logging
+import re
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.elements import TextClause
+from sqlalchemy.sql.selectable import Select
+from sqlalchemy.sql.dml import UpdateBase
+
+from genonaut.api.context import get_request_context
+
+logger = logging.getLogger(__name__)
+
+# Session.info keys
+REPLICA_KEY = "read_replica"
+WROTE_KEY = "wrote"  # pins the session to the primary
+PENDING_KEY = "pending_write"  # writes not yet committed
+WRITERS_KEY = "writers"
+
+# Seconds of replay lag; 0 on a primary or a standby that has replayed everything it received
+REPLICA_LAG_SQL = text("""
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+""")
+
+_READ_PREFIX = re.compile(r"^\s*(SELECT|WITH|SHOW|EXPLAIN|VALUES|TABLE)\b", re.IGNORECASE)
+_WRITE_IN_READ = re.compile(
+    r"\b(INSERT|UPDATE|DELETE|MERGE)\b|\bFOR\s+(NO\s+KEY\s+)?(UPDATE|SHARE)\b|\bnextval\s*\(",
+    re.IGNORECASE,
+)
+
+
+def is_read_statement(clause: Any) -> bool:
+    """Whether ``clause`` can safely run on a read-only replica."""
+    if isinstance(clause, Select):
+        return clause._for_update_arg is None
+    if isinstance(clause, TextClause):
+        sql = clause.text
+        return bool(_READ_PREFIX.match(sql)) and not _WRITE_IN_READ.search(sql)
+    return False
+
+
+class RoutingSession(Session):
+    """Session that sends reads to ``info["read_replica"]`` when set and everything else to the primary."""
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        replica = self.info.get(REPLICA_KEY)
+        if replica is not None and not self.info.get(WROTE_KEY):
+            if not self._flushing and is_read_statement(clause):
+                return replica
+        if isinstance(clause, (UpdateBase, TextClause)) and not is_read_statement(clause):
+            self.info[WROTE_KEY] = self.info[PENDING_KEY] = True
+        return super().get_bind(mapper=mapper, clause=clause, **kwargs)
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def _collect_writers(session: Session, flush_context: Any) -> None:
+    session.info[WROTE_KEY] = session.info[PENDING_KEY] = True
+    writers: Set[str] = session.info.setdefault(WRITERS_KEY, set())
+    for obj in itertools.chain(session.new, session.dirty, session.deleted):
+        for attribute in ("user_id", "creator_id"):
+            value = getattr(obj, attribute, None)
+            if value is not None:
+                writers.add(str(value))
+
+
+@event.listens_for(RoutingSession, "after_commit")
+def _record_writers(session: Session) -> None:
+    if not session.info.pop(PENDING_KEY, False):
+        return
+    writers: Set[str] = set(session.info.pop(WRITERS_KEY, ()))
+    context = get_request_context()
+    if context is not None and context.user_id:
+        writers.add(str(context.user_id))
+    on_commit = session.info.get("on_write_commit")
+    if writers and on_commit is not None:
+        on_commit(writers)
+
+
+@event.listens_for(RoutingSession, "after_rollback")
+def _discard_writers(session: Session) -> None:
+    session.info.pop(PENDING_KEY, None)
+    session.info.pop(WRITERS_KEY, None)
+
+
+class RecentWriters:
+    """Users who committed writes within the last ``window_seconds``.
+
+    Args:
+        window_seconds: Read-your-writes window
+        redis_client: Optional Redis client shared by all API workers
+        namespace: Redis key namespace
+    """
+
+    def __init__(self, window_seconds: float, redis_client: Any = None, namespace: str = "genonaut"):
+        self.window_seconds = window_seconds
+        self.redis_client = redis_client
+        self.prefix = f"{namespace}:db:recent_write"
+        self._local: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def record(self, user_ids: Iterable[str]) -> None:
+        if self.window_seconds <= 0:
+            return
+        user_ids = list(user_ids)
+        expires = time.monotonic() + self.window_seconds
+        with self._lock:
+            for user_id in user_ids:
+                self._local[user_id] = expires
+        if self.redis_client is not None:
+            try:
+                pipeline = self.redis_client.pipeline(transaction=False)
+                for user_id in user_ids:
+                    pipeline.set(f"{self.prefix}:{user_id}", 1, px=int(self.window_seconds * 1000))
+                pipeline.execute()
+            except Exception as e:
+                logger.warning(f"Failed to record recent writes in Redis: {e}")
+
+    def is_recent(self, user_id: Optional[str]) -> bool:
+        if not user_id or self.window_seconds <= 0:
+            return False
+        now = time.monotonic()
+        with self._lock:
+            expires = self._local.get(user_id)
+            if expires is not None and expires <= now:
+                del self._local[user_id]
+                expires = None
+        if expires is not None:
+            return True
+        if self.redis_client is not None:
+            try:
+                return bool(self.redis_client.exists(f"{self.prefix}:{user_id}"))
+            except Exception as e:
+                logger.warning(f"Failed to check recent writes in Redis, using primary: {e}")
+                return True
+        return False
+
+
+@dataclass
+class Replica:
+    """A read replica and its last measured lag."""
+
+    name: str
+    engine: Engine
+    lag_seconds: Optional[float] = None
+    checked_at: float = float("-inf")
+
+
+class ReplicaSet:
+    """Picks a sufficiently fresh replica, round robin.
+
+    Args:
+        replicas: Replicas of one primary
+        max_lag_seconds: Replicas lagging more than this are skipped
+        check_interval_seconds: Minimum time between lag probes of a replica
+        probe: Returns the lag of a replica in seconds (defaults to ``REPLICA_LAG_SQL``)
+    """
+
+    def __init__(
+        self,
+        replicas: List[Replica],
+        max_lag_seconds: float = 5.0,
+        check_interval_seconds: float = 2.0,
+        probe: Optional[Callable[[Replica], float]] = None,
+    ):
+        self.replicas = replicas
+        self.max_lag_seconds = max_lag_seconds
+        self.check_interval_seconds = check_interval_seconds
+        self.probe = probe or self._probe
+        self._next = itertools.count()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _probe(replica: Replica) -> float:
+        with replica.engine.connect() as conn:
+            return float(conn.execute(REPLICA_LAG_SQL).scalar() or 0)
+
+    def _refresh(self, replica: Replica) -> None:
+        now = time.monotonic()
+        with self._lock:
+            if now - replica.checked_at < self.check_interval_seconds:
+                return
+            replica.checked_at = now
+        try:
+            replica.lag_seconds = self.probe(replica)
+        except Exception as e:
+            replica.lag_seconds = None
+            logger.warning(f"Read replica {replica.name} lag check failed, using primary: {e}")
+            return
+        if replica.lag_seconds > self.max_lag_seconds:
+            logger.info(
+                f"Read replica {replica.name} is {replica.lag_seconds:.1f}s behind "
+                f"(max {self.max_lag_seconds}s), using primary"
+            )
+
+    def usable(self, replica: Replica) -> bool:
+        self._refresh(replica)
+        return replica.lag_seconds is not None and replica.lag_seconds <= self.max_lag_seconds
+
+    def choose(self) -> Optional[int]:
+        """Index of the replica to read from, or None for the primary."""
+        count = len(self.replicas)
+        start = next(self._next)
+        for offset in range(count):
+            index = (start + offset) % count
+            if self.usable(self.replicas[index]):
+                return index
+        return None
@@ -1,19 +1,26 @@
 """Dependency injection for the Genonaut API."""
 
+import importlib.util
 import logging
-from functools import lru_cache
-from typing import Dict, Generator
+import os
+from functools import lru_cache, partial
+from typing import AsyncGenerator, Awaitable, Callable, Dict, Generator, Iterable, List, Optional, Tuple, TypeVar
+from urllib.parse import quote_plus
 
 from fastapi import Depends, HTTPException, status
 from sqlalchemy import create_engine
-from sqlalchemy.engine import Engine
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.exc import OperationalError, SQLAlchemyError
+from starlette.concurrency import run_in_threadpool
 
 from genonaut.api.config import get_settings, Settings
 from genonaut.api.context import get_request_context
+from genonaut.api.db_routing import REPLICA_KEY, RecentWriters, Replica, ReplicaSet, RoutingSession
 from genonaut.api.exceptions import StatementTimeoutError
 from genonaut.db.utils import get_database_url, resolve_database_environment
+from genonaut.db.utils.utils import _database_name_for_environment
 
 
 SUPPORTED_ENVIRONMENTS = {"dev", "demo", "test"}
@@ -22,6 +29,45 @@ logger = logging.getLogger(__name__)
 
 STATEMENT_TIMEOUT_SQLSTATE = "57014"
 
+# Comma-separated replica URLs per environment; override db-read-replicas from config
+REPLICA_URLS_ENV = {
+    "dev": "DATABASE_REPLICA_URLS",
+    "demo": "DATABASE_REPLICA_URLS_DEMO",
+    "test": "DATABASE_REPLICA_URLS_TEST",
+}
+
+ASYNC_DRIVERNAME = "postgresql+asyncpg"
+
+T = TypeVar("T")
+
+
+@lru_cache()
+def async_driver_available() -> bool:
+    """Whether asyncpg is installed, so async engines can be created."""
+    return importlib.util.find_spec("asyncpg") is not None
+
+
+def to_async_database_url(database_url: str) -> str:
+    """Rewrite a PostgreSQL URL to use the asyncpg driver.
+
+    Args:
+        database_url: URL as returned by ``get_database_url`` (e.g. ``postgresql://...``)
+
+    Returns:
+        The same URL with the ``postgresql+asyncpg`` driver; ``sslmode`` is
+        renamed to asyncpg's ``ssl`` parameter
+
+    Raises:
+        ValueError: If the URL is not a PostgreSQL URL
+    """
+    url = make_url(database_url)
+    if url.get_backend_name() != "postgresql":
+        raise ValueError(f"Async sessions require PostgreSQL, got '{url.get_backend_name()}'")
+    query = dict(url.query)
+    if "sslmode" in query:
+        query["ssl"] = query.pop("sslmode")
+    return url.set(drivername=ASYNC_DRIVERNAME, query=query).render_as_string(hide_password=False)
+
 
 def _is_statement_timeout_error(error: SQLAlchemyError) -> bool:
     """Check whether the SQLAlchemy error represents a statement timeout."""
@@ -44,19 +90,53 @@ def _is_statement_timeout_error(error: SQLAlchemyError) -> bool:
     return "statement timeout" in message or "canceling statement" in message
 
 
+def get_replica_urls(environment: str, settings: Settings) -> List[str]:
+    """Read replica URLs for ``environment``.
+
+    ``DATABASE_REPLICA_URLS`` (``_DEMO`` / ``_TEST``) takes precedence. Otherwise
+    each ``db-read-replicas`` entry is either a URL or an object with ``host``,
+    ``port`` and ``name`` (default: the environment's database name); those
+    connect as ``db-user-ro`` with ``DB_PASSWORD_RO``.
+    """
+    raw_urls = os.getenv(REPLICA_URLS_ENV.get(environment, "DATABASE_REPLICA_URLS"), "")
+    if raw_urls.strip():
+        return [url.strip() for url in raw_urls.split(",") if url.strip()]
+
+    urls = []
+    for entry in settings.db_read_replicas or []:
+        if isinstance(entry, str):
+            urls.append(entry)
+            continue
+        if not settings.db_password_ro:
+            logger.warning("db-read-replicas configured but DB_PASSWORD_RO is not set; ignoring replicas")
+            return []
+        host = entry.get("host", settings.db_host)
+        port = entry.get("port", settings.db_port)
+        name = entry.get("name") or _database_name_for_environment(environment)
+        urls.append(
+            f"postgresql://{settings.db_user_ro}:{quote_plus(settings.db_password_ro)}@{host}:{port}/{name}"
+        )
+    return urls
+
+
 class DatabaseManager:
     """Database session manager for different environments."""
 
     def __init__(self):
         self._engines: Dict[str, Engine] = {}
         self._session_factories: Dict[str, sessionmaker] = {}
-
-    def _create_engine(self, environment: str):
-        """Create SQLAlchemy engine for the specified database."""
+        self._async_engines: Dict[Tuple[str, Optional[int]], AsyncEngine] = {}
+        self._async_session_factories: Dict[Tuple[str, Optional[int]], async_sessionmaker] = {}
+        self._replica_sets: Dict[str, Optional[ReplicaSet]] = {}
+        self._replica_urls: Dict[str, List[str]] = {}
+        self._recent_writers: Optional[RecentWriters] = None
+
+    def _create_engine(self, environment: str, database_url: Optional[str] = None, read_only: bool = False):
+        """Create SQLAlchemy engine for the specified database (or for ``database_url``, e.g. a replica)."""
         resolved_env = resolve_database_environment(environment=environment)
         try:
             settings = get_settings()
-            database_url = get_database_url(environment=resolved_env)
+            database_url = database_url or get_database_url(environment=resolved_env)
             connect_args = {}
             if database_url.startswith("postgresql"):
                 # Set session-level timeouts via PostgreSQL options
@@ -65,6 +145,8 @@ class DatabaseManager:
                     f"-c lock_timeout={settings.lock_timeout} "
                     f"-c idle_in_transaction_session_timeout={settings.idle_in_transaction_session_timeout}"
                 )
+                if read_only:
+                    connect_args["options"] += " -c default_transaction_read_only=on"
             engine_kwargs = {
                 "echo": settings.db_echo,
                 "pool_pre_ping": settings.db_pool_pre_ping,
@@ -94,11 +176,142 @@ class DatabaseManager:
         if resolved_env not in self._session_factories:
             self._session_factories[resolved_env] = sessionmaker(
                 bind=self._get_engine(resolved_env),
+                class_=RoutingSession,
                 autocommit=False,
                 autoflush=False,
+                info={
+                    "environment": resolved_env,
+                    "on_write_commit": partial(self.record_writes, resolved_env),
+                },
             )
         return self._session_factories[resolved_env]
 
+    def get_replica_set(self, environment: str) -> Optional[ReplicaSet]:
+        """Replicas configured for ``environment``, or None when reads always go to the primary."""
+        resolved_env = resolve_database_environment(environment=environment)
+        if resolved_env not in self._replica_sets:
+            settings = get_settings()
+            urls = get_replica_urls(resolved_env, settings)
+            self._replica_urls[resolved_env] = urls
+            replica_set = None
+            if urls:
+                replicas = [
+                    Replica(
+                        name=make_url(url).render_as_string(hide_password=True),
+                        engine=self._create_engine(resolved_env, database_url=url, read_only=True),
+                    )
+                    for url in urls
+                ]
+                replica_set = ReplicaSet(
+                    replicas,
+                    max_lag_seconds=settings.db_replica_max_lag_seconds,
+                    check_interval_seconds=settings.db_replica_lag_check_interval_seconds,
+                )
+                logger.info(f"Routing read-only {resolved_env} sessions to {len(replicas)} replica(s)")
+            self._replica_sets[resolved_env] = replica_set
+        return self._replica_sets[resolved_env]
+
+    def _get_recent_writers(self) -> RecentWriters:
+        if self._recent_writers is None:
+            settings = get_settings()
+            redis_client = None
+            if settings.redis_url:
+                try:
+                    from genonaut.worker.pubsub import get_redis_client
+
+                    redis_client = get_redis_client()
+                except Exception as e:
+                    logger.warning(f"Read-your-writes tracking is per process, Redis unavailable: {e}")
+            self._recent_writers = RecentWriters(
+                settings.db_read_your_writes_seconds, redis_client=redis_client, namespace=settings.redis_ns
+            )
+        return self._recent_writers
+
+    def record_writes(self, environment: str, user_ids: Iterable[str]) -> None:
+        """Keep these users' reads on the primary for the read-your-writes window."""
+        if self.get_replica_set(environment) is not None:
+            self._get_recent_writers().record(user_ids)
+
+    def choose_replica(self, environment: str, user_id: Optional[str] = None) -> Optional[int]:
+        """Index of the replica a read-only session should use, or None for the primary.
+
+        The primary is used when no replica is configured or fresh enough, and
+        when ``user_id`` wrote within the read-your-writes window.
+        """
+        replica_set = self.get_replica_set(environment)
+        if replica_set is None or self._get_recent_writers().is_recent(user_id):
+            return None
+        return replica_set.choose()
+
+    def use_read_replica(self, session: Session, user_id: Optional[str] = None) -> Optional[int]:
+        """Send the reads of a managed session to a replica when allowed.
+
+        Args:
+            session: Session from ``get_session_factory``; other sessions are left alone
+            user_id: Requesting user (default: the request context's user)
+
+        Returns:
+            Replica index, or None if reads stay on the primary
+        """
+        environment = session.info.get("environment")
+        if environment is None:
+            return None
+        if user_id is None:
+            context = get_request_context()
+            user_id = context.user_id if context is not None else None
+        index = self.choose_replica(environment, user_id)
+        if index is not None:
+            session.info[REPLICA_KEY] = self.get_replica_set(environment).replicas[index].engine
+        return index
+
+    def _create_async_engine(self, environment: str, replica: Optional[int] = None) -> AsyncEngine:
+        """Create an asyncpg-backed engine with the same pool and timeout settings as the sync one."""
+        try:
+            settings = get_settings()
+            server_settings = {
+                "statement_timeout": settings.statement_timeout,
+                "lock_timeout": settings.lock_timeout,
+                "idle_in_transaction_session_timeout": settings.idle_in_transaction_session_timeout,
+            }
+            if replica is None:
+                database_url = get_database_url(environment=environment)
+            else:
+                self.get_replica_set(environment)
+                database_url = self._replica_urls[environment][replica]
+                server_settings["default_transaction_read_only"] = "on"
+            database_url = to_async_database_url(database_url)
+            return create_async_engine(
+                database_url,
+                echo=settings.db_echo,
+                pool_pre_ping=settings.db_pool_pre_ping,
+                pool_recycle=settings.db_pool_recycle,
+                pool_size=settings.db_pool_size,
+                max_overflow=settings.db_max_overflow,
+                connect_args={"server_settings": server_settings},
+            )
+        except Exception as exc:
+            raise SQLAlchemyError(f"Failed to create async database engine: {exc}")
+
+    def get_async_session_factory(self, environment: str, replica: Optional[int] = None) -> async_sessionmaker:
+        """Async session factory for the primary, or for replica ``replica`` of ``get_replica_set``."""
+        key = (resolve_database_environment(environment=environment), replica)
+        if key not in self._async_session_factories:
+            if key not in self._async_engines:
+                self._async_engines[key] = self._create_async_engine(*key)
+            self._async_session_factories[key] = async_sessionmaker(
+                bind=self._async_engines[key],
+                autoflush=False,
+                expire_on_commit=False,
+            )
+        return self._async_session_factories[key]
+
+    async def dispose_async_engines(self) -> None:
+        """Close the async connection pools (they must be closed on the event loop that used them)."""
+        for engine in self._async_engines.values():
+            await engine.dispose()
+        self._async_engines.clear()
+        self._async_session_factories.clear()
+
 
 @lru_cache()
 def get_database_manager() -> DatabaseManager:
@@ -106,6 +319,59 @@ def get_database_manager() -> DatabaseManager:
     return DatabaseManager()
 
 
+def _raise_database_error(exc: SQLAlchemyError, environment: str) -> None:
+    """Translate a database error raised inside a request into the API exception."""
+    if _is_statement_timeout_error(exc):
+        settings = get_settings()
+        request_context = get_request_context()
+        context_data = {"environment": environment}
+
+        if request_context is not None:
+            context_data.update(
+                {
+                    "path": request_context.path,
+                    "method": request_context.method,
+                    "endpoint": request_context.endpoint,
+                    "user_id": request_context.user_id,
+                }
+            )
+
+        statement = getattr(exc, "statement", None)
+        if statement is not None and not isinstance(statement, str):
+            statement = str(statement)
+
+        context_data = {key: value for key, value in context_data.items() if value is not None}
+
+        log_context = dict(context_data)
+        if statement:
+            log_context["query"] = statement[:512]
+        log_context["timeout"] = settings.statement_timeout
+
+        logger.warning(
+            f"Database query exceeded timeout threshold of {settings.statement_timeout}",
+            extra={"timeout_context": log_context},
+            exc_info=exc,
+        )
+
+        message = (
+            "Database statement exceeded configured timeout "
+            f"({settings.statement_timeout})"
+        )
+
+        raise StatementTimeoutError(
+            message,
+            timeout=settings.statement_timeout,
+            query=statement,
+            context=context_data,
+            original_error=exc,
+        ) from exc
+
+    raise HTTPException(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        detail=f"Database error: {str(exc)}"
+    )
+
+
 def _yield_session(environment: str) -> Generator[Session, None, None]:
     db_manager = get_database_manager()
     session_factory = db_manager.get_session_factory(environment)
@@ -114,56 +380,7 @@ def _yield_session(environment: str) -> Generator[Session, None, None]:
         yield session
     except SQLAlchemyError as exc:
         session.rollback()
-
-        if _is_statement_timeout_error(exc):
-            settings = get_settings()
-            request_context = get_request_context()
-            context_data = {"environment": environment}
-
-            if request_context is not None:
-                context_data.update(
-                    {
-                        "path": request_context.path,
-                        "method": request_context.method,
-                        "endpoint": request_context.endpoint,
-                        "user_id": request_context.user_id,
-                    }
-                )
-
-            statement = getattr(exc, "statement", None)
-            if statement is not None and not isinstance(statement, str):
-                statement = str(statement)
-
-            context_data = {key: value for key, value in context_data.items() if value is not None}
-
-            log_context = dict(context_data)
-            if statement:
-                log_context["query"] = statement[:512]
-            log_context["timeout"] = settings.statement_timeout
-
-            logger.warning(
-                f"Database query exceeded timeout threshold of {settings.statement_timeout}",
-                extra={"timeout_context": log_context},
-                exc_info=exc,
-            )
-
-            message = (
-                "Database statement exceeded configured timeout "
-                f"({settings.statement_timeout})"
-            )
-
-            raise StatementTimeoutError(
-                message,
-                timeout=settings.statement_timeout,
-                query=statement,
-                context=context_data,
-                original_error=exc,
-            ) from exc
-
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Database error: {str(exc)}"
-        )
+        _raise_database_error(exc, environment)
     finally:
         session.close()
 
@@ -205,3 +422,113 @@ def get_database_session(settings: Settings = Depends(get_settings)) -> Generato
         yield from get_test_session()
     else:
         yield from get_dev_session()
+
+
+
+def get_read_only_session(session: Session = Depends(get_database_session)) -> Generator[Session, None, None]:
+    """Dependency for read-only routes: ``get_database_session`` with reads sent to a replica when possible."""
+    get_database_manager().use_read_replica(session)
+    yield session
+
+
+class ReadSession:
+    """Runs synchronous service code for read-heavy routes without blocking the event loop.
+
+    With an ``AsyncSession`` the callable goes through ``AsyncSession.run_sync``:
+    services and repositories stay unchanged, but each round trip is made by
+    asyncpg and yields to the event loop. Without one (asyncpg not installed or
+    ``db-async-reads`` off) the sync session is used from the threadpool.
+    Sessions that were not created by ``DatabaseManager`` (e.g. injected by
+    tests through ``dependency_overrides``) are used inline, as before.
+
+    Everything that touches ORM attributes, including building the response
+    models, must happen inside the callable so lazy loads stay in the session's
+    context.
+    With an ``AsyncSession`` the callable runs on the event loop thread and only
+    its database round trips yield, so other blocking work (Redis, files) belongs
+    outside it.
+    """
+
+    def __init__(
+        self,
+        session: Session,
+        async_session: Optional[AsyncSession] = None,
+        connect: Optional[Callable[[], Awaitable[Optional[AsyncSession]]]] = None,
+    ):
+        self.session = session
+        self.async_session = async_session
+        self._connect = connect
+        self._managed = "environment" in session.info
+
+    @property
+    def is_async(self) -> bool:
+        return self.async_session is not None
+
+    async def _ensure_connected(self) -> None:
+        # Replica choice and async session setup wait for the first query
+        if self._connect is not None:
+            connect, self._connect = self._connect, None
+            self.async_session = await connect()
+
+    async def run(self, fn: Callable[[Session], T]) -> T:
+        """Call ``fn`` with a sync ``Session`` and return its result."""
+        await self._ensure_connected()
+        if self.async_session is not None:
+            return await self.async_session.run_sync(fn)
+        if self._managed:
+            return await run_in_threadpool(fn, self.session)
+        return fn(self.session)
+
+    async def rollback(self) -> None:
+        if self.async_session is not None:
+            await self.async_session.rollback()
+        elif self._managed:
+            await run_in_threadpool(self.session.rollback)
+        else:
+            self.session.rollback()
+
+
+async def get_read_session(
+    session: Session = Depends(get_database_session),
+    settings: Settings = Depends(get_settings),
+) -> AsyncGenerator[ReadSession, None]:
+    """Dependency for read routes: an asyncpg session when available, else the sync session.
+
+    Reads go to a read replica when one is configured, fresh enough and the
+    requesting user has not written recently (see :mod:`genonaut.api.db_routing`).
+    The replica choice and the async session wait for the first ``run``, so a
+    route answered from the response cache never touches the database. The
+    sync session from ``get_database_session`` is still resolved so test
+    overrides keep applying; it does not check out a connection unless used.
+    """
+    environment = session.info.get("environment")
+    if environment is None:
+        yield ReadSession(session)
+        return
+
+    async def connect() -> Optional[AsyncSession]:
+        manager = get_database_manager()
+        replica = None
+        if manager.get_replica_set(environment) is not None:
+            # The lag probe is a blocking round trip, at most once per check interval
+            context = get_request_context()
+            user_id = context.user_id if context is not None else None
+            replica = await run_in_threadpool(manager.choose_replica, environment, user_id)
+
+        if not settings.db_async_reads or not async_driver_available():
+            if replica is not None:
+                session.info[REPLICA_KEY] = manager.get_replica_set(environment).replicas[replica].engine
+            return None
+        return manager.get_async_session_factory(environment, replica=replica)()
+
+    reader = ReadSession(session, connect=connect)
+    try:
+        yield reader
+    except SQLAlchemyError as exc:
+        if reader.async_session is None:
+            raise
+        await reader.async_session.rollback()
+        _raise_database_error(exc, environment)
+    finally:
+        if reader.async_session is not None:
+            await reader.async_session.close()
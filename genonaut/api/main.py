@@ -1,5 +1,6 @@
 """Genonaut FastAPI application main module."""
 
+import asyncio
 import faulthandler
 import logging
 import signal
@@ -11,16 +12,29 @@ from fastapi.responses import JSONResponse
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
-from genonaut.api.config import get_settings
-from genonaut.api.dependencies import get_database_session
-from genonaut.api.routes import content, content_auto, generation, interactions, recommendations, system, users, comfyui, images, tags, admin_flagged_content, websocket, notifications, checkpoint_models, lora_models, user_search_history, analytics, generation_analytics, bookmarks, bookmark_categories
+from genonaut.api.config import get_settings, reload_settings
+from genonaut.api.dependencies import async_driver_available, get_database_manager, get_database_session
+from genonaut.api.routes import content, content_auto, generation, interactions, recommendations, system, users, comfyui, images, tags, admin_flagged_content, websocket, sse, notifications, checkpoint_models, lora_models, user_search_history, analytics, generation_analytics, bookmarks, bookmark_categories
 from genonaut.api.context import build_request_context, reset_request_context, set_request_context
 from genonaut.api.exceptions import StatementTimeoutError
+from genonaut.api.middleware.query_profiler import QueryProfilerMiddleware
 from genonaut.api.middleware.route_analytics import RouteAnalyticsMiddleware
+from genonaut.api.services.comfyui_client import close_async_comfyui_clients
+from genonaut.api.services.interaction_ingest import close_interaction_ingestor
+from genonaut.api.services.job_status_hub import get_job_status_hub
+from genonaut.api.utils.json_response import FastJSONResponse
 
 logger = logging.getLogger(__name__)
 
 
+def _reload_settings_on_signal() -> None:
+    try:
+        settings = reload_settings()
+        logger.info(f"Settings reloaded on SIGHUP (env_target={settings.env_target})")
+    except Exception as e:
+        logger.error(f"Settings reload on SIGHUP failed; keeping previous settings: {e}")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan events."""
@@ -34,9 +48,28 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             logger.warning(f"Failed to register faulthandler: {e}")
 
+    # SIGHUP reloads configuration without restarting the worker
+    sighup_registered = False
+    if hasattr(signal, "SIGHUP"):
+        try:
+            asyncio.get_running_loop().add_signal_handler(signal.SIGHUP, _reload_settings_on_signal)
+            sighup_registered = True
+        except (NotImplementedError, RuntimeError, ValueError) as e:
+            logger.warning(f"Failed to register SIGHUP settings reload: {e}")
+
+    if settings.db_async_reads and not async_driver_available():
+        logger.warning("db-async-reads is enabled but asyncpg is not installed; read routes use the sync session")
+
     yield
 
     # Shutdown
+    if sighup_registered:
+        asyncio.get_running_loop().remove_signal_handler(signal.SIGHUP)
+    await get_database_manager().dispose_async_engines()
+    await get_job_status_hub().stop()
+    await close_async_comfyui_clients()
+    close_interaction_ingestor()
+
     if settings.enable_faulthandler:
         try:
             faulthandler.unregister(signal.SIGUSR1)
@@ -54,6 +87,7 @@ def create_app() -> FastAPI:
         version="1.0.0",
         debug=settings.api_debug,
         lifespan=lifespan,
+        default_response_class=FastJSONResponse,
     )
 
     # Add CORS middleware
@@ -78,6 +112,9 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
+    # SQL profiler runs inside route analytics so the request's DB totals are recorded
+    app.add_middleware(QueryProfilerMiddleware)
+
     # Add route analytics middleware
     app.add_middleware(RouteAnalyticsMiddleware)
 
@@ -85,9 +122,12 @@ def create_app() -> FastAPI:
     async def apply_request_context(request: Request, call_next):
         """Attach request metadata so downstream layers can reference it."""
 
-        token = set_request_context(build_request_context(request))
+        context = build_request_context(request)
+        token = set_request_context(context)
         try:
             response = await call_next(request)
+            # Settings loads from config files during this request (normally 0)
+            response.headers["X-Config-Loads"] = str(context.config_loads)
             return response
         finally:
             reset_request_context(token)
@@ -139,6 +179,7 @@ def create_app() -> FastAPI:
     app.include_router(generation_analytics.router)
     app.include_router(system.router)
     app.include_router(websocket.router)
+    app.include_router(sse.router)
     
     # Legacy health check endpoint (for backwards compatibility)
     @app.get("/health")
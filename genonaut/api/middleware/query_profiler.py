@@ -0,0 +1,83 @@
+"""Middleware that profiles the SQL executed by each API request.
+
+Enabled with ``sql-profiler.enabled``. Each ``/api/`` request gets a
+:class:`~genonaut.api.utils.query_profiler.QueryProfile`. The response carries
+it as a ``Server-Timing: db;dur=<ms>;desc="<n> queries"`` header (visible in
+the browser devtools timing tab), the route analytics middleware records the
+query count and DB time from ``request.state.query_profile``, and the most
+recent profiles are served by ``GET /api/v1/admin/sql-profile``.
+
+This is a plain ASGI middleware, so with profiling disabled a request costs
+one settings lookup.
+"""
+
+import logging
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from genonaut.api.config import get_settings
+from genonaut.api.utils.query_profiler import QueryProfile, profile_queries, remember_profile
+
+logger = logging.getLogger(__name__)
+
+
+def profiler_settings() -> dict:
+    """``sql-profiler`` config with defaults applied."""
+    config = get_settings().sql_profiler or {}
+    return {
+        "enabled": bool(config.get("enabled", False)),
+        "server_timing": bool(config.get("server_timing", True)),
+        "n_plus_one_threshold": int(config.get("n_plus_one_threshold", 5)),
+        "slow_query_ms": float(config.get("slow_query_ms", 200)),
+        "slowest_statements": int(config.get("slowest_statements", 5)),
+        "recent_requests": int(config.get("recent_requests", 200)),
+    }
+
+
+class QueryProfilerMiddleware:
+    """Profile the SQL of API requests when ``sql-profiler.enabled`` is set."""
+
+    def __init__(self, app: ASGIApp, path_prefix: str = "/api/"):
+        self.app = app
+        self.path_prefix = path_prefix
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not scope["path"].startswith(self.path_prefix):
+            await self.app(scope, receive, send)
+            return
+        config = profiler_settings()
+        if not config["enabled"]:
+            await self.app(scope, receive, send)
+            return
+
+        profile = None
+        try:
+            with profile_queries(scope["method"], scope["path"], config["slowest_statements"]) as profile:
+                scope.setdefault("state", {})["query_profile"] = profile
+
+                async def send_with_timing(message: Message) -> None:
+                    if message["type"] == "http.response.start":
+                        profile.status_code = message["status"]
+                        if config["server_timing"]:
+                            MutableHeaders(scope=message).append("Server-Timing", profile.server_timing())
+                    await send(message)
+
+                await self.app(scope, receive, send_with_timing)
+        finally:
+            if profile is not None:
+                self._report(profile, config)
+
+    @staticmethod
+    def _report(profile: QueryProfile, config: dict) -> None:
+        remember_profile(profile, config["recent_requests"])
+        for stats in profile.repeated(config["n_plus_one_threshold"]):
+            logger.warning(
+                f"Possible N+1 on {profile.method} {profile.path}: {stats.count} executions "
+                f"({stats.total_ms:.1f}ms) of {stats.fingerprint[:300]}"
+            )
+        for elapsed_ms, _, statement in profile.slowest:
+            if elapsed_ms >= config["slow_query_ms"]:
+                logger.warning(
+                    f"Slow query on {profile.method} {profile.path}: {elapsed_ms:.1f}ms {statement[:300]}"
+                )
@@ -8,6 +8,7 @@ for later batch processing into PostgreSQL. Data includes:
 - Status codes and error types
 - Request/response sizes
 - Query parameters (both raw and normalized)
+- Database query count and time (when the SQL profiler is enabled)
 
 The analytics data is used for cache planning and performance monitoring.
 """
@@ -245,6 +246,9 @@ class RouteAnalyticsMiddleware(BaseHTTPMiddleware):
             # Determine error type
             error_type = get_error_type_from_status(status_code)
 
+            # Set by QueryProfilerMiddleware when sql-profiler is enabled
+            query_profile = getattr(request.state, 'query_profile', None)
+
             # Build analytics event data
             event_data = {
                 'route': base_route,
@@ -258,7 +262,9 @@ class RouteAnalyticsMiddleware(BaseHTTPMiddleware):
                 'request_size_bytes': str(request_size_bytes),
                 'response_size_bytes': str(response_size_bytes),
                 'error_type': error_type or '',
-                'cache_status': '',  # Future: track cache hit/miss
+                'cache_status': getattr(request.state, 'cache_status', ''),  # Set by cached_response
+                'db_query_count': str(query_profile.query_count) if query_profile else '',
+                'db_duration_ms': f"{query_profile.db_time_ms:.2f}" if query_profile else '',
             }
 
             # Write to Redis Stream
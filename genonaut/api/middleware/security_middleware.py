@@ -6,6 +6,7 @@ from typing import Optional
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 from fastapi.responses import JSONResponse
+from starlette.concurrency import run_in_threadpool
 from starlette.middleware.cors import CORSMiddleware
 
 from genonaut.api.services.security_service import get_security_service
@@ -147,8 +148,9 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         operation = self._get_operation_type(request.url.path, request.method)
 
         if operation:
-            # Perform rate limit check
-            is_allowed, message, retry_after = self.security_service.check_rate_limit(
+            # Perform rate limit check (the Redis backend blocks, so keep it off the event loop)
+            is_allowed, message, retry_after = await run_in_threadpool(
+                self.security_service.check_rate_limit,
                 user_id or client_ip,
                 operation,
                 client_ip
@@ -95,6 +95,26 @@ class InteractionCreateRequest(BaseModel):
     metadata: Optional[Dict[str, Any]] = Field(default_factory=dict, description="Interaction metadata")
 
 
+class InteractionEventRequest(BaseModel):
+    """Request model for a buffered view/like event."""
+    user_id: UUID = Field(..., description="User ID")
+    content_item_id: int = Field(..., gt=0, description="Content item ID")
+    interaction_type: InteractionType = Field(..., description="Type of interaction (view or like)")
+    duration: Optional[int] = Field(None, ge=0, description="Duration in seconds")
+    metadata: Optional[Dict[str, Any]] = Field(default_factory=dict, description="Interaction metadata")
+
+    @validator('interaction_type')
+    def validate_interaction_type(cls, v):
+        if v not in (InteractionType.VIEW, InteractionType.LIKE):
+            raise ValueError('Only view and like events can be buffered; record other interactions with POST /api/v1/interactions')
+        return v
+
+
+class InteractionEventBatchRequest(BaseModel):
+    """Request model for submitting buffered view/like events."""
+    events: List[InteractionEventRequest] = Field(..., min_items=1, max_items=1000, description="Events to buffer")
+
+
 class InteractionUpdateRequest(BaseModel):
     """Request model for updating an interaction."""
     rating: Optional[int] = Field(None, ge=1, le=5, description="New rating (1-5 scale)")
@@ -107,6 +107,23 @@ class ContentListResponse(BaseModel):
     model_config = {"from_attributes": True}
 
 
+class SimilarContentItem(BaseModel):
+    """A content item returned by a similarity ("more like this") lookup."""
+
+    id: int = Field(..., description="Content ID")
+    source_type: str = Field(..., description="Content source: 'items' or 'auto'")
+    score: float = Field(..., description="Cosine similarity to the requested item")
+    title: str = Field(..., description="Content title")
+    path_thumb: Optional[str] = Field(None, description="Path to thumbnail image on disk")
+
+
+class SimilarContentResponse(BaseModel):
+    """Response model for similar content lookups."""
+
+    content_id: int = Field(..., description="Content ID the results are similar to")
+    items: List[SimilarContentItem] = Field(..., description="Similar content, most similar first")
+
+
 class ContentAutoResponse(ContentResponse):
     """Response model for automatically generated content."""
 
@@ -154,6 +171,12 @@ class InteractionListResponse(BaseModel):
     model_config = {"from_attributes": True}
 
 
+class InteractionIngestResponse(BaseModel):
+    """Response model for buffered interaction events."""
+    accepted: int = Field(..., description="Events buffered for insertion")
+    duplicates: int = Field(..., description="Repeat views collapsed within the dedupe window")
+
+
 class InteractionStatsResponse(BaseModel):
     """Response model for interaction statistics by content."""
     content_item_id: int = Field(..., description="Content item ID")
@@ -319,6 +342,23 @@ class HealthResponse(BaseModel):
     error: Optional[str] = Field(None, description="Error message if unhealthy")
 
 
+class SettingsReloadResponse(BaseModel):
+    """Result of reloading the API settings snapshot."""
+    env_target: Optional[str] = Field(None, description="ENV_TARGET of the reloaded settings")
+    config_loads: int = Field(..., description="Times this process has loaded settings from config files")
+    reloaded_at: datetime = Field(..., description="Timestamp of the reload")
+
+
+class SqlProfileResponse(BaseModel):
+    """Recent request SQL profiles from the request-scoped SQL profiler."""
+    enabled: bool = Field(..., description="Whether sql-profiler is enabled in this worker")
+    n_plus_one_threshold: int = Field(..., description="Executions of one statement fingerprint per request flagged as N+1")
+    profiles: List[Dict[str, Any]] = Field(..., description="Recent request profiles, newest first")
+    n_plus_one_statements: List[Dict[str, Any]] = Field(
+        ..., description="Repeated statement fingerprints across the listed profiles, most requests first"
+    )
+
+
 class DatabaseInfoResponse(BaseModel):
     """Database information response."""
     available_databases: List[str] = Field(..., description="List of available databases")
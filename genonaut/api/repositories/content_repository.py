@@ -1,10 +1,10 @@
 """Content repository for database operations."""
 
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Type
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type
 from uuid import UUID
 
-from sqlalchemy import asc, desc, func
+from sqlalchemy import and_, asc, desc, func, or_
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
@@ -457,3 +457,68 @@ class ContentRepository(BaseRepository[ContentItem, Dict[str, Any], Dict[str, An
         except SQLAlchemyError as e:
             self.db.rollback()
             raise DatabaseError(f"Failed to refresh gen source stats: {str(e)}")
+
+    def iter_similarity_documents(
+        self,
+        after_ids: Optional[Dict[str, int]] = None,
+        chunk_size: int = 5000,
+    ) -> Iterator[List[Tuple[int, str, str, str, List[UUID]]]]:
+        """Stream public content as ``(id, source_type, title, prompt, tag_ids)`` chunks.
+
+        Uses keyset pagination over ``content_items_all`` and one tag lookup per
+        chunk, so memory stays bounded regardless of table size.
+
+        Args:
+            after_ids: Only return items with an id above this value per source
+                type (e.g. ``{"items": 100, "auto": 250}``)
+            chunk_size: Rows per chunk
+
+        Yields:
+            Lists of document tuples ordered by id
+
+        Raises:
+            DatabaseError: If database operation fails
+        """
+        from genonaut.db.schema import ContentItemAll, ContentTag
+
+        after_ids = after_ids or {}
+        source_filters = [
+            and_(ContentItemAll.source_type == source, ContentItemAll.id > after_ids.get(source, 0))
+            for source in ("items", "auto")
+        ]
+        last_id = 0
+        try:
+            while True:
+                rows = (
+                    self.db.query(
+                        ContentItemAll.id,
+                        ContentItemAll.source_type,
+                        ContentItemAll.title,
+                        ContentItemAll.prompt,
+                    )
+                    .filter(ContentItemAll.is_private.is_(False))
+                    .filter(or_(*source_filters))
+                    .filter(ContentItemAll.id > last_id)
+                    .order_by(ContentItemAll.id)
+                    .limit(chunk_size)
+                    .all()
+                )
+                if not rows:
+                    return
+
+                tags: Dict[Tuple[int, str], List[UUID]] = {}
+                tag_rows = (
+                    self.db.query(ContentTag.content_id, ContentTag.content_source, ContentTag.tag_id)
+                    .filter(ContentTag.content_id.in_([row.id for row in rows]))
+                    .all()
+                )
+                for content_id, content_source, tag_id in tag_rows:
+                    tags.setdefault((content_id, content_source), []).append(tag_id)
+
+                yield [
+                    (row.id, row.source_type, row.title, row.prompt, tags.get((row.id, row.source_type), []))
+                    for row in rows
+                ]
+                last_id = rows[-1].id
+        except SQLAlchemyError as e:
+            raise DatabaseError(f"Failed to read content for similarity index: {str(e)}")
@@ -1,10 +1,11 @@
 """Flagged content repository for database operations."""
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
 from uuid import UUID
 
-from sqlalchemy import asc, desc, func, and_, or_
+from sqlalchemy import asc, desc, func, and_, or_, exists, insert, select, text, update
+from sqlalchemy.engine import Engine, Row
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
@@ -12,7 +13,11 @@ from genonaut.api.exceptions import DatabaseError, EntityNotFoundError
 from genonaut.api.repositories.base import BaseRepository
 from genonaut.api.models.requests import PaginationRequest
 from genonaut.api.models.responses import PaginatedResponse, PaginationMeta
-from genonaut.db.schema import FlaggedContent, ContentItem, ContentItemAuto
+from genonaut.db.schema import FlaggedContent, ContentItem, ContentItemAll, ContentItemAuto
+
+
+# Maps flagged_content.content_source values to content_items_all partition keys
+SCAN_SOURCE_TYPES = {'regular': 'items', 'auto': 'auto'}
 
 
 class FlaggedContentRepository(BaseRepository[FlaggedContent, Dict[str, Any], Dict[str, Any]]):
@@ -74,6 +79,140 @@ class FlaggedContentRepository(BaseRepository[FlaggedContent, Dict[str, Any], Di
         except SQLAlchemyError as exc:
             raise DatabaseError(f"Failed to get flagged content by item: {exc}")
 
+    def _flag_fk_column(self, content_source: str):
+        """Return the flagged_content FK column that references the given source."""
+        if content_source == 'regular':
+            return FlaggedContent.content_item_id
+        return FlaggedContent.content_item_auto_id
+
+    def stream_scan_candidates(
+        self,
+        content_source: str,
+        after_id: int = 0,
+        include_flagged: bool = False,
+        batch_size: int = 1000
+    ) -> Iterator[Sequence[Row]]:
+        """Stream content rows to scan from content_items_all in ascending ID order.
+
+        Rows are read through a server-side cursor (``yield_per``) so memory stays
+        bounded by ``batch_size`` regardless of table size. Unless
+        ``include_flagged`` is set, items that already have a flagged_content
+        record are excluded in the database via an anti-join.
+
+        The cursor runs on its own connection when the session is bound to an
+        engine, so callers may commit between batches without invalidating it.
+
+        Args:
+            content_source: Source type ('regular' or 'auto')
+            after_id: Only return items with an ID greater than this (for resuming)
+            include_flagged: If True, do not skip items that are already flagged
+            batch_size: Number of rows fetched per round trip and yielded per batch
+
+        Yields:
+            Batches of rows with ``id``, ``title``, ``item_metadata`` and ``creator_id``
+        """
+        flag_fk = self._flag_fk_column(content_source)
+        stmt = (
+            select(
+                ContentItemAll.id,
+                ContentItemAll.title,
+                ContentItemAll.item_metadata,
+                ContentItemAll.creator_id,
+            )
+            .where(
+                ContentItemAll.source_type == SCAN_SOURCE_TYPES[content_source],
+                ContentItemAll.id > after_id,
+            )
+            .order_by(ContentItemAll.id)
+        )
+        if not include_flagged:
+            stmt = stmt.where(~exists().where(flag_fk == ContentItemAll.id))
+
+        try:
+            bind = self.db.get_bind()
+            if isinstance(bind, Engine):
+                with bind.connect() as connection:
+                    if connection.dialect.name == "postgresql":
+                        # Analysis happens between fetches; don't let the idle
+                        # transaction timeout kill the cursor mid-scan.
+                        connection.execute(text("SET LOCAL idle_in_transaction_session_timeout = 0"))
+                    result = connection.execution_options(yield_per=batch_size).execute(stmt)
+                    yield from result.partitions()
+            else:
+                result = self.db.execute(stmt, execution_options={"yield_per": batch_size})
+                yield from result.partitions()
+        except SQLAlchemyError as exc:
+            raise DatabaseError(f"Failed to stream {content_source} content for scanning: {exc}")
+
+    def get_flag_ids_for_items(self, content_source: str, item_ids: List[int]) -> Dict[int, int]:
+        """Map content item IDs to their existing flagged_content IDs.
+
+        Args:
+            content_source: Source type ('regular' or 'auto')
+            item_ids: Content item IDs to look up
+
+        Returns:
+            Dictionary of content item ID -> flagged_content ID
+        """
+        if not item_ids:
+            return {}
+
+        flag_fk = self._flag_fk_column(content_source)
+        try:
+            rows = self.db.execute(
+                select(flag_fk, FlaggedContent.id).where(flag_fk.in_(item_ids))
+            ).all()
+            return {item_id: flag_id for item_id, flag_id in rows}
+        except SQLAlchemyError as exc:
+            raise DatabaseError(f"Failed to look up existing flags: {exc}")
+
+    def bulk_create(self, records: List[Dict[str, Any]]) -> int:
+        """Insert many flagged content records in a single multi-row INSERT.
+
+        Args:
+            records: Column dictionaries as accepted by :meth:`create`
+
+        Returns:
+            Number of records inserted
+        """
+        if not records:
+            return 0
+
+        flagged_at = datetime.utcnow()
+        rows = [
+            {**record, 'flagged_at': flagged_at, 'reviewed': False}
+            for record in records
+        ]
+        try:
+            self.db.execute(insert(FlaggedContent), rows)
+            self.db.commit()
+            return len(rows)
+        except SQLAlchemyError as exc:
+            self.db.rollback()
+            raise DatabaseError(f"Failed to bulk create flagged content: {exc}")
+
+    def bulk_refresh(self, records: List[Dict[str, Any]]) -> int:
+        """Update analysis fields of existing flagged content records by ID.
+
+        Review status and notes are left untouched.
+
+        Args:
+            records: Dictionaries containing ``id`` plus the analysis columns to update
+
+        Returns:
+            Number of records updated
+        """
+        if not records:
+            return 0
+
+        try:
+            self.db.execute(update(FlaggedContent), records)
+            self.db.commit()
+            return len(records)
+        except SQLAlchemyError as exc:
+            self.db.rollback()
+            raise DatabaseError(f"Failed to refresh flagged content: {exc}")
+
     def get_paginated(
         self,
         pagination: PaginationRequest,
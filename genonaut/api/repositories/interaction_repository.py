@@ -4,12 +4,92 @@ from typing import List, Optional, Dict, Any
 from uuid import UUID
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy import func, desc, asc
+from sqlalchemy import func, desc, asc, insert, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from datetime import datetime, timedelta
 
-from genonaut.db.schema import UserInteraction
+from genonaut.db.schema import (
+    ContentInteractionSummary,
+    ContentItem,
+    User,
+    UserInteraction,
+    UserInteractionSummary,
+)
 from genonaut.api.repositories.base import BaseRepository
-from genonaut.api.exceptions import DatabaseError
+from genonaut.api.exceptions import DatabaseError, EntityNotFoundError
+
+
+RECONCILE_USER_SUMMARY_SQL = text("""
+    INSERT INTO user_interaction_summary (
+        user_id, interaction_type, content_type, interaction_count,
+        rating_sum, rating_count, duration_sum, duration_count,
+        last_interaction_at, updated_at
+    )
+    SELECT ui.user_id, ui.interaction_type, COALESCE(ci.content_type, ''), COUNT(*),
+           COALESCE(SUM(ui.rating), 0), COUNT(ui.rating),
+           COALESCE(SUM(ui.duration), 0), COUNT(ui.duration),
+           MAX(ui.created_at), NOW()
+    FROM user_interactions ui
+    LEFT JOIN content_items ci ON ci.id = ui.content_item_id
+    GROUP BY ui.user_id, ui.interaction_type, COALESCE(ci.content_type, '')
+""")
+
+RECONCILE_CONTENT_SUMMARY_SQL = text("""
+    INSERT INTO content_interaction_summary (
+        content_item_id, interaction_type, interaction_count,
+        rating_sum, rating_count, duration_sum, duration_count,
+        last_interaction_at, updated_at
+    )
+    SELECT ui.content_item_id, ui.interaction_type, COUNT(*),
+           COALESCE(SUM(ui.rating), 0), COUNT(ui.rating),
+           COALESCE(SUM(ui.duration), 0), COUNT(ui.duration),
+           MAX(ui.created_at), NOW()
+    FROM user_interactions ui
+    WHERE ui.content_item_id IS NOT NULL
+    GROUP BY ui.content_item_id, ui.interaction_type
+""")
+
+
+SUMMARY_COUNTERS = ('interaction_count', 'rating_sum', 'rating_count', 'duration_sum', 'duration_count')
+# Interaction fields that decide which summary rows an interaction is counted in, and with what
+SUMMARY_FIELDS = ('user_id', 'content_item_id', 'interaction_type', 'rating', 'duration')
+
+
+def _average(total: int, count: int) -> Optional[float]:
+    return float(total) / count if count else None
+
+
+class _SummaryDeltas:
+    """Counter deltas for both summary tables, merged by primary key."""
+    
+    def __init__(self):
+        self.user: Dict[tuple, Dict[str, Any]] = {}
+        self.content: Dict[tuple, Dict[str, Any]] = {}
+    
+    def add(
+        self,
+        user_id: UUID,
+        content_item_id: Optional[int],
+        interaction_type: str,
+        content_type: Optional[str],
+        last_interaction_at: Optional[datetime],
+        **counters: int
+    ) -> None:
+        targets = [(self.user, {'user_id': user_id, 'interaction_type': interaction_type, 'content_type': content_type or ''})]
+        if content_item_id is not None:
+            targets.append((self.content, {'content_item_id': content_item_id, 'interaction_type': interaction_type}))
+        
+        for rows, key in targets:
+            row = rows.setdefault(
+                tuple(key.values()),
+                {**key, **{column: 0 for column in SUMMARY_COUNTERS}, 'last_interaction_at': None}
+            )
+            for column in SUMMARY_COUNTERS:
+                row[column] += counters.get(column, 0)
+            if last_interaction_at is not None and (
+                row['last_interaction_at'] is None or last_interaction_at > row['last_interaction_at']
+            ):
+                row['last_interaction_at'] = last_interaction_at
 
 
 class InteractionRepository(BaseRepository[UserInteraction, Dict[str, Any], Dict[str, Any]]):
@@ -178,6 +258,8 @@ class InteractionRepository(BaseRepository[UserInteraction, Dict[str, Any], Dict
     def get_interaction_stats_by_content(self, content_item_id: int) -> Dict[str, Any]:
         """Get interaction statistics for a content item.
         
+        Served from the ``content_interaction_summary`` rollup.
+        
         Args:
             content_item_id: Content item ID
             
@@ -188,30 +270,75 @@ class InteractionRepository(BaseRepository[UserInteraction, Dict[str, Any], Dict
             DatabaseError: If database operation fails
         """
         try:
-            result = (
-                self.db.query(
-                    UserInteraction.interaction_type,
-                    func.count(UserInteraction.id).label('count'),
-                    func.avg(UserInteraction.rating).label('avg_rating'),
-                    func.avg(UserInteraction.duration).label('avg_duration')
+            rows = (
+                self.db.query(ContentInteractionSummary)
+                .filter(
+                    ContentInteractionSummary.content_item_id == content_item_id,
+                    ContentInteractionSummary.interaction_count > 0,
                 )
-                .filter(UserInteraction.content_item_id == content_item_id)
-                .group_by(UserInteraction.interaction_type)
                 .all()
             )
             
             stats = {}
-            for row in result:
+            for row in rows:
                 stats[row.interaction_type] = {
-                    'count': row.count,
-                    'avg_rating': float(row.avg_rating) if row.avg_rating else None,
-                    'avg_duration': float(row.avg_duration) if row.avg_duration else None
+                    'count': row.interaction_count,
+                    'avg_rating': _average(row.rating_sum, row.rating_count),
+                    'avg_duration': _average(row.duration_sum, row.duration_count)
                 }
             
             return stats
         except SQLAlchemyError as e:
             raise DatabaseError(f"Failed to get interaction stats for content {content_item_id}: {str(e)}")
     
+    def get_user_interaction_rollup(self, user_id: UUID) -> Dict[str, Any]:
+        """Get a user's interaction totals from the ``user_interaction_summary`` rollup.
+        
+        Args:
+            user_id: User ID
+            
+        Returns:
+            Dictionary with ``total_interactions``, ``by_type`` (count and
+            avg_rating per interaction type) and ``by_content_type`` (count per
+            content type, most interacted first)
+            
+        Raises:
+            DatabaseError: If database operation fails
+        """
+        try:
+            rows = (
+                self.db.query(UserInteractionSummary)
+                .filter(
+                    UserInteractionSummary.user_id == user_id,
+                    UserInteractionSummary.interaction_count > 0,
+                )
+                .all()
+            )
+        except SQLAlchemyError as e:
+            raise DatabaseError(f"Failed to get interaction summary for user {user_id}: {str(e)}")
+        
+        by_type: Dict[str, Dict[str, int]] = {}
+        by_content_type: Dict[str, int] = {}
+        for row in rows:
+            totals = by_type.setdefault(row.interaction_type, {'count': 0, 'rating_sum': 0, 'rating_count': 0})
+            totals['count'] += row.interaction_count
+            totals['rating_sum'] += row.rating_sum
+            totals['rating_count'] += row.rating_count
+            if row.content_type:
+                by_content_type[row.content_type] = by_content_type.get(row.content_type, 0) + row.interaction_count
+        
+        return {
+            'total_interactions': sum(totals['count'] for totals in by_type.values()),
+            'by_type': {
+                interaction_type: {
+                    'count': totals['count'],
+                    'avg_rating': _average(totals['rating_sum'], totals['rating_count'])
+                }
+                for interaction_type, totals in by_type.items()
+            },
+            'by_content_type': dict(sorted(by_content_type.items(), key=lambda item: item[1], reverse=True)),
+        }
+    
     def get_user_interaction_summary(self, user_id: UUID) -> Dict[str, Any]:
         """Get interaction summary for a user.
         
@@ -221,39 +348,32 @@ class InteractionRepository(BaseRepository[UserInteraction, Dict[str, Any], Dict
         Returns:
             Dictionary with user interaction summary
             
+        Raises:
+            DatabaseError: If database operation fails
+        """
+        rollup = self.get_user_interaction_rollup(user_id)
+        summary: Dict[str, Any] = dict(rollup['by_type'])
+        summary['total_interactions'] = rollup['total_interactions']
+        return summary
+    
+    def get_interaction_type_totals(self) -> Dict[str, int]:
+        """Get the number of interactions per type across all users.
+        
         Raises:
             DatabaseError: If database operation fails
         """
         try:
-            result = (
+            rows = (
                 self.db.query(
-                    UserInteraction.interaction_type,
-                    func.count(UserInteraction.id).label('count'),
-                    func.avg(UserInteraction.rating).label('avg_rating')
+                    UserInteractionSummary.interaction_type,
+                    func.sum(UserInteractionSummary.interaction_count)
                 )
-                .filter(UserInteraction.user_id == user_id)
-                .group_by(UserInteraction.interaction_type)
+                .group_by(UserInteractionSummary.interaction_type)
                 .all()
             )
-            
-            summary = {}
-            for row in result:
-                summary[row.interaction_type] = {
-                    'count': row.count,
-                    'avg_rating': float(row.avg_rating) if row.avg_rating else None
-                }
-            
-            # Get total interactions
-            total_interactions = (
-                self.db.query(func.count(UserInteraction.id))
-                .filter(UserInteraction.user_id == user_id)
-                .scalar()
-            )
-            
-            summary['total_interactions'] = total_interactions
-            return summary
+            return {interaction_type: int(total or 0) for interaction_type, total in rows}
         except SQLAlchemyError as e:
-            raise DatabaseError(f"Failed to get interaction summary for user {user_id}: {str(e)}")
+            raise DatabaseError(f"Failed to get interaction totals: {str(e)}")
     
     def record_interaction(
         self,
@@ -262,10 +382,13 @@ class InteractionRepository(BaseRepository[UserInteraction, Dict[str, Any], Dict
         interaction_type: str,
         rating: Optional[int] = None,
         duration: Optional[int] = None,
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        content_type: Optional[str] = None
     ) -> UserInteraction:
         """Record a new user interaction.
         
+        The interaction insert and the summary upserts share one transaction.
+        
         Args:
             user_id: User ID
             content_item_id: Content item ID
@@ -273,6 +396,7 @@ class InteractionRepository(BaseRepository[UserInteraction, Dict[str, Any], Dict
             rating: Optional rating (1-5)
             duration: Optional duration in seconds
             metadata: Optional additional metadata
+            content_type: Content type of the item, if already known
             
         Returns:
             Created interaction
@@ -281,15 +405,250 @@ class InteractionRepository(BaseRepository[UserInteraction, Dict[str, Any], Dict
             DatabaseError: If database operation fails
         """
         try:
-            interaction_data = {
-                'user_id': user_id,
-                'content_item_id': content_item_id,
-                'interaction_type': interaction_type,
-                'rating': rating,
-                'duration': duration,
-                'interaction_metadata': metadata or {}
-            }
+            interaction = UserInteraction(
+                user_id=user_id,
+                content_item_id=content_item_id,
+                interaction_type=interaction_type,
+                rating=rating,
+                duration=duration,
+                interaction_metadata=metadata or {}
+            )
+            self.db.add(interaction)
+            self.db.flush()
             
-            return self.create(interaction_data)
+            self._apply_summary_delta(
+                interaction,
+                content_type=content_type,
+                interaction_count=1,
+                rating_sum=rating or 0,
+                rating_count=int(rating is not None),
+                duration_sum=duration or 0,
+                duration_count=int(duration is not None),
+                last_interaction_at=interaction.created_at
+            )
+            self.db.commit()
+            self.db.refresh(interaction)
+            return interaction
         except SQLAlchemyError as e:
+            self.db.rollback()
             raise DatabaseError(f"Failed to record interaction: {str(e)}")
+    
+    def update(self, id: int, obj_in: Dict[str, Any]) -> UserInteraction:
+        """Update an interaction, moving its contribution between summary rows as needed.
+        
+        The old values are subtracted from the summary rows they were counted
+        in and the new values added to theirs, so changes of the user, content
+        item or interaction type move the counts to the right rows.
+        
+        Raises:
+            EntityNotFoundError: If interaction not found
+            DatabaseError: If database operation fails
+        """
+        try:
+            interaction = self.get_or_404(id)
+            old = {field: getattr(interaction, field) for field in SUMMARY_FIELDS}
+            
+            for field, value in obj_in.items():
+                if hasattr(interaction, field):
+                    setattr(interaction, field, value)
+            
+            new = {field: getattr(interaction, field) for field in SUMMARY_FIELDS}
+            if new != old:
+                deltas = _SummaryDeltas()
+                for values, sign, last_interaction_at in ((old, -1, None), (new, 1, interaction.created_at)):
+                    deltas.add(
+                        values['user_id'], values['content_item_id'], values['interaction_type'],
+                        self._content_type_of(values['content_item_id']), last_interaction_at,
+                        interaction_count=sign,
+                        rating_sum=sign * (values['rating'] or 0),
+                        rating_count=sign * int(values['rating'] is not None),
+                        duration_sum=sign * (values['duration'] or 0),
+                        duration_count=sign * int(values['duration'] is not None)
+                    )
+                self._upsert_summaries(deltas)
+            self.db.commit()
+            self.db.refresh(interaction)
+            return interaction
+        except EntityNotFoundError:
+            raise
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            raise DatabaseError(f"Failed to update UserInteraction with id {id}: {str(e)}")
+    
+    def delete(self, id: int) -> bool:
+        """Delete an interaction and remove it from the summaries.
+        
+        Raises:
+            EntityNotFoundError: If interaction not found
+            DatabaseError: If database operation fails
+        """
+        try:
+            interaction = self.get_or_404(id)
+            self._apply_summary_delta(
+                interaction,
+                interaction_count=-1,
+                rating_sum=-(interaction.rating or 0),
+                rating_count=-int(interaction.rating is not None),
+                duration_sum=-(interaction.duration or 0),
+                duration_count=-int(interaction.duration is not None)
+            )
+            self.db.delete(interaction)
+            self.db.commit()
+            return True
+        except EntityNotFoundError:
+            raise
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            raise DatabaseError(f"Failed to delete UserInteraction with id {id}: {str(e)}")
+    
+    def reconcile_summaries(self) -> Dict[str, int]:
+        """Rebuild both interaction summaries from ``user_interactions``.
+        
+        Corrects any drift from writes that bypassed the repository (bulk
+        imports, content deletions that null out ``content_item_id``).
+        
+        On PostgreSQL both summary tables are locked against concurrent
+        writers (``SHARE ROW EXCLUSIVE``; readers are not blocked) before the
+        rebuild. The lock waits for in-flight delta upserts to commit, so their
+        interactions are visible to the rebuild, and holds back new ones until
+        the rebuilt rows are committed, so each interaction is counted once.
+        
+        Returns:
+            Dictionary with the number of rows written per summary table
+            
+        Raises:
+            DatabaseError: If database operation fails
+        """
+        try:
+            if self.db.get_bind().dialect.name == "postgresql":
+                self.db.execute(text(
+                    "LOCK TABLE user_interaction_summary, content_interaction_summary "
+                    "IN SHARE ROW EXCLUSIVE MODE"
+                ))
+            self.db.query(UserInteractionSummary).delete(synchronize_session=False)
+            self.db.query(ContentInteractionSummary).delete(synchronize_session=False)
+            user_rows = self.db.execute(RECONCILE_USER_SUMMARY_SQL).rowcount
+            content_rows = self.db.execute(RECONCILE_CONTENT_SUMMARY_SQL).rowcount
+            self.db.commit()
+            return {'user_summary_rows': user_rows, 'content_summary_rows': content_rows}
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            raise DatabaseError(f"Failed to reconcile interaction summaries: {str(e)}")
+    
+    def bulk_record_interactions(self, events: List[Dict[str, Any]]) -> Dict[str, int]:
+        """Insert many interactions with one multi-row insert and one summary upsert per table.
+        
+        Users and content are validated in bulk (``IN`` lookups); events for
+        unknown or inactive users, or for missing content, are dropped.
+        
+        Args:
+            events: Dicts with user_id, content_item_id, interaction_type and
+                optional rating, duration, metadata and created_at
+                
+        Returns:
+            Dictionary with the number of ``inserted`` and ``invalid`` events
+            
+        Raises:
+            DatabaseError: If database operation fails
+        """
+        if not events:
+            return {'inserted': 0, 'invalid': 0}
+        
+        try:
+            user_ids = {UUID(str(event['user_id'])) for event in events}
+            content_ids = {int(event['content_item_id']) for event in events}
+            active_users = {
+                row[0] for row in
+                self.db.query(User.id).filter(User.id.in_(user_ids), User.is_active.is_(True)).all()
+            }
+            content_types = dict(
+                self.db.query(ContentItem.id, ContentItem.content_type)
+                .filter(ContentItem.id.in_(content_ids))
+                .all()
+            )
+            
+            rows = []
+            deltas = _SummaryDeltas()
+            now = datetime.utcnow()
+            for event in events:
+                user_id = UUID(str(event['user_id']))
+                content_item_id = int(event['content_item_id'])
+                if user_id not in active_users or content_item_id not in content_types:
+                    continue
+                rating, duration = event.get('rating'), event.get('duration')
+                created_at = event.get('created_at') or now
+                rows.append({
+                    'user_id': user_id,
+                    'content_item_id': content_item_id,
+                    'interaction_type': event['interaction_type'],
+                    'rating': rating,
+                    'duration': duration,
+                    'interaction_metadata': event.get('metadata') or {},
+                    'created_at': created_at,
+                })
+                deltas.add(
+                    user_id, content_item_id, event['interaction_type'], content_types[content_item_id], created_at,
+                    interaction_count=1,
+                    rating_sum=rating or 0,
+                    rating_count=int(rating is not None),
+                    duration_sum=duration or 0,
+                    duration_count=int(duration is not None)
+                )
+            
+            if rows:
+                # executemany on an insert() construct is sent as batched multi-row INSERTs
+                self.db.execute(insert(UserInteraction), rows)
+                self._upsert_summaries(deltas)
+                self.db.commit()
+            return {'inserted': len(rows), 'invalid': len(events) - len(rows)}
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            raise DatabaseError(f"Failed to bulk record interactions: {str(e)}")
+    
+    def _apply_summary_delta(
+        self,
+        interaction: UserInteraction,
+        *,
+        content_type: Optional[str] = None,
+        last_interaction_at: Optional[datetime] = None,
+        **counters: int
+    ) -> None:
+        """Upsert one interaction's contribution into both summary tables (no commit)."""
+        if content_type is None:
+            content_type = self._content_type_of(interaction.content_item_id)
+        
+        deltas = _SummaryDeltas()
+        deltas.add(
+            interaction.user_id, interaction.content_item_id, interaction.interaction_type,
+            content_type, last_interaction_at, **counters
+        )
+        self._upsert_summaries(deltas)
+    
+    def _content_type_of(self, content_item_id: Optional[int]) -> Optional[str]:
+        if content_item_id is None:
+            return None
+        return (
+            self.db.query(ContentItem.content_type)
+            .filter(ContentItem.id == content_item_id)
+            .scalar()
+        )
+    
+    def _upsert_summaries(self, deltas: _SummaryDeltas) -> None:
+        """Add merged counter deltas to the summary tables, one multi-row upsert per table (no commit)."""
+        updated_at = datetime.utcnow()
+        for model, rows in ((UserInteractionSummary, deltas.user), (ContentInteractionSummary, deltas.content)):
+            if not rows:
+                continue
+            table = model.__table__
+            statement = pg_insert(model).values([{**row, 'updated_at': updated_at} for row in rows.values()])
+            statement = statement.on_conflict_do_update(
+                index_elements=[column.name for column in table.primary_key.columns],
+                set_={
+                    **{column: table.c[column] + statement.excluded[column] for column in SUMMARY_COUNTERS},
+                    'last_interaction_at': func.greatest(
+                        table.c.last_interaction_at, statement.excluded.last_interaction_at
+                    ),
+                    'updated_at': statement.excluded.updated_at,
+                },
+            )
+            self.db.execute(statement)
@@ -1,13 +1,14 @@
 """Recommendation repository for database operations."""
 
-from typing import List, Optional, Dict, Any
+from typing import Iterator, List, Optional, Dict, Any, Sequence, Tuple
 from uuid import UUID
 from sqlalchemy.orm import Session
+from sqlalchemy.engine import Row
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy import func, desc, asc
+from sqlalchemy import func, desc, asc, delete, insert, select
 from datetime import datetime, timedelta
 
-from genonaut.db.schema import Recommendation
+from genonaut.db.schema import ContentItem, ContentTag, Recommendation, User, UserInteraction
 from genonaut.api.repositories.base import BaseRepository
 from genonaut.api.exceptions import DatabaseError
 
@@ -112,13 +113,15 @@ class RecommendationRepository(BaseRepository[Recommendation, Dict[str, Any], Di
     def get_unserved_recommendations(
         self, 
         user_id: UUID, 
-        limit: int = 20
+        limit: int = 20,
+        algorithm_version: Optional[str] = None
     ) -> List[Recommendation]:
         """Get unserved recommendations for a user.
         
         Args:
             user_id: User ID
             limit: Maximum number of records to return
+            algorithm_version: Only return recommendations from this algorithm
             
         Returns:
             List of unserved recommendations
@@ -127,13 +130,15 @@ class RecommendationRepository(BaseRepository[Recommendation, Dict[str, Any], Di
             DatabaseError: If database operation fails
         """
         try:
+            query = self.db.query(Recommendation).filter(
+                Recommendation.user_id == user_id,
+                Recommendation.is_served.is_(False),
+                Recommendation.served_at.is_(None),
+            )
+            if algorithm_version is not None:
+                query = query.filter(Recommendation.algorithm_version == algorithm_version)
             return (
-                self.db.query(Recommendation)
-                .filter(
-                    Recommendation.user_id == user_id,
-                    Recommendation.is_served.is_(False),
-                    Recommendation.served_at.is_(None),
-                )
+                query
                 .order_by(desc(Recommendation.recommendation_score))
                 .limit(limit)
                 .all()
@@ -374,3 +379,148 @@ class RecommendationRepository(BaseRepository[Recommendation, Dict[str, Any], Di
         except SQLAlchemyError as e:
             self.db.rollback()
             raise DatabaseError(f"Failed to bulk create recommendations: {str(e)}")
+
+    def get_interaction_aggregates(self) -> List[Tuple[UUID, int, str, int, Optional[int]]]:
+        """Get interaction counts grouped by user, content item and type.
+
+        Returns:
+            List of ``(user_id, content_item_id, interaction_type, count, max_rating)`` rows
+
+        Raises:
+            DatabaseError: If database operation fails
+        """
+        try:
+            return [
+                tuple(row)
+                for row in self.db.query(
+                    UserInteraction.user_id,
+                    UserInteraction.content_item_id,
+                    UserInteraction.interaction_type,
+                    func.count(UserInteraction.id),
+                    func.max(UserInteraction.rating),
+                )
+                .filter(UserInteraction.content_item_id.isnot(None))
+                .group_by(
+                    UserInteraction.user_id,
+                    UserInteraction.content_item_id,
+                    UserInteraction.interaction_type,
+                )
+                .all()
+            ]
+        except SQLAlchemyError as e:
+            raise DatabaseError(f"Failed to get interaction aggregates: {str(e)}")
+
+    def get_candidate_content_ids(self) -> List[int]:
+        """Get IDs of public content items that can be recommended, newest first.
+
+        Raises:
+            DatabaseError: If database operation fails
+        """
+        try:
+            rows = (
+                self.db.query(ContentItem.id)
+                .filter(ContentItem.is_private.is_(False))
+                .order_by(desc(ContentItem.created_at), desc(ContentItem.id))
+                .all()
+            )
+            return [row[0] for row in rows]
+        except SQLAlchemyError as e:
+            raise DatabaseError(f"Failed to get candidate content: {str(e)}")
+
+    def stream_candidate_content_tags(self, batch_size: int = 50000) -> Iterator[Sequence[Row]]:
+        """Stream ``(content_id, tag_id)`` pairs of public regular content items.
+
+        Rows are read through a server-side cursor (``yield_per``), so callers
+        can pack them into compact arrays without holding every row at once.
+
+        Args:
+            batch_size: Number of rows fetched per round trip and yielded per batch
+
+        Raises:
+            DatabaseError: If database operation fails
+        """
+        stmt = (
+            select(ContentTag.content_id, ContentTag.tag_id)
+            .join(ContentItem, ContentItem.id == ContentTag.content_id)
+            .where(ContentTag.content_source == 'items', ContentItem.is_private.is_(False))
+        )
+        try:
+            result = self.db.execute(stmt, execution_options={"yield_per": batch_size})
+            yield from result.partitions()
+        except SQLAlchemyError as e:
+            raise DatabaseError(f"Failed to get content tags: {str(e)}")
+
+    def get_interacted_content_ids(self, user_id: UUID) -> List[int]:
+        """Get IDs of the content items a user has interacted with.
+
+        Raises:
+            DatabaseError: If database operation fails
+        """
+        try:
+            rows = (
+                self.db.query(UserInteraction.content_item_id)
+                .filter(UserInteraction.user_id == user_id, UserInteraction.content_item_id.isnot(None))
+                .distinct()
+                .all()
+            )
+            return [row[0] for row in rows]
+        except SQLAlchemyError as e:
+            raise DatabaseError(f"Failed to get interacted content: {str(e)}")
+
+    def get_active_user_profiles(
+        self,
+        user_ids: Optional[List[UUID]] = None
+    ) -> List[Tuple[UUID, Optional[List[str]]]]:
+        """Get ``(user_id, favorite_tag_ids)`` for active users.
+
+        Args:
+            user_ids: Restrict to these users (default: all active users)
+
+        Raises:
+            DatabaseError: If database operation fails
+        """
+        try:
+            query = self.db.query(User.id, User.favorite_tag_ids).filter(User.is_active.is_(True))
+            if user_ids is not None:
+                query = query.filter(User.id.in_(user_ids))
+            return [tuple(row) for row in query.order_by(User.id).all()]
+        except SQLAlchemyError as e:
+            raise DatabaseError(f"Failed to get active users: {str(e)}")
+
+    def replace_unserved_recommendations(
+        self,
+        user_ids: List[UUID],
+        algorithm_version: str,
+        rows: List[Dict[str, Any]]
+    ) -> int:
+        """Replace a batch of users' unserved recommendations for an algorithm.
+
+        Deletes the users' existing unserved rows for ``algorithm_version`` and
+        inserts ``rows`` with a single multi-row INSERT in the same transaction.
+
+        Args:
+            user_ids: Users whose recommendations are being regenerated
+            algorithm_version: Algorithm version being regenerated
+            rows: Recommendation column dictionaries to insert
+
+        Returns:
+            Number of rows inserted
+
+        Raises:
+            DatabaseError: If database operation fails
+        """
+        try:
+            self.db.execute(
+                delete(Recommendation)
+                .where(Recommendation.user_id.in_(user_ids))
+                .where(Recommendation.algorithm_version == algorithm_version)
+                .where(Recommendation.is_served.is_(False))
+                .execution_options(synchronize_session=False)
+            )
+            if rows:
+                self.db.execute(insert(Recommendation), rows)
+            self.db.commit()
+            return len(rows)
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            raise DatabaseError(f"Failed to replace recommendations: {str(e)}")
@@ -1,15 +1,19 @@
 """Admin routes for flagged content management."""
 
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from genonaut.api.dependencies import get_database_session
 from genonaut.api.services.flagged_content_service import FlaggedContentService
+from genonaut.api.services.response_cache import invalidate_content_pages
 from genonaut.api.models.requests import PaginationRequest
 from genonaut.api.models.responses import PaginatedResponse, SuccessResponse
 from genonaut.api.exceptions import EntityNotFoundError, ValidationError, DatabaseError
+from genonaut.worker.queue_app import celery_app
+from genonaut.worker.tasks import scan_flagged_content
 from pydantic import BaseModel, Field
 
 router = APIRouter(prefix="/api/v1/admin/flagged-content", tags=["admin", "flagged-content"])
@@ -34,6 +38,26 @@ class ScanContentResponse(BaseModel):
     items_scanned: int = Field(..., description="Number of items scanned")
     items_flagged: int = Field(..., description="Number of items flagged")
     processing_time_ms: float = Field(..., description="Processing time in milliseconds")
+    last_scanned_ids: Dict[str, int] = Field(
+        default_factory=dict,
+        description="Last scanned content ID per content type (for resuming)"
+    )
+
+
+class ScanTaskRequest(ScanContentRequest):
+    """Request model for queuing a background content scan."""
+    resume_from: Optional[Dict[str, int]] = Field(
+        default=None,
+        description="Last scanned content ID per content type to resume after"
+    )
+
+
+class ScanTaskResponse(BaseModel):
+    """Response model for a queued background content scan."""
+    task_id: Optional[str] = Field(..., description="Celery task ID")
+    state: str = Field(..., description="Celery task state")
+    progress: Optional[Dict[str, Any]] = Field(None, description="Latest scan progress")
+    result: Optional[Dict[str, Any]] = Field(None, description="Scan result once finished")
 
 
 class FlaggedContentResponse(BaseModel):
@@ -92,10 +116,15 @@ async def scan_for_flags(
     request: ScanContentRequest,
     db: Session = Depends(get_database_session)
 ):
-    """Manually trigger scan of existing content for problematic words."""
+    """Manually trigger scan of existing content for problematic words.
+
+    The scan walks every content row, so it runs in the threadpool; use
+    ``POST /scan/tasks`` to run it in the worker instead.
+    """
     try:
         service = FlaggedContentService(db)
-        result = service.scan_content_items(
+        result = await run_in_threadpool(
+            service.scan_content_items,
             content_types=request.content_types,
             force_rescan=request.force_rescan
         )
@@ -106,6 +135,31 @@ async def scan_for_flags(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
 
+@router.post("/scan/tasks", response_model=ScanTaskResponse, status_code=status.HTTP_202_ACCEPTED)
+async def queue_scan_for_flags(request: ScanTaskRequest):
+    """Queue a background scan of all existing content for problematic words."""
+    task_result = scan_flagged_content.delay(
+        content_types=request.content_types,
+        force_rescan=request.force_rescan,
+        resume_from=request.resume_from,
+    )
+    return ScanTaskResponse(task_id=getattr(task_result, "id", None), state="PENDING")
+
+
+@router.get("/scan/tasks/{task_id}", response_model=ScanTaskResponse)
+async def get_scan_task_status(task_id: str):
+    """Get state and progress of a background content scan."""
+    task_result = celery_app.AsyncResult(task_id)
+    state = task_result.state
+    info = task_result.info if isinstance(task_result.info, dict) else None
+    return ScanTaskResponse(
+        task_id=task_id,
+        state=state,
+        progress=info if state == "PROGRESS" else None,
+        result=info if state == "SUCCESS" else None,
+    )
+
+
 @router.get("/", response_model=PaginatedResponse[FlaggedContentResponse])
 async def get_flagged_content(
     page: int = Query(1, ge=1, description="Page number"),
@@ -197,6 +251,7 @@ async def delete_flagged_content(
     try:
         service = FlaggedContentService(db)
         service.delete_flagged_content(flagged_content_id)
+        await invalidate_content_pages()
         return SuccessResponse(
             success=True,
             message=f"Flagged content {flagged_content_id} deleted successfully"
@@ -216,6 +271,8 @@ async def bulk_delete_flagged_content(
     try:
         service = FlaggedContentService(db)
         result = service.bulk_delete_flagged_content(request.ids)
+        if result['deleted_count']:
+            await invalidate_content_pages()
         return BulkDeleteResponse(**result)
     except DatabaseError as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
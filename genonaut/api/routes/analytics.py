@@ -12,7 +12,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy import text, func
 from sqlalchemy.orm import Session
 
-from genonaut.api.dependencies import get_database_session
+from genonaut.api.dependencies import get_read_only_session
 from genonaut.cli.cache_analysis import get_top_routes_for_caching
 from genonaut.cli.cache_analysis_relative import get_top_routes_relative
 
@@ -37,7 +37,7 @@ async def get_cache_priorities(
         ge=0,
         description="Minimum p95 latency in ms (absolute system only)"
     ),
-    db: Session = Depends(get_database_session)
+    db: Session = Depends(get_read_only_session)
 ):
     """Get top N routes recommended for caching.
 
@@ -112,7 +112,7 @@ async def get_performance_trends(
         "hourly",
         description="Data granularity: 'hourly' or 'daily'"
     ),
-    db: Session = Depends(get_database_session)
+    db: Session = Depends(get_read_only_session)
 ):
     """Get performance trends for a specific route over time.
 
@@ -215,7 +215,7 @@ async def get_peak_hours(
     route: str = Query(None, description="Filter by specific route (optional)"),
     days: int = Query(30, ge=7, le=90, description="Days of history to analyze"),
     min_requests: int = Query(50, ge=1, description="Minimum avg requests for a route to be included"),
-    db: Session = Depends(get_database_session)
+    db: Session = Depends(get_read_only_session)
 ):
     """Get peak traffic hours analysis.
 
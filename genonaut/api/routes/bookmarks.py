@@ -7,7 +7,7 @@ from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 
-from genonaut.api.dependencies import get_database_session
+from genonaut.api.dependencies import ReadSession, get_database_session, get_read_session
 from genonaut.api.services.bookmark_service import BookmarkService
 from genonaut.api.services.bookmark_category_member_service import BookmarkCategoryMemberService
 from genonaut.api.models.requests import (
@@ -180,6 +180,81 @@ async def check_bookmarks_batch(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
 
 
+def _list_bookmarks(
+    service: BookmarkService,
+    user_id: UUID,
+    pinned: bool,
+    is_public: bool,
+    category_id: UUID,
+    skip: int,
+    limit: int,
+    sort_field: str,
+    sort_order: str,
+    include_content: bool,
+) -> BookmarkListResponse:
+    if include_content:
+        # Get bookmarks with content data
+        bookmark_dicts = service.get_user_bookmarks_with_content(
+            user_id=user_id,
+            skip=skip,
+            limit=limit,
+            pinned=pinned,
+            is_public=is_public,
+            category_id=category_id,
+            sort_field=sort_field,
+            sort_order=sort_order
+        )
+
+        # Construct BookmarkWithContentResponse objects
+        from genonaut.api.models.responses import BookmarkWithContentResponse, ContentResponse
+        items = []
+        for bm_dict in bookmark_dicts:
+            bookmark = bm_dict['bookmark']
+            content = bm_dict['content']
+            user_rating = bm_dict['user_rating']
+
+            # Create BookmarkWithContentResponse
+            bookmark_response = BookmarkWithContentResponse(
+                id=bookmark.id,
+                user_id=bookmark.user_id,
+                content_id=bookmark.content_id,
+                content_source_type=bookmark.content_source_type,
+                note=bookmark.note,
+                pinned=bookmark.pinned,
+                is_public=bookmark.is_public,
+                created_at=bookmark.created_at,
+                updated_at=bookmark.updated_at,
+                content=ContentResponse.model_validate(content) if content else None,
+                user_rating=user_rating
+            )
+            items.append(bookmark_response)
+    else:
+        # Get bookmarks without content (legacy behavior)
+        bookmarks = service.get_user_bookmarks(
+            user_id=user_id,
+            skip=skip,
+            limit=limit,
+            pinned=pinned,
+            is_public=is_public,
+            category_id=category_id
+        )
+        items = [BookmarkResponse.model_validate(bookmark) for bookmark in bookmarks]
+
+    total = service.count_user_bookmarks(
+        user_id=user_id,
+        pinned=pinned,
+        is_public=is_public,
+        category_id=category_id
+    )
+
+    return BookmarkListResponse(
+        items=items,
+        total=total,
+        skip=skip,
+        limit=limit
+    )
+
+
 @router.get("/", response_model=BookmarkListResponse)
 async def list_bookmarks(
     user_id: UUID = Query(..., description="User ID to list bookmarks for"),
@@ -191,72 +266,22 @@ async def list_bookmarks(
     sort_field: str = Query("user_rating_then_created", description="Field to sort by"),
     sort_order: str = Query("desc", pattern="^(asc|desc)$", description="Sort order"),
     include_content: bool = Query(True, description="Include content data in response"),
-    db: Session = Depends(get_database_session)
+    reader: ReadSession = Depends(get_read_session)
 ):
     """Get list of bookmarks for a user with optional filtering and sorting."""
-    service = BookmarkService(db)
     try:
-        if include_content:
-            # Get bookmarks with content data
-            bookmark_dicts = service.get_user_bookmarks_with_content(
-                user_id=user_id,
-                skip=skip,
-                limit=limit,
-                pinned=pinned,
-                is_public=is_public,
-                category_id=category_id,
-                sort_field=sort_field,
-                sort_order=sort_order
-            )
-
-            # Construct BookmarkWithContentResponse objects
-            from genonaut.api.models.responses import BookmarkWithContentResponse, ContentResponse
-            items = []
-            for bm_dict in bookmark_dicts:
-                bookmark = bm_dict['bookmark']
-                content = bm_dict['content']
-                user_rating = bm_dict['user_rating']
-
-                # Create BookmarkWithContentResponse
-                bookmark_response = BookmarkWithContentResponse(
-                    id=bookmark.id,
-                    user_id=bookmark.user_id,
-                    content_id=bookmark.content_id,
-                    content_source_type=bookmark.content_source_type,
-                    note=bookmark.note,
-                    pinned=bookmark.pinned,
-                    is_public=bookmark.is_public,
-                    created_at=bookmark.created_at,
-                    updated_at=bookmark.updated_at,
-                    content=ContentResponse.model_validate(content) if content else None,
-                    user_rating=user_rating
-                )
-                items.append(bookmark_response)
-        else:
-            # Get bookmarks without content (legacy behavior)
-            bookmarks = service.get_user_bookmarks(
-                user_id=user_id,
-                skip=skip,
-                limit=limit,
-                pinned=pinned,
-                is_public=is_public,
-                category_id=category_id
-            )
-            items = [BookmarkResponse.model_validate(bookmark) for bookmark in bookmarks]
-
-        total = service.count_user_bookmarks(
+        return await reader.run(lambda session: _list_bookmarks(
+            BookmarkService(session),
             user_id=user_id,
             pinned=pinned,
             is_public=is_public,
-            category_id=category_id
-        )
-
-        return BookmarkListResponse(
-            items=items,
-            total=total,
+            category_id=category_id,
             skip=skip,
-            limit=limit
-        )
+            limit=limit,
+            sort_field=sort_field,
+            sort_order=sort_order,
+            include_content=include_content,
+        ))
     except EntityNotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
 
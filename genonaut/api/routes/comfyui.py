@@ -1,11 +1,18 @@
 """ComfyUI generation API routes."""
 
-from typing import List
+from typing import Any, Dict, List
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
+from genonaut.api.config import get_settings
 from genonaut.api.dependencies import get_database_session
+from genonaut.api.services.comfyui_client import (
+    ComfyUICircuitOpenError,
+    ComfyUIConnectionError,
+    get_async_comfyui_client,
+)
 from genonaut.api.services.comfyui_generation_service import ComfyUIGenerationService
 from genonaut.api.models.requests import (
     ComfyUIGenerationCreateRequest,
@@ -50,6 +57,44 @@ async def create_generation(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
 
 
+def _backend_url(backend: str) -> str:
+    """Resolve a backend choice ('comfyui' or 'kerniegen') to its URL, as the worker does."""
+    settings = get_settings()
+    return settings.comfyui_url if backend == "comfyui" else settings.comfyui_mock_url
+
+
+@router.get("/health")
+async def comfyui_health(
+    backend: str = Query("comfyui", description="Backend to check: 'comfyui' or 'kerniegen'")
+) -> Dict[str, Any]:
+    """Check whether a ComfyUI backend is reachable without blocking the event loop."""
+    client = get_async_comfyui_client(_backend_url(backend))
+    is_healthy = await client.health_check()
+    return {
+        "status": "healthy" if is_healthy else "unhealthy",
+        "backend_url": client.base_url,
+        "circuit": client.circuit_breaker.get_status(),
+    }
+
+
+@router.get("/models/installed")
+async def list_installed_models(
+    backend: str = Query("comfyui", description="Backend to query: 'comfyui' or 'kerniegen'")
+) -> Dict[str, List[str]]:
+    """List checkpoint and LoRA models reported live by a ComfyUI backend."""
+    client = get_async_comfyui_client(_backend_url(backend))
+    try:
+        return await client.get_available_models()
+    except ComfyUICircuitOpenError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": str(max(1, round(client.circuit_breaker.retry_after())))},
+        )
+    except ComfyUIConnectionError as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e))
+
+
 @router.get("/{generation_id}", response_model=ComfyUIGenerationResponse)
 async def get_generation(
     generation_id: int,
@@ -99,7 +144,8 @@ async def cancel_generation(
     """Cancel a ComfyUI generation."""
     service = ComfyUIGenerationService(db)
     try:
-        service.cancel_generation(generation_id)
+        # Cancelling in ComfyUI goes through the blocking client
+        await run_in_threadpool(service.cancel_generation, generation_id)
         return SuccessResponse(message="Generation cancelled successfully")
     except EntityNotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -135,7 +181,7 @@ async def refresh_models(
     """Refresh available models from ComfyUI model directories."""
     service = ComfyUIGenerationService(db)
     try:
-        count = service.refresh_available_models()
+        count = await run_in_threadpool(service.refresh_available_models)
         return SuccessResponse(message=f"Refreshed {count} models successfully")
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
\ No newline at end of file
@@ -1,13 +1,20 @@
 """Content management API routes."""
 
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import Response
 from sqlalchemy.orm import Session
 
-from genonaut.api.dependencies import get_database_session, _is_statement_timeout_error
+from genonaut.api.dependencies import (
+    ReadSession,
+    get_database_session,
+    get_read_session,
+    _is_statement_timeout_error,
+)
 from genonaut.api.exceptions import StatementTimeoutError
 from genonaut.api.services.content_service import ContentService
+from genonaut.api.services.hot_feed import hot_feed_page
 from genonaut.api.config import get_settings
 from genonaut.api.models.requests import (
     ContentCreateRequest,
@@ -21,9 +28,13 @@ from genonaut.api.models.responses import (
     ContentListResponse,
     ContentStatsResponse,
     SuccessResponse,
-    PaginatedResponse
+    PaginatedResponse,
+    SimilarContentItem,
+    SimilarContentResponse
 )
 from genonaut.api.exceptions import EntityNotFoundError, ValidationError, DatabaseError
+from genonaut.api.services.response_cache import cached_response, invalidate_content_pages
+from genonaut.api.utils.json_response import FastJSONResponse
 
 router = APIRouter(prefix="/api/v1/content", tags=["content"])
 
@@ -46,6 +57,7 @@ async def create_content(
             tags=content_data.tags,
             is_private=content_data.is_private
         )
+        await invalidate_content_pages()
         return ContentResponse.model_validate(content)
     except ValidationError as e:
         raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
@@ -53,31 +65,30 @@ async def create_content(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
 
 
-@router.get("/unified")
-async def get_unified_content(
-    page: Optional[int] = Query(None, ge=1, description="Page number (for offset pagination)"),
-    page_size: int = Query(10, ge=1, le=1000, description="Items per page"),
-    cursor: Optional[str] = Query(None, description="Cursor for cursor-based pagination"),
-    backward: bool = Query(False, description="True for backward pagination (prevCursor), False for forward (nextCursor)"),
-    content_types: Optional[str] = Query(None, description="Comma-separated content types (regular, auto). Defaults to 'regular,auto' if not provided. Send empty string to get no results."),
-    creator_filter: str = Query("all", description="Creator filter (all, user, community)"),
-    content_source_types: Optional[List[str]] = Query(None, description="Specific content-source combinations (user-regular, user-auto, community-regular, community-auto). When provided, overrides content_types and creator_filter."),
-    user_id: Optional[UUID] = Query(None, description="User ID for filtering"),
-    search_term: Optional[str] = Query(None, description="Search term for title"),
-    sort_field: str = Query("created_at", description="Field to sort by"),
-    sort_order: str = Query("desc", description="Sort order (asc, desc)"),
-    tag: Optional[List[str]] = Query(None, description="Deprecated: filter by tags (legacy parameter)"),
-    tag_names: Optional[List[str]] = Query(None, description="Filter by tag names (can specify multiple)"),
-    tag_match: str = Query(
-        "any",
-        description="Tag match logic: 'any' (OR) or 'all' (AND)",
-    ),
-    include_stats: bool = Query(False, description="Include statistics counts (adds ~800ms query time)"),
-    db: Session = Depends(get_database_session)
-):
-    """Get unified content from both regular and auto tables with pagination."""
-    service = ContentService(db)
-
+def unified_content_query(
+    page: Optional[int] = None,
+    page_size: int = 10,
+    cursor: Optional[str] = None,
+    backward: bool = False,
+    content_types: Optional[str] = None,
+    creator_filter: str = "all",
+    content_source_types: Optional[List[str]] = None,
+    user_id: Optional[UUID] = None,
+    search_term: Optional[str] = None,
+    sort_field: str = "created_at",
+    sort_order: str = "desc",
+    tag: Optional[List[str]] = None,
+    tag_names: Optional[List[str]] = None,
+    tag_match: str = "any",
+    include_stats: bool = False,
+) -> Dict[str, Any]:
+    """Validate ``/unified`` query parameters and build ``get_unified_content_paginated`` kwargs.
+
+    Shared with the cache warmer so replayed requests match the route exactly.
+
+    Raises:
+        HTTPException: 400 for invalid content types, filters or tag match mode
+    """
     # NEW: Handle content_source_types parameter (preferred method)
     if content_source_types is not None:
         # Handle sentinel value for "explicitly empty" (HTTP doesn't send empty arrays)
@@ -153,32 +164,87 @@ async def get_unified_content(
             detail="tag_match must be either 'any' or 'all'",
         )
 
+    return dict(
+        pagination=pagination,
+        content_types=content_type_list if content_source_types is None else None,
+        creator_filter=creator_filter if content_source_types is None else None,
+        content_source_types=content_source_types,
+        user_id=user_id,
+        search_term=search_term,
+        sort_field=sort_field,
+        sort_order=sort_order,
+        tags=combined_tags if combined_tags else None,
+        tag_match=normalized_tag_match,
+        include_stats=include_stats,
+    )
+
+
+@router.get("/unified")
+async def get_unified_content(
+    page: Optional[int] = Query(None, ge=1, description="Page number (for offset pagination)"),
+    page_size: int = Query(10, ge=1, le=1000, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="Cursor for cursor-based pagination"),
+    backward: bool = Query(False, description="True for backward pagination (prevCursor), False for forward (nextCursor)"),
+    content_types: Optional[str] = Query(None, description="Comma-separated content types (regular, auto). Defaults to 'regular,auto' if not provided. Send empty string to get no results."),
+    creator_filter: str = Query("all", description="Creator filter (all, user, community)"),
+    content_source_types: Optional[List[str]] = Query(None, description="Specific content-source combinations (user-regular, user-auto, community-regular, community-auto). When provided, overrides content_types and creator_filter."),
+    user_id: Optional[UUID] = Query(None, description="User ID for filtering"),
+    search_term: Optional[str] = Query(None, description="Search term for title"),
+    sort_field: str = Query("created_at", description="Field to sort by"),
+    sort_order: str = Query("desc", description="Sort order (asc, desc)"),
+    tag: Optional[List[str]] = Query(None, description="Deprecated: filter by tags (legacy parameter)"),
+    tag_names: Optional[List[str]] = Query(None, description="Filter by tag names (can specify multiple)"),
+    tag_match: str = Query(
+        "any",
+        description="Tag match logic: 'any' (OR) or 'all' (AND)",
+    ),
+    include_stats: bool = Query(False, description="Include statistics counts (adds ~800ms query time)"),
+    # Pages pre-rendered by the cache warmer; resolved before the read session is set up
+    cached: Optional[Response] = Depends(cached_response),
+    reader: ReadSession = Depends(get_read_session)
+):
+    """Get unified content from both regular and auto tables with pagination."""
+    query = unified_content_query(
+        page=page,
+        page_size=page_size,
+        cursor=cursor,
+        backward=backward,
+        content_types=content_types,
+        creator_filter=creator_filter,
+        content_source_types=content_source_types,
+        user_id=user_id,
+        search_term=search_term,
+        sort_field=sort_field,
+        sort_order=sort_order,
+        tag=tag,
+        tag_names=tag_names,
+        tag_match=tag_match,
+        include_stats=include_stats,
+    )
+
+    if cached is not None:
+        return cached
+
     try:
+        # Default views are served from the hot feed; its Redis calls stay out of the session callable
+        hot_page = await hot_feed_page(reader, query)
+
         # Get unified content
-        result = service.get_unified_content_paginated(
-            pagination=pagination,
-            content_types=content_type_list if content_source_types is None else None,
-            creator_filter=creator_filter if content_source_types is None else None,
-            content_source_types=content_source_types,
-            user_id=user_id,
-            search_term=search_term,
-            sort_field=sort_field,
-            sort_order=sort_order,
-            tags=combined_tags if combined_tags else None,
-            tag_match=normalized_tag_match,
-            include_stats=include_stats,
+        result = await reader.run(
+            lambda session: ContentService(session).get_unified_content_paginated(**query, hot_page=hot_page)
         )
 
-        return result
+        # Returned as a response so FastAPI does not re-encode the page with jsonable_encoder
+        return FastJSONResponse(result)
 
     except StatementTimeoutError:
         # Rollback the failed transaction
-        db.rollback()
+        await reader.rollback()
         # Let timeout errors propagate to the global exception handler
         raise
     except Exception as exc:
         # Rollback the failed transaction
-        db.rollback()
+        await reader.rollback()
 
         # Check if this is a timeout error at the SQLAlchemy level
         if _is_statement_timeout_error(exc):
@@ -235,6 +301,35 @@ async def get_content(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
 
 
+@router.get("/{content_id}/similar", response_model=SimilarContentResponse)
+async def get_similar_content(
+    content_id: int,
+    limit: int = Query(10, ge=1, le=100, description="Maximum number of similar items"),
+    db: Session = Depends(get_database_session)
+):
+    """Get public content similar to a content item ("more like this").
+
+    Works for both regular and auto-generated content. Results come from the
+    prebuilt similarity index, which is updated every few minutes by the
+    ``update_content_similarity_index`` worker task.
+    """
+    service = ContentService(db)
+    try:
+        similar = service.get_similar_content(content_id, limit=limit)
+    except EntityNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+    if similar is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Content similarity index has not been built yet",
+        )
+    return SimilarContentResponse(
+        content_id=content_id,
+        items=[SimilarContentItem(**item) for item in similar],
+    )
+
+
 @router.put("/{content_id}", response_model=ContentResponse)
 async def update_content(
     content_id: int,
@@ -252,6 +347,7 @@ async def update_content(
             tags=content_data.tags,
             is_private=content_data.is_private
         )
+        await invalidate_content_pages()
         return ContentResponse.model_validate(content)
     except EntityNotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -276,6 +372,7 @@ async def delete_content(
     service = ContentService(db)
     try:
         service.delete_content(content_id)
+        await invalidate_content_pages()
         return SuccessResponse(message=f"Content {content_id} deleted successfully")
     except EntityNotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -291,6 +388,7 @@ async def update_content_quality(
     service = ContentService(db)
     try:
         content = service.update_quality_score(content_id, quality_data.quality_score)
+        await invalidate_content_pages()
         return ContentResponse.model_validate(content)
     except EntityNotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
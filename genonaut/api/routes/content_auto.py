@@ -20,6 +20,7 @@ from genonaut.api.models.responses import (
     SuccessResponse,
 )
 from genonaut.api.services.content_service import ContentAutoService
+from genonaut.api.services.response_cache import invalidate_content_pages
 
 router = APIRouter(prefix="/api/v1/content-auto", tags=["content-auto"])
 
@@ -48,6 +49,7 @@ async def create_auto_content(
             tags=content_data.tags,
             is_private=content_data.is_private,
         )
+        await invalidate_content_pages()
         return ContentAutoResponse.model_validate(content)
     except ValidationError as exc:
         raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc))
@@ -88,6 +90,7 @@ async def update_auto_content(
             tags=content_data.tags,
             is_private=content_data.is_private,
         )
+        await invalidate_content_pages()
         return ContentAutoResponse.model_validate(content)
     except EntityNotFoundError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc))
@@ -113,6 +116,7 @@ async def delete_auto_content(
     service = _service(db)
     try:
         service.delete_content(content_id)
+        await invalidate_content_pages()
         return SuccessResponse(message=f"Auto content {content_id} deleted successfully")
     except EntityNotFoundError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc))
@@ -129,6 +133,7 @@ async def update_auto_content_quality(
     service = _service(db)
     try:
         content = service.update_content_quality(content_id, quality_data.quality_score)
+        await invalidate_content_pages()
         return ContentAutoResponse.model_validate(content)
     except EntityNotFoundError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc))
@@ -16,7 +16,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query, status, Path
 from sqlalchemy.orm import Session
 
-from genonaut.api.dependencies import get_database_session
+from genonaut.api.dependencies import get_read_only_session
 from genonaut.api.services.generation_analytics_service import GenerationAnalyticsService
 
 router = APIRouter(prefix="/api/v1/analytics/generation", tags=["analytics", "generation"])
@@ -25,7 +25,7 @@ router = APIRouter(prefix="/api/v1/analytics/generation", tags=["analytics", "ge
 @router.get("/overview")
 async def get_generation_overview(
     days: int = Query(7, ge=1, le=90, description="Days of history to analyze"),
-    db: Session = Depends(get_database_session)
+    db: Session = Depends(get_read_only_session)
 ):
     """Get high-level overview of generation activity.
 
@@ -74,7 +74,7 @@ async def get_generation_trends(
         "hourly",
         description="Data granularity: 'hourly' or 'daily'"
     ),
-    db: Session = Depends(get_database_session)
+    db: Session = Depends(get_read_only_session)
 ):
     """Get time-series trends for generation metrics.
 
@@ -124,7 +124,7 @@ async def get_generation_trends(
 async def get_user_generation_analytics(
     user_id: UUID = Path(..., description="User ID to analyze"),
     days: int = Query(30, ge=1, le=90, description="Days of history to analyze"),
-    db: Session = Depends(get_database_session)
+    db: Session = Depends(get_read_only_session)
 ):
     """Get generation analytics for a specific user.
 
@@ -175,7 +175,7 @@ async def get_user_generation_analytics(
 @router.get("/models")
 async def get_model_performance(
     days: int = Query(30, ge=1, le=90, description="Days of history to analyze"),
-    db: Session = Depends(get_database_session)
+    db: Session = Depends(get_read_only_session)
 ):
     """Get performance comparison across different models.
 
@@ -228,7 +228,7 @@ async def get_model_performance(
 @router.get("/failures")
 async def get_failure_analysis(
     days: int = Query(7, ge=1, le=90, description="Days of history to analyze"),
-    db: Session = Depends(get_database_session)
+    db: Session = Depends(get_read_only_session)
 ):
     """Get detailed analysis of generation failures.
 
@@ -294,7 +294,7 @@ async def get_failure_analysis(
 @router.get("/peak-hours")
 async def get_peak_usage_times(
     days: int = Query(30, ge=7, le=90, description="Days of history to analyze"),
-    db: Session = Depends(get_database_session)
+    db: Session = Depends(get_read_only_session)
 ):
     """Get analysis of peak generation times.
 
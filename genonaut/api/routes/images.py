@@ -4,10 +4,13 @@ import os
 from pathlib import Path
 from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Response
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, RedirectResponse
+from sqlalchemy import select
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
-from genonaut.api.dependencies import get_database_session
+from genonaut.api.dependencies import ReadSession, get_database_session, get_read_session
+from genonaut.api.services.object_storage import ObjectStorage
 from genonaut.api.services.thumbnail_service import ThumbnailService
 from genonaut.api.config import get_settings
 from genonaut.db.schema import ContentItem, ContentItemAuto
@@ -15,11 +18,73 @@ from genonaut.db.schema import ContentItem, ContentItemAuto
 router = APIRouter(prefix="/api/v1/images", tags=["images"])
 
 
+def _lookup_content_path(session: Session, content_id: int) -> Optional[str]:
+    """Return ``content_data`` (the image path) for a content id, checking regular then auto content."""
+    for model in (ContentItem, ContentItemAuto):
+        image_path = session.execute(
+            select(model.content_data).where(model.id == content_id).limit(1)
+        ).scalar_one_or_none()
+        if image_path is not None:
+            return image_path
+    return None
+
+
+async def _in_remote_storage(storage: ObjectStorage, path: Path) -> bool:
+    key = storage.key_for(path) if storage.remote else None
+    return key is not None and await run_in_threadpool(storage.exists, key)
+
+
+async def _fetch_from_storage(storage: ObjectStorage, path: Path) -> bool:
+    """Download a file missing locally from a remote backend into its local path."""
+    key = storage.key_for(path) if storage.remote else None
+    return key is not None and await run_in_threadpool(storage.download, key, path)
+
+
+async def _storage_redirect(storage: ObjectStorage, path: Path) -> Optional[RedirectResponse]:
+    """Redirect to the object's presigned/public URL, if the backend has one and holds the object."""
+    key = storage.key_for(path)
+    if key is None:
+        return None
+    url = storage.url(key)
+    if url is None or not await run_in_threadpool(storage.exists, key):
+        return None
+    if storage.public_url:
+        cache_control = "public, max-age=3600"
+    else:
+        # A cached redirect must not outlive the presigned URL it points to
+        expires = getattr(storage, "presign_expires_seconds", 3600)
+        cache_control = f"private, max-age={min(3600, expires // 2)}"
+    return RedirectResponse(url, status_code=status.HTTP_307_TEMPORARY_REDIRECT, headers={"Cache-Control": cache_control})
+
+
+def _delete_thumbnail_files(thumbnail_service: ThumbnailService, thumbnail_dir: Path, source_stem: str) -> int:
+    """Delete every thumbnail of ``source_stem``, locally and in the object storage; returns the count."""
+    thumbnail_paths = []
+    if thumbnail_dir.exists():
+        # Look for thumbnails with this stem
+        for thumbnail_file in thumbnail_dir.glob(f"{source_stem}_*"):
+            thumbnail_paths.append(str(thumbnail_file))
+
+    # Delete thumbnails
+    deleted_count = 0
+    if thumbnail_paths:
+        deleted_count = thumbnail_service.cleanup_thumbnails(thumbnail_paths)
+
+    # Thumbnails that only exist in a remote object storage backend
+    storage = thumbnail_service.storage
+    thumbnail_prefix = storage.key_for(thumbnail_dir / f"{source_stem}_") if storage.remote else None
+    if thumbnail_prefix is not None:
+        local_keys = {storage.key_for(path) for path in thumbnail_paths}
+        remote_keys = [key for key in storage.list(thumbnail_prefix) if key not in local_keys]
+        deleted_count += storage.delete(remote_keys) if remote_keys else 0
+    return deleted_count
+
+
 @router.get("/{file_path:path}")
 async def serve_image(
     file_path: str,
     thumbnail: Optional[str] = None,
-    db: Session = Depends(get_database_session)
+    reader: ReadSession = Depends(get_read_session)
 ):
     """Serve images and thumbnails with proper caching headers.
 
@@ -28,9 +93,11 @@ async def serve_image(
             - A content_id (numeric) to look up the image path from the database
             - A relative path to the image file within the ComfyUI output directory
         thumbnail: Optional thumbnail size ('small', 'medium', 'large')
-        db: Database session
+        reader: Read session for the content lookup
 
     Returns:
+        Redirect to the object storage URL of the image when the backend has
+        one (presigned for S3, ``public-url`` if configured), otherwise a
         FileResponse with the image file
 
     Raises:
@@ -38,26 +105,22 @@ async def serve_image(
     """
     settings = get_settings()
     thumbnail_service = ThumbnailService()
+    storage = thumbnail_service.storage
 
     # Check if file_path is a content_id (numeric)
     use_db_lookup = file_path.isdigit()
     if use_db_lookup:
         content_id = int(file_path)
 
-        # Try to find content in both tables
-        content = db.query(ContentItem).filter(ContentItem.id == content_id).first()
-        if not content:
-            content = db.query(ContentItemAuto).filter(ContentItemAuto.id == content_id).first()
+        # Try to find content in both tables; content_data holds the file path
+        image_path = await reader.run(lambda session: _lookup_content_path(session, content_id))
 
-        if not content:
+        if image_path is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Image not found"
             )
 
-        # Get the content_data field which contains the file path
-        image_path = content.content_data
-
         # Expand tilde if present and check if it's an absolute path
         expanded_path = Path(image_path).expanduser()
         if expanded_path.is_absolute():
@@ -116,17 +179,18 @@ async def serve_image(
         thumbnail_filename = f"{source_stem}_{size_suffix}.webp"
         thumbnail_path = base_path / "thumbnails" / thumbnail_filename
 
-        # Generate thumbnail if it doesn't exist
-        if not thumbnail_path.exists():
-            if not full_path.exists():
+        # Generate thumbnail if it doesn't exist (locally or in the object storage)
+        if not thumbnail_path.exists() and not await _in_remote_storage(storage, thumbnail_path):
+            if not full_path.exists() and not await _fetch_from_storage(storage, full_path):
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail="Source image not found"
                 )
 
             try:
-                # Generate thumbnail
-                thumbnail_service.generate_thumbnails(
+                # Generate thumbnail (resizing and the object storage upload run in the threadpool)
+                await run_in_threadpool(
+                    thumbnail_service.generate_thumbnails,
                     str(full_path),
                     sizes=[size],
                     formats=['webp']
@@ -141,6 +205,11 @@ async def serve_image(
     else:
         target_path = full_path
 
+    # Let the client fetch the bytes from the object storage instead of through the API
+    redirect = await _storage_redirect(storage, target_path)
+    if redirect is not None:
+        return redirect
+
     # Check if file exists
     if not target_path.exists():
         raise HTTPException(
@@ -182,7 +251,7 @@ async def serve_image(
 @router.get("/{file_path:path}/info")
 async def get_image_info(
     file_path: str,
-    db: Session = Depends(get_database_session)
+    reader: ReadSession = Depends(get_read_session)
 ):
     """Get information about an image file.
 
@@ -190,7 +259,7 @@ async def get_image_info(
         file_path: Can be either:
             - A content_id (numeric) to look up the image path from the database
             - A relative path to the image file within the ComfyUI output directory
-        db: Database session
+        reader: Read session for the content lookup
 
     Returns:
         Dictionary with image information
@@ -206,20 +275,15 @@ async def get_image_info(
     if use_db_lookup:
         content_id = int(file_path)
 
-        # Try to find content in both tables
-        content = db.query(ContentItem).filter(ContentItem.id == content_id).first()
-        if not content:
-            content = db.query(ContentItemAuto).filter(ContentItemAuto.id == content_id).first()
+        # Try to find content in both tables; content_data holds the file path
+        image_path = await reader.run(lambda session: _lookup_content_path(session, content_id))
 
-        if not content:
+        if image_path is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Image not found"
             )
 
-        # Get the content_data field which contains the file path
-        image_path = content.content_data
-
         # Expand tilde if present and check if it's an absolute path
         expanded_path = Path(image_path).expanduser()
         if expanded_path.is_absolute():
@@ -348,20 +412,10 @@ async def delete_thumbnails(
                 detail="Access denied: Invalid file path"
             )
 
-    # Find all thumbnails for this image
-    source_stem = full_path.stem
-    thumbnail_dir = base_path / "thumbnails"
-
-    thumbnail_paths = []
-    if thumbnail_dir.exists():
-        # Look for thumbnails with this stem
-        for thumbnail_file in thumbnail_dir.glob(f"{source_stem}_*"):
-            thumbnail_paths.append(str(thumbnail_file))
-
-    # Delete thumbnails
-    deleted_count = 0
-    if thumbnail_paths:
-        deleted_count = thumbnail_service.cleanup_thumbnails(thumbnail_paths)
+    # Local and object storage round trips stay off the event loop
+    deleted_count = await run_in_threadpool(
+        _delete_thumbnail_files, thumbnail_service, base_path / "thumbnails", full_path.stem
+    )
 
     return {
         "success": True,
@@ -4,25 +4,27 @@ from typing import List, Dict, Any
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import func
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from genonaut.api.dependencies import get_database_session
 from genonaut.api.services.interaction_service import InteractionService
+from genonaut.api.services.interaction_ingest import get_interaction_ingestor
 from genonaut.api.models.requests import (
     InteractionCreateRequest, 
+    InteractionEventBatchRequest,
     InteractionUpdateRequest,
     InteractionSearchRequest
 )
 from genonaut.api.models.responses import (
     InteractionResponse,
+    InteractionIngestResponse,
     InteractionListResponse,
     InteractionStatsResponse,
     InteractionSummaryResponse,
     SuccessResponse,
 )
 from genonaut.api.exceptions import EntityNotFoundError, ValidationError
-from genonaut.db.schema import ContentItem, UserInteraction
 
 router = APIRouter(prefix="/api/v1/interactions", tags=["interactions"])
 
@@ -50,6 +52,21 @@ async def record_interaction(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
 
 
+@router.post("/events", response_model=InteractionIngestResponse, status_code=status.HTTP_202_ACCEPTED)
+async def ingest_interaction_events(request: InteractionEventBatchRequest):
+    """Buffer view/like events for batched insertion.
+
+    Events are written asynchronously in multi-row batches; unknown users or
+    content are dropped at flush time, and repeat views within the dedupe
+    window are collapsed. Ratings and other interaction types must use the
+    synchronous ``POST /api/v1/interactions`` endpoint.
+    """
+    events = [event.model_dump(mode="json") for event in request.events]
+    # The Redis buffer enqueues with a blocking pipeline round trip
+    accepted, duplicates = await run_in_threadpool(get_interaction_ingestor().submit, events)
+    return InteractionIngestResponse(accepted=accepted, duplicates=duplicates)
+
+
 @router.get("/{interaction_id}", response_model=InteractionResponse)
 async def get_interaction(
     interaction_id: int,
@@ -300,28 +317,14 @@ async def get_user_behavior_analytics(
 
     service = InteractionService(db)
     try:
-        summary = service.get_user_interaction_summary(user_id)
+        rollup = service.get_user_interaction_rollup(user_id)
     except EntityNotFoundError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc))
 
-    total_interactions = summary.pop('total_interactions', 0)
-
-    favorite_content_types_query = (
-        db.query(ContentItem.content_type, func.count(UserInteraction.id).label('count'))
-        .join(ContentItem, ContentItem.id == UserInteraction.content_item_id)
-        .filter(UserInteraction.user_id == user_id)
-        .group_by(ContentItem.content_type)
-        .order_by(func.count(UserInteraction.id).desc())
-        .limit(5)
-        .all()
-    )
-
-    favorite_content_types = [row.content_type for row in favorite_content_types_query]
-
     return {
-        "total_interactions": total_interactions,
-        "interaction_types": summary,
-        "favorite_content_types": favorite_content_types,
+        "total_interactions": rollup['total_interactions'],
+        "interaction_types": rollup['by_type'],
+        "favorite_content_types": list(rollup['by_content_type'])[:5],
     }
 
 
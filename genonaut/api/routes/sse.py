@@ -0,0 +1,204 @@
+"""Server-Sent Events endpoints for real-time job status updates.
+
+A lightweight alternative to the WebSocket endpoints for clients that cannot
+hold a WebSocket (CLI scripts, dashboards behind proxies). Updates come from
+the same shared job status hub, so each connection costs a queue rather than a
+Redis connection. Clients that reconnect with a ``Last-Event-ID`` header are
+replayed the updates they missed from the per-job history stream.
+"""
+
+import asyncio
+import json
+import logging
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+from fastapi import APIRouter, Header, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+
+from genonaut.api.services.job_status_hub import get_job_status_hub
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/sse", tags=["sse"])
+
+MAX_JOBS_PER_STREAM = 100
+HEARTBEAT_SECONDS = 15.0
+RETRY_MILLISECONDS = 3000
+TERMINAL_STATUSES = {"completed", "failed", "cancelled"}
+
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no",  # Disable proxy buffering (nginx)
+}
+
+
+def parse_event_cursor(last_event_id: Optional[str]) -> Dict[int, str]:
+    """Parse a ``Last-Event-ID`` value into per-job stream positions.
+
+    Event IDs have the form ``"<job_id>:<stream_id>,<job_id>:<stream_id>"`` so
+    a single ID captures the position in every job's history. Malformed parts
+    are ignored.
+    """
+    cursor: Dict[int, str] = {}
+    if not last_event_id:
+        return cursor
+    for part in last_event_id.split(","):
+        job_id, _, stream_id = part.strip().partition(":")
+        try:
+            cursor[int(job_id)] = stream_id
+        except ValueError:
+            continue
+    return cursor
+
+
+def format_event_cursor(cursor: Dict[int, str]) -> str:
+    """Serialize per-job stream positions into an SSE event ID."""
+    return ",".join(f"{job_id}:{stream_id}" for job_id, stream_id in sorted(cursor.items()))
+
+
+def _stream_id_key(stream_id: str) -> Tuple[int, int]:
+    millis, _, sequence = stream_id.partition("-")
+    try:
+        return int(millis), int(sequence or 0)
+    except ValueError:
+        return (0, 0)
+
+
+def _format_event(data: str, cursor: Dict[int, str]) -> str:
+    lines = []
+    if cursor:
+        lines.append(f"id: {format_event_cursor(cursor)}")
+    lines.append("event: job_status")
+    lines.append(f"data: {data}")
+    return "\n".join(lines) + "\n\n"
+
+
+async def job_event_stream(
+    request: Request,
+    job_ids: List[int],
+    last_event_id: Optional[str] = None,
+) -> AsyncIterator[str]:
+    """Yield SSE-formatted job updates until every job finishes or the client leaves.
+
+    Args:
+        request: Incoming request, used to detect client disconnects
+        job_ids: Generation job IDs to stream
+        last_event_id: ``Last-Event-ID`` sent by a reconnecting client
+
+    Yields:
+        Server-Sent Events frames
+    """
+    hub = get_job_status_hub()
+    # Subscribe before replaying history so nothing published in between is lost
+    subscription = await hub.subscribe(job_ids)
+    cursor = parse_event_cursor(last_event_id)
+    pending = set(job_ids)
+
+    try:
+        yield f"retry: {RETRY_MILLISECONDS}\n\n"
+
+        if last_event_id:
+            for job_id in job_ids:
+                for event_id, data in await hub.read_history(job_id, cursor.get(job_id)):
+                    cursor[job_id] = event_id
+                    yield _format_event(_with_event_id(data, event_id), cursor)
+                    if _status_of(data) in TERMINAL_STATUSES:
+                        pending.discard(job_id)
+
+        while pending:
+            try:
+                job_id, data = await asyncio.wait_for(subscription.get(), HEARTBEAT_SECONDS)
+            except asyncio.TimeoutError:
+                if await request.is_disconnected():
+                    break
+                yield ": keep-alive\n\n"
+                continue
+
+            try:
+                payload = json.loads(data)
+            except json.JSONDecodeError as e:
+                logger.error(f"Failed to parse job update for job {job_id}: {e}")
+                continue
+
+            event_id = payload.get("event_id")
+            if event_id:
+                seen = cursor.get(job_id)
+                if seen and _stream_id_key(event_id) <= _stream_id_key(seen):
+                    continue  # Already replayed from history
+                cursor[job_id] = event_id
+
+            yield _format_event(data, cursor)
+            if payload.get("status") in TERMINAL_STATUSES:
+                pending.discard(job_id)
+
+    finally:
+        hub.unsubscribe(subscription)
+
+
+def _with_event_id(data: str, event_id: str) -> str:
+    try:
+        payload = json.loads(data)
+    except json.JSONDecodeError:
+        return data
+    payload["event_id"] = event_id
+    return json.dumps(payload)
+
+
+def _status_of(data: str) -> Optional[str]:
+    try:
+        return json.loads(data).get("status")
+    except (json.JSONDecodeError, AttributeError):
+        return None
+
+
+def _streaming_response(request: Request, job_ids: List[int], last_event_id: Optional[str]) -> StreamingResponse:
+    return StreamingResponse(
+        job_event_stream(request, job_ids, last_event_id),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS,
+    )
+
+
+@router.get("/jobs/{job_id}")
+async def job_status_events(
+    request: Request,
+    job_id: int,
+    last_event_id: Optional[str] = Header(default=None, alias="Last-Event-ID"),
+):
+    """Stream status updates for a single generation job as Server-Sent Events.
+
+    The stream ends after the job reports ``completed``, ``failed`` or
+    ``cancelled``. Reconnecting with ``Last-Event-ID`` replays missed updates.
+
+    Example:
+        curl -N http://localhost:8001/sse/jobs/123
+    """
+    return _streaming_response(request, [job_id], last_event_id)
+
+
+@router.get("/jobs")
+async def multi_job_status_events(
+    request: Request,
+    job_ids: str = Query(..., description="Comma-separated list of job IDs to monitor"),
+    last_event_id: Optional[str] = Header(default=None, alias="Last-Event-ID"),
+):
+    """Stream status updates for several generation jobs as Server-Sent Events.
+
+    Example:
+        curl -N "http://localhost:8001/sse/jobs?job_ids=123,456,789"
+    """
+    try:
+        ids = list(dict.fromkeys(int(id.strip()) for id in job_ids.split(",") if id.strip()))
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="job_ids must be integers")
+
+    if not ids:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="No valid job IDs provided")
+    if len(ids) > MAX_JOBS_PER_STREAM:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"At most {MAX_JOBS_PER_STREAM} job IDs can be streamed at once",
+        )
+
+    return _streaming_response(request, ids, last_event_id)
@@ -1,23 +1,28 @@
 """System API routes for health checks and database information."""
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from datetime import datetime
+from typing import Any, Dict, Optional
 
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 from genonaut.api.dependencies import get_database_session
-from genonaut.api.config import get_settings
+from genonaut.api.config import config_load_count, get_settings, reload_settings
 from genonaut.api.models.responses import (
     HealthResponse,
     DatabaseInfoResponse,
     GlobalStatsResponse,
+    SettingsReloadResponse,
+    SqlProfileResponse,
 )
 from genonaut.api.services.user_service import UserService
 from genonaut.api.services.content_service import ContentService
 from genonaut.api.services.interaction_service import InteractionService
 from genonaut.api.services.recommendation_service import RecommendationService
 from genonaut.api.services.generation_service import GenerationService
+from genonaut.api.middleware.query_profiler import profiler_settings
+from genonaut.api.utils.query_profiler import recent_profiles
 
 router = APIRouter(prefix="/api/v1", tags=["system"])
 
@@ -66,6 +71,71 @@ async def get_database_info():
     )
 
 
+@router.post("/admin/settings/reload", response_model=SettingsReloadResponse)
+async def reload_api_settings():
+    """Reload configuration files and environment into a new settings snapshot for this worker process."""
+    try:
+        settings = reload_settings()
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to reload settings: {str(e)}"
+        )
+
+    return SettingsReloadResponse(
+        env_target=settings.env_target,
+        config_loads=config_load_count(),
+        reloaded_at=datetime.utcnow(),
+    )
+
+
+@router.get("/admin/sql-profile", response_model=SqlProfileResponse)
+async def get_sql_profile(
+    limit: int = Query(50, ge=1, le=1000, description="Maximum profiles to return"),
+    path: Optional[str] = Query(None, description="Only requests whose path starts with this"),
+    n_plus_one_only: bool = Query(False, description="Only requests with a repeated statement fingerprint"),
+):
+    """SQL profiles of this worker's most recent API requests (requires sql-profiler.enabled)."""
+    config = profiler_settings()
+    threshold = config["n_plus_one_threshold"]
+
+    profiles = []
+    repeated: Dict[str, Dict[str, Any]] = {}
+    for profile in recent_profiles():
+        if path and not profile.path.startswith(path):
+            continue
+        entry = profile.to_dict(threshold)
+        if n_plus_one_only and not entry["n_plus_one"]:
+            continue
+        for stats in entry["repeated"]:
+            summary = repeated.setdefault(stats["fingerprint"], {
+                "fingerprint": stats["fingerprint"],
+                "requests": 0,
+                "executions": 0,
+                "total_ms": 0.0,
+                "routes": set(),
+            })
+            summary["requests"] += 1
+            summary["executions"] += stats["count"]
+            summary["total_ms"] += stats["total_ms"]
+            summary["routes"].add(f"{profile.method} {profile.path}")
+        profiles.append(entry)
+        if len(profiles) >= limit:
+            break
+
+    n_plus_one_statements = sorted(repeated.values(), key=lambda item: (-item["requests"], -item["executions"]))
+    for item in n_plus_one_statements:
+        item["routes"] = sorted(item["routes"])
+        item["total_ms"] = round(item["total_ms"], 2)
+
+    return SqlProfileResponse(
+        enabled=config["enabled"],
+        n_plus_one_threshold=threshold,
+        profiles=profiles,
+        n_plus_one_statements=n_plus_one_statements,
+    )
+
+
 @router.get("/stats/global", response_model=GlobalStatsResponse)
 async def get_global_stats(db: Session = Depends(get_database_session)):
     """Get global system statistics."""
@@ -1,11 +1,13 @@
 """Tag API routes - database-backed tag management."""
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import Response
 from typing import Optional, List, Tuple, Dict, Any
 from uuid import UUID
 from sqlalchemy.orm import Session
 
-from genonaut.api.dependencies import get_database_session
+from genonaut.api.dependencies import ReadSession, get_database_session, get_read_session
+from genonaut.api.services.response_cache import cached_response
 from genonaut.api.services.tag_service import TagService
 from genonaut.api.models.requests import PaginationRequest
 from genonaut.api.models.responses import (
@@ -102,7 +104,9 @@ def _build_relation_response(pairs: List[Tuple[Tag, int]]) -> List[TagRelationRe
 @router.get("/hierarchy", response_model=TagHierarchyResponse)
 async def get_tag_hierarchy(
     include_ratings: bool = Query(False, description="Include average ratings for each tag"),
-    service: TagService = Depends(get_tag_service)
+    # Pre-rendered by the cache warmer; resolved before the read session is set up
+    cached: Optional[Response] = Depends(cached_response),
+    reader: ReadSession = Depends(get_read_session)
 ):
     """Get the complete tag hierarchy from database.
 
@@ -111,7 +115,8 @@ async def get_tag_hierarchy(
 
     Args:
         include_ratings: Whether to include average ratings for tags
-        service: Tag service instance
+        cached: Page from the response cache, if it was warmed
+        reader: Read session the service runs on
 
     Returns:
         dict: Complete hierarchy with nodes and metadata
@@ -119,8 +124,13 @@ async def get_tag_hierarchy(
     Raises:
         HTTPException: If hierarchy data cannot be loaded
     """
+    if cached is not None:
+        return cached
+
     try:
-        hierarchy = service.get_full_hierarchy(include_ratings=include_ratings)
+        hierarchy = await reader.run(
+            lambda session: TagService(session).get_full_hierarchy(include_ratings=include_ratings)
+        )
         return hierarchy
 
     except DatabaseError as e:
@@ -231,6 +241,36 @@ async def get_root_tags(service: TagService = Depends(get_tag_service)):
 
 # Tag CRUD Endpoints
 
+def _list_tags(
+    service: TagService,
+    page: int,
+    page_size: int,
+    sort: str,
+    search: Optional[str],
+    min_ratings: int,
+) -> TagListResponse:
+    pagination = PaginationRequest(page=page, page_size=page_size)
+
+    normalized_sort = (sort or "name-asc").lower()
+    if search:
+        result = service.search_tags(search, pagination)
+
+        if normalized_sort.startswith("rating") and result.items:
+            rating_map = service.repository.get_tags_with_ratings([tag.id for tag in result.items])
+            reverse = normalized_sort.endswith("desc")
+
+            def rating_key(tag: Tag) -> Tuple[float, int, str]:
+                avg, count = rating_map.get(tag.id, (0.0, 0))
+                return (float(avg or 0.0), int(count or 0), tag.name.lower())
+
+            sorted_items = sorted(result.items, key=rating_key, reverse=reverse)
+            result = PaginatedResponse(items=sorted_items, pagination=result.pagination)
+    else:
+        result = service.get_tags(pagination, sort=normalized_sort, min_ratings=min_ratings)
+
+    return _build_tag_list_response(service, result)
+
+
 @router.get("/", response_model=TagListResponse)
 async def list_tags(
     page: int = Query(1, ge=1, description="Page number"),
@@ -244,7 +284,7 @@ async def list_tags(
     ),
     search: Optional[str] = Query(None, description="Optional search query"),
     min_ratings: int = Query(1, ge=1, description="Minimum ratings when sorting by rating"),
-    service: TagService = Depends(get_tag_service)
+    reader: ReadSession = Depends(get_read_session)
 ):
     """Get all tags with pagination.
 
@@ -252,32 +292,15 @@ async def list_tags(
         page: Page number (1-indexed)
         page_size: Number of items per page
         sort: Sort field
-        service: Tag service instance
+        reader: Read session the service runs on
 
     Returns:
         PaginatedResponse: Paginated list of tags
     """
     try:
-        pagination = PaginationRequest(page=page, page_size=page_size)
-
-        normalized_sort = (sort or "name-asc").lower()
-        if search:
-            result = service.search_tags(search, pagination)
-
-            if normalized_sort.startswith("rating") and result.items:
-                rating_map = service.repository.get_tags_with_ratings([tag.id for tag in result.items])
-                reverse = normalized_sort.endswith("desc")
-
-                def rating_key(tag: Tag) -> Tuple[float, int, str]:
-                    avg, count = rating_map.get(tag.id, (0.0, 0))
-                    return (float(avg or 0.0), int(count or 0), tag.name.lower())
-
-                sorted_items = sorted(result.items, key=rating_key, reverse=reverse)
-                result = PaginatedResponse(items=sorted_items, pagination=result.pagination)
-        else:
-            result = service.get_tags(pagination, sort=normalized_sort, min_ratings=min_ratings)
-
-        return _build_tag_list_response(service, result)
+        return await reader.run(
+            lambda session: _list_tags(TagService(session), page, page_size, sort, search, min_ratings)
+        )
 
     except Exception as e:
         raise HTTPException(
@@ -299,7 +322,7 @@ async def search_tags(
         ),
     ),
     min_ratings: int = Query(1, ge=1, description="Minimum ratings when sorting by rating"),
-    service: TagService = Depends(get_tag_service)
+    reader: ReadSession = Depends(get_read_session)
 ):
     """Search tags by name.
 
@@ -307,19 +330,14 @@ async def search_tags(
         q: Search query string
         page: Page number
         page_size: Items per page
-        service: Tag service instance
+        reader: Read session the service runs on
 
     Returns:
         PaginatedResponse: Matching tags
     """
     try:
-        return await list_tags(
-            page=page,
-            page_size=page_size,
-            sort=sort,
-            search=q,
-            min_ratings=min_ratings,
-            service=service,
+        return await reader.run(
+            lambda session: _list_tags(TagService(session), page, page_size, sort, q, min_ratings)
         )
 
     except Exception as e:
@@ -1,39 +1,77 @@
 """WebSocket endpoints for real-time job status updates.
 
 This module provides WebSocket endpoints that clients can connect to for
-receiving real-time updates about generation job progress.
+receiving real-time updates about generation job progress. All connections in
+a process share a single Redis subscription through the job status hub.
 """
 
 import json
 import logging
 import asyncio
-from typing import Any, Optional
+from typing import Any, Dict, Iterable
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Query
 
-try:
-    import redis.asyncio as aioredis  # type: ignore
-except ImportError:  # pragma: no cover - optional dependency for real-time features
-    aioredis = None  # type: ignore
-
-from genonaut.api.config import get_settings
-from genonaut.worker.pubsub import get_job_channel
+from genonaut.api.services.job_status_hub import JobStatusSubscription, get_job_status_hub
 
 logger = logging.getLogger(__name__)
-settings = get_settings()
 
 router = APIRouter(prefix="/ws", tags=["websocket"])
 
 
-async def get_async_redis_client() -> Any:
-    """Get an async Redis client instance.
+async def _relay_updates(websocket: WebSocket, subscription: JobStatusSubscription) -> None:
+    """Forward queued job updates to the WebSocket until cancelled or the send fails."""
+    while True:
+        job_id, data = await subscription.get()
+        logger.debug(f"Relaying update for job {job_id}: {data}")
+        try:
+            await websocket.send_text(data)
+        except Exception as e:
+            logger.error(f"Failed to send WebSocket message: {e}")
+            break
+
 
-    Returns:
-        Async Redis client configured with the current environment's URL
+async def _serve_subscription(
+    websocket: WebSocket,
+    job_ids: Iterable[int],
+    confirmation: Dict[str, Any],
+    label: str,
+) -> None:
+    """Relay hub updates for ``job_ids`` and answer client pings until disconnect.
+
+    The subscription is registered before ``confirmation`` is sent, so any
+    update published after the client sees it is delivered.
     """
-    if aioredis is None:
-        raise RuntimeError("redis package with asyncio support is required for WebSocket pubsub functionality.")
+    hub = get_job_status_hub()
+    subscription = await hub.subscribe(job_ids)
+    relay_task = None
+
+    try:
+        await websocket.send_json(confirmation)
+        relay_task = asyncio.create_task(_relay_updates(websocket, subscription))
+
+        while True:
+            # Wait for client messages (currently we just use this to detect disconnection)
+            data = await websocket.receive_text()
+            logger.debug(f"Received client message for {label}: {data}")
 
-    return await aioredis.from_url(settings.redis_url, decode_responses=True)
+            try:
+                client_msg = json.loads(data)
+                if isinstance(client_msg, dict) and client_msg.get("type") == "ping":
+                    await websocket.send_json({"type": "pong"})
+            except json.JSONDecodeError:
+                pass  # Ignore malformed messages
+
+    except WebSocketDisconnect:
+        logger.info(f"WebSocket client disconnected for {label}")
+
+    finally:
+        if relay_task is not None:
+            relay_task.cancel()
+            try:
+                await relay_task
+            except asyncio.CancelledError:
+                pass
+        hub.unsubscribe(subscription)
 
 
 @router.websocket("/jobs/{job_id}")
@@ -70,98 +108,17 @@ async def job_status_websocket(
     await websocket.accept()
     logger.info(f"WebSocket client connected for job {job_id}")
 
-    redis_client: Optional[Any] = None
-    pubsub: Optional[Any] = None
-
     try:
-        # Connect to Redis and subscribe to job channel
-        redis_client = await get_async_redis_client()
-        pubsub = redis_client.pubsub()
-        channel = get_job_channel(job_id)
-
-        await pubsub.subscribe(channel)
-        logger.info(f"Subscribed to Redis channel: {channel}")
-
-        # Send initial connection confirmation
-        await websocket.send_json({
+        confirmation = {
             "type": "connection",
             "job_id": job_id,
             "status": "connected"
-        })
-
-        # Listen for Redis pub/sub messages and relay to WebSocket
-        async def redis_listener():
-            """Background task to listen for Redis messages."""
-            try:
-                async for message in pubsub.listen():
-                    if message['type'] == 'message':
-                        data = message['data']
-                        logger.debug(f"Received Redis message for job {job_id}: {data}")
-
-                        # Parse and relay the message
-                        try:
-                            if isinstance(data, str):
-                                payload = json.loads(data)
-                            else:
-                                payload = data
-
-                            await websocket.send_json(payload)
-                        except json.JSONDecodeError as e:
-                            logger.error(f"Failed to parse Redis message: {e}")
-                        except Exception as e:
-                            logger.error(f"Failed to send WebSocket message: {e}")
-                            break
-            except asyncio.CancelledError:
-                logger.info(f"Redis listener cancelled for job {job_id}")
-                raise
-            except Exception as e:
-                logger.error(f"Error in Redis listener for job {job_id}: {e}", exc_info=True)
-
-        # Start the Redis listener task
-        listener_task = asyncio.create_task(redis_listener())
-
-        try:
-            # Keep connection alive and handle client messages (if any)
-            while True:
-                # Wait for client messages (currently we just use this to detect disconnection)
-                data = await websocket.receive_text()
-                logger.debug(f"Received client message for job {job_id}: {data}")
-
-                # Optionally handle client commands here (e.g., unsubscribe, ping)
-                try:
-                    client_msg = json.loads(data)
-                    if client_msg.get("type") == "ping":
-                        await websocket.send_json({"type": "pong"})
-                except json.JSONDecodeError:
-                    pass  # Ignore malformed messages
-
-        except WebSocketDisconnect:
-            logger.info(f"WebSocket client disconnected for job {job_id}")
-            listener_task.cancel()
-            try:
-                await listener_task
-            except asyncio.CancelledError:
-                pass
+        }
+        await _serve_subscription(websocket, [job_id], confirmation, f"job {job_id}")
 
     except Exception as e:
         logger.error(f"Error in WebSocket connection for job {job_id}: {e}", exc_info=True)
 
-    finally:
-        # Clean up Redis subscription
-        if pubsub:
-            try:
-                await pubsub.unsubscribe()
-                await pubsub.close()
-                logger.info(f"Unsubscribed from Redis channel for job {job_id}")
-            except Exception as e:
-                logger.error(f"Error unsubscribing from Redis: {e}")
-
-        if redis_client:
-            try:
-                await redis_client.close()
-            except Exception as e:
-                logger.error(f"Error closing Redis client: {e}")
-
 
 @router.websocket("/jobs")
 async def multi_job_status_websocket(
@@ -189,76 +146,12 @@ async def multi_job_status_websocket(
             await websocket.close()
             return
 
-        # Connect to Redis and subscribe to multiple channels
-        redis_client = await get_async_redis_client()
-        pubsub = redis_client.pubsub()
-
-        channels = [get_job_channel(job_id) for job_id in ids]
-        await pubsub.subscribe(*channels)
-        logger.info(f"Subscribed to {len(channels)} Redis channels")
-
-        # Send connection confirmation
-        await websocket.send_json({
+        confirmation = {
             "type": "connection",
             "job_ids": ids,
             "status": "connected"
-        })
-
-        # Listen for messages
-        async def redis_listener():
-            """Background task to listen for Redis messages."""
-            try:
-                async for message in pubsub.listen():
-                    if message['type'] == 'message':
-                        data = message['data']
-                        try:
-                            if isinstance(data, str):
-                                payload = json.loads(data)
-                            else:
-                                payload = data
-                            await websocket.send_json(payload)
-                        except Exception as e:
-                            logger.error(f"Failed to relay message: {e}")
-            except asyncio.CancelledError:
-                raise
-            except Exception as e:
-                logger.error(f"Error in multi-job Redis listener: {e}", exc_info=True)
-
-        listener_task = asyncio.create_task(redis_listener())
-
-        try:
-            while True:
-                data = await websocket.receive_text()
-                logger.debug(f"Received client message: {data}")
-
-                try:
-                    client_msg = json.loads(data)
-                    if client_msg.get("type") == "ping":
-                        await websocket.send_json({"type": "pong"})
-                except json.JSONDecodeError:
-                    pass
-
-        except WebSocketDisconnect:
-            logger.info(f"Multi-job WebSocket client disconnected")
-            listener_task.cancel()
-            try:
-                await listener_task
-            except asyncio.CancelledError:
-                pass
+        }
+        await _serve_subscription(websocket, ids, confirmation, f"jobs {ids}")
 
     except Exception as e:
         logger.error(f"Error in multi-job WebSocket: {e}", exc_info=True)
-
-    finally:
-        if 'pubsub' in locals():
-            try:
-                await pubsub.unsubscribe()
-                await pubsub.close()
-            except Exception as e:
-                logger.error(f"Error unsubscribing: {e}")
-
-        if 'redis_client' in locals():
-            try:
-                await redis_client.close()
-            except Exception as e:
-                logger.error(f"Error closing Redis client: {e}")
@@ -0,0 +1,295 @@
+"""Pre-populate the response cache from route analytics (``cache-planning`` config).
+
+The warmer picks the ``top-n-routes`` most requested (route, normalized params)
+patterns of the cacheable routes from ``route_analytics_hourly``, and for each
+one renders the first ``pages-to-cache-per-route`` pages through the same
+service calls the routes make, storing the JSON in the
+:class:`~genonaut.api.services.response_cache.ResponseCache`. It runs as the
+``warm_response_cache`` Celery beat task; ``genonaut.cli.cache_warmer`` shows
+the plan and the projected hit rate without writing anything.
+
+Normalized params come from the route analytics middleware, which drops
+``page``, ``offset``, ``limit`` and ``cursor``; the warmer adds ``page`` back
+for each warmed page. Cursor requests are never served from the cache.
+"""
+
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.orm import Session
+
+from genonaut.api.config import get_settings
+from genonaut.api.services.response_cache import CACHE_HIT, CACHE_MISS, UNIFIED_CONTENT_ROUTE, ResponseCache
+from genonaut.api.utils.json_response import dumps
+
+logger = logging.getLogger(__name__)
+
+TAG_HIERARCHY_ROUTE = "/api/v1/tags/hierarchy"
+
+
+def _first(params: Mapping[str, Any], key: str, default: Any = None) -> Any:
+    value = params.get(key, default)
+    if isinstance(value, list):
+        return value[0] if value else default
+    return value
+
+
+def _as_list(params: Mapping[str, Any], key: str) -> Optional[List[str]]:
+    value = params.get(key)
+    if value is None:
+        return None
+    return [str(item) for item in value] if isinstance(value, list) else [str(value)]
+
+
+def _as_bool(value: Any) -> bool:
+    return str(value).lower() in {"1", "true", "yes", "on"}
+
+
+def unified_query_kwargs(params: Mapping[str, Any]) -> Dict[str, Any]:
+    """``get_unified_content_paginated`` kwargs for recorded ``/unified`` query params.
+
+    Raises:
+        HTTPException: For params the route would reject
+    """
+    from genonaut.api.routes.content import unified_content_query
+
+    user_id = _first(params, "user_id")
+    return unified_content_query(
+        page=int(_first(params, "page", 1)),
+        page_size=int(_first(params, "page_size", 10)),
+        backward=_as_bool(_first(params, "backward", False)),
+        content_types=_first(params, "content_types"),
+        creator_filter=_first(params, "creator_filter", "all"),
+        content_source_types=_as_list(params, "content_source_types"),
+        user_id=UUID(user_id) if user_id else None,
+        search_term=_first(params, "search_term"),
+        sort_field=_first(params, "sort_field", "created_at"),
+        sort_order=_first(params, "sort_order", "desc"),
+        tag=_as_list(params, "tag"),
+        tag_names=_as_list(params, "tag_names"),
+        tag_match=_first(params, "tag_match", "any"),
+        include_stats=_as_bool(_first(params, "include_stats", False)),
+    )
+
+
+def _render_unified_content(session: Session, params: Mapping[str, Any]) -> Any:
+    from genonaut.api.services.content_service import ContentService
+
+    return ContentService(session).get_unified_content_paginated(**unified_query_kwargs(params))
+
+
+def _render_tag_hierarchy(session: Session, params: Mapping[str, Any]) -> Any:
+    from genonaut.api.models.responses import TagHierarchyResponse
+    from genonaut.api.services.tag_service import TagService
+
+    hierarchy = TagService(session).get_full_hierarchy(
+        include_ratings=_as_bool(_first(params, "include_ratings", False))
+    )
+    # Same shape FastAPI produces through the route's response_model
+    return TagHierarchyResponse.model_validate(hierarchy).model_dump(mode="json", by_alias=True)
+
+
+# Routes that read the response cache, with the service call that renders them
+RENDERERS: Dict[str, Callable[[Session, Mapping[str, Any]], Any]] = {
+    UNIFIED_CONTENT_ROUTE: _render_unified_content,
+    TAG_HIERARCHY_ROUTE: _render_tag_hierarchy,
+}
+
+
+@dataclass
+class WarmTarget:
+    """A (route, normalized params) pattern selected for warming."""
+
+    route: str
+    params: Dict[str, Any]
+    requests: int
+    p95_ms: Optional[float] = None
+
+    def pages(self, count: int) -> List[Dict[str, Any]]:
+        """Query params of the first ``count`` pages (page 1 without a ``page`` param)."""
+        base = {key: value for key, value in self.params.items() if key not in {"page", "cursor"}}
+        return [base] + [dict(base, page=str(page)) for page in range(2, count + 1)]
+
+
+@dataclass
+class WarmReport:
+    """Outcome of a warming run."""
+
+    targets: List[WarmTarget] = field(default_factory=list)
+    warmed: int = 0
+    failed: int = 0
+    bytes_written: int = 0
+    duration_ms: float = 0.0
+    dry_run: bool = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "targets": len(self.targets),
+            "pages_warmed": self.warmed,
+            "pages_failed": self.failed,
+            "bytes_written": self.bytes_written,
+            "duration_ms": round(self.duration_ms, 1),
+            "dry_run": self.dry_run,
+        }
+
+
+def params_key(params: Optional[Mapping[str, Any]]) -> str:
+    """Stable identity of a normalized params dict."""
+    return json.dumps(params or {}, sort_keys=True, separators=(",", ":"))
+
+
+def projected_hit_rate(
+    targets: Sequence[WarmTarget],
+    request_counts: Sequence[Tuple[str, Optional[Mapping[str, Any]], Optional[str], bool, int]],
+    pages: int,
+) -> Tuple[int, int]:
+    """Count past requests that the warmed entries would have served.
+
+    Args:
+        targets: Patterns that would be warmed
+        request_counts: ``(route, normalized params, page, has_cursor, requests)`` rows
+            for the cacheable routes
+        pages: Pages warmed per pattern
+
+    Returns:
+        ``(hits, total)`` request counts
+    """
+    warmed = {(target.route, params_key(target.params)) for target in targets}
+    hits = total = 0
+    for route, params, page, has_cursor, requests in request_counts:
+        total += requests
+        if has_cursor or (route, params_key(params)) not in warmed:
+            continue
+        try:
+            page_number = int(page) if page else 1
+        except (TypeError, ValueError):
+            continue
+        if page_number <= pages:
+            hits += requests
+    return hits, total
+
+
+class CacheWarmer:
+    """Select warm targets from route analytics and render them into the response cache.
+
+    Args:
+        session: Sync database session (analytics queries and rendering)
+        cache: Response cache to fill; may be None for dry runs
+        top_n: Patterns to warm (default ``cache-planning.top-n-routes``)
+        pages: Pages per pattern (default ``cache-planning.pages-to-cache-per-route``)
+        lookback_days: Analytics window (default ``cache-planning.lookback-days``)
+    """
+
+    def __init__(
+        self,
+        session: Session,
+        cache: Optional[ResponseCache] = None,
+        top_n: Optional[int] = None,
+        pages: Optional[int] = None,
+        lookback_days: Optional[int] = None,
+    ):
+        planning = get_settings().cache_planning or {}
+        self.session = session
+        self.cache = cache
+        self.top_n = top_n if top_n is not None else int(planning.get("top_n_routes", 20))
+        self.pages = pages if pages is not None else int(planning.get("pages_to_cache_per_route", 1))
+        self.lookback_days = lookback_days if lookback_days is not None else int(planning.get("lookback_days", 7))
+
+    def select_targets(self) -> List[WarmTarget]:
+        """Top-N successful GET patterns of the cacheable routes by request volume."""
+        query = text("""
+            SELECT
+                route,
+                query_params_normalized,
+                SUM(total_requests) AS requests,
+                AVG(p95_duration_ms) AS p95_ms
+            FROM route_analytics_hourly
+            WHERE timestamp > NOW() - INTERVAL '1 day' * :lookback_days
+                AND method = 'GET'
+                AND route IN :routes
+            GROUP BY route, query_params_normalized
+            HAVING SUM(successful_requests) > 0
+            ORDER BY SUM(total_requests) DESC
+            LIMIT :limit
+        """).bindparams(bindparam("routes", expanding=True))
+        rows = self.session.execute(query, {
+            "lookback_days": self.lookback_days,
+            "routes": list(RENDERERS),
+            "limit": self.top_n,
+        })
+        return [
+            WarmTarget(
+                route=row.route,
+                params=dict(row.query_params_normalized or {}),
+                requests=int(row.requests),
+                p95_ms=float(row.p95_ms) if row.p95_ms is not None else None,
+            )
+            for row in rows
+        ]
+
+    def warm(self, dry_run: bool = False) -> WarmReport:
+        """Render every selected page into the cache (or only select targets when ``dry_run``)."""
+        started = time.perf_counter()
+        report = WarmReport(targets=self.select_targets(), dry_run=dry_run)
+        if dry_run or self.cache is None:
+            report.dry_run = True
+            report.duration_ms = (time.perf_counter() - started) * 1000
+            return report
+
+        for target in report.targets:
+            render = RENDERERS[target.route]
+            for params in target.pages(self.pages):
+                try:
+                    body = dumps(render(self.session, params))
+                    self.cache.set(target.route, params, body)
+                    report.warmed += 1
+                    report.bytes_written += len(body)
+                except Exception as e:
+                    self.session.rollback()
+                    report.failed += 1
+                    logger.warning(f"Failed to warm {target.route} {params}: {e}")
+        report.duration_ms = (time.perf_counter() - started) * 1000
+        return report
+
+    def request_counts(self) -> List[Tuple[str, Optional[Dict[str, Any]], Optional[str], bool, int]]:
+        """Per-page request counts of the cacheable routes over the lookback window."""
+        query = text("""
+            SELECT
+                route,
+                query_params_normalized,
+                query_params->>'page' AS page,
+                (query_params->>'cursor') IS NOT NULL AS has_cursor,
+                COUNT(*) AS requests
+            FROM route_analytics
+            WHERE timestamp > NOW() - INTERVAL '1 day' * :lookback_days
+                AND method = 'GET'
+                AND route IN :routes
+            GROUP BY 1, 2, 3, 4
+        """).bindparams(bindparam("routes", expanding=True))
+        rows = self.session.execute(query, {"lookback_days": self.lookback_days, "routes": list(RENDERERS)})
+        return [
+            (row.route, row.query_params_normalized, row.page, bool(row.has_cursor), int(row.requests))
+            for row in rows
+        ]
+
+    def observed_hit_rate(self, hours: int = 1) -> Dict[str, Any]:
+        """Hit rate recorded in ``route_analytics.cache_status`` over the last ``hours``."""
+        row = self.session.execute(text("""
+            SELECT
+                COUNT(*) FILTER (WHERE cache_status = :hit) AS hits,
+                COUNT(*) FILTER (WHERE cache_status = :miss) AS misses
+            FROM route_analytics
+            WHERE timestamp > NOW() - INTERVAL '1 hour' * :hours
+        """), {"hit": CACHE_HIT, "miss": CACHE_MISS, "hours": hours}).one()
+        lookups = row.hits + row.misses
+        return {
+            "hits": row.hits,
+            "misses": row.misses,
+            "hit_rate": round(row.hits / lookups, 4) if lookups else None,
+            "hours": hours,
+        }
@@ -1,18 +1,23 @@
 """ComfyUI client for workflow submission and management."""
 
+import asyncio
 import json
 import logging
+import threading
 import time
 import uuid
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException, ConnectionError, Timeout
 
 from genonaut.api.config import get_settings, Settings, get_cached_settings
 from genonaut.api.exceptions import ValidationError
 from genonaut.api.services.cache_service import ComfyUICacheService
+from genonaut.api.services.retry_service import CircuitBreaker, CircuitOpenError, get_retry_service
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +32,72 @@ class ComfyUIWorkflowError(Exception):
     pass
 
 
+class ComfyUICircuitOpenError(ComfyUIConnectionError, CircuitOpenError):
+    """Exception raised when calls to a ComfyUI backend are short-circuited."""
+    pass
+
+
+def _parse_available_models(object_info: Dict[str, Any]) -> Dict[str, List[str]]:
+    """Extract checkpoint and LoRA names from a ComfyUI ``/object_info`` payload."""
+    models = {}
+
+    # Extract checkpoint models
+    if "CheckpointLoaderSimple" in object_info:
+        checkpoint_info = object_info["CheckpointLoaderSimple"]["input"]["required"]
+        if "ckpt_name" in checkpoint_info:
+            models["checkpoints"] = checkpoint_info["ckpt_name"][0]
+
+    # Extract LoRA models
+    if "LoraLoader" in object_info:
+        lora_info = object_info["LoraLoader"]["input"]["required"]
+        if "lora_name" in lora_info:
+            models["loras"] = lora_info["lora_name"][0]
+
+    return models
+
+
+def _parse_queue_status(queue_data: Dict[str, Any], prompt_id: str, history_url: str) -> Dict[str, Any]:
+    """Build a status payload for a prompt that is not yet in ComfyUI history."""
+    # Check if prompt is in queue
+    for item in queue_data.get("queue_running", []) + queue_data.get("queue_pending", []):
+        if item[1] == prompt_id:
+            return {
+                "status": "running" if item in queue_data.get("queue_running", []) else "queued",
+                "prompt_id": prompt_id,
+                "history_url": history_url,
+                "raw_history": None  # No history data yet for queued/running
+            }
+
+    return {
+        "status": "unknown",
+        "prompt_id": prompt_id,
+        "history_url": history_url,
+        "raw_history": None
+    }
+
+
+def _parse_history_status(workflow_history: Dict[str, Any], prompt_id: str, history_url: str) -> Dict[str, Any]:
+    """Build a status payload for a prompt found in ComfyUI history."""
+    status = workflow_history.get("status", {})
+
+    if status.get("completed", False):
+        return {
+            "status": "completed",
+            "prompt_id": prompt_id,
+            "outputs": workflow_history.get("outputs", {}),
+            "messages": status.get("messages", []),
+            "history_url": history_url,
+            "raw_history": workflow_history  # Complete data from the prompt_id key
+        }
+    return {
+        "status": "failed",
+        "prompt_id": prompt_id,
+        "messages": status.get("messages", []),
+        "history_url": history_url,
+        "raw_history": workflow_history  # Complete data even for failed workflows
+    }
+
+
 class ComfyUIClient:
     """Client for interacting with ComfyUI API.
 
@@ -67,6 +138,10 @@ class ComfyUIClient:
         self.timeout = self.settings.comfyui_timeout
         self.poll_interval = self.settings.comfyui_poll_interval
         self.session = requests.Session()
+        # Keep enough pooled keep-alive connections for concurrent polling
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.settings.comfyui_max_connections)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
         self.cache_service = ComfyUICacheService()
 
     def health_check(self) -> bool:
@@ -208,46 +283,10 @@ class ComfyUIClient:
                     timeout=self.timeout
                 )
                 queue_response.raise_for_status()
-                queue_data = queue_response.json()
-
-                # Check if prompt is in queue
-                for item in queue_data.get("queue_running", []) + queue_data.get("queue_pending", []):
-                    if item[1] == prompt_id:
-                        return {
-                            "status": "running" if item in queue_data.get("queue_running", []) else "queued",
-                            "prompt_id": prompt_id,
-                            "history_url": history_url,
-                            "raw_history": None  # No history data yet for queued/running
-                        }
-
-                return {
-                    "status": "unknown",
-                    "prompt_id": prompt_id,
-                    "history_url": history_url,
-                    "raw_history": None
-                }
+                return _parse_queue_status(queue_response.json(), prompt_id, history_url)
 
             # Workflow is in history - check if completed successfully
-            workflow_history = history[prompt_id]
-            status = workflow_history.get("status", {})
-
-            if status.get("completed", False):
-                return {
-                    "status": "completed",
-                    "prompt_id": prompt_id,
-                    "outputs": workflow_history.get("outputs", {}),
-                    "messages": status.get("messages", []),
-                    "history_url": history_url,
-                    "raw_history": workflow_history  # Complete data from the prompt_id key
-                }
-            else:
-                return {
-                    "status": "failed",
-                    "prompt_id": prompt_id,
-                    "messages": status.get("messages", []),
-                    "history_url": history_url,
-                    "raw_history": workflow_history  # Complete data even for failed workflows
-                }
+            return _parse_history_status(history[prompt_id], prompt_id, history_url)
 
         except RequestException as e:
             raise ComfyUIConnectionError(f"Failed to get workflow status: {str(e)}")
@@ -317,22 +356,7 @@ class ComfyUIClient:
             )
             response.raise_for_status()
 
-            object_info = response.json()
-            models = {}
-
-            # Extract checkpoint models
-            if "CheckpointLoaderSimple" in object_info:
-                checkpoint_info = object_info["CheckpointLoaderSimple"]["input"]["required"]
-                if "ckpt_name" in checkpoint_info:
-                    models["checkpoints"] = checkpoint_info["ckpt_name"][0]
-
-            # Extract LoRA models
-            if "LoraLoader" in object_info:
-                lora_info = object_info["LoraLoader"]["input"]["required"]
-                if "lora_name" in lora_info:
-                    models["loras"] = lora_info["lora_name"][0]
-
-            return models
+            return _parse_available_models(response.json())
 
         except RequestException as e:
             raise ComfyUIConnectionError(f"Failed to get available models: {str(e)}")
@@ -390,3 +414,256 @@ class ComfyUIClient:
             raise FileNotFoundError(f"ComfyUI output file not found: {target_path}")
 
         return target_path.read_bytes()
+
+
+class AsyncComfyUIClient:
+    """Async ComfyUI client for use from the API event loop.
+
+    Holds a keep-alive ``httpx`` connection pool for one backend URL, bounds
+    the number of in-flight requests, and routes calls through
+    :class:`RetryService` with a per-backend :class:`CircuitBreaker` so a dead
+    backend fails fast instead of tying up request handlers. Use
+    :func:`get_async_comfyui_client` to share one instance per backend.
+    """
+
+    def __init__(
+        self,
+        settings: Optional[Settings] = None,
+        backend_url: Optional[str] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
+        """Initialize async ComfyUI client.
+
+        Args:
+            settings: Optional settings instance. When ``None``, configuration
+                is loaded via :func:`get_settings`.
+            backend_url: Optional backend URL override.
+            transport: Optional httpx transport (used for testing).
+        """
+        self.settings = settings or get_cached_settings() or get_settings()
+        self.base_url = (backend_url or self.settings.comfyui_url).rstrip('/')
+        self.timeout = self.settings.comfyui_timeout
+        max_connections = self.settings.comfyui_max_connections
+        self.http = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=self.timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+                keepalive_expiry=30.0,
+            ),
+            transport=transport,
+        )
+        # Queue excess callers instead of failing with httpx pool timeouts
+        self.semaphore = asyncio.Semaphore(max_connections)
+        self.retry_service = get_retry_service()
+        self.retry_config = self.retry_service.create_config("comfyui_connection")
+        self.circuit_breaker: CircuitBreaker = self.retry_service.get_circuit_breaker(
+            f"comfyui:{self.base_url}",
+            failure_threshold=self.settings.comfyui_circuit_failure_threshold,
+            reset_timeout=self.settings.comfyui_circuit_reset_seconds,
+        )
+        self.cache_service = ComfyUICacheService()
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        *,
+        operation: str,
+        retry: bool = True,
+        **kwargs: Any
+    ) -> httpx.Response:
+        """Send a request through the circuit breaker, optionally with retries.
+
+        Raises:
+            ComfyUICircuitOpenError: If the backend's circuit is open
+            ComfyUIConnectionError: If the request fails at the transport level
+        """
+        async def attempt() -> httpx.Response:
+            if not self.circuit_breaker.allow_request():
+                raise ComfyUICircuitOpenError(
+                    f"ComfyUI at {self.base_url} is unavailable; "
+                    f"retry in {self.circuit_breaker.retry_after():.0f}s"
+                )
+
+            succeeded = False
+            try:
+                async with self.semaphore:
+                    response = await self.http.request(method, path, **kwargs)
+                succeeded = response.status_code < 500
+                return response
+            except httpx.TimeoutException as e:
+                raise ComfyUIConnectionError(f"Timeout connecting to ComfyUI: {str(e)}")
+            except httpx.HTTPError as e:
+                raise ComfyUIConnectionError(f"Failed to connect to ComfyUI at {self.base_url}: {str(e)}")
+            finally:
+                if succeeded:
+                    self.circuit_breaker.record_success()
+                else:
+                    self.circuit_breaker.record_failure()
+
+        if not retry:
+            return await attempt()
+        return await self.retry_service.retry_async(attempt, self.retry_config, operation)
+
+    async def health_check(self) -> bool:
+        """Check if ComfyUI server is accessible.
+
+        Returns:
+            True if server is accessible, False otherwise
+        """
+        cached_health = self.cache_service.get_comfyui_health()
+        if cached_health is not None:
+            return cached_health.get('is_healthy', False)
+
+        try:
+            response = await self._request("GET", "/system_stats", operation="comfyui_health_check", retry=False, timeout=5)
+            is_healthy = response.status_code == 200
+            health_status = {
+                'is_healthy': is_healthy,
+                'checked_at': time.time(),
+                'status_code': response.status_code if is_healthy else None
+            }
+        except ComfyUIConnectionError as e:
+            is_healthy = False
+            health_status = {
+                'is_healthy': False,
+                'checked_at': time.time(),
+                'error': str(e)
+            }
+
+        self.cache_service.set_comfyui_health(health_status)
+        return is_healthy
+
+    async def submit_workflow(self, workflow: Dict[str, Any], client_id: Optional[str] = None) -> str:
+        """Submit a workflow to ComfyUI for execution.
+
+        Args:
+            workflow: ComfyUI workflow dictionary
+            client_id: Optional client ID for tracking
+
+        Returns:
+            Prompt ID for tracking the workflow execution
+
+        Raises:
+            ComfyUIConnectionError: If unable to connect to ComfyUI
+            ComfyUIWorkflowError: If workflow submission fails
+            ValidationError: If workflow is invalid
+        """
+        if not workflow:
+            raise ValidationError("Workflow cannot be empty")
+
+        payload = {
+            "prompt": workflow,
+            "client_id": client_id or str(uuid.uuid4())
+        }
+        response = await self._request("POST", "/prompt", operation="comfyui_submit_workflow", json=payload)
+
+        if response.is_error:
+            try:
+                error_detail = response.json()
+            except ValueError:
+                raise ComfyUIWorkflowError(f"ComfyUI request failed: HTTP {response.status_code}")
+            raise ComfyUIWorkflowError(f"ComfyUI rejected workflow: {error_detail}")
+
+        result = response.json()
+        if "prompt_id" not in result:
+            raise ComfyUIWorkflowError(f"Invalid response from ComfyUI: {result}")
+        return result["prompt_id"]
+
+    async def get_workflow_status(self, prompt_id: str) -> Dict[str, Any]:
+        """Get the status of a workflow execution.
+
+        See :meth:`ComfyUIClient.get_workflow_status` for the payload format.
+
+        Raises:
+            ComfyUIConnectionError: If unable to connect to ComfyUI
+        """
+        history_url = f"{self.base_url}/history/{prompt_id}"
+        response = await self._request("GET", f"/history/{prompt_id}", operation="comfyui_workflow_status")
+        self._raise_for_status(response, "Failed to get workflow status")
+        history = response.json()
+
+        if prompt_id in history:
+            return _parse_history_status(history[prompt_id], prompt_id, history_url)
+
+        queue_response = await self._request("GET", "/queue", operation="comfyui_queue_status")
+        self._raise_for_status(queue_response, "Failed to get workflow status")
+        return _parse_queue_status(queue_response.json(), prompt_id, history_url)
+
+    async def cancel_workflow(self, prompt_id: str) -> bool:
+        """Cancel a running workflow.
+
+        Raises:
+            ComfyUIConnectionError: If unable to connect to ComfyUI
+        """
+        response = await self._request("POST", "/interrupt", operation="comfyui_cancel_workflow")
+        self._raise_for_status(response, "Failed to cancel workflow")
+        return True
+
+    async def get_available_models(self) -> Dict[str, List[str]]:
+        """Get list of available models from ComfyUI.
+
+        Returns:
+            Dictionary with model types as keys and lists of model names as values
+
+        Raises:
+            ComfyUIConnectionError: If unable to connect to ComfyUI
+        """
+        response = await self._request("GET", "/object_info", operation="comfyui_available_models")
+        self._raise_for_status(response, "Failed to get available models")
+        return _parse_available_models(response.json())
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool."""
+        await self.http.aclose()
+
+    @staticmethod
+    def _raise_for_status(response: httpx.Response, message: str) -> None:
+        if response.is_error:
+            raise ComfyUIConnectionError(f"{message}: HTTP {response.status_code}")
+
+
+# One async client (and connection pool) per event loop and backend URL
+_ASYNC_CLIENTS: Dict[Tuple[int, str], Tuple[asyncio.AbstractEventLoop, AsyncComfyUIClient]] = {}
+_ASYNC_CLIENTS_LOCK = threading.Lock()
+
+
+def get_async_comfyui_client(backend_url: Optional[str] = None) -> AsyncComfyUIClient:
+    """Get the shared async ComfyUI client for a backend.
+
+    Must be called from a running event loop; clients are not shared across
+    loops because their pooled connections are bound to the loop.
+
+    Args:
+        backend_url: Backend URL; defaults to the configured ``comfyui_url``
+
+    Returns:
+        Shared AsyncComfyUIClient instance
+    """
+    loop = asyncio.get_running_loop()
+    settings = get_cached_settings() or get_settings()
+    base_url = (backend_url or settings.comfyui_url).rstrip('/')
+    key = (id(loop), base_url)
+
+    with _ASYNC_CLIENTS_LOCK:
+        entry = _ASYNC_CLIENTS.get(key)
+        if entry is None or entry[0] is not loop:
+            # Drop clients left behind by closed loops (e.g. between test clients)
+            for stale_key, (stale_loop, _) in list(_ASYNC_CLIENTS.items()):
+                if stale_loop.is_closed():
+                    del _ASYNC_CLIENTS[stale_key]
+            entry = (loop, AsyncComfyUIClient(settings=settings, backend_url=base_url))
+            _ASYNC_CLIENTS[key] = entry
+        return entry[1]
+
+
+async def close_async_comfyui_clients() -> None:
+    """Close the shared async clients belonging to the running event loop."""
+    loop = asyncio.get_running_loop()
+    with _ASYNC_CLIENTS_LOCK:
+        owned = [key for key, (client_loop, _) in _ASYNC_CLIENTS.items() if client_loop is loop]
+        clients = [_ASYNC_CLIENTS.pop(key)[1] for key in owned]
+    for client in clients:
+        await client.aclose()
@@ -12,7 +12,7 @@ from genonaut.db.schema import GenerationJob
 from genonaut.api.repositories.generation_job_repository import GenerationJobRepository
 from genonaut.api.repositories.user_repository import UserRepository
 from genonaut.api.services.comfyui_client import (
-    ComfyUIClient, ComfyUIConnectionError, ComfyUIWorkflowError
+    ComfyUIClient, ComfyUIConnectionError, ComfyUIWorkflowError, get_async_comfyui_client
 )
 from genonaut.api.services.workflow_builder import WorkflowBuilder, GenerationRequest
 from genonaut.api.services.thumbnail_service import ThumbnailService
@@ -283,6 +283,9 @@ class ComfyUIGenerationService:
                         thumbnail_results = self.thumbnail_service.generate_thumbnail_for_generation(
                             organized_paths, generation_request.id
                         )
+                        self.file_storage_service.record_thumbnails(
+                            thumbnail_results, generation_request.user_id, generation_request.id
+                        )
                         logger.info(f"Generated thumbnails for generation {generation_request.id}: {len(thumbnail_results)} images")
                     except Exception as e:
                         logger.error(f"Failed to generate thumbnails for generation {generation_request.id}: {e}")
@@ -495,9 +498,20 @@ class ComfyUIGenerationService:
             }
         )
 
+    async def health_check(self) -> bool:
+        """Check whether ComfyUI is reachable without blocking the event loop.
+
+        Returns:
+            True if the server is accessible, False otherwise
+        """
+        return await get_async_comfyui_client(self.comfyui_client.base_url).health_check()
+
     def process_pending_requests(self, max_concurrent: int = 5) -> int:
         """Process pending generation requests.
 
+        Submits through the blocking client; call it from worker code or from
+        a threadpool (``run_in_threadpool``), never directly on the event loop.
+
         Args:
             max_concurrent: Maximum number of concurrent generations
 
@@ -560,8 +574,8 @@ class ComfyUIGenerationService:
         logger.info(f"Updated status for {updated_count} processing requests")
         return updated_count
 
-    def get_available_models(self) -> Dict[str, List[str]]:
-        """Get available models from ComfyUI.
+    async def get_available_models(self) -> Dict[str, List[str]]:
+        """Get available models from ComfyUI through the pooled async client.
 
         Returns:
             Dictionary with model types and available models
@@ -569,7 +583,7 @@ class ComfyUIGenerationService:
         Raises:
             ComfyUIConnectionError: If ComfyUI connection fails
         """
-        return self.comfyui_client.get_available_models()
+        return await get_async_comfyui_client(self.comfyui_client.base_url).get_available_models()
 
     def list_available_models(self, request: ComfyUIModelListRequest) -> AvailableModelListResponse:
         """List available models with filtering.
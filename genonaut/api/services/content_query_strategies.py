@@ -5,16 +5,25 @@ This module implements the Strategy Pattern to allow switching between different
 query execution approaches (ORM vs Raw SQL) for performance optimization.
 """
 
+import hashlib
+import re
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
 from sqlalchemy import text, or_, and_
+from sqlalchemy.engine import Result
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.orm import Session
+from sqlalchemy.sql.elements import TextClause
 
+from genonaut.api.config import get_settings
 from genonaut.db.schema import ContentItemAll, ContentTag, User
 from genonaut.api.models.requests import PaginationRequest
+from genonaut.api.utils.json_response import CONTENT_ROW_FIELDS
 
 
 class QueryStrategy(Enum):
@@ -209,14 +218,393 @@ class ORMQueryExecutor(ContentQueryExecutor):
         return items, total_count
 
 
+# Creator filter per content source type (only applied when a user_id is given)
+CREATOR_CONDITIONS = {
+    'user-regular': "(content_items_all.source_type = 'items' AND content_items_all.creator_id = :user_id)",
+    'user-auto': "(content_items_all.source_type = 'auto' AND content_items_all.creator_id = :user_id)",
+    'community-regular': "(content_items_all.source_type = 'items' AND content_items_all.creator_id != :user_id)",
+    'community-auto': "(content_items_all.source_type = 'auto' AND content_items_all.creator_id != :user_id)",
+}
+
+# content_source values of tag_cardinality_stats per content source type
+COUNT_SOURCES = {
+    'user-regular': 'regular',
+    'user-auto': 'auto',
+    'community-regular': 'regular',
+    'community-auto': 'auto',
+}
+
+# Columns of a unified content row, in CONTENT_ROW_FIELDS order. creator_username is
+# denormalized; the users lookup only runs for rows where it has not been filled in.
+CONTENT_ROW_SELECT = """
+            content_items_all.id,
+            content_items_all.title,
+            content_items_all.content_type,
+            content_items_all.content_data,
+            content_items_all.path_thumb,
+            content_items_all.path_thumbs_alt_res,
+            content_items_all.prompt,
+            content_items_all.creator_id,
+            content_items_all.item_metadata,
+            content_items_all.is_private,
+            content_items_all.quality_score,
+            content_items_all.created_at,
+            content_items_all.updated_at,
+            content_items_all.source_type,
+            COALESCE(
+                content_items_all.creator_username,
+                (SELECT users.username FROM users WHERE users.id = content_items_all.creator_id)
+            ) as creator_username"""
+
+# Session-level prepared statements (names) of a DBAPI connection, kept in Connection.info
+PREPARED_STATEMENTS_KEY = "genonaut_prepared_statements"
+DUPLICATE_PREPARED_STATEMENT = "42P05"
+UNDEFINED_PREPARED_STATEMENT = "26000"
+
+_BIND_PARAM = re.compile(r"(?<![:\w]):(\w+)")
+
+
+@dataclass(frozen=True)
+class QueryShape:
+    """Everything that determines the SQL text of a unified content query.
+
+    Two requests with the same shape differ only in bound values (user, tags,
+    search terms, page), so they share one compiled query and one prepared
+    statement per connection.
+    """
+
+    creator_filters: Tuple[str, ...]
+    phrase_count: int
+    word_count: int
+    tag_match: str
+    tag_count: int
+    unique_tag_count: int
+    count_sources: Tuple[str, ...]
+    sort_field: str
+    sort_order: str
+    paginated: bool
+    has_offset: bool
+
+
+@dataclass(frozen=True)
+class CompiledContentQuery:
+    """SQL of one query shape: the count query and the page query (as rows and as JSON)."""
+
+    count_sql: TextClause
+    count_from_stats: bool
+    page_sql: TextClause
+    json_sql: TextClause
+
+
+@dataclass(frozen=True)
+class PreparedQuery:
+    """``PREPARE`` / ``EXECUTE`` statements for one SQL text."""
+
+    name: str
+    prepare_sql: str
+    execute_sql: str
+    arg_names: Tuple[str, ...]
+
+
+def content_query_shape(
+    pagination: PaginationRequest,
+    content_source_types: List[str],
+    user_id: Optional[UUID],
+    tag_uuids: List[UUID],
+    tag_match: str,
+    search_term: Optional[str],
+    sort_field: str,
+    sort_order: str,
+) -> Tuple[QueryShape, Dict[str, Any]]:
+    """Split a unified content query into its shape and its bind params."""
+    params: Dict[str, Any] = {}
+
+    creator_filters: Tuple[str, ...] = ()
+    if user_id:
+        creator_filters = tuple(cst for cst in content_source_types if cst in CREATOR_CONDITIONS)
+        params["user_id"] = str(user_id)
+
+    phrases: List[str] = []
+    words: List[str] = []
+    if search_term:
+        from genonaut.api.services.search_parser import parse_search_query
+        parsed = parse_search_query(search_term)
+        phrases = [phrase for phrase in parsed.phrases if phrase]
+        words = [word for word in parsed.words if word]
+    for idx, phrase in enumerate(phrases):
+        params[f"search_phrase_{idx}"] = f"%{phrase}%"
+    for idx, word in enumerate(words):
+        params[f"search_word_{idx}"] = f"%{word}%"
+
+    tag_match_normalized = (tag_match or "any").lower()
+    if tag_match_normalized not in {"any", "all"}:
+        tag_match_normalized = "any"
+
+    unique_tags = list(dict.fromkeys(tag_uuids or []))
+    prefix = "tag_all_" if tag_match_normalized == "all" else "tag_any_"
+    for idx, tag_id in enumerate(unique_tags):
+        params[f"{prefix}{idx}"] = str(tag_id)
+
+    count_sources: Tuple[str, ...] = ()
+    if len(tag_uuids or []) == 1:
+        params["tag_id"] = tag_uuids[0]
+        if content_source_types and len(content_source_types) < 4:
+            count_sources = tuple(sorted({COUNT_SOURCES[t] for t in content_source_types if t in COUNT_SOURCES}))
+    elif len(tag_uuids or []) > 1:
+        for i, tag_id in enumerate(tag_uuids):
+            params[f"tag{i}"] = tag_id
+
+    offset_value = 0
+    if pagination.page and pagination.page_size:
+        offset_value = (pagination.page - 1) * pagination.page_size
+    params["page_size"] = pagination.page_size or 1000000
+    params["offset"] = offset_value
+
+    shape = QueryShape(
+        creator_filters=creator_filters,
+        phrase_count=len(phrases),
+        word_count=len(words),
+        tag_match=tag_match_normalized,
+        tag_count=len(tag_uuids or []),
+        unique_tag_count=len(unique_tags),
+        count_sources=count_sources,
+        sort_field=sort_field,
+        sort_order=sort_order,
+        paginated=bool(pagination.page_size),
+        has_offset=offset_value > 0,
+    )
+    return shape, params
+
+
+@lru_cache(maxsize=512)
+def compile_content_query(shape: QueryShape) -> CompiledContentQuery:
+    """Build the SQL of a query shape (cached, so each shape is assembled once per process)."""
+    conditions = []
+
+    # Creator filters (complex OR conditions)
+    if shape.creator_filters:
+        creator_conditions = [CREATOR_CONDITIONS[cst] for cst in shape.creator_filters]
+        conditions.append(f"({' OR '.join(creator_conditions)})")
+
+    # Search term filter
+    search_conditions = [
+        f"(content_items_all.title ILIKE :search_phrase_{idx} OR content_items_all.prompt ILIKE :search_phrase_{idx})"
+        for idx in range(shape.phrase_count)
+    ] + [
+        f"(content_items_all.title ILIKE :search_word_{idx} OR content_items_all.prompt ILIKE :search_word_{idx})"
+        for idx in range(shape.word_count)
+    ]
+    if search_conditions:
+        conditions.append(f"({' AND '.join(search_conditions)})")
+
+    # Conditions without tag filtering, for the multi-tag count (tags are handled by its CTE)
+    untagged_conditions = list(conditions)
+
+    # Tag filtering
+    if shape.unique_tag_count:
+        if shape.tag_match == "all":
+            # For "all": content must have ALL tags
+            for idx in range(shape.unique_tag_count):
+                conditions.append(f"""
+                    EXISTS (
+                        SELECT 1 FROM content_tags
+                        WHERE content_tags.content_id = content_items_all.id
+                        AND content_tags.content_source = content_items_all.source_type
+                        AND content_tags.tag_id = :tag_all_{idx}
+                    )
+                """)
+        else:
+            # For "any": content must have AT LEAST ONE tag
+            tag_placeholders = ', '.join(f":tag_any_{i}" for i in range(shape.unique_tag_count))
+            conditions.append(f"""
+                EXISTS (
+                    SELECT 1 FROM content_tags
+                    WHERE content_tags.content_id = content_items_all.id
+                    AND content_tags.content_source = content_items_all.source_type
+                    AND content_tags.tag_id IN ({tag_placeholders})
+                )
+            """)
+
+    # Build WHERE clause
+    where_clause = " AND ".join(conditions) if conditions else "1=1"
+
+    # Build ORDER BY clause
+    sort_direction = "DESC" if shape.sort_order == "desc" else "ASC"
+    order_by = f"content_items_all.{shape.sort_field} {sort_direction}, content_items_all.id {sort_direction}"
+
+    # Count query - use efficient strategy based on filters
+    if shape.tag_count == 1:
+        # For single-tag queries, use pre-computed tag_cardinality_stats (fast: ~2ms)
+        count_sql = """
+            SELECT COALESCE(SUM(cardinality), 0) as total
+            FROM tag_cardinality_stats
+            WHERE tag_id = :tag_id
+        """
+        # Filter by content_source if specific types requested
+        if shape.count_sources:
+            placeholders = ', '.join(f"'{source}'" for source in shape.count_sources)
+            count_sql += f" AND content_source IN ({placeholders})"
+    elif shape.tag_count > 1:
+        # Multiple tags: Use optimized CTE GROUP BY strategy (~2-3s vs 12s with EXISTS)
+        # Strategy: Find items in content_tags that have ALL specified tags
+        tag_placeholders = ', '.join(f":tag{i}" for i in range(shape.tag_count))
+        count_where_parts = [condition.replace('content_items_all', 'cia') for condition in untagged_conditions]
+        count_where_clause = " AND ".join(count_where_parts) if count_where_parts else "1=1"
+
+        count_sql = f"""
+            WITH tag_matches AS (
+                SELECT content_id, content_source
+                FROM content_tags
+                WHERE tag_id IN ({tag_placeholders})
+                GROUP BY content_id, content_source
+                HAVING COUNT(DISTINCT tag_id) = {shape.tag_count}
+            )
+            SELECT COUNT(*)
+            FROM tag_matches tm
+            INNER JOIN content_items_all cia
+                ON tm.content_id = cia.id
+                AND tm.content_source = cia.source_type
+            WHERE {count_where_clause}
+        """
+    else:
+        # No tag filters: run COUNT query (fast without tag EXISTS clause)
+        count_sql = f"""
+            SELECT COUNT(*)
+            FROM content_items_all
+            WHERE {where_clause}
+        """
+
+    # Main query with pagination
+    limit_clause = "LIMIT :page_size" if shape.paginated else ""
+    offset_clause = "OFFSET :offset" if shape.has_offset else ""
+
+
+    if shape.has_offset and not search_conditions:
+        # Deferred join: skip OFFSET rows on (id, source_type) only, which a covering
+        # index on the sort key can serve as an index-only scan, then fetch the wide
+        # columns for just the rows of the page
+        page_sql = f"""
+        SELECT{CONTENT_ROW_SELECT}
+        FROM (
+            SELECT content_items_all.id, content_items_all.source_type
+            FROM content_items_all
+            WHERE {where_clause}
+            ORDER BY {order_by}
+            {limit_clause} {offset_clause}
+        ) AS page_keys
+        JOIN content_items_all
+            ON content_items_all.id = page_keys.id
+            AND content_items_all.source_type = page_keys.source_type
+        ORDER BY {order_by}
+    """
+    else:
+        page_sql = f"""
+        SELECT{CONTENT_ROW_SELECT}
+        FROM content_items_all
+        WHERE {where_clause}
+        ORDER BY {order_by}
+        {limit_clause} {offset_clause}
+    """
+
+    # PostgreSQL encodes the page as a JSON array (content-json-in-db)
+    page_order = order_by.replace("content_items_all.", "page.")
+    fields = ", ".join(f"'{name}', page.{name}" for name in CONTENT_ROW_FIELDS)
+    json_sql = f"""
+        SELECT
+            COALESCE(json_agg(json_build_object({fields}) ORDER BY {page_order}), '[]')::text AS items,
+            count(*) AS item_count,
+            (array_agg(page.created_at ORDER BY {page_order}))[count(*)] AS last_created_at,
+            (array_agg(page.id ORDER BY {page_order}))[count(*)] AS last_id,
+            (array_agg(page.source_type ORDER BY {page_order}))[count(*)] AS last_source_type
+        FROM ({page_sql}) AS page
+    """
+
+    return CompiledContentQuery(
+        count_sql=text(count_sql),
+        count_from_stats=shape.tag_count == 1,
+        page_sql=text(page_sql),
+        json_sql=text(json_sql),
+    )
+
+
+@lru_cache(maxsize=1024)
+def prepared_query(sql: str) -> PreparedQuery:
+    """Rewrite ``:name`` binds of ``sql`` as a named server-side prepared statement."""
+    arg_names: List[str] = []
+
+    def positional(match: "re.Match[str]") -> str:
+        name = match.group(1)
+        if name not in arg_names:
+            arg_names.append(name)
+        return f"${arg_names.index(name) + 1}"
+
+    body = _BIND_PARAM.sub(positional, sql)
+    name = f"genonaut_{hashlib.sha1(sql.encode('utf-8')).hexdigest()[:16]}"
+    args = ", ".join(f"%({arg})s" for arg in arg_names)
+    return PreparedQuery(
+        name=name,
+        prepare_sql=f"PREPARE {name} AS {body}",
+        execute_sql=f"EXECUTE {name}({args})" if arg_names else f"EXECUTE {name}",
+        arg_names=tuple(arg_names),
+    )
+
+
+def execute_prepared(session: Session, clause: TextClause, params: Dict[str, Any], prepare: bool = True) -> Result:
+    """Execute ``clause`` as a server-side prepared statement on psycopg2 connections.
+
+    The statement is prepared once per pooled connection (tracked in
+    ``Connection.info``), so later executions skip parsing and, once PostgreSQL
+    settles on a generic plan, planning. Other drivers execute ``clause``
+    directly (asyncpg prepares and caches statements by itself).
+    """
+    if not prepare:
+        return session.execute(clause, params)
+
+    # Resolve the connection like session.execute would (read replicas included)
+    conn = session.connection(bind_arguments={"clause": clause})
+    if conn.dialect.driver != "psycopg2":
+        return session.execute(clause, params)
+
+    query = prepared_query(clause.text)
+    prepared = conn.info.setdefault(PREPARED_STATEMENTS_KEY, set())
+    if query.name not in prepared:
+        try:
+            # In a savepoint, so a failed PREPARE leaves the caller's transaction usable
+            with conn.begin_nested():
+                conn.exec_driver_sql(query.prepare_sql, execution_options={"no_parameters": True})
+        except DBAPIError as exc:
+            # Already prepared on this connection (PREPARE survives rollbacks): just execute it
+            if getattr(exc.orig, "pgcode", None) != DUPLICATE_PREPARED_STATEMENT:
+                raise
+        prepared.add(query.name)
+
+    try:
+        return conn.exec_driver_sql(query.execute_sql, {arg: params[arg] for arg in query.arg_names})
+    except DBAPIError as exc:
+        # Failed executions (timeouts, ...) keep the statement; only forget it if the server lost it
+        if getattr(exc.orig, "pgcode", None) == UNDEFINED_PREPARED_STATEMENT:
+            prepared.discard(query.name)
+        raise
+
+
 class RawSQLQueryExecutor(ContentQueryExecutor):
     """
     Raw SQL query executor for maximum performance.
 
     Bypasses SQLAlchemy ORM overhead by executing SQL directly.
     ~140x faster than ORM for complex queries with EXISTS subqueries.
+
+    SQL is assembled once per query shape (:func:`compile_content_query`) and,
+    on PostgreSQL via psycopg2, run as server-side prepared statements unless
+    ``content-query-prepared-statements`` is off.
+
+    Args:
+        prepare: Use prepared statements (default: ``content-query-prepared-statements``)
     """
 
+    def __init__(self, prepare: Optional[bool] = None):
+        self.prepare = get_settings().content_query_prepared_statements if prepare is None else prepare
+
     def execute_query(
         self,
         session: Session,
@@ -230,208 +618,74 @@ class RawSQLQueryExecutor(ContentQueryExecutor):
         sort_order: str,
     ) -> Tuple[List[Any], int]:
         """Execute query using raw SQL."""
+        compiled, params, total_count = self._build_page_query(
+            session, pagination, content_source_types, user_id, tag_uuids, tag_match,
+            search_term, sort_field, sort_order,
+        )
 
-        # Build WHERE conditions
-        conditions = []
-        params = {}
-
-        # Map content_source_types to source_type values and build creator filters
-        # The creator filter logic combines source_type and creator_id checks in OR clauses
-        creator_conditions = []
-
-        for cst in content_source_types:
-            if cst == 'user-regular':
-                if user_id:
-                    creator_conditions.append(f"(content_items_all.source_type = 'items' AND content_items_all.creator_id = :user_id)")
-            elif cst == 'user-auto':
-                if user_id:
-                    creator_conditions.append(f"(content_items_all.source_type = 'auto' AND content_items_all.creator_id = :user_id)")
-            elif cst == 'community-regular':
-                if user_id:
-                    creator_conditions.append(f"(content_items_all.source_type = 'items' AND content_items_all.creator_id != :user_id)")
-            elif cst == 'community-auto':
-                if user_id:
-                    creator_conditions.append(f"(content_items_all.source_type = 'auto' AND content_items_all.creator_id != :user_id)")
-
-        # Add user_id param once (used by all conditions)
-        if user_id:
-            params["user_id"] = str(user_id)
-
-        # Creator filters (complex OR conditions)
-        if creator_conditions:
-            conditions.append(f"({' OR '.join(creator_conditions)})")
-
-        # Search term filter
-        if search_term:
-            from genonaut.api.services.search_parser import parse_search_query
-            parsed = parse_search_query(search_term)
-            search_conditions = []
-
-            for idx, phrase in enumerate(parsed.phrases):
-                if phrase:
-                    search_conditions.append(
-                        f"(content_items_all.title ILIKE :search_phrase_{idx} OR content_items_all.prompt ILIKE :search_phrase_{idx})"
-                    )
-                    params[f"search_phrase_{idx}"] = f"%{phrase}%"
+        result = execute_prepared(session, compiled.page_sql, params, self.prepare)
+        items = result.fetchall()
 
-            for idx, word in enumerate(parsed.words):
-                if word:
-                    search_conditions.append(
-                        f"(content_items_all.title ILIKE :search_word_{idx} OR content_items_all.prompt ILIKE :search_word_{idx})"
-                    )
-                    params[f"search_word_{idx}"] = f"%{word}%"
+        return items, total_count
 
-            if search_conditions:
-                conditions.append(f"({' AND '.join(search_conditions)})")
+    def execute_query_json(
+        self,
+        session: Session,
+        pagination: PaginationRequest,
+        content_source_types: List[str],
+        user_id: Optional[UUID],
+        tag_uuids: List[UUID],
+        tag_match: str,
+        search_term: Optional[str],
+        sort_field: str,
+        sort_order: str,
+    ) -> Tuple[bytes, int, Optional[Dict[str, Any]], int]:
+        """
+        Execute the page query and let PostgreSQL encode the page as a JSON array.
 
-        # Tag filtering
-        tag_match_normalized = (tag_match or "any").lower()
-        if tag_match_normalized not in {"any", "all"}:
-            tag_match_normalized = "any"
+        Items have the same keys and value formats as the dicts built from
+        ``execute_query`` rows, so the result can be sent to clients without
+        decoding it in Python.
 
-        if tag_uuids:
-            unique_tags = list(dict.fromkeys(tag_uuids))
+        Returns:
+            Tuple of (items JSON bytes, item count, last item's cursor fields or None, total_count)
+        """
+        compiled, params, total_count = self._build_page_query(
+            session, pagination, content_source_types, user_id, tag_uuids, tag_match,
+            search_term, sort_field, sort_order,
+        )
+
+        row = execute_prepared(session, compiled.json_sql, params, self.prepare).one()
+        last_item = None
+        if row.item_count:
+            last_item = {"created_at": row.last_created_at, "id": row.last_id, "source_type": row.last_source_type}
+        return row.items.encode("utf-8"), row.item_count, last_item, total_count
+
+    def _build_page_query(
+        self,
+        session: Session,
+        pagination: PaginationRequest,
+        content_source_types: List[str],
+        user_id: Optional[UUID],
+        tag_uuids: List[UUID],
+        tag_match: str,
+        search_term: Optional[str],
+        sort_field: str,
+        sort_order: str,
+    ) -> Tuple[CompiledContentQuery, Dict[str, Any], int]:
+        """Run the count query and look up the compiled page query.
 
-            if tag_match_normalized == "all":
-                # For "all": content must have ALL tags
-                for idx, tag_id in enumerate(unique_tags):
-                    conditions.append(f"""
-                        EXISTS (
-                            SELECT 1 FROM content_tags
-                            WHERE content_tags.content_id = content_items_all.id
-                            AND content_tags.content_source = content_items_all.source_type
-                            AND content_tags.tag_id = :tag_all_{idx}
-                        )
-                    """)
-                    params[f"tag_all_{idx}"] = str(tag_id)
-            else:
-                # For "any": content must have AT LEAST ONE tag
-                tag_placeholders = ', '.join([f":tag_any_{i}" for i in range(len(unique_tags))])
-                conditions.append(f"""
-                    EXISTS (
-                        SELECT 1 FROM content_tags
-                        WHERE content_tags.content_id = content_items_all.id
-                        AND content_tags.content_source = content_items_all.source_type
-                        AND content_tags.tag_id IN ({tag_placeholders})
-                    )
-                """)
-                for idx, tag_id in enumerate(unique_tags):
-                    params[f"tag_any_{idx}"] = str(tag_id)
-
-        # Build WHERE clause
-        where_clause = " AND ".join(conditions) if conditions else "1=1"
-
-        # Build ORDER BY clause
-        sort_direction = "DESC" if sort_order == "desc" else "ASC"
-        order_by = f"content_items_all.{sort_field} {sort_direction}, content_items_all.id {sort_direction}"
-
-        # Count query - use efficient strategy based on filters
-        if tag_uuids and len(tag_uuids) == 1:
-            # For single-tag queries, use pre-computed tag_cardinality_stats (fast: ~2ms)
-            stats_sql = """
-                SELECT COALESCE(SUM(cardinality), 0) as total
-                FROM tag_cardinality_stats
-                WHERE tag_id = :tag_id
-            """
-            # Filter by content_source if specific types requested
-            if content_source_types and len(content_source_types) < 4:
-                # Map content_source_types to content_source values
-                source_map = {
-                    'user-regular': 'regular',
-                    'user-auto': 'auto',
-                    'community-regular': 'regular',
-                    'community-auto': 'auto'
-                }
-                sources = list(set(source_map.get(t) for t in content_source_types if t in source_map))
-                if sources:
-                    placeholders = ', '.join(f"'{s}'" for s in sources)
-                    stats_sql += f" AND content_source IN ({placeholders})"
-
-            count_result = session.execute(text(stats_sql), {'tag_id': tag_uuids[0]}).scalar()
-            total_count = count_result or 0
-        elif tag_uuids and len(tag_uuids) > 1:
-            # Multiple tags: Use optimized CTE GROUP BY strategy (~2-3s vs 12s with EXISTS)
-            # Strategy: Find items in content_tags that have ALL specified tags
-            tag_placeholders = ', '.join(f":tag{i}" for i in range(len(tag_uuids)))
-            for i, tag_id in enumerate(tag_uuids):
-                params[f'tag{i}'] = tag_id
-
-            # Build WHERE clause without tag filtering (handled by CTE)
-            # Replace table references with alias
-            count_where_parts = []
-            for condition in conditions:
-                # Skip tag-related conditions (already handled by CTE)
-                if 'content_tags' not in condition and 'tag_' not in condition:
-                    # Replace content_items_all with alias cia
-                    aliased_condition = condition.replace('content_items_all', 'cia')
-                    count_where_parts.append(aliased_condition)
-
-            count_where_clause = " AND ".join(count_where_parts) if count_where_parts else "1=1"
-
-            count_sql = f"""
-                WITH tag_matches AS (
-                    SELECT content_id, content_source
-                    FROM content_tags
-                    WHERE tag_id IN ({tag_placeholders})
-                    GROUP BY content_id, content_source
-                    HAVING COUNT(DISTINCT tag_id) = {len(tag_uuids)}
-                )
-                SELECT COUNT(*)
-                FROM tag_matches tm
-                INNER JOIN content_items_all cia
-                    ON tm.content_id = cia.id
-                    AND tm.content_source = cia.source_type
-                WHERE {count_where_clause}
-            """
-
-            count_result = session.execute(text(count_sql), params).scalar()
-            total_count = count_result or 0
-        else:
-            # No tag filters: run COUNT query (fast without tag EXISTS clause)
-            count_sql = f"""
-                SELECT COUNT(*)
-                FROM content_items_all
-                WHERE {where_clause}
-            """
-
-            count_result = session.execute(text(count_sql), params).scalar()
-            total_count = count_result or 0
-
-        # Main query with pagination
-        limit_clause = f"LIMIT :page_size" if pagination.page_size else ""
-        offset_value = 0
-        if pagination.page and pagination.page_size:
-            offset_value = (pagination.page - 1) * pagination.page_size
-        offset_clause = f"OFFSET :offset" if offset_value > 0 else ""
-
-        params['page_size'] = pagination.page_size or 1000000
-        params['offset'] = offset_value
-
-        main_sql = f"""
-            SELECT
-                content_items_all.id,
-                content_items_all.title,
-                content_items_all.content_type,
-                content_items_all.content_data,
-                content_items_all.path_thumb,
-                content_items_all.path_thumbs_alt_res,
-                content_items_all.prompt,
-                content_items_all.creator_id,
-                content_items_all.item_metadata,
-                content_items_all.is_private,
-                content_items_all.quality_score,
-                content_items_all.created_at,
-                content_items_all.updated_at,
-                content_items_all.source_type,
-                users.username as creator_username
-            FROM content_items_all
-            JOIN users ON users.id = content_items_all.creator_id
-            WHERE {where_clause}
-            ORDER BY {order_by}
-            {limit_clause} {offset_clause}
+        Returns:
+            Tuple of (compiled query, bind params, total_count)
         """
+        shape, params = content_query_shape(
+            pagination, content_source_types, user_id, tag_uuids, tag_match,
+            search_term, sort_field, sort_order,
+        )
+        compiled = compile_content_query(shape)
 
-        result = session.execute(text(main_sql), params)
-        items = result.fetchall()
+        count_params = {"tag_id": params["tag_id"]} if compiled.count_from_stats else params
+        count_result = execute_prepared(session, compiled.count_sql, count_params, self.prepare).scalar()
+        total_count = count_result or 0
 
-        return items, total_count
+        return compiled, params, total_count
@@ -1,6 +1,6 @@
 """Content service for business logic operations."""
 
-from typing import Any, Dict, List, Optional, Type, Union
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
 from uuid import UUID
 
 from sqlalchemy import desc, func, text, literal, or_, and_, case
@@ -12,11 +12,14 @@ from genonaut.api.repositories.user_repository import UserRepository
 from genonaut.api.repositories.tag_repository import TagRepository
 from genonaut.api.models.requests import PaginationRequest
 from genonaut.api.models.responses import PaginatedResponse
-from genonaut.db.schema import ContentItem, ContentItemAuto, ContentItemAll, UserInteraction, User, ContentTag
+from genonaut.db.schema import ContentItem, ContentItemAuto, ContentItemAll, ContentInteractionSummary, User, ContentTag
 from genonaut.api.services.flagged_content_service import FlaggedContentService
 from genonaut.api.services.tag_query_planner import TagQueryPlanner
 from genonaut.api.services.tag_query_builder import TagQueryBuilder
 from genonaut.api.services.content_query_strategies import QueryStrategy, ORMQueryExecutor, RawSQLQueryExecutor
+from genonaut.api.services.content_similarity_index import get_content_similarity_index
+from genonaut.api.services.hot_feed import record_created, record_deleted
+from genonaut.api.utils.json_response import PreSerializedJSON, serialize_content_row
 from genonaut.api.utils.tag_identifiers import expand_tag_identifiers
 from genonaut.api.config import get_settings
 
@@ -360,6 +363,8 @@ class ContentService:
 
             self.db.commit()
 
+        record_created(content_item)
+
         # Automatically check for problematic words and flag if needed
         if self.flagging_service:
             try:
@@ -476,7 +481,13 @@ class ContentService:
     def delete_content(self, content_id: int) -> bool:
         """Delete a content record."""
 
-        return self.repository.delete(content_id)
+        content = self.repository.get_or_404(content_id)
+        # Read before the delete expires the instance
+        feed_key = (content.id, content.source_type, content.creator_id)
+        deleted = self.repository.delete(content_id)
+        if deleted:
+            record_deleted(*feed_key)
+        return deleted
 
     # ------------------------------------------------------------------
     # Search helpers
@@ -544,41 +555,86 @@ class ContentService:
         self.repository.get_or_404(content_id)
         session = self.repository.db
 
-        total_views = (
-            session.query(func.count())
-            .select_from(UserInteraction)
-            .filter(
-                UserInteraction.content_item_id == content_id,
-                UserInteraction.interaction_type == "view",
-            )
-            .scalar()
-        ) or 0
-
-        total_likes = (
-            session.query(func.count())
-            .select_from(UserInteraction)
-            .filter(
-                UserInteraction.content_item_id == content_id,
-                UserInteraction.interaction_type == "like",
-            )
-            .scalar()
-        ) or 0
-
-        avg_rating = (
-            session.query(func.avg(UserInteraction.rating))
-            .filter(
-                UserInteraction.content_item_id == content_id,
-                UserInteraction.rating.isnot(None),
+        rows = (
+            session.query(
+                ContentInteractionSummary.interaction_type,
+                ContentInteractionSummary.interaction_count,
+                ContentInteractionSummary.rating_sum,
+                ContentInteractionSummary.rating_count,
             )
-            .scalar()
+            .filter(ContentInteractionSummary.content_item_id == content_id)
+            .all()
         )
+        counts = {row.interaction_type: row.interaction_count for row in rows}
+        rating_sum = sum(row.rating_sum for row in rows)
+        rating_count = sum(row.rating_count for row in rows)
 
         return {
-            "total_views": total_views,
-            "total_likes": total_likes,
-            "avg_rating": float(avg_rating) if avg_rating is not None else 0.0,
+            "total_views": counts.get("view", 0),
+            "total_likes": counts.get("like", 0),
+            "avg_rating": rating_sum / rating_count if rating_count else 0.0,
         }
 
+    def get_similar_content(self, content_id: int, limit: int = 10) -> Optional[List[Dict[str, Any]]]:
+        """Return public content most similar to ``content_id`` from the similarity index.
+
+        Candidates come from the approximate nearest-neighbor index; a single
+        query then drops items that were deleted or made private since the
+        index was built and adds display fields.
+
+        Args:
+            content_id: Content ID from either content_items or content_items_auto
+            limit: Maximum number of similar items
+
+        Returns:
+            List of dicts with id, source_type, score, title and path_thumb, best
+            first, or None if the similarity index has not been built yet
+
+        Raises:
+            EntityNotFoundError: If the content does not exist
+        """
+        index = get_content_similarity_index()
+        if index is None:
+            return None
+
+        neighbours = index.similar(content_id, k=limit * 2)
+        if neighbours is None:
+            exists = self.repository.db.query(ContentItemAll.id).filter(ContentItemAll.id == content_id).first()
+            if exists is None:
+                raise EntityNotFoundError("Content", content_id)
+            return []  # Not indexed yet; picked up by the next index update
+        if not neighbours:
+            return []
+
+        rows = (
+            self.repository.db.query(
+                ContentItemAll.id,
+                ContentItemAll.source_type,
+                ContentItemAll.title,
+                ContentItemAll.path_thumb,
+            )
+            .filter(ContentItemAll.id.in_([neighbour_id for neighbour_id, _, _ in neighbours]))
+            .filter(ContentItemAll.is_private.is_(False))
+            .all()
+        )
+        details = {(row.id, row.source_type): row for row in rows}
+
+        similar = []
+        for neighbour_id, source_type, score in neighbours:
+            row = details.get((neighbour_id, source_type))
+            if row is None:
+                continue
+            similar.append({
+                "id": row.id,
+                "source_type": row.source_type,
+                "score": round(score, 4),
+                "title": row.title,
+                "path_thumb": row.path_thumb,
+            })
+            if len(similar) == limit:
+                break
+        return similar
+
     def update_quality_score(self, content_id: int, quality_score: float) -> Any:
         """Alias retained for backwards compatibility with older callers."""
 
@@ -736,6 +792,7 @@ class ContentService:
         tags: Optional[List[str]] = None,
         tag_match: str = "any",
         include_stats: bool = False,
+        hot_page: Optional[Tuple[List[Dict[str, Any]], int]] = None,
     ) -> Dict[str, Any]:
         """
         Get paginated content from partitioned parent table content_items_all.
@@ -755,6 +812,7 @@ class ContentService:
             sort_order: Sort order ("asc" or "desc")
             tags: List of tag UUIDs/slugs to filter by
             tag_match: Tag matching logic ("any" for OR, "all" for AND)
+            hot_page: Items and total count of the page read from the hot feed, if it served it
 
         Returns:
             Dict with items, pagination metadata, and stats
@@ -851,6 +909,12 @@ class ContentService:
                 "stats": self.get_unified_content_stats(user_id),
             }
 
+        # Default views (newest first, unfiltered, first pages) come from the materialized hot feed,
+        # looked up by the route (hot_feed.hot_feed_page) so its Redis calls stay out of the session callable
+        if hot_page is not None:
+            t_before_query = time.perf_counter()
+            timings['query_building'] = t_before_query - t_after_tag_processing
+
         # Use strategy pattern for query execution (when using new content_source_types approach)
         # Cursor pagination not yet supported in strategies, so fall back to ORM for that case
         use_strategy_pattern = (
@@ -859,7 +923,14 @@ class ContentService:
             not use_python_tag_filter
         )
 
-        if use_strategy_pattern:
+        if hot_page is not None:
+            items, total_count = hot_page
+            t_after_query = time.perf_counter()
+            timings['query_execution'] = t_after_query - t_before_query
+            cursor_items = items
+            use_cursor_pagination = False
+
+        elif use_strategy_pattern:
             # Select query strategy from config
             settings = get_settings()
             strategy_name = settings.content_query_strategy
@@ -871,8 +942,7 @@ class ContentService:
             t_before_query = time.perf_counter()
             timings['query_building'] = t_before_query - t_after_tag_processing
 
-            # Execute query using strategy
-            rows, total_count = executor.execute_query(
+            query_args = dict(
                 session=session,
                 pagination=pagination,
                 content_source_types=content_source_types,
@@ -884,51 +954,21 @@ class ContentService:
                 sort_order=sort_order,
             )
 
-            t_after_query = time.perf_counter()
-            timings['query_execution'] = t_after_query - t_before_query
-
-            # Format results (raw SQL returns tuples, ORM returns RowProxy)
-            items = []
-            for row in rows:
-                # Handle both tuple and ORM object results
-                if hasattr(row, '_mapping'):
-                    # SQLAlchemy Row object
-                    items.append({
-                        "id": row.id,
-                        "title": row.title,
-                        "content_type": row.content_type,
-                        "content_data": row.content_data,
-                        "path_thumb": row.path_thumb,
-                        "path_thumbs_alt_res": row.path_thumbs_alt_res,
-                        "prompt": row.prompt,
-                        "creator_id": str(row.creator_id),
-                        "creator_username": row.creator_username,
-                        "item_metadata": row.item_metadata,
-                        "is_private": row.is_private,
-                        "quality_score": row.quality_score,
-                        "created_at": row.created_at.isoformat() if row.created_at else None,
-                        "updated_at": row.updated_at.isoformat() if row.updated_at else None,
-                        "source_type": row.source_type,
-                    })
-                else:
-                    # Raw SQL tuple result (id, title, content_type, ...)
-                    items.append({
-                        "id": row[0],
-                        "title": row[1],
-                        "content_type": row[2],
-                        "content_data": row[3],
-                        "path_thumb": row[4],
-                        "path_thumbs_alt_res": row[5],
-                        "prompt": row[6],
-                        "creator_id": str(row[7]),
-                        "item_metadata": row[8],
-                        "is_private": row[9],
-                        "quality_score": row[10],
-                        "created_at": row[11].isoformat() if row[11] else None,
-                        "updated_at": row[12].isoformat() if row[12] else None,
-                        "source_type": row[13],
-                        "creator_username": row[14],
-                    })
+            if settings.content_json_in_db and isinstance(executor, RawSQLQueryExecutor):
+                # PostgreSQL builds the page as JSON; it is sent to the client without decoding
+                items_json, item_count, last_item, total_count = executor.execute_query_json(**query_args)
+                t_after_query = time.perf_counter()
+                timings['query_execution'] = t_after_query - t_before_query
+                items = PreSerializedJSON(items_json, item_count)
+                cursor_items = [last_item] if last_item else []
+            else:
+                # Execute query using strategy
+                rows, total_count = executor.execute_query(**query_args)
+                t_after_query = time.perf_counter()
+                timings['query_execution'] = t_after_query - t_before_query
+                # Raw SQL and ORM rows share the column order of CONTENT_ROW_FIELDS
+                items = [serialize_content_row(row) for row in rows]
+                cursor_items = items
 
             t_after_serialization = time.perf_counter()
             timings['result_serialization'] = t_after_serialization - t_after_query
@@ -1149,25 +1189,8 @@ class ContentService:
 
             t_after_query = time.perf_counter()
             timings['query_execution'] = t_after_query - t_before_query
-            items = []
-            for row in rows:
-                items.append({
-                    "id": row.id,
-                    "title": row.title,
-                    "content_type": row.content_type,
-                    "content_data": row.content_data,
-                    "path_thumb": row.path_thumb,
-                    "path_thumbs_alt_res": row.path_thumbs_alt_res,
-                    "prompt": row.prompt,
-                    "creator_id": str(row.creator_id),
-                    "creator_username": row.creator_username,
-                    "item_metadata": row.item_metadata,
-                    "is_private": row.is_private,
-                    "quality_score": row.quality_score,
-                    "created_at": row.created_at.isoformat() if row.created_at else None,
-                    "updated_at": row.updated_at.isoformat() if row.updated_at else None,
-                    "source_type": row.source_type,
-                })
+            items = [serialize_content_row(row) for row in rows]
+            cursor_items = items
 
             t_after_serialization = time.perf_counter()
             timings['result_serialization'] = t_after_serialization - t_after_query
@@ -1199,11 +1222,11 @@ class ContentService:
 
             # Generate next cursor if we got a full page (more results likely exist)
             if len(items) == pagination.page_size:
-                next_cursor = create_next_cursor(items)
+                next_cursor = create_next_cursor(cursor_items)
 
             # Generate prev cursor only if currently using cursor pagination
             if use_cursor_pagination and pagination.cursor:
-                prev_cursor = create_prev_cursor(items)
+                prev_cursor = create_prev_cursor(cursor_items)
 
         t_end = time.perf_counter()
         timings['total'] = t_end - t_start
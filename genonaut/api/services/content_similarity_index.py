@@ -0,0 +1,532 @@
+"""Approximate nearest-neighbor index for "more like this" content lookups.
+
+Each content item is turned into a small dense vector:
+
+- TF-IDF weighted title and prompt tokens plus one-hot tags, projected to
+  ``dim`` dimensions with a signed feature-hashing random projection (a sparse
+  Johnson-Lindenstrauss transform), so no vocabulary has to be stored
+- rows are L2-normalized, so a dot product is cosine similarity
+
+Vectors live in a float32 memory-mapped file and are searched with an IVF
+(inverted file) index: items are bucketed by their nearest k-means centroid and
+a query only scans the ``n_probe`` closest buckets. New items are appended and
+assigned to the existing centroids; centroids are retrained once the index has
+grown enough that the buckets drift out of balance.
+
+Readers never see a half-written index: updates are made in a staging copy
+next to the index directory (:func:`stage_index`, :func:`rebuild_index`) and
+swapped in with a rename (:func:`publish_index`). ``meta.json`` is written last.
+Processes holding memory maps of the old files keep reading the old inodes
+until they notice the new ``meta.json`` and reload.
+
+On-disk layout (one directory)::
+
+    meta.json        counts, dimensions and per-source high-water marks
+    vectors.f32      (capacity, dim) float32 memmap
+    ids.i64          content id per row
+    sources.u8       0 = content_items, 1 = content_items_auto
+    lists.i32        IVF bucket per row
+    centroids.npy    (n_lists, dim) float32
+    df.npy           hashed document frequencies for IDF
+"""
+
+import json
+import logging
+import math
+import os
+import re
+import shutil
+import zlib
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from genonaut.api.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# (content_id, source_type, title, prompt, tag_ids)
+SimilarityDocument = Tuple[int, str, Optional[str], Optional[str], Sequence]
+
+SOURCES = ("items", "auto")
+FORMAT_VERSION = 1
+DEFAULT_DIM = 128
+DF_BUCKETS = 1 << 20
+# Rows below ``count`` of these files are never rewritten, so a staged update hard-links them
+APPEND_ONLY_FILES = ("vectors.f32", "ids.i64", "sources.u8")
+PROJECTIONS_PER_FEATURE = 3
+TAG_WEIGHT = 0.5
+TITLE_REPEAT = 2
+KMEANS_ITERATIONS = 10
+KMEANS_SAMPLE_PER_LIST = 64
+ASSIGN_CHUNK_ROWS = 8192
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def _hash(feature: str, salt: int = 0) -> int:
+    # crc32 is stable across processes, unlike hash()
+    return zlib.crc32(feature.encode("utf-8"), salt)
+
+
+class ContentSimilarityIndex:
+    """Memory-mapped IVF index of content feature vectors.
+
+    Args:
+        directory: Directory holding the index files
+        dim: Vector dimensions (fixed when the index is first built)
+        n_probe: Number of IVF buckets scanned per query
+        writable: Open the memory maps for writing (builder processes only)
+    """
+
+    def __init__(self, directory: str, dim: int = DEFAULT_DIM, n_probe: int = 8, writable: bool = False):
+        self.directory = Path(directory)
+        self.dim = dim
+        self.n_probe = n_probe
+        self.writable = writable
+        self.count = 0
+        self.capacity = 0
+        self.documents = 0
+        self.max_ids: Dict[str, int] = {source: 0 for source in SOURCES}
+        self.trained_count = 0
+        self.df = np.zeros(DF_BUCKETS, dtype=np.int32)
+        self.centroids = np.zeros((0, dim), dtype=np.float32)
+        self.vectors = np.zeros((0, dim), dtype=np.float32)
+        self.ids = np.zeros(0, dtype=np.int64)
+        self.sources = np.zeros(0, dtype=np.uint8)
+        self.lists = np.zeros(0, dtype=np.int32)
+        self._id_order = np.zeros(0, dtype=np.int64)
+        self._list_rows = np.zeros(0, dtype=np.int64)
+        self._list_offsets = np.zeros(1, dtype=np.int64)
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    @property
+    def meta_path(self) -> Path:
+        return self.directory / "meta.json"
+
+    def exists(self) -> bool:
+        return self.meta_path.exists()
+
+    @classmethod
+    def load(cls, directory: str, n_probe: int = 8, writable: bool = False) -> "ContentSimilarityIndex":
+        """Open an existing index from disk.
+
+        Raises:
+            FileNotFoundError: If no index has been built in ``directory``
+        """
+        meta = json.loads((Path(directory) / "meta.json").read_text())
+        if meta.get("version") != FORMAT_VERSION:
+            raise FileNotFoundError(f"Unsupported similarity index version in {directory}; rebuild it")
+
+        index = cls(directory, dim=meta["dim"], n_probe=n_probe, writable=writable)
+        index.count = meta["count"]
+        index.capacity = meta["capacity"]
+        index.documents = meta["documents"]
+        index.trained_count = meta["trained_count"]
+        index.max_ids = {source: int(meta["max_ids"].get(source, 0)) for source in SOURCES}
+        index.df = np.load(index.directory / "df.npy")
+        index.centroids = np.load(index.directory / "centroids.npy")
+        index._map_arrays()
+        index._refresh_lookups()
+        return index
+
+    def save(self) -> None:
+        """Flush arrays and atomically replace the metadata file."""
+        for array in (self.vectors, self.ids, self.sources, self.lists):
+            if isinstance(array, np.memmap):
+                array.flush()
+        self._save_array("df.npy", self.df)
+        self._save_array("centroids.npy", self.centroids)
+        meta = {
+            "version": FORMAT_VERSION,
+            "dim": self.dim,
+            "count": self.count,
+            "capacity": self.capacity,
+            "documents": self.documents,
+            "trained_count": self.trained_count,
+            "n_lists": int(self.centroids.shape[0]),
+            "max_ids": self.max_ids,
+        }
+        tmp_path = self.meta_path.with_suffix(".json.tmp")
+        tmp_path.write_text(json.dumps(meta, indent=2))
+        os.replace(tmp_path, self.meta_path)
+
+    def _save_array(self, filename: str, array: np.ndarray) -> None:
+        tmp_path = self.directory / f"{filename}.tmp"
+        with open(tmp_path, "wb") as handle:
+            np.save(handle, array)
+        os.replace(tmp_path, self.directory / filename)
+
+    def _array_specs(self) -> List[Tuple[str, str, np.dtype, Tuple[int, ...]]]:
+        return [
+            ("vectors", "vectors.f32", np.dtype(np.float32), (self.dim,)),
+            ("ids", "ids.i64", np.dtype(np.int64), ()),
+            ("sources", "sources.u8", np.dtype(np.uint8), ()),
+            ("lists", "lists.i32", np.dtype(np.int32), ()),
+        ]
+
+    def _map_arrays(self) -> None:
+        mode = "r+" if self.writable else "r"
+        for attr, filename, dtype, row_shape in self._array_specs():
+            path = self.directory / filename
+            if self.capacity == 0:
+                setattr(self, attr, np.zeros((0,) + row_shape, dtype=dtype))
+                continue
+            setattr(self, attr, np.memmap(path, dtype=dtype, mode=mode, shape=(self.capacity,) + row_shape))
+
+    def _reserve(self, rows: int) -> None:
+        """Grow the memory-mapped files so ``rows`` more items fit."""
+        needed = self.count + rows
+        if needed <= self.capacity:
+            return
+        new_capacity = max(needed, self.capacity * 2, 1024)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        for attr, filename, dtype, row_shape in self._array_specs():
+            array = getattr(self, attr)
+            if isinstance(array, np.memmap):
+                array.flush()
+            setattr(self, attr, None)
+            del array
+            row_bytes = dtype.itemsize * int(np.prod(row_shape or (1,)))
+            with open(self.directory / filename, "ab") as handle:
+                handle.truncate(new_capacity * row_bytes)
+        self.capacity = new_capacity
+        self.writable = True
+        self._map_arrays()
+
+    def _refresh_lookups(self) -> None:
+        ids = np.asarray(self.ids[: self.count])
+        self._id_order = np.argsort(ids, kind="stable")
+        lists = np.asarray(self.lists[: self.count])
+        self._list_rows = np.argsort(lists, kind="stable")
+        offsets = np.zeros(len(self.centroids) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(lists, minlength=len(self.centroids)), out=offsets[1:])
+        self._list_offsets = offsets
+
+    # ------------------------------------------------------------------
+    # Featurization
+    # ------------------------------------------------------------------
+
+    def _doc_features(self, title: Optional[str], prompt: Optional[str]) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for token in _TOKEN_RE.findall((title or "").lower()) * TITLE_REPEAT + _TOKEN_RE.findall((prompt or "").lower()):
+            counts[token] = counts.get(token, 0) + 1
+        return counts
+
+    def _update_document_frequencies(self, documents: Iterable[SimilarityDocument]) -> None:
+        buckets: List[int] = []
+        for _, _, title, prompt, _ in documents:
+            buckets.extend(_hash(token) % DF_BUCKETS for token in self._doc_features(title, prompt))
+            self.documents += 1
+        if buckets:
+            np.add.at(self.df, np.asarray(buckets, dtype=np.int64), 1)
+
+    def vectorize(self, documents: Sequence[SimilarityDocument]) -> np.ndarray:
+        """Project documents to L2-normalized ``(len(documents), dim)`` vectors."""
+        rows: List[int] = []
+        cols: List[int] = []
+        values: List[float] = []
+        log_documents = math.log(self.documents + 1)
+
+        for row, (_, _, title, prompt, tag_ids) in enumerate(documents):
+            features = self._doc_features(title, prompt)
+            weights = []
+            for token, count in features.items():
+                idf = log_documents - math.log(self.df[_hash(token) % DF_BUCKETS] + 1) + 1.0
+                weights.append((token, (1.0 + math.log(count)) * idf))
+            norm = math.sqrt(sum(weight * weight for _, weight in weights)) or 1.0
+            tag_weight = TAG_WEIGHT / math.sqrt(len(tag_ids)) if tag_ids else 0.0
+            weighted = [(token, weight / norm) for token, weight in weights]
+            weighted += [(f"tag:{tag_id}", tag_weight) for tag_id in tag_ids or ()]
+
+            for feature, weight in weighted:
+                for salt in range(PROJECTIONS_PER_FEATURE):
+                    hashed = _hash(feature, salt)
+                    rows.append(row)
+                    cols.append((hashed >> 1) % self.dim)
+                    values.append(weight if hashed & 1 else -weight)
+
+        vectors = np.zeros((len(documents), self.dim), dtype=np.float32)
+        np.add.at(vectors, (np.asarray(rows, dtype=np.int64), np.asarray(cols, dtype=np.int64)), values)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
+
+    # ------------------------------------------------------------------
+    # IVF training and assignment
+    # ------------------------------------------------------------------
+
+    def _assign(self, vectors: np.ndarray) -> np.ndarray:
+        assignments = np.empty(len(vectors), dtype=np.int32)
+        for start in range(0, len(vectors), ASSIGN_CHUNK_ROWS):
+            chunk = np.asarray(vectors[start:start + ASSIGN_CHUNK_ROWS])
+            assignments[start:start + len(chunk)] = np.argmax(chunk @ self.centroids.T, axis=1)
+        return assignments
+
+    def train(self, n_lists: Optional[int] = None, seed: int = 0) -> None:
+        """Retrain IVF centroids with spherical k-means and reassign every row."""
+        if self.count == 0:
+            self.centroids = np.zeros((0, self.dim), dtype=np.float32)
+            self._refresh_lookups()
+            return
+
+        n_lists = n_lists or int(min(4096, max(1, round(math.sqrt(self.count)))))
+        n_lists = min(n_lists, self.count)
+        rng = np.random.default_rng(seed)
+        sample_size = min(self.count, n_lists * KMEANS_SAMPLE_PER_LIST)
+        sample = np.asarray(self.vectors[np.sort(rng.choice(self.count, sample_size, replace=False))])
+        centroids = sample[rng.choice(sample_size, n_lists, replace=False)].copy()
+
+        for _ in range(KMEANS_ITERATIONS):
+            self.centroids = centroids
+            labels = self._assign(sample)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, labels, sample)
+            empty = np.bincount(labels, minlength=n_lists) == 0
+            # Reseed empty buckets with random sample points
+            sums[empty] = sample[rng.choice(sample_size, int(empty.sum()))]
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+            centroids = np.divide(sums, norms, out=np.zeros_like(sums), where=norms > 0).astype(np.float32)
+
+        self.centroids = centroids
+        self.lists[: self.count] = self._assign(self.vectors[: self.count])
+        self.trained_count = self.count
+        self._refresh_lookups()
+
+    # ------------------------------------------------------------------
+    # Building
+    # ------------------------------------------------------------------
+
+    def build(
+        self,
+        documents_factory: Callable[[], Iterable[List[SimilarityDocument]]],
+        n_lists: Optional[int] = None,
+    ) -> int:
+        """Rebuild the index from scratch.
+
+        Args:
+            documents_factory: Callable returning an iterable of document
+                chunks; it is called twice (document frequencies, then vectors)
+            n_lists: Number of IVF buckets (default: sqrt of the item count)
+
+        Returns:
+            Number of indexed items
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.count = 0
+        self.documents = 0
+        self.df[:] = 0
+        self.max_ids = {source: 0 for source in SOURCES}
+        self.centroids = np.zeros((0, self.dim), dtype=np.float32)
+
+        for chunk in documents_factory():
+            self._update_document_frequencies(chunk)
+        for chunk in documents_factory():
+            self._append(chunk)
+
+        self.train(n_lists=n_lists)
+        self.save()
+        logger.info(f"Built content similarity index with {self.count} items in {len(self.centroids)} lists")
+        return self.count
+
+    def add(self, documents: Sequence[SimilarityDocument]) -> int:
+        """Append new items, assigning them to the existing IVF buckets.
+
+        Items whose id is already indexed are skipped.
+
+        Returns:
+            Number of items added
+        """
+        documents = [doc for doc in documents if self.row_of(doc[0]) is None]
+        if not documents:
+            return 0
+        self._update_document_frequencies(documents)
+        start = self.count
+        self._append(documents)
+        if len(self.centroids):
+            self.lists[start:self.count] = self._assign(self.vectors[start:self.count])
+        self._refresh_lookups()
+        return self.count - start
+
+    def _append(self, documents: Sequence[SimilarityDocument]) -> None:
+        if not documents:
+            return
+        self.append_vectors(
+            [doc[0] for doc in documents],
+            [doc[1] for doc in documents],
+            self.vectorize(documents),
+        )
+
+    def append_vectors(self, content_ids: Sequence[int], source_types: Sequence[str], vectors: np.ndarray) -> None:
+        """Append precomputed, L2-normalized vectors without assigning IVF buckets.
+
+        Call :meth:`train` (or :meth:`add` for featurized documents) afterwards
+        to make the rows searchable.
+        """
+        if len(content_ids) == 0:
+            return
+        self._reserve(len(content_ids))
+        start, end = self.count, self.count + len(content_ids)
+        self.vectors[start:end] = vectors
+        self.ids[start:end] = content_ids
+        self.sources[start:end] = [SOURCES.index(source) for source in source_types]
+        self.lists[start:end] = 0
+        self.count = end
+        for source in SOURCES:
+            source_ids = [int(content_id) for content_id, s in zip(content_ids, source_types) if s == source]
+            if source_ids:
+                self.max_ids[source] = max(self.max_ids[source], max(source_ids))
+
+    # ------------------------------------------------------------------
+    # Querying
+    # ------------------------------------------------------------------
+
+    def row_of(self, content_id: int) -> Optional[int]:
+        """Return the row holding ``content_id``, or None if it is not indexed."""
+        if self.count == 0 or len(self._id_order) != self.count:
+            ids = np.asarray(self.ids[: self.count])
+            matches = np.flatnonzero(ids == content_id)
+            return int(matches[0]) if matches.size else None
+        ids = self.ids
+        position = np.searchsorted(ids[: self.count], content_id, sorter=self._id_order)
+        if position < self.count and ids[self._id_order[position]] == content_id:
+            return int(self._id_order[position])
+        return None
+
+    def search(
+        self,
+        vector: np.ndarray,
+        k: int = 10,
+        exclude_row: Optional[int] = None,
+        n_probe: Optional[int] = None,
+    ) -> List[Tuple[int, str, float]]:
+        """Return up to ``k`` ``(content_id, source_type, score)`` nearest to ``vector``."""
+        if self.count == 0 or k <= 0:
+            return []
+        n_probe = min(n_probe or self.n_probe, len(self.centroids))
+        if n_probe <= 0:
+            return []
+
+        centroid_scores = self.centroids @ vector
+        probe = np.argpartition(-centroid_scores, n_probe - 1)[:n_probe]
+        rows = np.concatenate(
+            [self._list_rows[self._list_offsets[bucket]:self._list_offsets[bucket + 1]] for bucket in probe]
+        )
+        if exclude_row is not None:
+            rows = rows[rows != exclude_row]
+        if rows.size == 0:
+            return []
+
+        rows.sort()  # Sequential access through the memory map
+        scores = self.vectors[rows] @ vector
+        k = min(k, rows.size)
+        best = np.argpartition(-scores, k - 1)[:k]
+        best = best[np.argsort(-scores[best])]
+        return [
+            (int(self.ids[rows[i]]), SOURCES[self.sources[rows[i]]], float(scores[i]))
+            for i in best
+        ]
+
+    def similar(self, content_id: int, k: int = 10, n_probe: Optional[int] = None) -> Optional[List[Tuple[int, str, float]]]:
+        """Return the items most similar to an indexed item, or None if it is not indexed."""
+        row = self.row_of(content_id)
+        if row is None:
+            return None
+        return self.search(np.asarray(self.vectors[row]), k=k, exclude_row=row, n_probe=n_probe)
+
+
+def _staging_paths(directory: str) -> Tuple[Path, Path, Path]:
+    target = Path(directory)
+    staging = target.with_name(target.name + ".building")
+    retired = target.with_name(target.name + ".old")
+    for path in (staging, retired):
+        if path.exists():
+            shutil.rmtree(path)
+    return target, staging, retired
+
+
+def rebuild_index(
+    directory: str,
+    documents_factory: Callable[[], Iterable[List[SimilarityDocument]]],
+    dim: int = DEFAULT_DIM,
+) -> ContentSimilarityIndex:
+    """Build a fresh index next to ``directory`` and swap it into place."""
+    _, staging, _ = _staging_paths(directory)
+    index = ContentSimilarityIndex(str(staging), dim=dim, writable=True)
+    index.build(documents_factory)
+    return publish_index(index, directory)
+
+
+def stage_index(directory: str) -> ContentSimilarityIndex:
+    """Open a writable copy of the index in ``directory`` for an incremental update.
+
+    The append-only files are hard-linked: new rows go past the ``count`` that
+    readers of the live index use. Every other file is copied. Apply the
+    changes, then call :func:`publish_index` (or :func:`discard_staged_index`).
+    """
+    target, staging, _ = _staging_paths(directory)
+    staging.mkdir(parents=True)
+    for entry in target.iterdir():
+        if not entry.is_file() or entry.name.endswith(".tmp"):
+            continue
+        if entry.name in APPEND_ONLY_FILES:
+            try:
+                os.link(entry, staging / entry.name)
+                continue
+            except OSError:
+                pass  # No hard links on this filesystem
+        shutil.copy2(entry, staging / entry.name)
+    return ContentSimilarityIndex.load(str(staging), writable=True)
+
+
+def publish_index(index: ContentSimilarityIndex, directory: str) -> ContentSimilarityIndex:
+    """Save a staged index and swap it into ``directory``; returns the published index."""
+    index.save()
+    target = Path(directory)
+    retired = target.with_name(target.name + ".old")
+    if target.exists():
+        os.replace(target, retired)
+    os.replace(index.directory, target)
+    shutil.rmtree(retired, ignore_errors=True)
+    return ContentSimilarityIndex.load(str(target), writable=True)
+
+
+def discard_staged_index(index: ContentSimilarityIndex) -> None:
+    shutil.rmtree(index.directory, ignore_errors=True)
+
+
+def get_similarity_index_dir() -> str:
+    """Directory holding the content similarity index."""
+    settings = get_settings()
+    if settings.similarity_index_dir:
+        return os.path.expanduser(settings.similarity_index_dir)
+    return os.path.join(os.path.expanduser(settings.storage_dir or "io/storage/"), "similarity_index")
+
+
+_INDEX: Optional[ContentSimilarityIndex] = None
+# (inode, mtime) of the meta.json the index was loaded from
+_INDEX_MTIME: Optional[Tuple[int, int]] = None
+
+
+def get_content_similarity_index() -> Optional[ContentSimilarityIndex]:
+    """Return the process-wide read-only index, reloading it after a rebuild.
+
+    Returns:
+        The loaded index, or None if no index has been built yet
+    """
+    global _INDEX, _INDEX_MTIME
+    directory = get_similarity_index_dir()
+    try:
+        stat = os.stat(os.path.join(directory, "meta.json"))
+        mtime = (stat.st_ino, stat.st_mtime_ns)
+    except FileNotFoundError:
+        _INDEX, _INDEX_MTIME = None, None
+        return None
+
+    if _INDEX is None or mtime != _INDEX_MTIME or _INDEX.directory != Path(directory):
+        _INDEX = ContentSimilarityIndex.load(directory, n_probe=get_settings().similarity_index_n_probe)
+        _INDEX_MTIME = mtime
+    return _INDEX
@@ -1,18 +1,49 @@
-"""File storage and management service."""
+"""File storage and management service.
 
+Usage and statistics come from the storage index (see
+:mod:`genonaut.api.services.storage_index`), which this service updates on every
+write, move and delete; file moves and cleanup unlinks run on a bounded thread
+pool (``file-storage.workers``). Organized outputs are also published to the
+configured object storage backend (see :mod:`genonaut.api.services.object_storage`).
+"""
+
+import asyncio
 import os
 import logging
 import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
 from genonaut.api.config import get_settings, get_cached_settings
+from genonaut.api.services.object_storage import get_object_storage
+from genonaut.api.services.storage_index import (
+    INDEX_FILENAME,
+    StorageIndex,
+    classify,
+    get_storage_index,
+    scan_tree,
+)
 
 logger = logging.getLogger(__name__)
 
 
+def file_storage_settings() -> Dict[str, Any]:
+    """``file-storage`` config with defaults applied."""
+    settings = get_cached_settings() or get_settings()
+    config = getattr(settings, "file_storage", None) or {}
+    retention_days = config.get("retention_days")
+    return {
+        "index_path": config.get("index_path"),
+        "workers": max(1, int(config.get("workers", 8))),
+        "cleanup_batch_size": max(1, int(config.get("cleanup_batch_size", 500))),
+        "retention_days": int(retention_days) if retention_days is not None else None,
+    }
+
+
 class FileStorageService:
     """Service for managing file storage and organization."""
 
@@ -31,6 +62,83 @@ class FileStorageService:
         for directory in [self.thumbnails_dir, self.temp_dir]:
             directory.mkdir(parents=True, exist_ok=True)
 
+        config = file_storage_settings()
+        self.max_workers = config["workers"]
+        self.cleanup_batch_size = config["cleanup_batch_size"]
+        self.index_path = Path(config["index_path"] or self.base_output_dir / INDEX_FILENAME).expanduser()
+        self.index = get_storage_index(self.index_path)
+        self.storage = get_object_storage()
+
+    def _relative(self, path: Path) -> Optional[str]:
+        """Index key of a file: its path relative to the output directory, or None if outside it."""
+        try:
+            return path.resolve().relative_to(self.base_output_dir.resolve()).as_posix()
+        except (ValueError, OSError):
+            return None
+
+    def _index_skip(self) -> List[str]:
+        # The index database (and its WAL files) must not index or delete itself
+        relative = self._relative(self.index_path)
+        return [f"{relative}{suffix}" for suffix in ("", "-wal", "-shm", "-journal")] if relative else []
+
+    def record_files(
+        self,
+        file_paths: List[str],
+        user_id: Optional[UUID] = None,
+        generation_id: Optional[int] = None
+    ) -> None:
+        """Add files written outside this service (e.g. thumbnails) to the storage index.
+
+        Args:
+            file_paths: Files under the output directory; others are ignored
+            user_id: Owner of the files, if known
+            generation_id: Generation the files belong to, if known
+        """
+        if self.index is None:
+            return
+        entries = []
+        for file_path in file_paths:
+            path = Path(file_path)
+            relative = self._relative(path)
+            if relative is None:
+                continue
+            try:
+                stat = path.stat()
+            except OSError as e:
+                logger.warning(f"Cannot index {file_path}: {e}")
+                continue
+            entries.append((relative, stat.st_size, stat.st_mtime_ns))
+        self.index.add(entries, user_id=user_id, generation_id=generation_id)
+
+    def record_thumbnails(
+        self,
+        thumbnail_results: Dict[str, Dict[str, List[str]]],
+        user_id: UUID,
+        generation_id: int
+    ) -> None:
+        """Add the output of ``ThumbnailService.generate_thumbnail_for_generation`` to the storage index."""
+        self.record_files(
+            [path for thumbnails in thumbnail_results.values() for paths in thumbnails.values() for path in paths],
+            user_id,
+            generation_id,
+        )
+
+    def _usage_index(self) -> StorageIndex:
+        """The storage index, built from a scan the first time it is used.
+
+        Without a persistent index, returns a throwaway in-memory one built from
+        a fresh scan, so callers get the same answers at the old per-call cost.
+        """
+        index = self.index
+        if index is not None and index.is_built():
+            return index
+        if index is None:
+            index = StorageIndex(":memory:")
+        scan_started = time.time()
+        scanned = scan_tree(self.base_output_dir, self.max_workers, skip=self._index_skip())
+        index.reconcile(scanned.files, scan_started)
+        return index
+
     def organize_generation_files(
         self,
         generation_id: int,
@@ -59,38 +167,112 @@ class FileStorageService:
         # If organize is False, just return the original paths
         if not organize:
             logger.info(f"Skipping file organization for generation {generation_id} (organize=False)")
+            self.record_files(file_paths, user_id, generation_id)
+            self.publish_files(file_paths)
             return file_paths
 
+        user_dir = self._organized_dir(user_id)
+        moves = [(file_path, user_dir / f"gen_{generation_id}_{Path(file_path).name}") for file_path in file_paths]
+
+        workers = min(self.max_workers, len(moves))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(lambda move: self._move_file(*move), moves))
+        else:
+            results = [self._move_file(*move) for move in moves]
+
+        return self._record_organized(moves, results, user_id, generation_id)
+
+    async def organize_generation_files_async(
+        self,
+        generation_id: int,
+        user_id: UUID,
+        file_paths: List[str],
+        organize: bool = False
+    ) -> List[str]:
+        """Async variant of :meth:`organize_generation_files` for event-loop callers.
+
+        Moves run in worker threads, at most ``file-storage.workers`` at a time,
+        so the event loop is never blocked on file I/O.
+        """
+        if not file_paths or not organize:
+            return await asyncio.to_thread(
+                self.organize_generation_files, generation_id, user_id, file_paths, organize
+            )
+
+        user_dir = await asyncio.to_thread(self._organized_dir, user_id)
+        moves = [(file_path, user_dir / f"gen_{generation_id}_{Path(file_path).name}") for file_path in file_paths]
+        semaphore = asyncio.Semaphore(self.max_workers)
+
+        async def move(source: str, target: Path) -> Optional[str]:
+            async with semaphore:
+                return await asyncio.to_thread(self._move_file, source, target)
+
+        results = await asyncio.gather(*(move(*pair) for pair in moves))
+        return await asyncio.to_thread(self._record_organized, moves, results, user_id, generation_id)
+
+    def _organized_dir(self, user_id: UUID) -> Path:
         # Create user directory structure: user_id/YYYY/MM/DD/
         now = datetime.utcnow()
         user_dir = self.base_output_dir / str(user_id) / now.strftime("%Y") / now.strftime("%m") / now.strftime("%d")
         user_dir.mkdir(parents=True, exist_ok=True)
+        return user_dir
 
-        organized_paths = []
+    @staticmethod
+    def _move_file(file_path: str, target_path: Path) -> Optional[str]:
+        """Move one file; returns its new path, the original path if the move failed, or None if missing."""
+        source_path = Path(file_path)
 
-        for file_path in file_paths:
-            source_path = Path(file_path)
+        if not source_path.exists():
+            logger.warning(f"Source file not found: {file_path}")
+            return None
 
-            if not source_path.exists():
-                logger.warning(f"Source file not found: {file_path}")
-                continue
+        try:
+            shutil.move(str(source_path), str(target_path))
+            logger.info(f"Organized file: {file_path} -> {target_path}")
+            return str(target_path)
 
-            # Create organized filename: gen_{generation_id}_{original_name}
-            organized_filename = f"gen_{generation_id}_{source_path.name}"
-            target_path = user_dir / organized_filename
+        except Exception as e:
+            logger.error(f"Failed to organize file {file_path}: {e}")
+            # If move fails, keep original path
+            return file_path
 
-            try:
-                # Move file to organized location
-                shutil.move(str(source_path), str(target_path))
-                organized_paths.append(str(target_path))
-                logger.info(f"Organized file: {file_path} -> {target_path}")
+    def _record_organized(
+        self,
+        moves: List[Tuple[str, Path]],
+        results: List[Optional[str]],
+        user_id: UUID,
+        generation_id: int
+    ) -> List[str]:
+        organized_paths = [result for result in results if result is not None]
+        if self.index is not None:
+            moved_from = [
+                self._relative(Path(source)) for (source, _), result in zip(moves, results)
+                if result is not None and result != source
+            ]
+            self.index.remove(relative for relative in moved_from if relative is not None)
+        self.record_files(organized_paths, user_id, generation_id)
+        self.publish_files(organized_paths)
+        return organized_paths
 
-            except Exception as e:
-                logger.error(f"Failed to organize file {file_path}: {e}")
-                # If move fails, keep original path
-                organized_paths.append(file_path)
+    def publish_files(self, file_paths: List[str]) -> int:
+        """Upload files to a remote object storage backend, several at a time.
 
-        return organized_paths
+        Large files go up as parallel multipart uploads. With the local backend
+        the output directory already is the storage, so nothing happens.
+
+        Args:
+            file_paths: Files under the output directory; others are skipped
+
+        Returns:
+            Number of files uploaded
+        """
+        if not self.storage.remote:
+            return 0
+        items = [(file_path, self.storage.key_for(file_path)) for file_path in file_paths]
+        uploaded = self.storage.put_files([(file_path, key) for file_path, key in items if key is not None])
+        logger.info(f"Uploaded {uploaded}/{len(file_paths)} files to {self.storage.name} storage")
+        return uploaded
 
     def get_user_storage_usage(self, user_id: UUID) -> Dict[str, int]:
         """Get storage usage statistics for a user.
@@ -101,135 +283,126 @@ class FileStorageService:
         Returns:
             Dictionary with storage usage statistics
         """
-        user_dir = self.base_output_dir / str(user_id)
-
-        if not user_dir.exists():
-            return {
-                "total_files": 0,
-                "total_size_bytes": 0,
-                "total_size_mb": 0,
-                "generations": 0,
-                "thumbnails": 0
-            }
-
-        total_files = 0
-        total_size = 0
-        generations = 0
-        thumbnails = 0
-
-        # Count generation files
-        for file_path in user_dir.rglob("*"):
-            if file_path.is_file():
-                total_files += 1
-                total_size += file_path.stat().st_size
-
-                if file_path.name.startswith("gen_"):
-                    generations += 1
-
-        # Count thumbnails
-        user_thumbnails_pattern = f"{user_id}_*"
-        for thumbnail_path in self.thumbnails_dir.glob(user_thumbnails_pattern):
-            if thumbnail_path.is_file():
-                thumbnails += 1
+        usage = self._usage_index().user_usage(user_id)
+        generation_usage = usage["generation"]
 
         return {
-            "total_files": total_files,
-            "total_size_bytes": total_size,
-            "total_size_mb": round(total_size / (1024 * 1024), 2),
-            "generations": generations,
-            "thumbnails": thumbnails
+            "total_files": generation_usage["files"],
+            "total_size_bytes": generation_usage["bytes"],
+            "total_size_mb": round(generation_usage["bytes"] / (1024 * 1024), 2),
+            "generations": generation_usage["generation_files"],
+            "thumbnails": usage["thumbnail"]["files"]
         }
 
-    def cleanup_old_files(self, days_old: int = 30) -> Dict[str, int]:
+    def cleanup_old_files(self, days_old: Optional[int] = 30, dry_run: bool = False) -> Dict[str, Any]:
         """Clean up files older than specified days.
 
+        The output directory is walked with ``scandir`` on a thread pool and
+        expired files are unlinked in batches of ``file-storage.cleanup-batch-size``
+        in parallel. The same walk reconciles the storage index with the disk.
+
         Args:
-            days_old: Remove files older than this many days
+            days_old: Remove generation files and thumbnails older than this many
+                days; None removes temp files only
+            dry_run: Report what would be deleted without deleting anything
 
         Returns:
             Dictionary with cleanup statistics
         """
-        cutoff_date = datetime.utcnow() - timedelta(days=days_old)
-        cutoff_timestamp = cutoff_date.timestamp()
-
         stats = {
             "generations_deleted": 0,
             "thumbnails_deleted": 0,
             "temp_files_deleted": 0,
             "bytes_freed": 0,
-            "errors": 0
+            "files_scanned": 0,
+            "directories_removed": 0,
+            "errors": 0,
+            "dry_run": dry_run
         }
-
-        # Clean up generation files from base output directory
-        # Skip thumbnails and temp subdirectories
-        for file_path in self.base_output_dir.rglob("*"):
-            if file_path.is_file():
-                # Skip thumbnails and temp directories
-                if self.thumbnails_dir in file_path.parents or self.temp_dir in file_path.parents:
-                    continue
-                try:
-                    if file_path.stat().st_mtime < cutoff_timestamp:
-                        file_size = file_path.stat().st_size
-                        file_path.unlink()
-                        stats["generations_deleted"] += 1
-                        stats["bytes_freed"] += file_size
-                        logger.debug(f"Deleted old generation file: {file_path}")
-
-                except Exception as e:
-                    logger.error(f"Failed to delete generation file {file_path}: {e}")
-                    stats["errors"] += 1
-
-        # Clean up thumbnail files
-        for file_path in self.thumbnails_dir.rglob("*"):
-            if file_path.is_file():
-                try:
-                    if file_path.stat().st_mtime < cutoff_timestamp:
-                        file_size = file_path.stat().st_size
-                        file_path.unlink()
-                        stats["thumbnails_deleted"] += 1
-                        stats["bytes_freed"] += file_size
-                        logger.debug(f"Deleted old thumbnail: {file_path}")
-
-                except Exception as e:
-                    logger.error(f"Failed to delete thumbnail {file_path}: {e}")
-                    stats["errors"] += 1
-
-        # Clean up temp files (any age)
-        for file_path in self.temp_dir.rglob("*"):
-            if file_path.is_file():
-                try:
-                    file_size = file_path.stat().st_size
-                    file_path.unlink()
-                    stats["temp_files_deleted"] += 1
-                    stats["bytes_freed"] += file_size
-                    logger.debug(f"Deleted temp file: {file_path}")
-
-                except Exception as e:
-                    logger.error(f"Failed to delete temp file {file_path}: {e}")
-                    stats["errors"] += 1
-
-        # Clean up empty directories
-        self._cleanup_empty_directories(self.base_output_dir)
-        self._cleanup_empty_directories(self.thumbnails_dir)
+        counters = {"generation": "generations_deleted", "thumbnail": "thumbnails_deleted", "temp": "temp_files_deleted"}
+        cutoff_ns = None
+        if days_old is not None:
+            cutoff_ns = int((datetime.utcnow() - timedelta(days=days_old)).timestamp() * 1_000_000_000)
+
+        scan_started = time.time()
+        scanned = scan_tree(self.base_output_dir, self.max_workers, skip=self._index_skip())
+        stats["files_scanned"] = len(scanned.files)
+        stats["errors"] += scanned.errors
+
+        expired = []
+        for relative, size, mtime_ns in scanned.files:
+            kind = classify(relative)[0]
+            # Temp files go regardless of age
+            if kind == "temp" or (cutoff_ns is not None and mtime_ns < cutoff_ns):
+                expired.append((relative, kind, size))
+
+        deleted = set()
+        if dry_run:
+            for relative, kind, size in expired:
+                stats[counters[kind]] += 1
+                stats["bytes_freed"] += size
+        else:
+            batches = [
+                expired[offset:offset + self.cleanup_batch_size]
+                for offset in range(0, len(expired), self.cleanup_batch_size)
+            ]
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                for batch_deleted, batch_missing, batch_errors in executor.map(self._unlink_batch, batches):
+                    for relative, kind, size in batch_deleted:
+                        stats[counters[kind]] += 1
+                        stats["bytes_freed"] += size
+                        deleted.add(relative)
+                    deleted.update(batch_missing)
+                    stats["errors"] += batch_errors
+
+            stats["directories_removed"] = self._remove_empty_directories(scanned.directories)
+            if self.index is not None:
+                remaining = [entry for entry in scanned.files if entry[0] not in deleted]
+                self.index.reconcile(remaining, scan_started)
 
         logger.info(f"Cleanup completed: {stats}")
         return stats
 
-    def _cleanup_empty_directories(self, base_path: Path):
-        """Recursively remove empty directories.
+    def _unlink_batch(self, batch: List[Tuple[str, str, int]]) -> Tuple[List[Tuple[str, str, int]], List[str], int]:
+        deleted = []
+        missing = []
+        errors = 0
+        for relative, kind, size in batch:
+            try:
+                os.unlink(self.base_output_dir / relative)
+                deleted.append((relative, kind, size))
+                logger.debug(f"Deleted old {kind} file: {relative}")
+            except FileNotFoundError:
+                # Deleted since the scan
+                missing.append(relative)
+            except OSError as e:
+                logger.error(f"Failed to delete {kind} file {relative}: {e}")
+                errors += 1
+        return deleted, missing, errors
+
+    def _remove_empty_directories(self, directories: List[str]) -> int:
+        """Remove empty directories found by a scan, deepest first.
 
         Args:
-            base_path: Base path to start cleanup from
+            directories: Relative directory paths from :func:`scan_tree`
+
+        Returns:
+            Number of directories removed
         """
-        for dir_path in sorted(base_path.rglob("*"), key=lambda p: len(p.parts), reverse=True):
-            if dir_path.is_dir() and dir_path != base_path:
-                try:
-                    # Only remove if directory is empty
-                    dir_path.rmdir()
-                    logger.debug(f"Removed empty directory: {dir_path}")
-                except OSError:
-                    # Directory not empty or other error, skip
-                    pass
+        removed = 0
+        keep = {"", "thumbnails", "temp"}
+        for relative in sorted(directories, key=lambda d: d.count("/"), reverse=True):
+            if relative in keep:
+                continue
+            try:
+                # Only remove if directory is empty
+                os.rmdir(self.base_output_dir / relative)
+                removed += 1
+                logger.debug(f"Removed empty directory: {relative}")
+            except OSError:
+                # Directory not empty or other error, skip
+                pass
+        return removed
 
     def validate_file_path(self, file_path: str) -> bool:
         """Validate that a file path is within allowed directories.
@@ -287,40 +460,48 @@ class FileStorageService:
     def cleanup_generation_files(self, generation_id: int) -> int:
         """Clean up all files associated with a generation.
 
+        Deletes the files the storage index attributes to the generation plus any
+        ``gen_{generation_id}_*`` / ``gen_job_{generation_id}_*`` file in the
+        directories it is known to write to (the output root, ``thumbnails/`` and
+        the directories of its indexed files), which catches outputs written
+        since the last reconcile.
+
         Args:
             generation_id: Generation ID to clean up
 
         Returns:
             Number of files deleted
         """
-        deleted_count = 0
-
-        # Find and delete generation files (pattern: gen_{generation_id}_*)
-        pattern = f"gen_{generation_id}_*"
-
-        for file_path in self.base_output_dir.rglob(pattern):
-            if file_path.is_file():
-                try:
-                    file_path.unlink()
-                    deleted_count += 1
-                    logger.debug(f"Deleted generation file: {file_path}")
-                except Exception as e:
-                    logger.error(f"Failed to delete generation file {file_path}: {e}")
-
-        # Find and delete associated thumbnails
-        for thumbnail_path in self.thumbnails_dir.glob(f"gen_{generation_id}_*"):
-            if thumbnail_path.is_file():
-                try:
-                    thumbnail_path.unlink()
-                    deleted_count += 1
-                    logger.debug(f"Deleted generation thumbnail: {thumbnail_path}")
-                except Exception as e:
-                    logger.error(f"Failed to delete generation thumbnail {thumbnail_path}: {e}")
-
-        if deleted_count > 0:
-            logger.info(f"Cleaned up {deleted_count} files for generation {generation_id}")
-
-        return deleted_count
+        index = self._usage_index()
+        paths = set(index.generation_paths(generation_id))
+        directories = {self.base_output_dir, self.thumbnails_dir}
+        directories.update((self.base_output_dir / relative).parent for relative in paths)
+        for directory in directories:
+            for pattern in (f"gen_{generation_id}_*", f"gen_job_{generation_id}_*"):
+                for path in directory.glob(pattern):
+                    relative = self._relative(path)
+                    if relative is not None and path.is_file():
+                        paths.add(relative)
+
+        deleted = []
+        missing = []
+        for relative in sorted(paths):
+            try:
+                os.unlink(self.base_output_dir / relative)
+                deleted.append(relative)
+                logger.debug(f"Deleted generation file: {relative}")
+            except FileNotFoundError:
+                missing.append(relative)
+            except Exception as e:
+                logger.error(f"Failed to delete generation file {relative}: {e}")
+
+        index.remove(deleted + missing)
+        if self.storage.remote:
+            self.storage.delete(deleted + missing)
+        if deleted:
+            logger.info(f"Cleaned up {len(deleted)} files for generation {generation_id}")
+
+        return len(deleted)
 
     def get_storage_statistics(self) -> Dict[str, int]:
         """Get overall storage statistics.
@@ -328,41 +509,14 @@ class FileStorageService:
         Returns:
             Dictionary with storage statistics
         """
-        stats = {
-            "total_generations": 0,
-            "total_thumbnails": 0,
-            "total_temp_files": 0,
-            "total_size_bytes": 0,
-            "total_size_mb": 0,
-            "users_with_data": 0
-        }
-
-        # Count generation files (excluding thumbnails and temp)
-        for file_path in self.base_output_dir.rglob("*"):
-            if file_path.is_file():
-                # Skip thumbnails and temp directories
-                if self.thumbnails_dir in file_path.parents or self.temp_dir in file_path.parents:
-                    continue
-                stats["total_generations"] += 1
-                stats["total_size_bytes"] += file_path.stat().st_size
-
-        # Count thumbnail files
-        for file_path in self.thumbnails_dir.rglob("*"):
-            if file_path.is_file():
-                stats["total_thumbnails"] += 1
-                stats["total_size_bytes"] += file_path.stat().st_size
-
-        # Count temp files
-        for file_path in self.temp_dir.rglob("*"):
-            if file_path.is_file():
-                stats["total_temp_files"] += 1
-                stats["total_size_bytes"] += file_path.stat().st_size
-
-        # Count users with data (directories at base level that look like UUIDs)
-        for item in self.base_output_dir.iterdir():
-            if item.is_dir() and item != self.thumbnails_dir and item != self.temp_dir:
-                stats["users_with_data"] += 1
-
-        stats["total_size_mb"] = round(stats["total_size_bytes"] / (1024 * 1024), 2)
+        totals = self._usage_index().totals()
+        total_size = sum(totals[kind]["bytes"] for kind in ("generation", "thumbnail", "temp"))
 
-        return stats
+        return {
+            "total_generations": totals["generation"]["files"],
+            "total_thumbnails": totals["thumbnail"]["files"],
+            "total_temp_files": totals["temp"]["files"],
+            "total_size_bytes": total_size,
+            "total_size_mb": round(total_size / (1024 * 1024), 2),
+            "users_with_data": totals["users_with_data"]
+        }
@@ -1,13 +1,23 @@
 """Flagged content service for business logic operations."""
 
+import copy
+import logging
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Set, Tuple
 from uuid import UUID
 
 from sqlalchemy.orm import Session
 
 from genonaut.api.exceptions import EntityNotFoundError, ValidationError, DatabaseError
-from genonaut.api.repositories.flagged_content_repository import FlaggedContentRepository
+from genonaut.api.repositories.flagged_content_repository import (
+    FlaggedContentRepository,
+    SCAN_SOURCE_TYPES,
+)
 from genonaut.api.repositories.content_repository import ContentRepository
 from genonaut.api.models.requests import PaginationRequest
 from genonaut.api.models.responses import PaginatedResponse
@@ -18,6 +28,83 @@ from genonaut.utils.flagging import (
     get_default_flag_words_path
 )
 
+logger = logging.getLogger(__name__)
+
+# Number of content items fetched, analyzed and persisted per scan batch
+SCAN_BATCH_SIZE = 1000
+
+# Flag words installed in each scan worker process by _init_scan_worker
+_scan_worker_flag_words: Optional[Set[str]] = None
+
+
+def _init_scan_worker(flag_words: Set[str]) -> None:
+    """Process pool initializer that ships the flag words to the worker once."""
+    global _scan_worker_flag_words
+    _scan_worker_flag_words = flag_words
+
+
+def _analyze_in_worker(text: str) -> Dict[str, Any]:
+    """Analyze a single text inside a scan worker process."""
+    return analyze_content(text, _scan_worker_flag_words)
+
+
+@contextmanager
+def _analysis_executor(
+    flag_words: Set[str],
+    max_workers: int
+) -> Iterator[Callable[[List[str]], List[Dict[str, Any]]]]:
+    """Yield a callable that analyzes a list of texts, in parallel if requested.
+
+    With ``max_workers`` above 1 the texts are analyzed in a process pool;
+    otherwise they are analyzed inline. Daemonic processes (e.g. Celery
+    prefork workers) can't have children, and pool processes are only
+    started on the first submit, so that case is detected up front and any
+    failure to start the pool on the first batch also falls back to inline.
+    """
+    def analyze_inline(texts: List[str]) -> List[Dict[str, Any]]:
+        return [analyze_content(text, flag_words) for text in texts]
+
+    if max_workers <= 1:
+        yield analyze_inline
+        return
+
+    if multiprocessing.current_process().daemon:
+        logger.warning("Falling back to inline flag analysis: running in a daemonic process")
+        yield analyze_inline
+        return
+
+    try:
+        executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_scan_worker,
+            initargs=(flag_words,),
+        )
+    except (AssertionError, OSError, ValueError) as exc:
+        logger.warning("Falling back to inline flag analysis: %s", exc)
+        yield analyze_inline
+        return
+
+    pool_state = {"started": False, "failed": False}
+
+    def analyze_parallel(texts: List[str]) -> List[Dict[str, Any]]:
+        if pool_state["failed"]:
+            return analyze_inline(texts)
+        chunksize = max(1, len(texts) // (max_workers * 4))
+        if pool_state["started"]:
+            return list(executor.map(_analyze_in_worker, texts, chunksize=chunksize))
+        try:
+            results = list(executor.map(_analyze_in_worker, texts, chunksize=chunksize))
+        except (AssertionError, OSError, BrokenProcessPool) as exc:
+            logger.warning("Falling back to inline flag analysis: %s", exc)
+            pool_state["failed"] = True
+            executor.shutdown(wait=False, cancel_futures=True)
+            return analyze_inline(texts)
+        pool_state["started"] = True
+        return results
+
+    with executor:
+        yield analyze_parallel
+
 
 class FlaggedContentService:
     """Service class for flagged content business logic.
@@ -76,92 +163,88 @@ class FlaggedContentService:
     def scan_content_items(
         self,
         content_types: List[str] = None,
-        force_rescan: bool = False
+        force_rescan: bool = False,
+        resume_from: Optional[Dict[str, int]] = None,
+        batch_size: int = SCAN_BATCH_SIZE,
+        max_workers: int = 1,
+        progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None
     ) -> Dict[str, Any]:
         """Scan existing content items for problematic words.
 
+        Content is streamed from content_items_all in ID order with a server-side
+        cursor, so every item is covered no matter how large the tables are.
+        Already-flagged items are skipped in the database (anti-join) unless
+        ``force_rescan`` is set, and flags are written one batch at a time.
+
         Args:
             content_types: List of content types to scan ('regular', 'auto', or both).
                           Defaults to ['regular', 'auto']
-            force_rescan: If True, rescan items that are already flagged
+            force_rescan: If True, rescan items that are already flagged and refresh
+                          their existing flag records instead of skipping them
+            resume_from: Optional mapping of content type -> last scanned ID; scanning
+                         of that type continues after the given ID
+            batch_size: Number of items fetched, analyzed and persisted per batch
+            max_workers: Number of processes used to analyze each batch. Values
+                         above 1 analyze batches in a process pool.
+            progress_callback: Optional callable receiving a progress dict
+                               (same shape as the return value) after each batch
 
         Returns:
             Dictionary with scan results:
             {
                 'items_scanned': int,
                 'items_flagged': int,
-                'processing_time_ms': float
+                'processing_time_ms': float,
+                'last_scanned_ids': Dict[str, int]
             }
+
+        Raises:
+            ValidationError: If a content type is invalid or flag words are unavailable
         """
-        import time
         start_time = time.time()
 
         if content_types is None:
             content_types = ['regular', 'auto']
 
-        items_scanned = 0
-        items_flagged = 0
-
-        # Scan regular content items
-        if 'regular' in content_types:
-            regular_items = self.content_repository.get_multi(skip=0, limit=10000)
-            for item in regular_items:
-                items_scanned += 1
-
-                # Skip if already flagged and not forcing rescan
-                if not force_rescan:
-                    existing = self.repository.get_by_content_item(content_item_id=item.id)
-                    if existing:
-                        continue
-
-                # Check if item should be flagged
-                text_to_check = self._extract_text_from_content(item)
-                if text_to_check:
-                    result = self._flag_content_if_needed(
-                        text=text_to_check,
-                        content_item_id=item.id,
-                        content_item_auto_id=None,
-                        content_source='regular',
-                        creator_id=item.creator_id
-                    )
-                    if result:
-                        items_flagged += 1
-
-        # Scan auto content items
-        if 'auto' in content_types:
-            from genonaut.db.schema import ContentItemAuto
-            auto_repo = ContentRepository(self.db, model=ContentItemAuto)
-            auto_items = auto_repo.get_multi(skip=0, limit=10000)
-            for item in auto_items:
-                items_scanned += 1
-
-                # Skip if already flagged and not forcing rescan
-                if not force_rescan:
-                    existing = self.repository.get_by_content_item(content_item_auto_id=item.id)
-                    if existing:
-                        continue
-
-                # Check if item should be flagged
-                text_to_check = self._extract_text_from_content(item)
-                if text_to_check:
-                    result = self._flag_content_if_needed(
-                        text=text_to_check,
-                        content_item_id=None,
-                        content_item_auto_id=item.id,
-                        content_source='auto',
-                        creator_id=item.creator_id
+        invalid_types = set(content_types) - set(SCAN_SOURCE_TYPES)
+        if invalid_types:
+            raise ValidationError(
+                f"Invalid content types: {sorted(invalid_types)}. Must be 'regular' or 'auto'"
+            )
+
+        flag_words = self.flag_words
+        resume_from = resume_from or {}
+        progress: Dict[str, Any] = {
+            'items_scanned': 0,
+            'items_flagged': 0,
+            'processing_time_ms': 0.0,
+            'last_scanned_ids': {
+                content_source: int(resume_from.get(content_source, 0))
+                for content_source in content_types
+            },
+        }
+
+        with _analysis_executor(flag_words, max_workers) as analyze:
+            for content_source in content_types:
+                batches = self.repository.stream_scan_candidates(
+                    content_source=content_source,
+                    after_id=progress['last_scanned_ids'][content_source],
+                    include_flagged=force_rescan,
+                    batch_size=batch_size,
+                )
+                for batch in batches:
+                    progress['items_flagged'] += self._flag_scan_batch(
+                        batch, content_source, analyze, force_rescan
                     )
-                    if result:
-                        items_flagged += 1
+                    progress['items_scanned'] += len(batch)
+                    progress['last_scanned_ids'][content_source] = batch[-1].id
+                    progress['processing_time_ms'] = round((time.time() - start_time) * 1000, 2)
 
-        end_time = time.time()
-        processing_time_ms = (end_time - start_time) * 1000
+                    if progress_callback is not None:
+                        progress_callback(copy.deepcopy(progress))
 
-        return {
-            'items_scanned': items_scanned,
-            'items_flagged': items_flagged,
-            'processing_time_ms': round(processing_time_ms, 2)
-        }
+        progress['processing_time_ms'] = round((time.time() - start_time) * 1000, 2)
+        return progress
 
     def flag_content_item(
         self,
@@ -345,13 +428,75 @@ class FlaggedContentService:
 
     # Private helper methods
 
+    def _flag_scan_batch(
+        self,
+        batch: Sequence[Any],
+        content_source: str,
+        analyze: Callable[[List[str]], List[Dict[str, Any]]],
+        force_rescan: bool
+    ) -> int:
+        """Analyze one batch of scanned rows and persist its flags.
+
+        Args:
+            batch: Rows from :meth:`FlaggedContentRepository.stream_scan_candidates`
+            content_source: Source type of the batch ('regular' or 'auto')
+            analyze: Callable mapping a list of texts to analysis results
+            force_rescan: Whether the batch may contain already-flagged items
+
+        Returns:
+            Number of items in the batch that were flagged
+        """
+        texts = [self._extract_text_from_content(row) for row in batch]
+        candidates = [(row, text) for row, text in zip(batch, texts) if text]
+        analyses = analyze([text for _, text in candidates])
+
+        flagged = [
+            (row, text, analysis)
+            for (row, text), analysis in zip(candidates, analyses)
+            if analysis['should_flag']
+        ]
+        if not flagged:
+            return 0
+
+        existing: Dict[int, int] = {}
+        if force_rescan:
+            existing = self.repository.get_flag_ids_for_items(
+                content_source, [row.id for row, _, _ in flagged]
+            )
+
+        new_records = []
+        refreshed_records = []
+        for row, text, analysis in flagged:
+            record = {
+                'flagged_text': text,
+                'flagged_words': analysis['flagged_words'],
+                'total_problem_words': analysis['total_problem_words'],
+                'total_words': analysis['total_words'],
+                'problem_percentage': analysis['problem_percentage'],
+                'risk_score': analysis['risk_score'],
+            }
+            if row.id in existing:
+                refreshed_records.append({'id': existing[row.id], **record})
+            else:
+                new_records.append({
+                    'content_item_id': row.id if content_source == 'regular' else None,
+                    'content_item_auto_id': row.id if content_source == 'auto' else None,
+                    'content_source': content_source,
+                    'creator_id': row.creator_id,
+                    **record,
+                })
+
+        self.repository.bulk_create(new_records)
+        self.repository.bulk_refresh(refreshed_records)
+        return len(flagged)
+
     def _extract_text_from_content(self, content_item) -> str:
         """Extract text to check from content item.
 
         Checks item_metadata for 'prompt' field, falls back to title.
 
         Args:
-            content_item: ContentItem or ContentItemAuto instance
+            content_item: ContentItem, ContentItemAuto or scanned row
 
         Returns:
             Text to analyze
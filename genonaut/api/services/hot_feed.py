@@ -0,0 +1,403 @@
+"""Materialized "hot feed" for the default gallery views (``hot-feed`` config).
+
+Most gallery requests are the unfiltered default view: newest first, no
+search, no tags, one of the first few pages. For those, the ``(created_at, id,
+source_type)`` keys of the newest ``depth`` items are kept in Redis sorted sets,
+so a page is one ``ZREVRANGE`` plus a primary-key fetch of its rows instead of
+an ordered scan and a ``COUNT(*)`` over the partitions.
+
+There is one feed per partition combination (``items``, ``auto``,
+``items,auto``), for everyone's content and for each user's own content:
+
+- ``user-X`` and ``community-X`` together read the global feed of partition X;
+- ``user-X`` alone reads the user's feed;
+- anything else (community-only views, filters, other sort orders, cursors,
+  pages past ``depth``) falls back to the SQL path of
+  ``ContentService.get_unified_content_paginated``.
+
+Members are ``<zero-padded id>:<source_type>`` scored by ``created_at`` in
+microseconds, so ``ZREVRANGE`` returns ``created_at DESC, id DESC`` like the
+SQL. Each feed also holds a :data:`COUNT_MEMBER` sentinel whose score is minus
+the total number of items (it sorts below every real entry). A feed without
+the sentinel is treated as missing and rebuilt from the database on the next
+read.
+
+``ContentService.create_content`` / ``delete_content`` update the feeds
+containing the item in one ``MULTI`` block. Counts change with ``ZADD XX INCR``
+on the sentinel, which never recreates a feed that was not materialized (or
+expired); such partial feeds are deleted again right after. Every update also
+bumps the feed's version key, even when the feed is missing. A rebuild reads
+the version before loading its database snapshot and stores the snapshot under
+``WATCH`` of that key only if no update happened in between, so an item
+created during a rebuild is never overwritten by the older snapshot (the next
+read rebuilds again). Feeds expire ``ttl-seconds`` after their rebuild, which
+bounds the drift from content written outside ``ContentService``.
+
+:meth:`HotFeed.page` is called from the async route with its ``ReadSession``:
+the Redis round trips run in the threadpool and only the database work goes
+through ``ReadSession.run``, so the event loop is never blocked on Redis.
+"""
+
+import calendar
+import logging
+import time
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from redis.exceptions import WatchError
+from sqlalchemy import DateTime, bindparam, text
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from genonaut.api.config import get_settings
+from genonaut.api.models.requests import PaginationRequest
+from genonaut.api.services.content_query_strategies import CONTENT_ROW_SELECT
+from genonaut.api.utils.json_response import serialize_content_row
+
+if TYPE_CHECKING:  # pragma: no cover
+    from genonaut.api.dependencies import ReadSession
+
+logger = logging.getLogger(__name__)
+
+PARTITIONS = ("items", "auto")
+SOURCE_TYPES = {
+    "user-regular": ("items", "user"),
+    "user-auto": ("auto", "user"),
+    "community-regular": ("items", "community"),
+    "community-auto": ("auto", "community"),
+}
+COUNT_MEMBER = "#count"
+VERSION_SUFFIX = ":version"
+
+# After a Redis error, skip the hot feed for this many seconds instead of failing every request
+UNAVAILABLE_BACKOFF_SECONDS = 30.0
+
+_unavailable_until = 0.0
+
+
+def feed_score(created_at: datetime) -> float:
+    """Sort score of a ``created_at`` (naive UTC): microseconds since the epoch, exact in a double."""
+    return float(calendar.timegm(created_at.utctimetuple()) * 1_000_000 + created_at.microsecond)
+
+
+def feed_member(content_id: int, source_type: str) -> str:
+    # Zero-padded so equal scores order by id, as ZREVRANGE breaks ties by member
+    return f"{content_id:012d}:{source_type}"
+
+
+def parse_member(member: str) -> Tuple[int, str]:
+    content_id, source_type = member.split(":", 1)
+    return int(content_id), source_type
+
+
+def feed_scope(content_source_types: Sequence[str], user_id: Optional[UUID]) -> Optional[Tuple[Tuple[str, ...], Optional[UUID]]]:
+    """``(partitions, owner)`` of the feed serving a source type selection, or None if not materialized.
+
+    ``owner`` is None for the global feed of ``partitions``.
+    """
+    if not user_id:
+        # Source type selections only apply with a user (ContentService returns nothing otherwise)
+        return None
+    selected: Dict[str, set] = {}
+    for cst in content_source_types:
+        if cst not in SOURCE_TYPES:
+            return None
+        partition, creator = SOURCE_TYPES[cst]
+        selected.setdefault(partition, set()).add(creator)
+    if not selected:
+        return None
+    owners = {"all" if creators == {"user", "community"} else creators.pop() for creators in selected.values()}
+    if owners == {"all"}:
+        return tuple(p for p in PARTITIONS if p in selected), None
+    if owners == {"user"}:
+        return tuple(p for p in PARTITIONS if p in selected), user_id
+    return None
+
+
+class HotFeed:
+    """Precomputed first pages of the default gallery views, in Redis.
+
+    Args:
+        redis_client: Redis client (``decode_responses=True``)
+        namespace: Redis key namespace (``redis_ns``)
+        depth: Newest items kept per feed
+        ttl_seconds: Expiry of a feed after it is rebuilt
+    """
+
+    def __init__(self, redis_client: Any, namespace: str, depth: int = 500, ttl_seconds: int = 3600):
+        self.redis_client = redis_client
+        self.prefix = f"{namespace}:hot_feed"
+        self.depth = depth
+        self.ttl_seconds = ttl_seconds
+
+    def key(self, partitions: Sequence[str], owner: Optional[UUID] = None) -> str:
+        scope = f"user:{owner}" if owner else "all"
+        return f"{self.prefix}:{scope}:{','.join(partitions)}"
+
+    @staticmethod
+    def version_key(key: str) -> str:
+        return f"{key}{VERSION_SUFFIX}"
+
+    def keys_for(self, source_type: str, creator_id: UUID) -> List[str]:
+        """Feeds that contain items of ``source_type`` created by ``creator_id``."""
+        combos = [(source_type,), PARTITIONS]
+        return [self.key(combo, owner) for combo in combos for owner in (None, creator_id)]
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+    def serves(
+        self,
+        pagination: PaginationRequest,
+        content_source_types: Optional[List[str]],
+        search_term: Optional[str],
+        sort_field: str,
+        sort_order: str,
+        tags: Optional[List[str]],
+    ) -> bool:
+        """Whether a unified content request is a default view within the feed depth."""
+        return (
+            content_source_types is not None
+            and not pagination.cursor
+            and not search_term
+            and not tags
+            and sort_field == "created_at"
+            and sort_order == "desc"
+            and bool(pagination.page_size)
+            and pagination.page * pagination.page_size <= self.depth
+        )
+
+    async def page(
+        self,
+        reader: "ReadSession",
+        pagination: PaginationRequest,
+        content_source_types: List[str],
+        user_id: Optional[UUID],
+    ) -> Optional[Tuple[List[Dict[str, Any]], int]]:
+        """Items and total count of a page, or None when the page has to come from SQL."""
+        scope = feed_scope(content_source_types, user_id)
+        if scope is None or time.monotonic() < _unavailable_until:
+            return None
+        key = self.key(*scope)
+        start = (pagination.page - 1) * pagination.page_size
+        stop = start + pagination.page_size - 1
+        try:
+            members, total, version = await run_in_threadpool(self._read, key, start, stop)
+        except Exception as e:
+            _unavailable(e)
+            return None
+        if total is None:
+            rows, count = await reader.run(lambda session: self._load(session, *scope))
+            try:
+                if not await run_in_threadpool(self._store, key, rows, count, version):
+                    # Content changed while loading; this request uses SQL, the next one rebuilds
+                    return None
+                members, total, _ = await run_in_threadpool(self._read, key, start, stop)
+            except Exception as e:
+                _unavailable(e)
+                return None
+        if total is None:
+            return None
+
+        expected = max(0, min(pagination.page_size, total - start))
+        if len(members) < expected:
+            # Deletions left the feed shorter than the page; let SQL answer
+            return None
+        keys = [parse_member(member) for member in members]
+        rows = await reader.run(lambda session: self._fetch(session, keys))
+        if len(rows) != len(keys):
+            # Deleted or not yet visible (e.g. on a lagging replica)
+            return None
+        return [serialize_content_row(rows[k]) for k in keys], total
+
+    def _read(self, key: str, start: int, stop: int) -> Tuple[List[str], Optional[int], Optional[str]]:
+        pipe = self.redis_client.pipeline(transaction=False)
+        pipe.zrevrange(key, start, stop)
+        pipe.zscore(key, COUNT_MEMBER)
+        pipe.get(self.version_key(key))
+        members, count_score, version = pipe.execute()
+        members = [member for member in members if member != COUNT_MEMBER]
+        return members, None if count_score is None else int(-count_score), version
+
+    @staticmethod
+    def _fetch(session: Session, keys: Sequence[Tuple[int, str]]) -> Dict[Tuple[int, str], Any]:
+        if not keys:
+            return {}
+        query = text(f"""
+            SELECT{CONTENT_ROW_SELECT}
+            FROM content_items_all
+            WHERE content_items_all.id IN :ids
+        """).bindparams(bindparam("ids", expanding=True)).columns(created_at=DateTime, updated_at=DateTime)
+        rows = session.execute(query, {"ids": [content_id for content_id, _ in keys]})
+        wanted = set(keys)
+        return {(row.id, row.source_type): row for row in rows if (row.id, row.source_type) in wanted}
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+    def rebuild(self, session: Session, key: str, partitions: Sequence[str], owner: Optional[UUID] = None) -> bool:
+        """Load the newest ``depth`` keys and the total count of a feed from the database.
+
+        Returns:
+            False if the feed changed while loading and the snapshot was discarded
+        """
+        version = self.redis_client.get(self.version_key(key))
+        return self._store(key, *self._load(session, partitions, owner), version)
+
+    def _load(self, session: Session, partitions: Sequence[str], owner: Optional[UUID] = None) -> Tuple[List[Any], int]:
+        where = "content_items_all.source_type IN :partitions"
+        params: Dict[str, Any] = {"partitions": list(partitions), "depth": self.depth}
+        if owner:
+            where += " AND content_items_all.creator_id = :owner"
+            params["owner"] = str(owner)
+        rows = session.execute(text(f"""
+            SELECT content_items_all.id, content_items_all.source_type, content_items_all.created_at
+            FROM content_items_all
+            WHERE {where}
+            ORDER BY content_items_all.created_at DESC, content_items_all.id DESC
+            LIMIT :depth
+        """).bindparams(bindparam("partitions", expanding=True)).columns(created_at=DateTime), params).all()
+        total = session.execute(text(f"""
+            SELECT COUNT(*) FROM content_items_all WHERE {where}
+        """).bindparams(bindparam("partitions", expanding=True)), params).scalar() or 0
+        return rows, int(total)
+
+    def _store(self, key: str, rows: Sequence[Any], total: int, version: Optional[str]) -> bool:
+        """Replace the feed with a snapshot, unless an update happened since ``version`` was read."""
+        mapping = {feed_member(row.id, row.source_type): feed_score(row.created_at) for row in rows}
+        mapping[COUNT_MEMBER] = -float(total)
+        version_key = self.version_key(key)
+        with self.redis_client.pipeline(transaction=True) as pipe:
+            try:
+                pipe.watch(version_key)
+                if pipe.get(version_key) != version:
+                    return False
+                pipe.multi()
+                pipe.delete(key)
+                pipe.zadd(key, mapping)
+                pipe.expire(key, self.ttl_seconds)
+                pipe.execute()
+            except WatchError:
+                return False
+        return True
+
+    def add(self, content_id: int, source_type: str, creator_id: UUID, created_at: datetime) -> None:
+        """Put a new item at its place in the existing feeds that contain it."""
+        member = feed_member(content_id, source_type)
+        score = feed_score(created_at)
+        keys = self.keys_for(source_type, creator_id)
+        pipe = self.redis_client.pipeline(transaction=True)
+        for key in keys:
+            # XX: only complete feeds have their count moved
+            pipe.zadd(key, {COUNT_MEMBER: -1}, xx=True, incr=True)
+            pipe.zadd(key, {member: score})
+            # Keep the sentinel (rank 0, lowest score) and the newest ``depth`` items
+            pipe.zremrangebyrank(key, 1, -(self.depth + 1))
+            self._bump_version(pipe, key)
+        results = pipe.execute()
+        self._drop_incomplete(keys, results[::5])
+
+    def remove(self, content_id: int, source_type: str, creator_id: UUID) -> None:
+        """Drop a deleted item from the feeds that contain it."""
+        member = feed_member(content_id, source_type)
+        keys = self.keys_for(source_type, creator_id)
+        pipe = self.redis_client.pipeline(transaction=True)
+        for key in keys:
+            pipe.zadd(key, {COUNT_MEMBER: 1}, xx=True, incr=True)
+            pipe.zrem(key, member)
+            self._bump_version(pipe, key)
+        results = pipe.execute()
+        self._drop_incomplete(keys, results[::4])
+
+    def _bump_version(self, pipe: Any, key: str) -> None:
+        # Also for missing feeds: a rebuild in progress must not store its older snapshot
+        version_key = self.version_key(key)
+        pipe.incr(version_key)
+        pipe.expire(version_key, self.ttl_seconds)
+
+    def _drop_incomplete(self, keys: Sequence[str], counts: Sequence[Optional[float]]) -> None:
+        # A feed without the sentinel was not materialized (or expired): the update just
+        # created a partial one, which readers ignore; delete it rather than leave it behind
+        missing = [key for key, count in zip(keys, counts) if count is None]
+        if missing:
+            self.redis_client.delete(*missing)
+
+    def invalidate(self) -> int:
+        """Delete every feed (they are rebuilt on demand)."""
+        keys = list(self.redis_client.scan_iter(match=f"{self.prefix}:*"))
+        if keys:
+            self.redis_client.delete(*keys)
+        return len(keys)
+
+
+def _unavailable(error: Exception) -> None:
+    global _unavailable_until
+    _unavailable_until = time.monotonic() + UNAVAILABLE_BACKOFF_SECONDS
+    logger.warning(f"Hot feed unavailable, bypassing for {UNAVAILABLE_BACKOFF_SECONDS:.0f}s: {error}")
+
+
+def hot_feed_settings() -> Dict[str, Any]:
+    """``hot-feed`` config with defaults applied."""
+    config = get_settings().hot_feed or {}
+    return {
+        "enabled": bool(config.get("enabled", False)),
+        "depth": int(config.get("depth", 500)),
+        "ttl_seconds": int(config.get("ttl_seconds", 3600)),
+    }
+
+
+def get_hot_feed() -> Optional[HotFeed]:
+    """Hot feed from settings, or None when disabled or Redis is not configured."""
+    settings = get_settings()
+    config = hot_feed_settings()
+    if not config["enabled"] or not settings.redis_url:
+        return None
+
+    from genonaut.worker.pubsub import get_redis_client
+
+    return HotFeed(get_redis_client(), settings.redis_ns, depth=config["depth"], ttl_seconds=config["ttl_seconds"])
+
+
+async def hot_feed_page(reader: "ReadSession", query: Dict[str, Any]) -> Optional[Tuple[List[Dict[str, Any]], int]]:
+    """Page of a ``ContentService.get_unified_content_paginated`` query from the hot feed.
+
+    Args:
+        reader: Read session of the request
+        query: Keyword arguments of ``get_unified_content_paginated``
+
+    Returns:
+        Items and total count, or None when the page has to come from SQL
+    """
+    feed = get_hot_feed()
+    if feed is None or not feed.serves(
+        query["pagination"], query["content_source_types"], query["search_term"],
+        query["sort_field"], query["sort_order"], query["tags"],
+    ):
+        return None
+    return await feed.page(reader, query["pagination"], query["content_source_types"], query["user_id"])
+
+
+def record_created(content: Any) -> None:
+    """Add newly created content to the hot feeds (errors are logged, never raised)."""
+    _update(content.id, lambda feed: feed.add(content.id, content.source_type, content.creator_id, content.created_at))
+
+
+def record_deleted(content_id: int, source_type: str, creator_id: UUID) -> None:
+    """Remove deleted content from the hot feeds (errors are logged, never raised)."""
+    _update(content_id, lambda feed: feed.remove(content_id, source_type, creator_id))
+
+
+def _update(content_id: int, change: Callable[[HotFeed], None]) -> None:
+    feed = get_hot_feed()
+    if feed is None or time.monotonic() < _unavailable_until:
+        return
+    try:
+        change(feed)
+    except Exception as e:
+        # A feed that missed this change would be off by one item until it expires; drop them all instead
+        logger.warning(f"Hot feed update failed for content {content_id}: {e}")
+        try:
+            feed.invalidate()
+        except Exception as invalidate_error:
+            _unavailable(invalidate_error)
@@ -0,0 +1,635 @@
+"""Index advisor for the gallery list queries (``/api/v1/content/unified``).
+
+The advisor takes the query shapes that cost the most DB time according to
+``route_analytics`` (and, optionally, statement fingerprints reported by the SQL
+profiler), runs ``EXPLAIN (ANALYZE, BUFFERS)`` on them and proposes btree
+indexes on the content partitions (``content_items``, ``content_items_auto``):
+
+- the sort key plus ``id`` as the tie-breaker, behind any equality filter
+  (``creator_id`` for "my content" feeds), so pages come off the index in order;
+- narrow filter and output columns as ``INCLUDE`` columns when that makes the
+  query coverable, so deep pages (which the page query resolves to
+  ``(id, source_type)`` first, see ``compile_content_query``) and counts run as
+  index-only scans;
+- ``WHERE is_private = false`` for public-only statements.
+
+Wide columns (``content_data``, ``prompt``, ``item_metadata``) are never
+included: btree entries are capped at about 2.7kB. Proposals already served by
+an existing index are dropped. ``what_if`` creates the proposals inside a
+transaction, re-runs the plans and rolls back, giving before/after plans
+without keeping anything; ``render_migration`` writes them as an Alembic
+migration that builds them ``CONCURRENTLY``.
+
+``genonaut.cli.index_advisor`` is the command-line front end.
+"""
+
+import hashlib
+import json
+import logging
+import re
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.orm import Session
+
+from genonaut.api.services.cache_warmer import UNIFIED_CONTENT_ROUTE, unified_query_kwargs
+from genonaut.api.services.content_query_strategies import compile_content_query, content_query_shape
+from genonaut.api.utils.tag_identifiers import resolve_tag_uuid
+
+logger = logging.getLogger(__name__)
+
+CONTENT_PARTITIONS = ("content_items", "content_items_auto")
+
+SOURCE_TYPE_PARTITIONS = {
+    "user-regular": "content_items",
+    "user-auto": "content_items_auto",
+    "community-regular": "content_items",
+    "community-auto": "content_items_auto",
+}
+
+# Columns small enough to key or INCLUDE in a btree index
+NARROW_COLUMNS = frozenset({
+    "id", "source_type", "creator_id", "creator_username", "created_at", "updated_at",
+    "quality_score", "is_private", "content_type", "title",
+})
+
+# PostgreSQL truncates identifiers to 63 bytes
+MAX_IDENTIFIER_LENGTH = 63
+
+_BTREE_INDEX = re.compile(
+    r"ON (?:ONLY )?(?:[\w\"]+\.)?\"?(?P<table>\w+)\"?(?: USING btree)? \((?P<keys>[^()]*)\)"
+    r"(?: INCLUDE \((?P<include>[^()]*)\))?(?: WHERE (?P<where>.+))?$",
+    re.IGNORECASE,
+)
+_PARTITION_TABLE = re.compile(r"\b(content_items_auto|content_items|content_items_all)\b")
+_ORDER_BY = re.compile(r"ORDER BY (.+?)(?: LIMIT| OFFSET|\)|$)", re.IGNORECASE)
+_CREATOR_EQUALS = re.compile(r"\bcreator_id = (?:\?|\$\d+)", re.IGNORECASE)
+_PUBLIC_ONLY = re.compile(r"\bis_private (?:= false|IS false|= \?)|NOT \w*\.?is_private\b", re.IGNORECASE)
+_WHERE_COLUMNS = re.compile(r"\b(?:content_items\w*\.)?(\w+) (?:=|!=|<>|<|>|<=|>=|IN|IS) ", re.IGNORECASE)
+
+
+@dataclass(frozen=True)
+class AccessPattern:
+    """How a query reads the content partitions: what an index must serve.
+
+    Attributes:
+        partitions: Content partitions the query reads
+        equality: Columns compared with ``=`` (index key prefix)
+        order_by: ``(column, "asc"|"desc")`` pairs of the ORDER BY
+        filter_columns: Other columns filtered on (candidates for INCLUDE)
+        output_columns: Columns the scan returns
+        public_only: Filters on ``is_private = false``
+    """
+
+    partitions: Tuple[str, ...]
+    equality: Tuple[str, ...] = ()
+    order_by: Tuple[Tuple[str, str], ...] = ()
+    filter_columns: Tuple[str, ...] = ()
+    output_columns: Tuple[str, ...] = ()
+    public_only: bool = False
+
+    @property
+    def coverable(self) -> bool:
+        """Whether every column the scan touches fits in an index."""
+        touched = set(self.equality) | {col for col, _ in self.order_by} | set(self.filter_columns) | set(self.output_columns)
+        return touched <= NARROW_COLUMNS
+
+
+@dataclass(frozen=True)
+class IndexProposal:
+    """A btree index proposed for one partition."""
+
+    table: str
+    keys: Tuple[str, ...]
+    include: Tuple[str, ...] = ()
+    where: Optional[str] = None
+    reason: str = ""
+
+    @property
+    def name(self) -> str:
+        columns = "_".join(key.split()[0] for key in self.keys)
+        name = f"idx_{self.table}_{columns}"
+        if self.include:
+            name += "_cov"
+        if self.where:
+            name += "_pub"
+        if len(name) > MAX_IDENTIFIER_LENGTH:
+            digest = hashlib.sha1(name.encode("utf-8")).hexdigest()[:8]
+            name = f"{name[:MAX_IDENTIFIER_LENGTH - 9]}_{digest}"
+        return name
+
+    def create_sql(self, concurrently: bool = False) -> str:
+        sql = f"CREATE INDEX {'CONCURRENTLY ' if concurrently else ''}{self.name} ON {self.table} ({', '.join(self.keys)})"
+        if self.include:
+            sql += f" INCLUDE ({', '.join(self.include)})"
+        if self.where:
+            sql += f" WHERE {self.where}"
+        return sql
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"name": self.name, "table": self.table, "sql": self.create_sql(), "reason": self.reason}
+
+
+@dataclass
+class PlanSummary:
+    """The parts of an ``EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON)`` plan worth comparing."""
+
+    planning_ms: Optional[float] = None
+    execution_ms: Optional[float] = None
+    shared_hit_blocks: int = 0
+    shared_read_blocks: int = 0
+    heap_fetches: int = 0
+    scans: List[str] = field(default_factory=list)
+    sorts: int = 0
+    node_types: List[str] = field(default_factory=list)
+
+    @classmethod
+    def from_explain(cls, plan: Any) -> "PlanSummary":
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        top = plan[0] if isinstance(plan, list) else plan
+        root = top["Plan"]
+        summary = cls(
+            planning_ms=top.get("Planning Time"),
+            execution_ms=top.get("Execution Time"),
+            shared_hit_blocks=int(root.get("Shared Hit Blocks", 0)),
+            shared_read_blocks=int(root.get("Shared Read Blocks", 0)),
+        )
+        summary._walk(root)
+        return summary
+
+    def _walk(self, node: Mapping[str, Any]) -> None:
+        node_type = node["Node Type"]
+        self.node_types.append(node_type)
+        if node_type == "Sort":
+            self.sorts += 1
+        if "Relation Name" in node:
+            scan = f"{node_type} on {node['Relation Name']}"
+            if node.get("Index Name"):
+                scan += f" using {node['Index Name']}"
+            self.scans.append(scan)
+            self.heap_fetches += int(node.get("Heap Fetches", 0))
+        for child in node.get("Plans", ()):
+            self._walk(child)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "planning_ms": self.planning_ms,
+            "execution_ms": self.execution_ms,
+            "shared_hit_blocks": self.shared_hit_blocks,
+            "shared_read_blocks": self.shared_read_blocks,
+            "heap_fetches": self.heap_fetches,
+            "sorts": self.sorts,
+            "scans": self.scans,
+        }
+
+
+@dataclass
+class QueryCandidate:
+    """A query worth indexing for, with its plans."""
+
+    label: str
+    sql: str
+    params: Dict[str, Any]
+    pattern: AccessPattern
+    requests: int = 0
+    avg_db_ms: Optional[float] = None
+    analyze: bool = True
+    before: Optional[PlanSummary] = None
+    after: Optional[PlanSummary] = None
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "label": self.label,
+            "requests": self.requests,
+            "avg_db_ms": self.avg_db_ms,
+            "before": self.before.to_dict() if self.before else None,
+            "after": self.after.to_dict() if self.after else None,
+            "error": self.error,
+        }
+
+
+@dataclass
+class AdvisorReport:
+    candidates: List[QueryCandidate] = field(default_factory=list)
+    proposals: List[IndexProposal] = field(default_factory=list)
+    what_if: bool = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "candidates": [candidate.to_dict() for candidate in self.candidates],
+            "proposals": [proposal.to_dict() for proposal in self.proposals],
+            "what_if": self.what_if,
+        }
+
+
+def pattern_for_shape(
+    content_source_types: Sequence[str],
+    creator_filters: Sequence[str],
+    sort_field: str,
+    sort_order: str,
+    deferred_join: bool,
+    count: bool = False,
+) -> AccessPattern:
+    """Access pattern of a unified content page (or count) query.
+
+    Args:
+        content_source_types: Requested content source types
+        creator_filters: Content source types filtered by creator (``QueryShape.creator_filters``)
+        sort_field: Sort column
+        sort_order: ``"asc"`` or ``"desc"``
+        deferred_join: The page query selects ``(id, source_type)`` first (deep pages without search)
+        count: Pattern of the count query instead of the page query
+    """
+    partitions = tuple(sorted({SOURCE_TYPE_PARTITIONS[cst] for cst in content_source_types
+                               if cst in SOURCE_TYPE_PARTITIONS})) or CONTENT_PARTITIONS
+    own_only = bool(creator_filters) and all(cst.startswith("user-") for cst in creator_filters)
+    equality = ("creator_id",) if own_only else ()
+    filters = ("creator_id",) if creator_filters and not own_only else ()
+    if count:
+        return AccessPattern(partitions=partitions, equality=equality, filter_columns=filters)
+    direction = "desc" if sort_order == "desc" else "asc"
+    outputs = ("id", "source_type") if deferred_join else ("id", "source_type", "content_data", "prompt")
+    return AccessPattern(
+        partitions=partitions,
+        equality=equality,
+        order_by=((sort_field, direction), ("id", direction)),
+        filter_columns=filters,
+        output_columns=outputs,
+    )
+
+
+def pattern_for_statement(statement: str) -> Optional[AccessPattern]:
+    """Best-effort access pattern of a profiled statement fingerprint on the content tables."""
+    tables = set(_PARTITION_TABLE.findall(statement))
+    if not tables:
+        return None
+    partitions = CONTENT_PARTITIONS if "content_items_all" in tables else tuple(sorted(tables & set(CONTENT_PARTITIONS)))
+    order_by: List[Tuple[str, str]] = []
+    match = _ORDER_BY.search(statement)
+    if match:
+        for term in match.group(1).split(","):
+            words = term.strip().split()
+            if not words:
+                continue
+            column = words[0].split(".")[-1]
+            if not re.fullmatch(r"\w+", column):
+                return None  # expression ordering; not something a plain index serves
+            order_by.append((column, "desc" if len(words) > 1 and words[1].lower() == "desc" else "asc"))
+    public_only = bool(_PUBLIC_ONLY.search(statement))
+    equality = ("creator_id",) if _CREATOR_EQUALS.search(statement) else ()
+    where = statement.split(" WHERE ", 1)[1] if " WHERE " in statement else ""
+    filters = tuple(sorted(
+        (set(_WHERE_COLUMNS.findall(where)) & NARROW_COLUMNS) - set(equality) - {"is_private"}
+    ))
+    return AccessPattern(
+        partitions=partitions,
+        equality=equality,
+        order_by=tuple(order_by),
+        filter_columns=filters,
+        output_columns=("content_data",),  # profiled statements select whole rows
+        public_only=public_only,
+    )
+
+
+def propose_indexes(pattern: AccessPattern, reason: str = "") -> List[IndexProposal]:
+    """Indexes serving ``pattern``, one per partition."""
+    keys = list(pattern.equality) + [f"{column} {direction.upper()}" for column, direction in pattern.order_by]
+    if not keys:
+        return []
+    key_columns = {key.split()[0] for key in keys}
+    include: Tuple[str, ...] = ()
+    if pattern.coverable:
+        include = tuple(sorted(
+            (set(pattern.filter_columns) | set(pattern.output_columns)) - key_columns - {"is_private"}
+        ))
+    where = "is_private = false" if pattern.public_only else None
+    return [
+        IndexProposal(table=table, keys=tuple(keys), include=include, where=where, reason=reason)
+        for table in pattern.partitions
+    ]
+
+
+def parse_index_definition(indexdef: str) -> Optional[Tuple[str, Tuple[str, ...], Tuple[str, ...], Optional[str]]]:
+    """``(table, keys, include, where)`` of a btree index definition (None for other indexes).
+
+    Accepts ``pg_indexes.indexdef`` and :meth:`IndexProposal.create_sql` output.
+    """
+    match = _BTREE_INDEX.search(indexdef.strip())
+    if not match:
+        return None
+
+    def columns(value: Optional[str]) -> Tuple[str, ...]:
+        return tuple(" ".join(part.replace('"', "").split()) for part in value.split(",")) if value else ()
+
+    return match.group("table"), columns(match.group("keys")), columns(match.group("include")), match.group("where")
+
+
+def _predicate(where: Optional[str]) -> Optional[str]:
+    return " ".join(where.replace("(", " ").replace(")", " ").lower().split()) if where else None
+
+
+def _key_parts(key: str) -> Tuple[str, str]:
+    words = key.lower().split()
+    return words[0], "desc" if "desc" in words[1:] else "asc"
+
+
+def is_served_by(proposal: IndexProposal, indexdef: str) -> bool:
+    """Whether an existing index (``pg_indexes.indexdef``) already does what ``proposal`` would.
+
+    The existing index must be on the same table, start with the proposed keys
+    (in the same or the exactly reversed directions, as btrees scan both ways),
+    hold every proposed INCLUDE column, and have the same predicate.
+    """
+    parsed = parse_index_definition(indexdef)
+    if parsed is None:
+        return False
+    table, keys, include, where = parsed
+    if table != proposal.table or len(keys) < len(proposal.keys):
+        return False
+    if _predicate(where) != _predicate(proposal.where):
+        return False
+    wanted = [_key_parts(key) for key in proposal.keys]
+    existing = [_key_parts(key) for key in keys[:len(proposal.keys)]]
+    if [column for column, _ in wanted] != [column for column, _ in existing]:
+        return False
+    # Equality-prefix columns do not care about direction; the ordered tail must match or be fully reversed
+    ordered = [i for i, key in enumerate(proposal.keys) if len(key.split()) > 1]
+    same = all(wanted[i][1] == existing[i][1] for i in ordered)
+    reversed_ = all(wanted[i][1] != existing[i][1] for i in ordered)
+    if not (same or reversed_):
+        return False
+    available = {_key_parts(key)[0] for key in keys} | {column.lower() for column in include}
+    return set(proposal.include) <= available
+
+
+def dedupe_proposals(proposals: Iterable[IndexProposal]) -> List[IndexProposal]:
+    """Drop proposals another proposal (or the same one) already serves, keeping order."""
+    unique: Dict[str, IndexProposal] = {}
+    for proposal in proposals:
+        unique.setdefault(proposal.name, proposal)
+    kept = []
+    for proposal in unique.values():
+        others = [other for other in unique.values() if other is not proposal and other.table == proposal.table]
+        if any(is_served_by(proposal, other.create_sql()) and not is_served_by(other, proposal.create_sql())
+               for other in others):
+            continue
+        kept.append(proposal)
+    return kept
+
+
+def render_migration(
+    proposals: Sequence[IndexProposal],
+    revision: str,
+    down_revision: Optional[str],
+    message: str = "add advised content indexes",
+    created_at: Optional[datetime] = None,
+) -> str:
+    """Alembic migration creating ``proposals`` concurrently (and dropping them on downgrade)."""
+    created_at = created_at or datetime.now()
+    notes = "\n".join(f"- {proposal.name}: {proposal.reason}" if proposal.reason else f"- {proposal.name}"
+                      for proposal in proposals)
+    creates = []
+    drops = []
+    for proposal in proposals:
+        args = [
+            f"            '{proposal.name}',",
+            f"            '{proposal.table}',",
+            f"            [{', '.join(f'sa.text({key!r})' for key in proposal.keys)}],",
+        ]
+        if proposal.include:
+            args.append(f"            postgresql_include={list(proposal.include)!r},")
+        if proposal.where:
+            args.append(f"            postgresql_where=sa.text({proposal.where!r}),")
+        args.append("            postgresql_concurrently=True,")
+        args.append("            if_not_exists=True,")
+        creates.append("        op.create_index(\n" + "\n".join(args) + "\n        )")
+        drops.append(
+            f"        op.drop_index('{proposal.name}', table_name='{proposal.table}', "
+            f"postgresql_concurrently=True, if_exists=True)"
+        )
+    down = repr(down_revision)
+    return f'''"""{message}
+
+Revision ID: {revision}
+Revises: {down_revision or ''}
+Create Date: {created_at.isoformat(sep=' ')}
+
+Generated by genonaut.cli.index_advisor:
+{notes}
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '{revision}'
+down_revision: Union[str, Sequence[str], None] = {down}
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+{chr(10).join(creates)}
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+{chr(10).join(reversed(drops))}
+'''
+
+
+def generic_plan_sql(fingerprint: str) -> str:
+    """Turn a profiler fingerprint (``?`` placeholders) into SQL for ``EXPLAIN (GENERIC_PLAN)``."""
+    counter = iter(range(1, fingerprint.count("?") + 1))
+    return re.sub(r"\?", lambda _: f"${next(counter)}", fingerprint)
+
+
+class IndexAdvisor:
+    """Explain the most expensive gallery queries and propose indexes for them.
+
+    Args:
+        session: Database session (PostgreSQL)
+        top_n: Query shapes to take from ``route_analytics``
+        lookback_days: Analytics window
+    """
+
+    def __init__(self, session: Session, top_n: int = 10, lookback_days: int = 7):
+        self.session = session
+        self.top_n = top_n
+        self.lookback_days = lookback_days
+
+    def route_candidates(self) -> List[QueryCandidate]:
+        """Page and count queries of the ``/unified`` patterns that spent the most DB time."""
+        rows = self.session.execute(text("""
+            SELECT
+                query_params_normalized AS params,
+                COUNT(*) AS requests,
+                AVG(COALESCE(db_duration_ms, duration_ms)) AS avg_db_ms,
+                MODE() WITHIN GROUP (ORDER BY COALESCE(query_params->>'page', '1')) AS page
+            FROM route_analytics
+            WHERE timestamp > NOW() - INTERVAL '1 day' * :lookback_days
+                AND route = :route
+                AND method = 'GET'
+                AND status_code < 400
+                AND (query_params->>'cursor') IS NULL
+            GROUP BY query_params_normalized
+            ORDER BY SUM(COALESCE(db_duration_ms, duration_ms)) DESC
+            LIMIT :limit
+        """), {"lookback_days": self.lookback_days, "route": UNIFIED_CONTENT_ROUTE, "limit": self.top_n})
+
+        candidates: List[QueryCandidate] = []
+        for row in rows:
+            params = dict(row.params or {})
+            params["page"] = row.page or "1"
+            try:
+                candidates.extend(self._unified_candidates(params, int(row.requests), row.avg_db_ms))
+            except Exception as e:
+                logger.warning(f"Skipping /unified pattern {params}: {e}")
+        return candidates
+
+    def _unified_candidates(self, params: Dict[str, Any], requests: int,
+                            avg_db_ms: Optional[float]) -> List[QueryCandidate]:
+        query = unified_query_kwargs(params)
+        content_source_types = query["content_source_types"]
+        if content_source_types is None:
+            # Legacy content_types/creator_filter requests go through the ORM path
+            return []
+        if not re.fullmatch(r"\w+", query["sort_field"]):
+            raise ValueError(f"unsupported sort field {query['sort_field']!r}")
+        tag_uuids = [resolve_tag_uuid(tag) for tag in query["tags"] or []]
+        shape, bind = content_query_shape(
+            query["pagination"], content_source_types, query["user_id"], tag_uuids,
+            query["tag_match"], query["search_term"], query["sort_field"], query["sort_order"],
+        )
+        compiled = compile_content_query(shape)
+        deferred = shape.has_offset and not (shape.phrase_count or shape.word_count)
+        label = json.dumps({key: value for key, value in params.items() if key != "user_id"}, sort_keys=True)
+
+        page = QueryCandidate(
+            label=f"page {label}",
+            sql=compiled.page_sql.text,
+            params=bind,
+            pattern=pattern_for_shape(content_source_types, shape.creator_filters,
+                                      shape.sort_field, shape.sort_order, deferred),
+            requests=requests,
+            avg_db_ms=float(avg_db_ms) if avg_db_ms is not None else None,
+        )
+        if compiled.count_from_stats or shape.tag_count > 1:
+            # Served by tag_cardinality_stats / the content_tags CTE, not by content indexes
+            return [page]
+        count = QueryCandidate(
+            label=f"count {label}",
+            sql=compiled.count_sql.text,
+            params=bind,
+            pattern=pattern_for_shape(content_source_types, shape.creator_filters,
+                                      shape.sort_field, shape.sort_order, deferred, count=True),
+            requests=requests,
+            avg_db_ms=page.avg_db_ms,
+        )
+        return [page, count]
+
+    def profile_candidates(self, report: Mapping[str, Any], limit: Optional[int] = None) -> List[QueryCandidate]:
+        """Candidates from a ``GET /api/v1/admin/sql-profile`` response.
+
+        Fingerprints carry no values, so they are explained with
+        ``EXPLAIN (GENERIC_PLAN)`` (PostgreSQL 16+) rather than ANALYZE.
+        """
+        totals: Dict[str, Dict[str, float]] = {}
+        for profile in report.get("profiles", []):
+            for stats in profile.get("repeated", []):
+                entry = totals.setdefault(stats["fingerprint"], {"count": 0, "total_ms": 0.0})
+                entry["count"] += stats["count"]
+                entry["total_ms"] += stats["total_ms"]
+        for stats in report.get("n_plus_one_statements", []):
+            entry = totals.setdefault(stats["fingerprint"], {"count": 0, "total_ms": 0.0})
+            entry["count"] = max(entry["count"], stats.get("executions", 0))
+
+        candidates = []
+        for statement, entry in sorted(totals.items(), key=lambda item: -item[1]["total_ms"]):
+            if not statement.lstrip().upper().startswith("SELECT"):
+                continue
+            pattern = pattern_for_statement(statement)
+            if pattern is None:
+                continue
+            candidates.append(QueryCandidate(
+                label=f"profiled {statement[:80]}",
+                sql=generic_plan_sql(statement),
+                params={},
+                pattern=pattern,
+                requests=int(entry["count"]),
+                avg_db_ms=entry["total_ms"] / entry["count"] if entry["count"] else None,
+                analyze=False,
+            ))
+        return candidates[:limit] if limit else candidates
+
+    def explain(self, candidate: QueryCandidate) -> PlanSummary:
+        """Plan ``candidate``; ANALYZE actually runs the (read-only) query."""
+        options = "ANALYZE, BUFFERS, FORMAT JSON" if candidate.analyze else "GENERIC_PLAN, FORMAT JSON"
+        plan = self.session.execute(text(f"EXPLAIN ({options}) {candidate.sql}"), candidate.params).scalar()
+        return PlanSummary.from_explain(plan)
+
+    def existing_indexes(self) -> List[str]:
+        """``indexdef`` of every index on the content partitions."""
+        rows = self.session.execute(
+            text("SELECT indexdef FROM pg_indexes WHERE tablename IN :tables").bindparams(
+                bindparam("tables", expanding=True)
+            ),
+            {"tables": list(CONTENT_PARTITIONS)},
+        )
+        return [row.indexdef for row in rows]
+
+    def propose(self, candidates: Sequence[QueryCandidate]) -> List[IndexProposal]:
+        """Proposals for ``candidates`` that no existing index already serves."""
+        existing = self.existing_indexes()
+        proposals = []
+        for candidate in candidates:
+            for proposal in propose_indexes(candidate.pattern, reason=candidate.label):
+                if not any(is_served_by(proposal, indexdef) for indexdef in existing):
+                    proposals.append(proposal)
+        return dedupe_proposals(proposals)
+
+    def what_if(self, candidates: Sequence[QueryCandidate], proposals: Sequence[IndexProposal]) -> None:
+        """Re-plan ``candidates`` with ``proposals`` built, then roll the indexes back.
+
+        The indexes are really built (holding a SHARE lock that blocks writes to
+        the partitions), so run this against a copy of production data, not
+        production itself.
+        """
+        savepoint = self.session.begin_nested()
+        try:
+            for proposal in proposals:
+                self.session.execute(text(proposal.create_sql()))
+            for candidate in candidates:
+                if candidate.before is not None:
+                    candidate.after = self.explain(candidate)
+        finally:
+            savepoint.rollback()
+
+    def advise(self, candidates: Sequence[QueryCandidate], what_if: bool = False) -> AdvisorReport:
+        """Explain ``candidates``, propose indexes and optionally measure them."""
+        report = AdvisorReport(candidates=list(candidates), what_if=what_if)
+        for candidate in report.candidates:
+            savepoint = self.session.begin_nested()
+            try:
+                candidate.before = self.explain(candidate)
+                savepoint.commit()
+            except Exception as e:
+                savepoint.rollback()
+                candidate.error = str(e).splitlines()[0]
+                logger.warning(f"Could not explain {candidate.label}: {candidate.error}")
+        explained = [candidate for candidate in report.candidates if candidate.before is not None]
+        report.proposals = self.propose(explained)
+        if what_if and report.proposals:
+            self.what_if(explained, report.proposals)
+        self.session.rollback()
+        return report
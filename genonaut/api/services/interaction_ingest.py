@@ -0,0 +1,440 @@
+"""Buffered ingestion for high-volume interactions (views and likes).
+
+``POST /api/v1/interactions`` validates the user and content and commits one
+row per call, which is too expensive for view tracking on a busy gallery.
+Events accepted through ``POST /api/v1/interactions/events`` are instead
+appended to a buffer and written later in batches:
+
+- ``RedisInteractionBuffer`` appends to a Redis stream shared by all API
+  workers; the ``flush_interaction_events`` Celery task drains it through a
+  consumer group, so a batch is only removed once it has been committed.
+- ``MemoryInteractionBuffer`` keeps events in process and is flushed by a
+  background thread in each API worker. It is used when the backend is
+  ``memory`` and as a fallback while Redis is unreachable.
+
+Repeated views of the same content by the same user within
+``interaction_ingest_dedupe_window_seconds`` are collapsed at enqueue time.
+Flushing validates users and content with bulk ``IN`` lookups and writes each
+batch with one multi-row insert (see
+:meth:`InteractionRepository.bulk_record_interactions`). Ratings and other
+interaction types keep the synchronous endpoint.
+"""
+
+import json
+import logging
+import os
+import socket
+import threading
+import time
+from collections import OrderedDict, deque
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from genonaut.api.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Interaction types accepted by the buffered ingestion path
+BUFFERED_INTERACTION_TYPES = frozenset({"view", "like"})
+# Interaction types collapsed when repeated within the dedupe window
+DEDUPED_INTERACTION_TYPES = frozenset({"view"})
+
+Entry = Tuple[Any, Dict[str, Any]]
+
+
+def _dedupe_key(event: Dict[str, Any]) -> Optional[str]:
+    if event["interaction_type"] not in DEDUPED_INTERACTION_TYPES:
+        return None
+    return f"{event['user_id']}:{event['content_item_id']}:{event['interaction_type']}"
+
+
+def collapse_duplicates(events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Keep only the first event per user/content for deduplicated types."""
+    seen = set()
+    collapsed = []
+    for event in events:
+        key = _dedupe_key(event)
+        if key is not None:
+            if key in seen:
+                continue
+            seen.add(key)
+        collapsed.append(event)
+    return collapsed
+
+
+class MemoryInteractionBuffer:
+    """In-process interaction buffer with a time-window dedupe.
+
+    Holds at most ``max_pending`` events; beyond that the oldest are dropped,
+    which is acceptable for view/like counters but logged.
+    """
+
+    def __init__(self, dedupe_window_seconds: float = 30.0, max_pending: int = 100000):
+        self.dedupe_window_seconds = dedupe_window_seconds
+        self._events: deque = deque()
+        self._max_pending = max_pending
+        self._seen: "OrderedDict[str, float]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.dropped = 0
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def enqueue_many(self, events: Iterable[Dict[str, Any]]) -> Tuple[int, int]:
+        """Append events, skipping duplicates within the dedupe window.
+
+        Returns:
+            Tuple of (accepted, duplicates)
+        """
+        accepted = duplicates = 0
+        now = time.monotonic()
+        with self._lock:
+            # Keys expire in insertion order because the window is fixed
+            while self._seen and next(iter(self._seen.values())) <= now:
+                self._seen.popitem(last=False)
+
+            for event in events:
+                key = _dedupe_key(event) if self.dedupe_window_seconds > 0 else None
+                if key is not None:
+                    if key in self._seen:
+                        duplicates += 1
+                        continue
+                    self._seen[key] = now + self.dedupe_window_seconds
+                if len(self._events) >= self._max_pending:
+                    self._events.popleft()
+                    self.dropped += 1
+                self._events.append(event)
+                accepted += 1
+        return accepted, duplicates
+
+    def read(self, count: int) -> List[Entry]:
+        """Remove and return up to ``count`` events."""
+        with self._lock:
+            return [(None, self._events.popleft()) for _ in range(min(count, len(self._events)))]
+
+    def ack(self, ids: List[Any]) -> None:
+        """Events are removed on read; nothing to acknowledge."""
+
+    def release(self, entries: List[Entry]) -> None:
+        """Put events from a failed flush back at the front of the buffer."""
+        with self._lock:
+            self._events.extendleft(event for _, event in reversed(entries))
+
+
+class RedisInteractionBuffer:
+    """Interaction buffer shared by all API workers, backed by a Redis stream.
+
+    Enqueueing runs a Lua script that sets the dedupe key (``SET NX EX``) and
+    appends to the stream in one round trip. Flushers read through a consumer
+    group and acknowledge entries only after their batch is committed; entries
+    left pending by a flusher that died are reclaimed after ``claim_idle_ms``.
+    """
+
+    # KEYS[1] = stream, KEYS[2] = dedupe key ('' to skip)
+    # ARGV[1] = dedupe window (s), ARGV[2] = approximate max stream length, ARGV[3] = event JSON
+    ENQUEUE_SCRIPT = """
+if KEYS[2] ~= '' and tonumber(ARGV[1]) > 0 then
+    if not redis.call('SET', KEYS[2], 1, 'NX', 'EX', ARGV[1]) then
+        return 0
+    end
+end
+redis.call('XADD', KEYS[1], 'MAXLEN', '~', ARGV[2], '*', 'e', ARGV[3])
+return 1
+"""
+
+    GROUP = "flushers"
+
+    def __init__(
+        self,
+        redis_client: Any,
+        key_prefix: str = "genonaut:interactions",
+        dedupe_window_seconds: int = 30,
+        max_pending: int = 1000000,
+        claim_idle_ms: int = 60000
+    ):
+        """Initialize the Redis buffer.
+
+        Args:
+            redis_client: Redis client (sync, ``decode_responses=True``)
+            key_prefix: Prefix for the stream and dedupe keys (should include the Redis namespace)
+            dedupe_window_seconds: Window in which repeated views are collapsed
+            max_pending: Approximate cap on the stream length
+            claim_idle_ms: Idle time after which another flusher's pending entries are reclaimed
+        """
+        self.redis_client = redis_client
+        self.stream_key = f"{key_prefix}:stream"
+        self.key_prefix = key_prefix
+        self.dedupe_window_seconds = int(dedupe_window_seconds)
+        self.max_pending = max_pending
+        self.claim_idle_ms = claim_idle_ms
+        self.consumer = f"{socket.gethostname()}-{os.getpid()}"
+        self._script = redis_client.register_script(self.ENQUEUE_SCRIPT)
+        self._group_ready = False
+
+    def enqueue_many(self, events: Iterable[Dict[str, Any]]) -> Tuple[int, int]:
+        """Append events to the stream in one pipeline.
+
+        Returns:
+            Tuple of (accepted, duplicates)
+        """
+        pipeline = self.redis_client.pipeline(transaction=False)
+        for event in events:
+            key = _dedupe_key(event)
+            self._script(
+                keys=[self.stream_key, f"{self.key_prefix}:seen:{key}" if key else ""],
+                args=[self.dedupe_window_seconds, self.max_pending, json.dumps(event)],
+                client=pipeline,
+            )
+        results = [int(result) for result in pipeline.execute()]
+        accepted = sum(results)
+        return accepted, len(results) - accepted
+
+    def _ensure_group(self) -> None:
+        if self._group_ready:
+            return
+        try:
+            self.redis_client.xgroup_create(self.stream_key, self.GROUP, id="0", mkstream=True)
+        except Exception as exc:
+            if "BUSYGROUP" not in str(exc):
+                raise
+        self._group_ready = True
+
+    def read(self, count: int) -> List[Entry]:
+        """Claim up to ``count`` entries: stale pending entries first, then new ones."""
+        self._ensure_group()
+        claimed = self.redis_client.xautoclaim(
+            self.stream_key, self.GROUP, self.consumer,
+            min_idle_time=self.claim_idle_ms, start_id="0-0", count=count,
+        )
+        messages = list(claimed[1]) if claimed else []
+        if len(messages) < count:
+            for _, stream_messages in self.redis_client.xreadgroup(
+                self.GROUP, self.consumer, {self.stream_key: ">"}, count=count - len(messages)
+            ) or []:
+                messages.extend(stream_messages)
+        return [(message_id, json.loads(fields["e"])) for message_id, fields in messages if fields]
+
+    def ack(self, ids: List[Any]) -> None:
+        """Acknowledge and delete committed entries."""
+        if not ids:
+            return
+        pipeline = self.redis_client.pipeline(transaction=False)
+        pipeline.xack(self.stream_key, self.GROUP, *ids)
+        pipeline.xdel(self.stream_key, *ids)
+        pipeline.execute()
+
+    def release(self, entries: List[Entry]) -> None:
+        """Unacknowledged entries stay pending and are reclaimed by the next flush."""
+
+    def __len__(self) -> int:
+        return int(self.redis_client.xlen(self.stream_key))
+
+
+def _write_batch(events: List[Dict[str, Any]]) -> Dict[str, int]:
+    from genonaut.api.dependencies import get_database_session
+    from genonaut.api.repositories.interaction_repository import InteractionRepository
+
+    db = next(get_database_session())
+    try:
+        return InteractionRepository(db).bulk_record_interactions(events)
+    finally:
+        db.close()
+
+
+class InteractionIngestor:
+    """Accepts view/like events into a buffer and flushes them in batches."""
+
+    def __init__(
+        self,
+        primary: Optional[RedisInteractionBuffer] = None,
+        fallback: Optional[MemoryInteractionBuffer] = None,
+        batch_size: int = 1000,
+        flush_interval_seconds: float = 2.0,
+        retry_interval_seconds: float = 30.0,
+        write_batch: Callable[[List[Dict[str, Any]]], Dict[str, int]] = _write_batch
+    ):
+        """Initialize the ingestor.
+
+        Args:
+            primary: Shared Redis buffer, or None to buffer in process only
+            fallback: In-process buffer, used while ``primary`` is missing or unreachable
+            batch_size: Maximum events written per multi-row insert
+            flush_interval_seconds: How often the in-process buffer is flushed
+            retry_interval_seconds: How long to stay on the fallback after a Redis error
+            write_batch: Callable that persists a batch of events and returns
+                ``{'inserted': int, 'invalid': int}``
+        """
+        self.primary = primary
+        self.fallback = fallback or MemoryInteractionBuffer()
+        self.batch_size = batch_size
+        self.flush_interval_seconds = flush_interval_seconds
+        self.retry_interval_seconds = retry_interval_seconds
+        self.write_batch = write_batch
+        self._primary_down_until = 0.0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._thread_lock = threading.Lock()
+
+    def submit(self, events: Iterable[Dict[str, Any]]) -> Tuple[int, int]:
+        """Buffer events for batched insertion.
+
+        Args:
+            events: Dicts with user_id, content_item_id, interaction_type and
+                optional duration and metadata
+
+        Returns:
+            Tuple of (accepted, duplicates)
+        """
+        now = time.time()
+        events = [
+            {
+                "user_id": str(event["user_id"]),
+                "content_item_id": int(event["content_item_id"]),
+                "interaction_type": str(event["interaction_type"]),
+                "duration": event.get("duration"),
+                "metadata": event.get("metadata") or {},
+                "ts": now,
+            }
+            for event in events
+        ]
+
+        if self.primary is not None and time.time() >= self._primary_down_until:
+            try:
+                return self.primary.enqueue_many(events)
+            except Exception as exc:
+                logger.warning(
+                    f"Redis interaction buffer unavailable, buffering in process for "
+                    f"{self.retry_interval_seconds}s: {exc}"
+                )
+                self._primary_down_until = time.time() + self.retry_interval_seconds
+
+        result = self.fallback.enqueue_many(events)
+        self.start()
+        return result
+
+    def flush(self, buffer: Optional[Any] = None, max_batches: Optional[int] = None) -> Dict[str, int]:
+        """Write buffered events to the database in batches.
+
+        Args:
+            buffer: Buffer to drain (defaults to the in-process buffer)
+            max_batches: Stop after this many batches (None drains the buffer)
+
+        Returns:
+            Dictionary with counts of events read, collapsed, inserted and invalid
+        """
+        buffer = buffer if buffer is not None else self.fallback
+        totals = {"batches": 0, "read": 0, "collapsed": 0, "inserted": 0, "invalid": 0}
+
+        while max_batches is None or totals["batches"] < max_batches:
+            entries = buffer.read(self.batch_size)
+            if not entries:
+                break
+
+            events = collapse_duplicates([event for _, event in entries])
+            for event in events:
+                event["created_at"] = datetime.utcfromtimestamp(event.pop("ts", time.time()))
+            try:
+                result = self.write_batch(events)
+            except Exception:
+                buffer.release(entries)
+                raise
+            buffer.ack([entry_id for entry_id, _ in entries if entry_id is not None])
+
+            totals["batches"] += 1
+            totals["read"] += len(entries)
+            totals["collapsed"] += len(entries) - len(events)
+            totals["inserted"] += result.get("inserted", 0)
+            totals["invalid"] += result.get("invalid", 0)
+            if len(entries) < self.batch_size:
+                break
+
+        return totals
+
+    def start(self) -> None:
+        """Start the background thread that flushes the in-process buffer."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._thread_lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="interaction-ingest-flusher", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the flusher thread and write whatever is still buffered in process."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.flush_interval_seconds + 5)
+            self._thread = None
+        if len(self.fallback):
+            try:
+                self.flush()
+            except Exception as exc:
+                logger.error(f"Failed to flush buffered interactions on shutdown: {exc}")
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.flush_interval_seconds):
+            if not len(self.fallback):
+                continue
+            try:
+                totals = self.flush()
+                logger.debug(f"Flushed buffered interactions: {totals}")
+            except Exception as exc:
+                logger.error(f"Failed to flush buffered interactions: {exc}", exc_info=True)
+
+
+def create_interaction_ingestor(settings: Optional[Any] = None) -> InteractionIngestor:
+    """Create the interaction ingestor for the configured buffer backend.
+
+    Uses a :class:`RedisInteractionBuffer` when ``interaction_ingest_backend`` is
+    ``"redis"`` and a Redis URL is configured, with an in-process fallback.
+
+    Args:
+        settings: Optional Settings instance (loaded if not provided)
+    """
+    if settings is None:
+        settings = get_settings()
+
+    fallback = MemoryInteractionBuffer(
+        dedupe_window_seconds=settings.interaction_ingest_dedupe_window_seconds,
+        max_pending=settings.interaction_ingest_max_pending,
+    )
+    primary = None
+    if settings.interaction_ingest_backend == "redis" and settings.redis_url:
+        try:
+            from genonaut.worker.pubsub import get_redis_client
+            primary = RedisInteractionBuffer(
+                get_redis_client(),
+                key_prefix=f"{settings.redis_ns}:interactions",
+                dedupe_window_seconds=settings.interaction_ingest_dedupe_window_seconds,
+                max_pending=settings.interaction_ingest_max_pending,
+            )
+        except Exception as exc:
+            logger.warning(f"Redis interaction buffer unavailable, buffering in process: {exc}")
+
+    return InteractionIngestor(
+        primary=primary,
+        fallback=fallback,
+        batch_size=settings.interaction_ingest_batch_size,
+        flush_interval_seconds=settings.interaction_ingest_flush_interval_seconds,
+    )
+
+
+_INGESTOR: Optional[InteractionIngestor] = None
+
+
+def get_interaction_ingestor() -> InteractionIngestor:
+    """Return the process-wide interaction ingestor, creating it on first use."""
+    global _INGESTOR
+    if _INGESTOR is None:
+        _INGESTOR = create_interaction_ingestor()
+    return _INGESTOR
+
+
+def close_interaction_ingestor() -> None:
+    """Flush and stop the process-wide ingestor, if one was created."""
+    global _INGESTOR
+    if _INGESTOR is not None:
+        _INGESTOR.stop()
+        _INGESTOR = None
@@ -1,9 +1,8 @@
 from typing import List, Optional, Dict, Any
 from uuid import UUID
 from sqlalchemy.orm import Session
-from sqlalchemy import func
 
-from genonaut.db.schema import UserInteraction, ContentItem
+from genonaut.db.schema import UserInteraction
 from genonaut.api.repositories.interaction_repository import InteractionRepository
 from genonaut.api.repositories.user_repository import UserRepository
 from genonaut.api.repositories.content_repository import ContentRepository
@@ -149,7 +148,7 @@ class InteractionService:
         
         # Validate content exists
         try:
-            self.content_repository.get_or_404(final_content_item_id)
+            content = self.content_repository.get_or_404(final_content_item_id)
         except EntityNotFoundError:
             raise ValidationError("Content not found")
         
@@ -174,7 +173,8 @@ class InteractionService:
             interaction_type=final_interaction_type,
             rating=final_rating,
             duration=final_duration,
-            metadata=final_metadata
+            metadata=final_metadata,
+            content_type=content.content_type
         )
     
     def get_recent_user_interactions(
@@ -275,6 +275,22 @@ class InteractionService:
         self.user_repository.get_or_404(user_id)
         return self.repository.get_user_interaction_summary(user_id)
     
+    def get_user_interaction_rollup(self, user_id: UUID) -> Dict[str, Any]:
+        """Get per-type and per-content-type interaction totals for a user.
+        
+        Args:
+            user_id: User ID
+            
+        Returns:
+            Dictionary with ``total_interactions``, ``by_type`` and ``by_content_type``
+            
+        Raises:
+            EntityNotFoundError: If user not found
+        """
+        # Verify user exists
+        self.user_repository.get_or_404(user_id)
+        return self.repository.get_user_interaction_rollup(user_id)
+    
     def update_interaction(
         self,
         interaction_id: int,
@@ -343,39 +359,15 @@ class InteractionService:
         Raises:
             EntityNotFoundError: If user not found
         """
-        # Verify user exists
-        self.user_repository.get_or_404(user_id)
-        
-        # Get total interactions for user
-        total_interactions = self.repository.count({'user_id': user_id})
-        
-        # Count by interaction type for this user
-        interaction_types = ['view', 'like', 'share', 'download', 'bookmark', 'comment', 'rate']
-        type_breakdown = {}
-        for interaction_type in interaction_types:
-            count = self.repository.count({'user_id': user_id, 'interaction_type': interaction_type})
-            if count > 0:
-                type_breakdown[interaction_type] = count
-        
-        # Get favorite content types by analyzing user's interactions
-        session = self.repository.db
-        content_type_query = (
-            session.query(ContentItem.content_type, func.count(UserInteraction.id))
-            .join(UserInteraction, ContentItem.id == UserInteraction.content_item_id)
-            .filter(UserInteraction.user_id == user_id)
-            .group_by(ContentItem.content_type)
-            .order_by(func.count(UserInteraction.id).desc())
-            .all()
-        )
-        
-        favorite_content_types = {}
-        for content_type, count in content_type_query:
-            favorite_content_types[content_type] = count
+        rollup = self.get_user_interaction_rollup(user_id)
         
         return {
-            'total_interactions': total_interactions,
-            'interaction_types': type_breakdown,
-            'favorite_content_types': favorite_content_types
+            'total_interactions': rollup['total_interactions'],
+            'interaction_types': {
+                interaction_type: totals['count']
+                for interaction_type, totals in rollup['by_type'].items()
+            },
+            'favorite_content_types': rollup['by_content_type']
         }
     
     def get_interaction_stats(self) -> Dict[str, Any]:
@@ -384,15 +376,12 @@ class InteractionService:
         Returns:
             Dictionary with interaction statistics
         """
-        total_interactions = self.repository.count()
+        totals = self.repository.get_interaction_type_totals()
         
-        # Count by interaction type
         interaction_types = ['view', 'like', 'share', 'download', 'bookmark', 'comment', 'rate']
-        type_breakdown = {}
-        for interaction_type in interaction_types:
-            type_breakdown[interaction_type] = self.repository.count({'interaction_type': interaction_type})
+        type_breakdown = {interaction_type: totals.get(interaction_type, 0) for interaction_type in interaction_types}
         
         return {
-            'total_interactions': total_interactions,
+            'total_interactions': sum(totals.values()),
             'type_breakdown': type_breakdown
-        }
\ No newline at end of file
+        }
@@ -0,0 +1,275 @@
+"""Process-wide fan-out of job status updates from Redis pub/sub.
+
+Each API worker process holds a single Redis connection with one pattern
+subscription on ``{redis_ns}:job:*``. Incoming messages are demultiplexed to
+in-memory per-job subscriber sets, so the cost of an additional WebSocket (or
+other streaming) client is a bounded queue rather than a Redis connection.
+"""
+
+import asyncio
+import logging
+from collections import defaultdict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+try:
+    import redis.asyncio as aioredis  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency for real-time features
+    aioredis = None  # type: ignore
+
+from genonaut.api.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_QUEUE_SIZE = 100
+RECONNECT_DELAY_SECONDS = 1.0
+MAX_RECONNECT_DELAY_SECONDS = 30.0
+
+
+class JobStatusSubscription:
+    """A single client's view of the hub: the jobs it watches and its queue.
+
+    Messages are queued as ``(job_id, raw_json)`` tuples. The queue is bounded;
+    when a slow consumer falls behind, the oldest pending update is dropped so
+    the client always converges on the latest job state.
+    """
+
+    def __init__(self, job_ids: Iterable[int], queue_size: int = DEFAULT_QUEUE_SIZE):
+        self.job_ids = frozenset(job_ids)
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.dropped = 0
+
+    def deliver(self, job_id: int, data: str) -> None:
+        """Enqueue an update without blocking, dropping the oldest one if full."""
+        if self.queue.full():
+            try:
+                self.queue.get_nowait()
+                self.dropped += 1
+            except asyncio.QueueEmpty:  # pragma: no cover - single-threaded loop
+                pass
+        self.queue.put_nowait((job_id, data))
+
+    async def get(self) -> Tuple[int, str]:
+        """Wait for the next update for any of the subscribed jobs."""
+        return await self.queue.get()
+
+
+class JobStatusHub:
+    """Single Redis pattern subscriber shared by all clients in the process.
+
+    Args:
+        redis_factory: Callable returning an async Redis client. Defaults to a
+            client built from ``settings.redis_url``.
+        namespace: Redis namespace prefix for job channels. Defaults to
+            ``settings.redis_ns``.
+        queue_size: Maximum number of pending updates per subscription.
+    """
+
+    def __init__(
+        self,
+        redis_factory: Optional[Callable[[], Any]] = None,
+        namespace: Optional[str] = None,
+        queue_size: Optional[int] = None,
+    ):
+        settings = get_settings()
+        self.redis_factory = redis_factory or _default_redis_factory
+        self.namespace = namespace or settings.redis_ns
+        self.queue_size = queue_size or settings.job_status_queue_size
+        self.subscribers: Dict[int, Set[JobStatusSubscription]] = defaultdict(set)
+        self.messages_received = 0
+        self._task: Optional[asyncio.Task] = None
+        self._command_client: Any = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._ready: Optional[asyncio.Event] = None
+
+    @property
+    def pattern(self) -> str:
+        return f"{self.namespace}:job:*"
+
+    @property
+    def subscriber_count(self) -> int:
+        return sum(len(subs) for subs in self.subscribers.values())
+
+    async def subscribe(self, job_ids: Iterable[int]) -> JobStatusSubscription:
+        """Register interest in one or more jobs, starting the listener if needed.
+
+        Waits until the pattern subscription is active so that updates
+        published after this call returns are not missed.
+
+        Args:
+            job_ids: Generation job IDs to receive updates for
+
+        Returns:
+            Subscription whose queue receives ``(job_id, raw_json)`` updates
+
+        Raises:
+            RuntimeError: If the async Redis client is unavailable
+        """
+        self._ensure_started()
+        subscription = JobStatusSubscription(job_ids, queue_size=self.queue_size)
+        for job_id in subscription.job_ids:
+            self.subscribers[job_id].add(subscription)
+        await self._ready.wait()
+        return subscription
+
+    def unsubscribe(self, subscription: JobStatusSubscription) -> None:
+        """Remove a subscription; empty per-job sets are discarded."""
+        for job_id in subscription.job_ids:
+            subs = self.subscribers.get(job_id)
+            if subs is None:
+                continue
+            subs.discard(subscription)
+            if not subs:
+                del self.subscribers[job_id]
+        if subscription.dropped:
+            logger.info(
+                f"Job status subscriber for jobs {sorted(subscription.job_ids)} "
+                f"dropped {subscription.dropped} stale updates"
+            )
+
+    def dispatch(self, channel: str, data: str) -> int:
+        """Route a raw pub/sub message to the subscribers of its job.
+
+        Args:
+            channel: Redis channel the message was published on
+            data: Raw JSON payload
+
+        Returns:
+            Number of subscriptions the message was delivered to
+        """
+        self.messages_received += 1
+        try:
+            job_id = int(channel.rsplit(":", 1)[1])
+        except (IndexError, ValueError):
+            logger.debug(f"Ignoring message on unexpected channel {channel}")
+            return 0
+
+        subs = self.subscribers.get(job_id)
+        if not subs:
+            return 0
+        for subscription in tuple(subs):
+            subscription.deliver(job_id, data)
+        return len(subs)
+
+    def history_key(self, job_id: int) -> str:
+        """Redis stream key holding the recent update history for a job."""
+        return f"{self.namespace}:job:{job_id}:history"
+
+    async def read_history(self, job_id: int, after_event_id: Optional[str] = None) -> List[Tuple[str, str]]:
+        """Return recorded updates for a job that are newer than ``after_event_id``.
+
+        Args:
+            job_id: Generation job ID
+            after_event_id: Stream entry ID already seen by the client, or None
+                to return the whole retained history
+
+        Returns:
+            List of ``(event_id, raw_json)`` tuples in publish order
+        """
+        self._ensure_started()
+        if self._command_client is None:
+            self._command_client = await _maybe_await(self.redis_factory())
+
+        entries = await _maybe_await(
+            self._command_client.xrange(self.history_key(job_id), min=after_event_id or "-", max="+")
+        )
+        history = []
+        for event_id, fields in entries:
+            if event_id == after_event_id:
+                continue
+            data = fields.get("data")
+            if data is not None:
+                history.append((event_id, data))
+        return history
+
+    async def stop(self) -> None:
+        """Cancel the listener task and close the Redis connections."""
+        task, self._task = self._task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._ready = None
+        client, self._command_client = self._command_client, None
+        await _close_quietly(None, client)
+
+    def _ensure_started(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # A new event loop (e.g. a fresh test client) cannot reuse the old task
+            self._task = None
+            self._command_client = None
+            self._loop = loop
+        if self._task is None or self._task.done():
+            if aioredis is None and self.redis_factory is _default_redis_factory:
+                raise RuntimeError(
+                    "redis package with asyncio support is required for WebSocket pubsub functionality."
+                )
+            self._ready = asyncio.Event()
+            self._task = loop.create_task(self._run())
+
+    async def _run(self) -> None:
+        delay = RECONNECT_DELAY_SECONDS
+        while True:
+            client = None
+            pubsub = None
+            try:
+                client = await _maybe_await(self.redis_factory())
+                pubsub = client.pubsub(ignore_subscribe_messages=True)
+                await pubsub.psubscribe(self.pattern)
+                logger.info(f"Job status hub subscribed to {self.pattern}")
+                self._ready.set()
+                delay = RECONNECT_DELAY_SECONDS
+
+                async for message in pubsub.listen():
+                    if message.get("type") == "pmessage":
+                        self.dispatch(message["channel"], message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.error(f"Job status hub lost Redis subscription: {exc}; retrying in {delay:.0f}s")
+                # Let waiting subscribers through; updates resume once reconnected
+                self._ready.set()
+            finally:
+                await _close_quietly(pubsub, client)
+
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, MAX_RECONNECT_DELAY_SECONDS)
+
+
+async def _maybe_await(value: Any) -> Any:
+    if asyncio.iscoroutine(value):
+        return await value
+    return value
+
+
+async def _close_quietly(pubsub: Any, client: Any) -> None:
+    for resource in (pubsub, client):
+        if resource is None:
+            continue
+        close = getattr(resource, "aclose", None) or getattr(resource, "close", None)
+        if close is None:
+            continue
+        try:
+            await _maybe_await(close())
+        except Exception as exc:
+            logger.debug(f"Error closing Redis pubsub resource: {exc}")
+
+
+def _default_redis_factory() -> Any:
+    settings = get_settings()
+    if not settings.redis_url:
+        raise RuntimeError("REDIS_URL must be configured for job status updates.")
+    return aioredis.from_url(settings.redis_url, decode_responses=True)
+
+
+_HUB: Optional[JobStatusHub] = None
+
+
+def get_job_status_hub() -> JobStatusHub:
+    """Return the process-wide job status hub, creating it on first use."""
+    global _HUB
+    if _HUB is None:
+        _HUB = JobStatusHub()
+    return _HUB
@@ -2,7 +2,6 @@
 
 import os
 import logging
-import hashlib
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
 from sqlalchemy.orm import Session
@@ -12,6 +11,7 @@ from genonaut.api.config import get_settings, get_cached_settings
 from genonaut.api.repositories.available_model_repository import AvailableModelRepository
 from genonaut.api.services.cache_service import ComfyUICacheService
 from genonaut.db.schema import AvailableModel
+from genonaut.utils.file_hashing import get_file_hasher
 
 logger = logging.getLogger(__name__)
 
@@ -163,11 +163,17 @@ class ModelDiscoveryService:
         model_files = []
 
         try:
-            for file_path in directory.rglob("*"):
-                if file_path.is_file() and file_path.suffix.lower() in self.MODEL_EXTENSIONS:
-                    model_info = self._extract_model_info(file_path, model_type)
-                    if model_info:
-                        model_files.append(model_info)
+            paths = [
+                file_path for file_path in directory.rglob("*")
+                if file_path.is_file() and file_path.suffix.lower() in self.MODEL_EXTENSIONS
+            ]
+            # Warm the hash cache for the whole directory concurrently
+            get_file_hasher().hash_files(paths, (self.settings.model_hash_algorithm,))
+
+            for file_path in paths:
+                model_info = self._extract_model_info(file_path, model_type)
+                if model_info:
+                    model_files.append(model_info)
 
         except Exception as e:
             logger.error(f"Error scanning model files in {directory}: {e}")
@@ -227,30 +233,20 @@ class ModelDiscoveryService:
             logger.error(f"Failed to extract model info for {file_path}: {e}")
             return None
 
-    def _calculate_file_hash(self, file_path: Path, chunk_size: int = 8192) -> str:
-        """Calculate SHA-256 hash of a file.
+    def _calculate_file_hash(self, file_path: Path) -> str:
+        """Calculate a full-file hash using ``model_hash_algorithm`` (BLAKE2b by default).
+
+        Digests are served from the persistent file hash cache while the file's
+        size, mtime and inode are unchanged.
 
         Args:
             file_path: Path to the file
-            chunk_size: Size of chunks to read at a time
 
         Returns:
             Hexadecimal string of the file hash
         """
-        hash_sha256 = hashlib.sha256()
         try:
-            with open(file_path, "rb") as f:
-                # Only hash the first 1MB for large files to improve performance
-                bytes_read = 0
-                max_bytes = 1024 * 1024  # 1MB
-
-                for chunk in iter(lambda: f.read(chunk_size), b""):
-                    if bytes_read >= max_bytes:
-                        break
-                    hash_sha256.update(chunk)
-                    bytes_read += len(chunk)
-
-            return hash_sha256.hexdigest()
+            return get_file_hasher().hash_file(file_path, self.settings.model_hash_algorithm)
         except Exception as e:
             logger.error(f"Failed to calculate hash for {file_path}: {e}")
             return f"error_{file_path.name}_{file_path.stat().st_size}"
@@ -277,6 +273,7 @@ class ModelDiscoveryService:
         # Get existing models from database
         existing_models = self.repository.get_all_models()
         existing_by_hash = {model.file_hash: model for model in existing_models}
+        existing_by_path = {model.file_path: model for model in existing_models}
         discovered_hashes = set()
 
         try:
@@ -286,11 +283,19 @@ class ModelDiscoveryService:
                         file_hash = model_info['file_hash']
                         discovered_hashes.add(file_hash)
 
-                        if file_hash in existing_by_hash:
+                        existing_model = existing_by_hash.get(file_hash)
+                        rehashed = False
+                        if existing_model is None and model_info['file_path'] in existing_by_path:
+                            # Same file, hashed with a different algorithm (e.g. the old
+                            # first-1MB hash) or modified in place: adopt the new hash
+                            existing_model = existing_by_path[model_info['file_path']]
+                            existing_model.file_hash = file_hash
+                            rehashed = True
+
+                        if existing_model is not None:
                             # Update existing model
-                            existing_model = existing_by_hash[file_hash]
                             updated = self._update_existing_model(existing_model, model_info)
-                            if updated:
+                            if updated or rehashed:
                                 stats['updated'] += 1
                         else:
                             # Add new model
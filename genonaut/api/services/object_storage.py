@@ -0,0 +1,402 @@
+"""Object storage for generated images and thumbnails (``object-storage`` config).
+
+Images and thumbnails are always written to ``comfyui-output-dir`` first; an
+object storage backend decides where they are kept and how clients fetch them.
+Object keys are paths relative to the output directory (the same keys as the
+storage index), so ``content_data`` keeps holding the local path and
+``serve_image`` maps it to a key.
+
+Backends:
+
+- ``local``: the output directory itself. Nothing is copied. ``serve_image``
+  streams files, or redirects to ``public-url`` when one is set (e.g. nginx or
+  a CDN in front of the directory) so image bytes bypass the API.
+- ``s3``: any S3-compatible service (AWS S3, MinIO, ...). The worker uploads
+  outputs and thumbnails after a generation; files above
+  ``multipart-threshold-mb`` go up as multipart uploads with
+  ``upload-workers`` parts in flight. ``serve_image`` redirects to a presigned
+  GET URL (or ``public-url`` for a public bucket/CDN), so the API and worker
+  no longer need a shared filesystem. Credentials come from the standard AWS
+  environment variables (``AWS_ACCESS_KEY_ID`` / ``AWS_SECRET_ACCESS_KEY``).
+"""
+
+import logging
+import mimetypes
+import os
+import shutil
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+from urllib.parse import quote
+
+from genonaut.api.config import get_cached_settings, get_settings
+
+logger = logging.getLogger(__name__)
+
+BACKENDS = ("local", "s3")
+# S3 DeleteObjects accepts at most this many keys per request
+DELETE_BATCH_SIZE = 1000
+# Existence checks of immutable objects are remembered for this many keys
+EXISTS_CACHE_SIZE = 10_000
+
+PathLike = Union[str, Path]
+
+
+@dataclass
+class ObjectInfo:
+    """Metadata of a stored object."""
+
+    key: str
+    size: int
+    modified: float
+    etag: Optional[str] = None
+
+
+def content_type_for(key: str) -> str:
+    return mimetypes.guess_type(key)[0] or "application/octet-stream"
+
+
+class ObjectStorage(ABC):
+    """Base class: keys are ``/``-separated paths relative to the output directory."""
+
+    name = "base"
+    # Whether objects live somewhere other than the output directory
+    remote = False
+
+    def __init__(self, root: PathLike, public_url: Optional[str] = None, upload_workers: int = 8):
+        """Initialize the backend.
+
+        Args:
+            root: Output directory the keys are relative to
+            public_url: Base URL serving the objects directly, if any
+            upload_workers: Files uploaded concurrently by :meth:`put_files`
+        """
+        self.root = Path(root).expanduser()
+        self.public_url = public_url.rstrip("/") if public_url else None
+        self.upload_workers = max(1, upload_workers)
+
+    def key_for(self, path: PathLike) -> Optional[str]:
+        """Object key of a local path, or None if it is outside the output directory."""
+        try:
+            return Path(path).expanduser().resolve().relative_to(self.root.resolve()).as_posix()
+        except (ValueError, OSError):
+            return None
+
+    @abstractmethod
+    def put_file(self, local_path: PathLike, key: str) -> None:
+        """Store a local file under ``key``."""
+
+    def put_files(self, items: Sequence[Tuple[PathLike, str]]) -> int:
+        """Store several files concurrently; failures are logged and skipped.
+
+        Args:
+            items: (local path, key) pairs
+
+        Returns:
+            Number of files stored
+        """
+        def put(item: Tuple[PathLike, str]) -> bool:
+            try:
+                self.put_file(*item)
+                return True
+            except Exception as e:
+                logger.error(f"Failed to store {item[0]} as {item[1]} in {self.name} storage: {e}")
+                return False
+
+        if len(items) <= 1:
+            return sum(put(item) for item in items)
+        with ThreadPoolExecutor(max_workers=min(self.upload_workers, len(items))) as executor:
+            return sum(executor.map(put, items))
+
+    @abstractmethod
+    def download(self, key: str, local_path: PathLike) -> bool:
+        """Fetch ``key`` into a local file; returns False if the object does not exist."""
+
+    @abstractmethod
+    def stat(self, key: str) -> Optional[ObjectInfo]:
+        """Object metadata, or None if it does not exist."""
+
+    def exists(self, key: str) -> bool:
+        return self.stat(key) is not None
+
+    @abstractmethod
+    def list(self, prefix: str) -> List[str]:
+        """Keys starting with ``prefix``."""
+
+    @abstractmethod
+    def delete(self, keys: Sequence[str]) -> int:
+        """Delete objects; returns how many were deleted."""
+
+    def url(self, key: str) -> Optional[str]:
+        """URL clients can fetch ``key`` from directly, or None if the API has to serve it."""
+        if self.public_url:
+            return f"{self.public_url}/{quote(key)}"
+        return None
+
+
+class LocalObjectStorage(ObjectStorage):
+    """The output directory itself."""
+
+    name = "local"
+
+    def _path(self, key: str) -> Path:
+        path = (self.root / key).resolve()
+        path.relative_to(self.root.resolve())  # Raises ValueError for keys escaping the root
+        return path
+
+    def put_file(self, local_path: PathLike, key: str) -> None:
+        target = self._path(key)
+        source = Path(local_path).expanduser().resolve()
+        if source == target:
+            return
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(source, target)
+
+    def download(self, key: str, local_path: PathLike) -> bool:
+        source = self._path(key)
+        if not source.is_file():
+            return False
+        if source != Path(local_path).expanduser().resolve():
+            Path(local_path).parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(source, local_path)
+        return True
+
+    def stat(self, key: str) -> Optional[ObjectInfo]:
+        try:
+            stat = self._path(key).stat()
+        except (OSError, ValueError):
+            return None
+        return ObjectInfo(key=key, size=stat.st_size, modified=stat.st_mtime)
+
+    def list(self, prefix: str) -> List[str]:
+        directory, _, name_prefix = prefix.rpartition("/")
+        base = self.root / directory if directory else self.root
+        if not base.is_dir():
+            return []
+        return sorted(
+            f"{directory}/{entry.name}" if directory else entry.name
+            for entry in os.scandir(base)
+            if entry.is_file() and entry.name.startswith(name_prefix)
+        )
+
+    def delete(self, keys: Sequence[str]) -> int:
+        deleted = 0
+        for key in keys:
+            try:
+                self._path(key).unlink()
+                deleted += 1
+            except FileNotFoundError:
+                pass
+            except (OSError, ValueError) as e:
+                logger.error(f"Failed to delete {key}: {e}")
+        return deleted
+
+
+class S3ObjectStorage(ObjectStorage):
+    """An S3-compatible bucket (AWS S3, MinIO, ...)."""
+
+    name = "s3"
+    remote = True
+
+    def __init__(
+        self,
+        root: PathLike,
+        bucket: str,
+        prefix: str = "",
+        endpoint_url: Optional[str] = None,
+        region: Optional[str] = None,
+        public_url: Optional[str] = None,
+        presign_expires_seconds: int = 3600,
+        multipart_threshold_mb: int = 8,
+        multipart_chunk_mb: int = 8,
+        upload_workers: int = 8,
+        client: Any = None,
+    ):
+        """Initialize the backend.
+
+        Args:
+            root: Output directory the keys are relative to
+            bucket: Bucket holding the objects
+            prefix: Key prefix inside the bucket
+            endpoint_url: Endpoint of a non-AWS service, e.g. ``http://localhost:9000`` for MinIO
+            region: Bucket region
+            public_url: Base URL serving the bucket publicly; presigned URLs are used otherwise
+            presign_expires_seconds: Lifetime of presigned GET URLs
+            multipart_threshold_mb: Files at least this large are uploaded in parts
+            multipart_chunk_mb: Part size of multipart uploads
+            upload_workers: Files, and parts of one file, uploaded concurrently
+            client: Preconfigured boto3 S3 client (for tests)
+        """
+        super().__init__(root, public_url=public_url, upload_workers=upload_workers)
+        try:
+            import boto3
+            from boto3.s3.transfer import TransferConfig
+            from botocore.config import Config
+        except ModuleNotFoundError as e:  # pragma: no cover - boto3 is in requirements.txt
+            raise RuntimeError("The s3 object storage backend needs boto3 (pip install boto3)") from e
+
+        self.bucket = bucket
+        self.prefix = prefix.strip("/") + "/" if prefix.strip("/") else ""
+        self.presign_expires_seconds = presign_expires_seconds
+        self.client = client or boto3.client(
+            "s3",
+            endpoint_url=endpoint_url,
+            region_name=region,
+            # Connections for every upload thread times the parts each one has in flight
+            config=Config(signature_version="s3v4", max_pool_connections=upload_workers * upload_workers),
+        )
+        self.transfer_config = TransferConfig(
+            multipart_threshold=multipart_threshold_mb * 1024 * 1024,
+            multipart_chunksize=multipart_chunk_mb * 1024 * 1024,
+            max_concurrency=upload_workers,
+            use_threads=True,
+        )
+        self._known = OrderedDict()
+        self._known_lock = threading.Lock()
+
+    def _object_key(self, key: str) -> str:
+        return f"{self.prefix}{key}"
+
+    @staticmethod
+    def _is_missing(error: Exception) -> bool:
+        code = str(getattr(error, "response", {}).get("Error", {}).get("Code", ""))
+        return code in ("404", "NoSuchKey", "NotFound")
+
+    def _remember(self, key: str) -> None:
+        with self._known_lock:
+            self._known[key] = True
+            self._known.move_to_end(key)
+            while len(self._known) > EXISTS_CACHE_SIZE:
+                self._known.popitem(last=False)
+
+    def _forget(self, keys: Sequence[str]) -> None:
+        with self._known_lock:
+            for key in keys:
+                self._known.pop(key, None)
+
+    def put_file(self, local_path: PathLike, key: str) -> None:
+        self.client.upload_file(
+            str(local_path),
+            self.bucket,
+            self._object_key(key),
+            ExtraArgs={"ContentType": content_type_for(key), "CacheControl": "public, max-age=3600"},
+            Config=self.transfer_config,
+        )
+        self._remember(key)
+
+    def download(self, key: str, local_path: PathLike) -> bool:
+        local_path = Path(local_path)
+        local_path.parent.mkdir(parents=True, exist_ok=True)
+        partial = local_path.with_name(f".{local_path.name}.part")
+        try:
+            self.client.download_file(self.bucket, self._object_key(key), str(partial), Config=self.transfer_config)
+        except Exception as e:
+            partial.unlink(missing_ok=True)
+            if self._is_missing(e):
+                return False
+            raise
+        os.replace(partial, local_path)
+        return True
+
+    def stat(self, key: str) -> Optional[ObjectInfo]:
+        try:
+            response = self.client.head_object(Bucket=self.bucket, Key=self._object_key(key))
+        except Exception as e:
+            if self._is_missing(e):
+                self._forget([key])
+                return None
+            raise
+        self._remember(key)
+        return ObjectInfo(
+            key=key,
+            size=response["ContentLength"],
+            modified=response["LastModified"].timestamp(),
+            etag=response.get("ETag"),
+        )
+
+    def exists(self, key: str) -> bool:
+        # Generated images are never rewritten in place, so a positive answer can be reused
+        with self._known_lock:
+            if key in self._known:
+                return True
+        return self.stat(key) is not None
+
+    def list(self, prefix: str) -> List[str]:
+        keys = []
+        paginator = self.client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=self._object_key(prefix)):
+            keys.extend(item["Key"][len(self.prefix):] for item in page.get("Contents", []))
+        return sorted(keys)
+
+    def delete(self, keys: Sequence[str]) -> int:
+        keys = list(keys)
+        self._forget(keys)
+        deleted = 0
+        for offset in range(0, len(keys), DELETE_BATCH_SIZE):
+            batch = keys[offset:offset + DELETE_BATCH_SIZE]
+            response = self.client.delete_objects(
+                Bucket=self.bucket,
+                Delete={"Objects": [{"Key": self._object_key(key)} for key in batch], "Quiet": True},
+            )
+            for error in response.get("Errors", []):
+                logger.error(f"Failed to delete {error.get('Key')}: {error.get('Message')}")
+            deleted += len(batch) - len(response.get("Errors", []))
+        return deleted
+
+    def url(self, key: str) -> Optional[str]:
+        if self.public_url:
+            return super().url(key)
+        return self.client.generate_presigned_url(
+            "get_object",
+            Params={"Bucket": self.bucket, "Key": self._object_key(key)},
+            ExpiresIn=self.presign_expires_seconds,
+        )
+
+
+def object_storage_settings() -> Dict[str, Any]:
+    """``object-storage`` config with defaults applied."""
+    settings = get_cached_settings() or get_settings()
+    config = getattr(settings, "object_storage", None) or {}
+    backend = config.get("backend") or "local"
+    if backend not in BACKENDS:
+        raise ValueError(f"Unsupported object storage backend '{backend}'. Must be one of: {BACKENDS}")
+    return {
+        "backend": backend,
+        "root": settings.comfyui_output_dir,
+        "public_url": config.get("public_url"),
+        "bucket": config.get("bucket"),
+        "prefix": config.get("prefix") or "",
+        "endpoint_url": config.get("endpoint_url"),
+        "region": config.get("region"),
+        "presign_expires_seconds": int(config.get("presign_expires_seconds", 3600)),
+        "multipart_threshold_mb": int(config.get("multipart_threshold_mb", 8)),
+        "multipart_chunk_mb": int(config.get("multipart_chunk_mb", 8)),
+        "upload_workers": int(config.get("upload_workers", 8)),
+    }
+
+
+_STORAGE: Optional[Tuple[Tuple, ObjectStorage]] = None
+_STORAGE_LOCK = threading.Lock()
+
+
+def get_object_storage() -> ObjectStorage:
+    """Return the process-wide object storage backend configured from settings."""
+    global _STORAGE
+    config = object_storage_settings()
+    key = tuple(sorted(config.items()))
+    with _STORAGE_LOCK:
+        if _STORAGE is None or _STORAGE[0] != key:
+            if config["backend"] == "s3":
+                if not config["bucket"]:
+                    raise ValueError("object-storage.bucket is required for the s3 backend")
+                storage = S3ObjectStorage(**{name: value for name, value in config.items() if name != "backend"})
+            else:
+                storage = LocalObjectStorage(
+                    config["root"], public_url=config["public_url"], upload_workers=config["upload_workers"]
+                )
+            _STORAGE = (key, storage)
+        return _STORAGE[1]
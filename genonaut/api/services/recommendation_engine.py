@@ -0,0 +1,407 @@
+"""Vectorized batch recommendation engine.
+
+Scores every candidate item for a batch of users in a few matrix products
+instead of per-item Python loops. The score blends three signals, each in
+[0, 1]:
+
+- collaborative filtering: a truncated SVD ("PureSVD") of the weighted,
+  row-normalized user x item interaction matrix, normalized per user
+- tag affinity: cosine similarity between the user's tag profile (tags of
+  items they interacted with plus their favorite tags) and each item's tags
+- popularity: log-scaled total interaction weight, used for cold-start users
+
+SciPy is not a dependency of this project, so the few sparse operations needed
+are implemented on NumPy arrays by :class:`CSRMatrix`.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+# Implicit feedback weight per interaction type; ratings are handled separately
+INTERACTION_WEIGHTS: Dict[str, float] = {
+    "view": 1.0,
+    "like": 3.0,
+    "bookmark": 3.0,
+    "download": 3.0,
+    "comment": 2.0,
+    "share": 4.0,
+}
+
+DEFAULT_WEIGHTS = {"cf": 0.6, "tags": 0.3, "popularity": 0.1}
+
+
+def interaction_weights(
+    interaction_types: Sequence[str],
+    counts: Sequence[int],
+    ratings: Sequence[Optional[int]],
+) -> np.ndarray:
+    """Convert aggregated interaction rows into implicit feedback weights.
+
+    Args:
+        interaction_types: Interaction type per row
+        counts: Number of interactions of that type per row
+        ratings: Highest rating per row (only used for ``rate``)
+
+    Returns:
+        Weight per row; ratings of 1-2 count as no positive signal
+    """
+    types = np.asarray(interaction_types, dtype=object)
+    weights = np.fromiter((INTERACTION_WEIGHTS.get(t, 0.0) for t in types), dtype=np.float32, count=len(types))
+    weights *= np.asarray(counts, dtype=np.float32)
+    rating_values = np.asarray([r if r is not None else 0 for r in ratings], dtype=np.float32)
+    return np.where(types == "rate", np.maximum(rating_values - 2.0, 0.0), weights).astype(np.float32)
+
+
+class CSRMatrix:
+    """Minimal compressed sparse row matrix on NumPy arrays."""
+
+    __slots__ = ("indptr", "indices", "data", "shape")
+
+    def __init__(self, indptr: np.ndarray, indices: np.ndarray, data: np.ndarray, shape: Tuple[int, int]):
+        self.indptr = indptr
+        self.indices = indices
+        self.data = data
+        self.shape = shape
+
+    @classmethod
+    def from_coo(
+        cls,
+        rows: np.ndarray,
+        cols: np.ndarray,
+        values: np.ndarray,
+        shape: Tuple[int, int],
+    ) -> "CSRMatrix":
+        """Build a CSR matrix from coordinate triplets, summing duplicates."""
+        rows = np.asarray(rows, dtype=np.int64)
+        cols = np.asarray(cols, dtype=np.int64)
+        values = np.asarray(values, dtype=np.float32)
+
+        if rows.size:
+            order = np.lexsort((cols, rows))
+            rows, cols, values = rows[order], cols[order], values[order]
+            keys = rows * shape[1] + cols
+            starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+            rows, cols = rows[starts], cols[starts]
+            values = np.add.reduceat(values, starts)
+
+        indptr = np.zeros(shape[0] + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=shape[0]), out=indptr[1:])
+        return cls(indptr, cols.astype(np.int32), values.astype(np.float32), shape)
+
+    @property
+    def nnz(self) -> int:
+        return int(self.data.size)
+
+    def row_lengths(self) -> np.ndarray:
+        return np.diff(self.indptr)
+
+    def row_ids(self) -> np.ndarray:
+        """Row index of every stored value."""
+        return np.repeat(np.arange(self.shape[0]), self.row_lengths())
+
+    def transpose(self) -> "CSRMatrix":
+        return CSRMatrix.from_coo(self.indices, self.row_ids(), self.data, (self.shape[1], self.shape[0]))
+
+    def scale_rows(self, factors: np.ndarray) -> "CSRMatrix":
+        data = self.data * np.repeat(factors.astype(np.float32), self.row_lengths())
+        return CSRMatrix(self.indptr, self.indices, data, self.shape)
+
+    def scale_columns(self, factors: np.ndarray) -> "CSRMatrix":
+        return CSRMatrix(self.indptr, self.indices, self.data * factors.astype(np.float32)[self.indices], self.shape)
+
+    def row_norms(self) -> np.ndarray:
+        squares = np.zeros(self.shape[0], dtype=np.float32)
+        np.add.at(squares, self.row_ids(), self.data ** 2)
+        return np.sqrt(squares)
+
+    def l2_normalize_rows(self) -> "CSRMatrix":
+        norms = self.row_norms()
+        return self.scale_rows(np.divide(1.0, norms, out=np.zeros_like(norms), where=norms > 0))
+
+    def dot(self, dense: np.ndarray, max_products: int = 1 << 22) -> np.ndarray:
+        """Multiply by a dense matrix of shape (n, k), returning (m, k).
+
+        Rows are processed in blocks so the per-value products never exceed
+        about ``max_products`` floats, however many values the matrix stores.
+        """
+        dense = np.asarray(dense, dtype=np.float32)
+        out = np.zeros((self.shape[0], dense.shape[1]), dtype=np.float32)
+        if not self.nnz:
+            return out
+        block_nnz = max(1, max_products // max(1, dense.shape[1]))
+        start = 0
+        while start < self.shape[0]:
+            end = int(np.searchsorted(self.indptr, self.indptr[start] + block_nnz, side="right")) - 1
+            end = min(max(end, start + 1), self.shape[0])
+            lo, hi = self.indptr[start], self.indptr[end]
+            if hi > lo:
+                row_starts = self.indptr[start:end]
+                nonempty = row_starts < self.indptr[start + 1:end + 1]
+                products = self.data[lo:hi, None] * dense[self.indices[lo:hi]]
+                out[start:end][nonempty] = np.add.reduceat(products, row_starts[nonempty] - lo, axis=0)
+            start = end
+        return out
+
+    def sparse_dot(self, other: "CSRMatrix") -> "CSRMatrix":
+        """Multiply by another CSR matrix of shape (n, k), returning CSR (m, k)."""
+        counts = other.row_lengths()[self.indices]
+        total = int(counts.sum())
+        offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        positions = np.repeat(other.indptr[self.indices], counts) + offsets
+        return CSRMatrix.from_coo(
+            np.repeat(self.row_ids(), counts),
+            other.indices[positions],
+            np.repeat(self.data, counts) * other.data[positions],
+            (self.shape[0], other.shape[1]),
+        )
+
+    def rows_dense(self, rows: np.ndarray) -> np.ndarray:
+        """Materialize the given rows as a dense (len(rows), n) array."""
+        out = np.zeros((len(rows), self.shape[1]), dtype=np.float32)
+        starts, ends = self.indptr[rows], self.indptr[rows + 1]
+        counts = ends - starts
+        positions = np.repeat(starts, counts) + (np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts))
+        out[np.repeat(np.arange(len(rows)), counts), self.indices[positions]] = self.data[positions]
+        return out
+
+
+def randomized_svd(
+    matrix: CSRMatrix,
+    rank: int,
+    oversample: int = 10,
+    power_iterations: int = 2,
+    seed: int = 0,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Truncated SVD of a sparse matrix (Halko et al. randomized range finder).
+
+    Returns:
+        Tuple ``(U, s, Vt)`` with shapes (m, r), (r,), (r, n)
+    """
+    rank = max(1, min(rank, min(matrix.shape) - 1 if min(matrix.shape) > 1 else 1))
+    width = min(rank + oversample, matrix.shape[1])
+    rng = np.random.default_rng(seed)
+    transposed = matrix.transpose()
+
+    sample = matrix.dot(rng.standard_normal((matrix.shape[1], width), dtype=np.float32))
+    for _ in range(power_iterations):
+        sample, _ = np.linalg.qr(sample)
+        sample = matrix.dot(transposed.dot(sample))
+    basis, _ = np.linalg.qr(sample)
+
+    projected = transposed.dot(basis).T  # (width, n)
+    u_small, singular_values, vt = np.linalg.svd(projected, full_matrices=False)
+    return (basis @ u_small)[:, :rank], singular_values[:rank], vt[:rank]
+
+
+@dataclass
+class RecommendationModel:
+    """Fitted model state; indices refer to positions in ``user_ids``/``item_ids``."""
+
+    user_ids: List
+    item_ids: np.ndarray
+    interactions: CSRMatrix  # users x items, raw weights (for excluding seen items)
+    item_tags: CSRMatrix  # items x tags, L2-normalized rows
+    user_tags: CSRMatrix  # users x tags, L2-normalized rows
+    user_factors: np.ndarray  # users x rank
+    item_factors: np.ndarray  # items x rank
+    popularity: np.ndarray  # items, in [0, 1]
+    weights: Dict[str, float]
+    _user_rows: Optional[Dict] = field(default=None, init=False, repr=False)
+
+    def user_row(self, user_id) -> Optional[int]:
+        """Row of a user in the model, or None if they were not fitted."""
+        if self._user_rows is None:
+            self._user_rows = {uid: row for row, uid in enumerate(self.user_ids)}
+        return self._user_rows.get(user_id)
+
+    def popular(self, top_k: int, exclude: Iterable[int] = ()) -> Tuple[np.ndarray, np.ndarray]:
+        """``(item_ids, scores)`` of the most popular items, best first, skipping ``exclude``.
+
+        Used for users the model was not fitted on.
+        """
+        scores = self.popularity.copy()
+        exclude = list(exclude)
+        if exclude:
+            scores[np.isin(self.item_ids, exclude)] = -np.inf
+        top_k = min(top_k, len(self.item_ids))
+        if top_k <= 0:
+            return self.item_ids[:0], scores[:0]
+        best = np.sort(np.argpartition(-scores, top_k - 1)[:top_k])
+        best = best[np.argsort(-scores[best], kind="stable")]  # ties keep item order
+        best = best[np.isfinite(scores[best])]
+        return self.item_ids[best], scores[best]
+
+    def score_batch(self, user_rows: np.ndarray) -> np.ndarray:
+        """Blend signals for a batch of users into a dense (batch, items) score matrix.
+
+        Signals are accumulated in place, so peak memory stays at about two
+        (batch, items) float32 arrays.
+        """
+        scores = self.user_factors[user_rows] @ self.item_factors.T
+        peak = scores.max(axis=1, keepdims=True)
+        np.divide(scores, peak, out=scores, where=peak > 0)
+        scores[peak[:, 0] <= 0] = 0.0
+        np.clip(scores, 0.0, 1.0, out=scores)
+        scores *= self.weights["cf"]
+
+        tags = self.item_tags.dot(self.user_tags.rows_dense(user_rows).T)  # (items, batch)
+        tags *= self.weights["tags"]
+        scores += tags.T
+        del tags
+        scores += self.weights["popularity"] * self.popularity[None, :]
+
+        # Never recommend items the user has already interacted with
+        counts = self.interactions.row_lengths()[user_rows]
+        starts = self.interactions.indptr[user_rows]
+        positions = np.repeat(starts, counts) + (np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts))
+        scores[np.repeat(np.arange(len(user_rows)), counts), self.interactions.indices[positions]] = -np.inf
+        return scores
+
+    def recommend(
+        self,
+        top_k: int,
+        user_rows: Optional[np.ndarray] = None,
+        batch_size: int = 256,
+    ) -> Iterator[Tuple[int, np.ndarray, np.ndarray]]:
+        """Yield ``(user_row, item_ids, scores)`` for each user, best first.
+
+        Args:
+            top_k: Number of recommendations per user
+            user_rows: Users to score (default: all)
+            batch_size: Users scored per matrix product; bounds memory to
+                ``batch_size x len(item_ids)`` floats
+        """
+        if user_rows is None:
+            user_rows = np.arange(len(self.user_ids))
+        top_k = min(top_k, len(self.item_ids))
+        if top_k <= 0:
+            return
+
+        for start in range(0, len(user_rows), batch_size):
+            batch = np.asarray(user_rows[start:start + batch_size])
+            scores = self.score_batch(batch)
+            candidates = np.argpartition(-scores, top_k - 1, axis=1)[:, :top_k]
+            candidate_scores = np.take_along_axis(scores, candidates, axis=1)
+            order = np.argsort(-candidate_scores, axis=1)
+            candidates = np.take_along_axis(candidates, order, axis=1)
+            candidate_scores = np.take_along_axis(candidate_scores, order, axis=1)
+
+            for row, items, item_scores in zip(batch, candidates, candidate_scores):
+                keep = np.isfinite(item_scores)
+                yield int(row), self.item_ids[items[keep]], item_scores[keep]
+
+
+def fit_model(
+    user_ids: Sequence,
+    item_ids: Sequence[int],
+    interactions: Tuple[Sequence, Sequence[int], Sequence[float]],
+    item_tags: Tuple[Sequence[int], Sequence],
+    favorite_tags: Optional[Dict] = None,
+    rank: int = 32,
+    weights: Optional[Dict[str, float]] = None,
+    favorite_tag_weight: float = 1.0,
+    seed: int = 0,
+) -> RecommendationModel:
+    """Fit the blended recommender from raw arrays.
+
+    Args:
+        user_ids: Users to build profiles for (e.g., all active users)
+        item_ids: Candidate item IDs
+        interactions: ``(user_ids, item_ids, weights)`` aggregated per pair;
+            pairs referring to unknown users or items are ignored
+        item_tags: ``(item_ids, tag_ids)`` pairs
+        favorite_tags: Mapping of user ID to a list of favorite tag IDs
+        rank: Number of latent factors for the SVD
+        weights: Blend weights for "cf", "tags" and "popularity"
+        favorite_tag_weight: Weight of a favorite tag relative to the user's
+            strongest interaction-derived tag
+        seed: Random seed for the SVD
+
+    Returns:
+        Fitted RecommendationModel
+    """
+    user_ids = list(user_ids)
+    item_ids = np.asarray(item_ids, dtype=np.int64)
+    user_index = {user_id: row for row, user_id in enumerate(user_ids)}
+    item_index = {int(item_id): col for col, item_id in enumerate(item_ids)}
+    n_users, n_items = len(user_ids), len(item_ids)
+
+    # Interaction matrix
+    inter_users, inter_items, inter_weights = interactions
+    rows = np.fromiter((user_index.get(u, -1) for u in inter_users), dtype=np.int64, count=len(inter_users))
+    cols = np.fromiter((item_index.get(int(i), -1) for i in inter_items), dtype=np.int64, count=len(inter_items))
+    values = np.asarray(inter_weights, dtype=np.float32)
+    valid = (rows >= 0) & (cols >= 0) & (values > 0)
+    matrix = CSRMatrix.from_coo(rows[valid], cols[valid], values[valid], (n_users, n_items))
+
+    # Tag vocabulary and item x tag matrix
+    tag_items, tag_values = item_tags
+    favorite_tags = favorite_tags or {}
+    vocabulary: Dict = {}
+    for tag in list(tag_values) + [tag for tags in favorite_tags.values() for tag in (tags or [])]:
+        vocabulary.setdefault(str(tag), len(vocabulary))
+    tag_rows = np.fromiter((item_index.get(int(i), -1) for i in tag_items), dtype=np.int64, count=len(tag_items))
+    tag_cols = np.fromiter((vocabulary[str(t)] for t in tag_values), dtype=np.int64, count=len(tag_values))
+    keep = tag_rows >= 0
+    item_tag_matrix = CSRMatrix.from_coo(
+        tag_rows[keep], tag_cols[keep], np.ones(int(keep.sum()), dtype=np.float32), (n_items, len(vocabulary))
+    )
+    item_tag_matrix = CSRMatrix(
+        item_tag_matrix.indptr, item_tag_matrix.indices, np.minimum(item_tag_matrix.data, 1.0), item_tag_matrix.shape
+    ).l2_normalize_rows()
+
+    # Popularity (log-scaled total weight) for cold start
+    item_weight = np.zeros(n_items, dtype=np.float32)
+    np.add.at(item_weight, matrix.indices, matrix.data)
+    popularity = np.log1p(item_weight)
+    if popularity.max() > 0:
+        popularity /= popularity.max()
+
+    # Collaborative filtering: scale each item by 1/sqrt(1 + its total weight) so popular
+    # items dominate less, L2-normalize each user's row, then PureSVD
+    normalized = matrix.scale_columns(1.0 / np.sqrt(1.0 + item_weight)).l2_normalize_rows()
+    if normalized.nnz and n_items > 1:
+        _, _, vt = randomized_svd(normalized, rank=rank, seed=seed)
+        item_factors = vt.T.astype(np.float32)
+        user_factors = normalized.dot(item_factors)
+    else:
+        item_factors = np.zeros((n_items, 1), dtype=np.float32)
+        user_factors = np.zeros((n_users, 1), dtype=np.float32)
+
+    # User tag profiles: tags of interacted items plus favorite tags
+    user_tags = normalized.sparse_dot(item_tag_matrix)
+    peak = np.zeros(n_users, dtype=np.float32)
+    np.maximum.at(peak, user_tags.row_ids(), user_tags.data)
+    fav_rows, fav_cols = [], []
+    for user_id, tags in favorite_tags.items():
+        row = user_index.get(user_id)
+        if row is None:
+            continue
+        for tag in tags or []:
+            fav_rows.append(row)
+            fav_cols.append(vocabulary[str(tag)])
+    if fav_rows:
+        fav_rows_arr = np.asarray(fav_rows, dtype=np.int64)
+        fav_values = favorite_tag_weight * np.where(peak[fav_rows_arr] > 0, peak[fav_rows_arr], 1.0)
+        user_tags = CSRMatrix.from_coo(
+            np.r_[user_tags.row_ids(), fav_rows_arr],
+            np.r_[user_tags.indices, np.asarray(fav_cols, dtype=np.int64)],
+            np.r_[user_tags.data, fav_values],
+            user_tags.shape,
+        )
+    user_tags = user_tags.l2_normalize_rows()
+
+    return RecommendationModel(
+        user_ids=user_ids,
+        item_ids=item_ids,
+        interactions=matrix,
+        item_tags=item_tag_matrix,
+        user_tags=user_tags,
+        user_factors=user_factors,
+        item_factors=item_factors,
+        popularity=popularity,
+        weights=dict(weights or DEFAULT_WEIGHTS),
+    )
@@ -1,15 +1,28 @@
 """Recommendation service for business logic operations."""
 
-from typing import List, Optional, Dict, Any
+import threading
+import time
+from array import array
+from typing import List, Optional, Dict, Any, Tuple
 from uuid import UUID
+
+import numpy as np
 from sqlalchemy.orm import Session
 
-from genonaut.db.schema import Recommendation, UserInteraction
+from genonaut.db.schema import Recommendation
 from genonaut.api.repositories.recommendation_repository import RecommendationRepository
 from genonaut.api.repositories.user_repository import UserRepository
 from genonaut.api.repositories.content_repository import ContentRepository
+from genonaut.api.config import get_settings
+from genonaut.api.services.recommendation_engine import RecommendationModel, fit_model, interaction_weights
 from genonaut.api.exceptions import ValidationError, EntityNotFoundError
 
+BATCH_ALGORITHM_VERSION = "hybrid-svd-v1"
+
+# Most recently fitted model per process: (fitted_at, rank, model)
+_MODEL: Optional[Tuple[float, int, RecommendationModel]] = None
+_MODEL_LOCK = threading.Lock()
+
 
 class RecommendationService:
     """Service class for recommendation business logic."""
@@ -394,6 +407,12 @@ class RecommendationService:
         limit: int = 10
     ) -> List[Recommendation]:
         """Generate recommendations for a specific user.
+
+        Scores the user with the process's fitted model (refitted once it is
+        older than ``recommendation-model-ttl-seconds``) and skips items the
+        user has interacted with since the fit. Users the model was not fitted
+        on get the most popular items; they are picked up by the next
+        scheduled refit rather than on the request path.
         
         Args:
             user_id: User ID
@@ -411,64 +430,187 @@ class RecommendationService:
         user = self.user_repository.get_or_404(user_id)
         if not user.is_active:
             raise ValidationError("Cannot generate recommendations for inactive users")
-        
-        # Get available content items (excluding private content for now)
-        available_content = self.content_repository.get_public_content(limit=100)
-        
-        recommendations = []
-        for content in available_content[:limit]:
-            # Calculate recommendation score using similarity calculation
-            score = self._calculate_content_similarity(user, content)
-            
-            # Create recommendation
-            recommendation = self.create_recommendation({
-                'user_id': user_id,
-                'content_item_id': content.id,
-                'recommendation_score': score,
-                'algorithm_version': algorithm_version,
-                'metadata': {'generated_by': 'generate_recommendations_for_user'}
-            })
-            recommendations.append(recommendation)
-        
-        return recommendations
-    
-    def _calculate_content_similarity(self, user, content_item) -> float:
-        """Calculate similarity score between user and content.
-        
-        This is a placeholder implementation for the recommendation algorithm.
-        In a real system, this would use ML models, collaborative filtering, etc.
-        
+        if not algorithm_version or not str(algorithm_version).strip():
+            raise ValidationError("Algorithm version cannot be empty")
+        algorithm_version = str(algorithm_version).strip()
+
+        # Reuse the process's fitted model; users it was not fitted on get the most popular
+        # items until the scheduled batch job refits
+        model = self._cached_model() or self._fit()[0]
+        row = model.user_row(user_id)
+        # The model may predate the user's latest interactions
+        seen = set(self.repository.get_interacted_content_ids(user_id))
+        if row is not None:
+            candidates = model.recommend(limit + len(seen), user_rows=np.array([row]))
+        else:
+            candidates = [(None, *model.popular(limit + len(seen), exclude=seen))]
+        ranked = [
+            (item_id, score)
+            for _, items, scores in candidates
+            for item_id, score in zip(items, scores)
+            if int(item_id) not in seen
+        ]
+        self.repository.replace_unserved_recommendations(
+            [user_id], algorithm_version, self._records(user_id, ranked[:limit], algorithm_version)
+        )
+        return self.repository.get_unserved_recommendations(
+            user_id, limit=limit, algorithm_version=algorithm_version
+        )
+
+    def generate_batch_recommendations(
+        self,
+        user_ids: Optional[List[UUID]] = None,
+        algorithm_version: str = BATCH_ALGORITHM_VERSION,
+        top_k: int = 20,
+        batch_size: int = 256,
+        rank: int = 32,
+    ) -> Dict[str, Any]:
+        """Generate and store top-K recommendations for many users at once.
+
+        Loads interactions, tags and candidates with a handful of set-based
+        queries, scores every candidate for each batch of users in one
+        vectorized pass (see :mod:`genonaut.api.services.recommendation_engine`),
+        and replaces each batch's unserved recommendations with a multi-row
+        insert. Items a user has already interacted with are never recommended.
+        The fitted model is kept for :meth:`generate_recommendations_for_user`.
+
         Args:
-            user: User object
-            content_item: ContentItem object
-            
+            user_ids: Users to generate for (default: all active users). The
+                model is always fitted on every active user's interactions.
+            algorithm_version: Algorithm version recorded on the rows
+            top_k: Recommendations stored per user
+            batch_size: Users scored per matrix product
+            rank: Latent factors used for collaborative filtering
+
         Returns:
-            Similarity score between 0.0 and 1.0
+            Dictionary with user/recommendation counts and phase timings
+
+        Raises:
+            ValidationError: If parameters are invalid
         """
-        # Placeholder algorithm - in practice this would be much more sophisticated
-        # For now, return a reasonable score based on simple heuristics
-        
-        base_score = 0.5  # Default baseline score
-        
-        # Boost score if user has interacted with similar content types
-        user_interactions = self.repository.db.query(UserInteraction).filter(
-            UserInteraction.user_id == user.id
-        ).all()
-        
-        similar_content_interactions = [
-            interaction for interaction in user_interactions
-            if interaction.content_item and interaction.content_item.content_type == content_item.content_type
+        if top_k < 1:
+            raise ValidationError("top_k must be at least 1")
+        if batch_size < 1:
+            raise ValidationError("batch_size must be at least 1")
+        if not algorithm_version or not str(algorithm_version).strip():
+            raise ValidationError("Algorithm version cannot be empty")
+        algorithm_version = str(algorithm_version).strip()
+
+        model, stats = self._fit(rank)
+        fitted = time.perf_counter()
+
+        all_user_ids = model.user_ids
+        if user_ids is None:
+            targets = all_user_ids
+        else:
+            targets = [user_id for user_id in dict.fromkeys(user_ids) if model.user_row(user_id) is not None]
+        rows = np.array([model.user_row(user_id) for user_id in targets], dtype=np.int64)
+
+        created = 0
+        for start in range(0, len(rows), batch_size):
+            batch_rows = rows[start:start + batch_size]
+            records = [
+                record
+                for row, items, scores in model.recommend(top_k, user_rows=batch_rows, batch_size=batch_size)
+                for record in self._records(all_user_ids[row], zip(items, scores), algorithm_version)
+            ]
+            created += self.repository.replace_unserved_recommendations(
+                [all_user_ids[row] for row in batch_rows], algorithm_version, records
+            )
+        finished = time.perf_counter()
+
+        return {
+            'users': len(targets),
+            'candidates': stats['candidates'],
+            'interactions': stats['interactions'],
+            'recommendations_created': created,
+            'algorithm_version': algorithm_version,
+            'timings': {
+                'load_seconds': stats['load_seconds'],
+                'fit_seconds': stats['fit_seconds'],
+                'score_and_store_seconds': round(finished - fitted, 3),
+            },
+        }
+
+    def _fit(self, rank: int = 32) -> Tuple[RecommendationModel, Dict[str, Any]]:
+        """Load interactions, candidates and tags, fit the model and cache it.
+
+        Returns:
+            Tuple of the fitted model and load/fit statistics
+        """
+        global _MODEL
+        started = time.perf_counter()
+        profiles = self.repository.get_active_user_profiles()
+        aggregates = self.repository.get_interaction_aggregates()
+        item_ids = self.repository.get_candidate_content_ids()
+        tag_items, tag_ids = self._load_candidate_tags()
+        loaded = time.perf_counter()
+
+        if aggregates:
+            inter_users, inter_items, inter_types, counts, ratings = zip(*aggregates)
+        else:
+            inter_users, inter_items, inter_types, counts, ratings = (), (), (), (), ()
+
+        model = fit_model(
+            [user_id for user_id, _ in profiles],
+            item_ids,
+            (inter_users, inter_items, interaction_weights(inter_types, counts, ratings)),
+            (tag_items, tag_ids),
+            favorite_tags={user_id: tags for user_id, tags in profiles if tags},
+            rank=rank,
+        )
+        fitted = time.perf_counter()
+
+        with _MODEL_LOCK:
+            _MODEL = (time.monotonic(), rank, model)
+        return model, {
+            'candidates': len(item_ids),
+            'interactions': len(aggregates),
+            'load_seconds': round(loaded - started, 3),
+            'fit_seconds': round(fitted - loaded, 3),
+        }
+
+    def _load_candidate_tags(self) -> Tuple[np.ndarray, List[str]]:
+        """Pack the streamed candidate tags into an ID array and shared tag keys."""
+        tag_items = array('q')
+        tag_keys: List[str] = []
+        keys: Dict[Any, str] = {}
+        for batch in self.repository.stream_candidate_content_tags():
+            for content_id, tag_id in batch:
+                tag_items.append(content_id)
+                key = keys.get(tag_id)
+                if key is None:
+                    key = keys[tag_id] = str(tag_id)
+                tag_keys.append(key)
+        return np.frombuffer(tag_items, dtype=np.int64), tag_keys
+
+    @staticmethod
+    def _cached_model(rank: int = 32) -> Optional[RecommendationModel]:
+        """The process's fitted model, if fitted with ``rank`` within the TTL."""
+        with _MODEL_LOCK:
+            entry = _MODEL
+        if entry is None:
+            return None
+        fitted_at, fitted_rank, model = entry
+        ttl = get_settings().recommendation_model_ttl_seconds
+        if fitted_rank != rank or time.monotonic() - fitted_at > ttl:
+            return None
+        return model
+
+    @staticmethod
+    def _records(user_id: UUID, ranked, algorithm_version: str) -> List[Dict[str, Any]]:
+        """Recommendation rows for ``(item_id, score)`` pairs, best first."""
+        return [
+            {
+                'user_id': user_id,
+                'content_item_id': int(item_id),
+                'recommendation_score': round(float(min(max(score, 0.0), 1.0)), 4),
+                'algorithm_version': algorithm_version,
+                'rec_metadata': {'rank': position + 1},
+                'is_served': False,
+            }
+            for position, (item_id, score) in enumerate(ranked)
         ]
-        
-        if similar_content_interactions:
-            base_score += 0.2  # Boost for familiar content type
-        
-        # Add some randomization to avoid always returning the same scores
-        import random
-        random_factor = random.uniform(-0.1, 0.3)
-        
-        final_score = min(1.0, max(0.0, base_score + random_factor))
-        return round(final_score, 2)
 
     def get_served_recommendations(
         self, 
@@ -0,0 +1,242 @@
+"""Redis response cache for hot read routes, filled by the cache warmer.
+
+Entries are only written by the ``warm_response_cache`` Celery task (see
+:mod:`genonaut.api.services.cache_warmer`), which replays the most requested
+(route, normalized params) patterns from ``route_analytics_hourly``. Routes
+look the request up with its full query string and serve the stored JSON
+as-is on a hit. The outcome is put on ``request.state.cache_status``
+(``hit`` / ``miss``) so the route analytics middleware records it in
+``route_analytics.cache_status``; the hourly aggregation turns that into
+``cache_hits`` / ``cache_misses``.
+
+Entries expire after ``cache-planning.response-ttl-seconds``. Writes that add,
+change or remove content drop every cached page of the routes that list it
+(``invalidate_content_pages``), so those pages are never staler than the last
+content write. Each route keeps the keys of its entries in a Redis set, so
+invalidation deletes exactly those keys instead of scanning the keyspace. Routes read through an ``asyncio`` Redis client so lookups do not
+block the event loop.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
+from urllib.parse import parse_qs
+
+from fastapi import Request
+from starlette.responses import Response
+
+from genonaut.api.config import get_settings
+
+try:
+    import redis.asyncio as aioredis  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    aioredis = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+CACHE_HIT = "hit"
+CACHE_MISS = "miss"
+
+# After a Redis error, skip the cache for this many seconds instead of failing every request
+UNAVAILABLE_BACKOFF_SECONDS = 30.0
+UNIFIED_CONTENT_ROUTE = "/api/v1/content/unified"
+# Routes whose pages list content items
+CONTENT_ROUTES = (UNIFIED_CONTENT_ROUTE,)
+
+_unavailable_until = 0.0
+# (event loop, client); asyncio Redis connections belong to the loop that opened them
+_async_client: Optional[Tuple[Any, Any]] = None
+
+
+def canonical_params(params: Mapping[str, Any]) -> List[Tuple[str, List[str]]]:
+    """Order-independent form of query parameters used in cache keys.
+
+    Values are compared as lists of strings (``parse_qs`` style), and
+    ``page=1`` is dropped because it is the default page.
+    """
+    items = []
+    for key, value in params.items():
+        values = [str(item) for item in value] if isinstance(value, (list, tuple)) else [str(value)]
+        if key == "page" and values == ["1"]:
+            continue
+        items.append((key, values))
+    return sorted(items)
+
+
+def query_params(request: Request) -> Dict[str, Union[str, List[str]]]:
+    """Query parameters of ``request`` flattened like the route analytics middleware does."""
+    parsed = parse_qs(request.url.query or "", keep_blank_values=True)
+    return {key: values[0] if len(values) == 1 else values for key, values in parsed.items()}
+
+
+class ResponseCache:
+    """Serialized JSON responses in Redis, keyed by route and canonical query params.
+
+    Args:
+        redis_client: Redis client (``decode_responses=True``)
+        namespace: Redis key namespace (``redis_ns``)
+        ttl_seconds: Expiry of written entries
+    """
+
+    def __init__(self, redis_client: Any, namespace: str, ttl_seconds: int = 900):
+        self.redis_client = redis_client
+        self.prefix = f"{namespace}:response_cache"
+        self.ttl_seconds = ttl_seconds
+
+    def key(self, route: str, params: Mapping[str, Any]) -> str:
+        digest = hashlib.sha1(
+            json.dumps(canonical_params(params), separators=(",", ":")).encode("utf-8")
+        ).hexdigest()
+        return f"{self.prefix}:{route}:{digest}"
+
+    def index_key(self, route: str) -> str:
+        """Redis set of the entry keys written for ``route``, so invalidation never scans the keyspace."""
+        return f"{self.prefix}:{route}:keys"
+
+    def get(self, route: str, params: Mapping[str, Any]) -> Optional[str]:
+        """Return the cached JSON body, or None on a miss or when Redis is unavailable."""
+        if not _available():
+            return None
+        try:
+            return self.redis_client.get(self.key(route, params))
+        except Exception as e:
+            _mark_unavailable(e)
+            return None
+
+    def set(self, route: str, params: Mapping[str, Any], body: Union[bytes, str], ttl_seconds: Optional[int] = None) -> None:
+        if isinstance(body, bytes):
+            body = body.decode("utf-8")
+        key = self.key(route, params)
+        ttl_seconds = ttl_seconds or self.ttl_seconds
+        pipe = self.redis_client.pipeline()
+        pipe.set(key, body, ex=ttl_seconds)
+        pipe.sadd(self.index_key(route), key)
+        # Outlives the entries it lists; refreshed on every write
+        pipe.expire(self.index_key(route), ttl_seconds)
+        pipe.execute()
+
+    def invalidate(self, route: str) -> int:
+        """Delete every cached page of ``route``; returns the number of entries removed."""
+        pipe = self.redis_client.pipeline()
+        pipe.smembers(self.index_key(route))
+        pipe.delete(self.index_key(route))
+        keys, _ = pipe.execute()
+        return self.redis_client.unlink(*keys) if keys else 0
+
+
+class AsyncResponseCache(ResponseCache):
+    """:class:`ResponseCache` over a ``redis.asyncio`` client, for use from async routes."""
+
+    async def get(self, route: str, params: Mapping[str, Any]) -> Optional[str]:
+        if not _available():
+            return None
+        try:
+            return await self.redis_client.get(self.key(route, params))
+        except Exception as e:
+            _mark_unavailable(e)
+            return None
+
+    async def invalidate(self, route: str) -> int:
+        pipe = self.redis_client.pipeline()
+        pipe.smembers(self.index_key(route))
+        pipe.delete(self.index_key(route))
+        keys, _ = await pipe.execute()
+        return await self.redis_client.unlink(*keys) if keys else 0
+
+
+def _available() -> bool:
+    return time.monotonic() >= _unavailable_until
+
+
+def _mark_unavailable(error: Exception) -> None:
+    global _unavailable_until
+    _unavailable_until = time.monotonic() + UNAVAILABLE_BACKOFF_SECONDS
+    logger.warning(f"Response cache unavailable, bypassing for {UNAVAILABLE_BACKOFF_SECONDS:.0f}s: {error}")
+
+
+def _enabled_settings():
+    settings = get_settings()
+    planning = settings.cache_planning or {}
+    if not planning.get("response_cache_enabled", True) or not settings.redis_url:
+        return None, planning
+    return settings, planning
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """Response cache from settings, or None when disabled or Redis is not configured."""
+    settings, planning = _enabled_settings()
+    if settings is None:
+        return None
+
+    from genonaut.worker.pubsub import get_redis_client
+
+    return ResponseCache(
+        get_redis_client(),
+        settings.redis_ns,
+        ttl_seconds=int(planning.get("response_ttl_seconds", 900)),
+    )
+
+
+def get_async_response_cache() -> Optional[AsyncResponseCache]:
+    """:func:`get_response_cache` for the running event loop, on a shared ``asyncio`` client."""
+    global _async_client
+    settings, planning = _enabled_settings()
+    if settings is None or aioredis is None:
+        return None
+
+    loop = asyncio.get_running_loop()
+    if _async_client is None or _async_client[0] is not loop:
+        _async_client = (loop, aioredis.from_url(settings.redis_url, decode_responses=True))
+    return AsyncResponseCache(
+        _async_client[1],
+        settings.redis_ns,
+        ttl_seconds=int(planning.get("response_ttl_seconds", 900)),
+    )
+
+
+async def cached_response(request: Request) -> Optional[Response]:
+    """Serve ``request`` from the response cache if it was warmed.
+
+    Usable as a route dependency declared before ``get_read_session``, so a hit
+    never sets up a database session. Records ``hit`` or ``miss`` on
+    ``request.state.cache_status`` whenever the cache is enabled.
+
+    Returns:
+        JSON response with the cached body, or None on a miss
+    """
+    cache = get_async_response_cache()
+    if cache is None:
+        return None
+
+    body = await cache.get(request.url.path, query_params(request))
+    request.state.cache_status = CACHE_HIT if body is not None else CACHE_MISS
+    if body is None:
+        return None
+    return Response(content=body, media_type="application/json", headers={"X-Cache": CACHE_HIT})
+
+
+async def invalidate_content_pages() -> None:
+    """Drop the cached pages that list content, after content was created, changed or deleted."""
+    cache = get_async_response_cache()
+    if cache is None or not _available():
+        return
+    try:
+        for route in CONTENT_ROUTES:
+            await cache.invalidate(route)
+    except Exception as e:
+        _mark_unavailable(e)
+
+
+def invalidate_content_pages_sync() -> None:
+    """:func:`invalidate_content_pages` for synchronous callers (Celery tasks)."""
+    cache = get_response_cache()
+    if cache is None or not _available():
+        return
+    try:
+        for route in CONTENT_ROUTES:
+            cache.invalidate(route)
+    except Exception as e:
+        _mark_unavailable(e)
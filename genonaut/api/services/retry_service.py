@@ -3,6 +3,7 @@
 import asyncio
 import logging
 import random
+import threading
 import time
 from typing import Any, Callable, Dict, List, Optional, Type, Union
 from functools import wraps
@@ -28,6 +29,97 @@ class NonRetryableError(Exception):
     pass
 
 
+class CircuitOpenError(NonRetryableError):
+    """Raised when a call is rejected because its circuit breaker is open."""
+    pass
+
+
+class CircuitState(Enum):
+    """Circuit breaker states."""
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker shared by callers of one dependency.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and calls
+    are rejected immediately for ``reset_timeout`` seconds. The first call after
+    that is let through as a trial (half-open); success closes the circuit,
+    failure reopens it.
+    """
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """Initialize circuit breaker.
+
+        Args:
+            name: Name of the protected dependency, used in logs
+            failure_threshold: Consecutive failures before the circuit opens
+            reset_timeout: Seconds to wait before allowing a trial call
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = CircuitState.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at: Optional[float] = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow_request(self) -> bool:
+        """Return True if a call may proceed, transitioning to half-open when due."""
+        with self._lock:
+            if self.state == CircuitState.CLOSED:
+                return True
+            if self.state == CircuitState.OPEN:
+                if time.monotonic() - self.opened_at < self.reset_timeout:
+                    return False
+                self.state = CircuitState.HALF_OPEN
+                self._trial_in_flight = False
+            # Half-open: allow a single trial call at a time
+            if self._trial_in_flight:
+                return False
+            self._trial_in_flight = True
+            return True
+
+    def record_success(self) -> None:
+        """Record a successful call, closing the circuit."""
+        with self._lock:
+            if self.state != CircuitState.CLOSED:
+                logger.info(f"Circuit '{self.name}' closed after successful trial call")
+            self.state = CircuitState.CLOSED
+            self.consecutive_failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """Record a failed call, opening the circuit when the threshold is reached."""
+        with self._lock:
+            self.consecutive_failures += 1
+            self._trial_in_flight = False
+            if self.state == CircuitState.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+                if self.state != CircuitState.OPEN:
+                    logger.warning(
+                        f"Circuit '{self.name}' opened after {self.consecutive_failures} consecutive failures"
+                    )
+                self.state = CircuitState.OPEN
+                self.opened_at = time.monotonic()
+
+    def retry_after(self) -> float:
+        """Seconds until the circuit will allow a trial call (0 if not open)."""
+        if self.state != CircuitState.OPEN or self.opened_at is None:
+            return 0.0
+        return max(0.0, self.reset_timeout - (time.monotonic() - self.opened_at))
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get circuit state for monitoring."""
+        return {
+            "state": self.state.value,
+            "consecutive_failures": self.consecutive_failures,
+            "retry_after_seconds": round(self.retry_after(), 2),
+        }
+
+
 class RetryConfig:
     """Configuration for retry behavior."""
 
@@ -76,6 +168,7 @@ class RetryService:
 
     # Default non-retryable exceptions
     DEFAULT_NON_RETRYABLE_EXCEPTIONS = [
+        NonRetryableError,  # Includes CircuitOpenError: retrying an open circuit is pointless
         ValueError,  # Invalid parameters
         TypeError,   # Type errors
         KeyError,    # Missing keys
@@ -84,6 +177,38 @@ class RetryService:
     def __init__(self):
         """Initialize retry service."""
         self.retry_stats = {}
+        self.circuit_breakers: Dict[str, CircuitBreaker] = {}
+        self._breaker_lock = threading.Lock()
+
+    def get_circuit_breaker(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0
+    ) -> CircuitBreaker:
+        """Get or create the circuit breaker registered under ``name``.
+
+        Breakers are shared by everything using this service instance, so use
+        the global service (:func:`get_retry_service`) for process-wide state.
+
+        Args:
+            name: Breaker name (e.g., "comfyui:http://localhost:8000")
+            failure_threshold: Consecutive failures before opening (new breakers only)
+            reset_timeout: Seconds before a trial call (new breakers only)
+
+        Returns:
+            CircuitBreaker instance
+        """
+        with self._breaker_lock:
+            breaker = self.circuit_breakers.get(name)
+            if breaker is None:
+                breaker = CircuitBreaker(name, failure_threshold, reset_timeout)
+                self.circuit_breakers[name] = breaker
+            return breaker
+
+    def get_circuit_breaker_states(self) -> Dict[str, Dict[str, Any]]:
+        """Get the state of all registered circuit breakers for monitoring."""
+        return {name: breaker.get_status() for name, breaker in self.circuit_breakers.items()}
 
     def create_config(
         self,
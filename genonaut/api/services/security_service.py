@@ -3,10 +3,12 @@
 import re
 import logging
 import hashlib
+import math
+import threading
 import time
 from typing import Dict, List, Optional, Set, Any, Tuple
 from pathlib import Path
-from collections import defaultdict, deque
+from collections import OrderedDict, defaultdict, deque
 from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
@@ -22,14 +24,107 @@ class ContentFilterResult:
         self.violations = violations or []
 
 
+class _SlidingWindowCounter:
+    """Fixed-size ring of per-bucket request counts approximating a sliding window.
+
+    The window is split into ``bucket_count`` equal buckets. Each slot remembers
+    which absolute bucket it currently holds, so stale slots are reset lazily and
+    memory per identifier stays constant no matter how many requests arrive.
+    """
+
+    __slots__ = ("window_seconds", "bucket_seconds", "counts", "bucket_ids")
+
+    def __init__(self, window_seconds: float, bucket_count: int):
+        self.window_seconds = window_seconds
+        self.bucket_seconds = window_seconds / bucket_count
+        self.counts = [0] * bucket_count
+        self.bucket_ids = [-1] * bucket_count
+
+    def count(self, now: float, within_seconds: Optional[float] = None) -> int:
+        """Count requests in the window (or the most recent ``within_seconds`` of it)."""
+        current = int(now // self.bucket_seconds)
+        span = len(self.counts)
+        if within_seconds is not None:
+            span = min(span, max(1, int(-(-within_seconds // self.bucket_seconds))))
+        oldest = current - span
+        return sum(
+            count for count, bucket_id in zip(self.counts, self.bucket_ids)
+            if bucket_id > oldest
+        )
+
+    def add(self, now: float) -> None:
+        """Record one request at ``now``."""
+        current = int(now // self.bucket_seconds)
+        slot = current % len(self.counts)
+        if self.bucket_ids[slot] != current:
+            self.bucket_ids[slot] = current
+            self.counts[slot] = 0
+        self.counts[slot] += 1
+
+    def retry_after(self, now: float) -> float:
+        """Seconds until the oldest in-window bucket expires."""
+        current = int(now // self.bucket_seconds)
+        live = [bucket_id for bucket_id in self.bucket_ids if bucket_id > current - len(self.counts)]
+        if not live:
+            return 0.0
+        expires_at = (min(live) + len(self.counts)) * self.bucket_seconds
+        return max(0.0, expires_at - now)
+
+
 class RateLimiter:
-    """Rate limiter for API endpoints and user actions."""
+    """In-process rate limiter for API endpoints and user actions.
+
+    Used directly when Redis is not configured and as the fallback for
+    :class:`RedisRateLimiter`. Memory is bounded: at most ``max_identifiers``
+    identifiers are tracked (least recently seen are evicted first) and each one
+    keeps a fixed-size ring of bucket counters rather than a timestamp per request.
+    """
 
-    def __init__(self):
-        """Initialize rate limiter."""
-        self.requests = defaultdict(lambda: deque())
+    def __init__(self, max_identifiers: int = 10000, bucket_count: int = 12):
+        """Initialize rate limiter.
+
+        Args:
+            max_identifiers: Maximum number of identifiers tracked at once
+            bucket_count: Number of ring buckets each window is split into
+        """
+        self.max_identifiers = max_identifiers
+        self.bucket_count = bucket_count
+        self.requests: "OrderedDict[str, _SlidingWindowCounter]" = OrderedDict()
         self.blocked_ips = {}
         self.blocked_users = {}
+        self._lock = threading.Lock()
+
+    def _get_counter(self, identifier: str, window_seconds: float) -> _SlidingWindowCounter:
+        """Get (or create) the counter for an identifier, maintaining LRU order."""
+        counter = self.requests.get(identifier)
+        if counter is None or counter.window_seconds != window_seconds:
+            counter = _SlidingWindowCounter(window_seconds, self.bucket_count)
+            self.requests[identifier] = counter
+            while len(self.requests) > self.max_identifiers:
+                self.requests.popitem(last=False)
+        self.requests.move_to_end(identifier)
+        return counter
+
+    def check(self, identifier: str, limit: int, window_seconds: float) -> Tuple[bool, int, float]:
+        """Check and record a request.
+
+        Args:
+            identifier: User ID, IP address, or other identifier
+            limit: Maximum requests allowed in window
+            window_seconds: Time window in seconds
+
+        Returns:
+            Tuple of (is_allowed, remaining_requests, retry_after_seconds)
+        """
+        now = time.time()
+        with self._lock:
+            counter = self._get_counter(identifier, window_seconds)
+            current = counter.count(now)
+            if current >= limit:
+                return False, 0, counter.retry_after(now)
+
+            counter.add(now)
+            return True, max(0, limit - current - 1), 0.0
 
     def is_allowed(
         self,
@@ -50,8 +145,6 @@ class RateLimiter:
             Tuple of (is_allowed, remaining_requests)
         """
         now = time.time()
-        window_seconds = window_minutes * 60
-        cutoff_time = now - window_seconds
 
         # Check if identifier is blocked
         if identifier_type == "ip" and identifier in self.blocked_ips:
@@ -66,33 +159,15 @@ class RateLimiter:
             else:
                 del self.blocked_users[identifier]
 
-        # Clean old requests
-        requests = self.requests[identifier]
-        while requests and requests[0] < cutoff_time:
-            requests.popleft()
-
-        # Check limit
-        if len(requests) >= limit:
-            # Block for extended time if severely over limit
-            if len(requests) > limit * 2:
-                if identifier_type == "ip":
-                    self.blocked_ips[identifier] = now + (window_seconds * 2)
-                elif identifier_type == "user":
-                    self.blocked_users[identifier] = now + (window_seconds * 2)
-
-                logger.warning(f"Blocked {identifier_type} {identifier} for severe rate limit violation: {len(requests)} requests in window")
-
-            return False, 0
-
-        # Add current request
-        requests.append(now)
-        remaining = max(0, limit - len(requests))
-
-        return True, remaining
+        allowed, remaining, _ = self.check(identifier, limit, window_minutes * 60)
+        return allowed, remaining
 
     def get_stats(self, identifier: str) -> Dict[str, Any]:
         """Get rate limiting stats for an identifier.
 
+        Counts are approximate to the ring bucket size and never extend beyond
+        the identifier's tracked window.
+
         Args:
             identifier: Identifier to check
 
@@ -100,24 +175,178 @@ class RateLimiter:
             Dictionary with stats
         """
         now = time.time()
-        requests = list(self.requests[identifier])
-
-        # Count recent requests
-        recent_1min = sum(1 for req_time in requests if now - req_time <= 60)
-        recent_5min = sum(1 for req_time in requests if now - req_time <= 300)
-        recent_1hour = sum(1 for req_time in requests if now - req_time <= 3600)
+        with self._lock:
+            counter = self.requests.get(identifier)
+            if counter is None:
+                recent_1min = recent_5min = recent_1hour = total = 0
+            else:
+                recent_1min = counter.count(now, 60)
+                recent_5min = counter.count(now, 300)
+                recent_1hour = counter.count(now, 3600)
+                total = counter.count(now)
 
         return {
             "identifier": identifier,
             "requests_last_1min": recent_1min,
             "requests_last_5min": recent_5min,
             "requests_last_1hour": recent_1hour,
-            "total_tracked_requests": len(requests),
+            "total_tracked_requests": total,
             "is_blocked_ip": identifier in self.blocked_ips,
             "is_blocked_user": identifier in self.blocked_users
         }
 
 
+class RedisRateLimiter:
+    """Rate limiter shared by all API workers, backed by Redis.
+
+    Implements GCRA (generic cell rate algorithm) in a Lua script so each check
+    is a single round trip that stores one timestamp per identifier, expiring
+    on its own once the identifier goes idle. Redis server time is used so all
+    workers agree on the clock.
+
+    If Redis is unreachable, checks are answered by an in-process
+    :class:`RateLimiter` and Redis is retried after ``retry_interval_seconds``.
+    """
+
+    # KEYS[1] = limiter key; ARGV[1] = emission interval (ms); ARGV[2] = window (ms)
+    # Returns {allowed (0/1), remaining, retry_after_ms}
+    GCRA_SCRIPT = """
+local interval = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local tat = tonumber(redis.call('GET', KEYS[1]))
+if tat == nil or tat < now then
+    tat = now
+end
+local new_tat = tat + interval
+local allow_at = new_tat - window
+if now < allow_at then
+    return {0, 0, allow_at - now}
+end
+redis.call('SET', KEYS[1], new_tat, 'PX', math.ceil(new_tat - now))
+local remaining = math.floor((window - (new_tat - now)) / interval)
+return {1, remaining, 0}
+"""
+
+    def __init__(
+        self,
+        redis_client: Any,
+        key_prefix: str = "genonaut:ratelimit",
+        fallback: Optional[RateLimiter] = None,
+        retry_interval_seconds: float = 30.0
+    ):
+        """Initialize the Redis rate limiter.
+
+        Args:
+            redis_client: Redis client (sync) used to run the GCRA script
+            key_prefix: Prefix for limiter keys (should include the Redis namespace)
+            fallback: In-process limiter used while Redis is unavailable
+            retry_interval_seconds: How long to stay on the fallback after a Redis error
+        """
+        self.redis_client = redis_client
+        self.key_prefix = key_prefix
+        self.fallback = fallback or RateLimiter()
+        self.retry_interval_seconds = retry_interval_seconds
+        self._script = redis_client.register_script(self.GCRA_SCRIPT)
+        self._redis_down_until = 0.0
+
+    @property
+    def blocked_ips(self) -> Dict[str, float]:
+        """Blocked IPs tracked by the fallback limiter."""
+        return self.fallback.blocked_ips
+
+    @property
+    def blocked_users(self) -> Dict[str, float]:
+        """Blocked users tracked by the fallback limiter."""
+        return self.fallback.blocked_users
+
+    def check(self, identifier: str, limit: int, window_seconds: float) -> Tuple[bool, int, float]:
+        """Check and record a request.
+
+        Args:
+            identifier: User ID, IP address, or other identifier
+            limit: Maximum requests allowed in window
+            window_seconds: Time window in seconds
+
+        Returns:
+            Tuple of (is_allowed, remaining_requests, retry_after_seconds)
+        """
+        if limit <= 0:
+            return False, 0, float(window_seconds)
+
+        if time.time() < self._redis_down_until:
+            return self.fallback.check(identifier, limit, window_seconds)
+
+        window_ms = int(window_seconds * 1000)
+        interval_ms = max(1, window_ms // limit)
+        key = f"{self.key_prefix}:{identifier}:{window_ms}"
+        try:
+            allowed, remaining, retry_after_ms = self._script(keys=[key], args=[interval_ms, window_ms])
+        except Exception as exc:
+            logger.warning(
+                f"Redis rate limiter unavailable, using in-process limits for "
+                f"{self.retry_interval_seconds}s: {exc}"
+            )
+            self._redis_down_until = time.time() + self.retry_interval_seconds
+            return self.fallback.check(identifier, limit, window_seconds)
+
+        return bool(int(allowed)), int(remaining), int(retry_after_ms) / 1000.0
+
+    def is_allowed(
+        self,
+        identifier: str,
+        limit: int,
+        window_minutes: int = 60,
+        identifier_type: str = "user"
+    ) -> Tuple[bool, int]:
+        """Check if request is allowed under rate limits.
+
+        Args:
+            identifier: User ID, IP address, or other identifier
+            limit: Maximum requests allowed in window
+            window_minutes: Time window in minutes
+            identifier_type: Type of identifier ('user', 'ip', 'global')
+
+        Returns:
+            Tuple of (is_allowed, remaining_requests)
+        """
+        allowed, remaining, _ = self.check(identifier, limit, window_minutes * 60)
+        return allowed, remaining
+
+
+def create_rate_limiter(settings: Optional[Any] = None) -> Any:
+    """Create the rate limiter backend selected by configuration.
+
+    Uses :class:`RedisRateLimiter` when ``rate_limit_backend`` is ``"redis"`` and a
+    Redis URL is configured, otherwise the in-process :class:`RateLimiter`.
+
+    Args:
+        settings: Optional Settings instance (loaded if not provided)
+
+    Returns:
+        Rate limiter exposing ``check`` and ``is_allowed``
+    """
+    if settings is None:
+        from genonaut.api.config import get_settings
+        settings = get_settings()
+
+    fallback = RateLimiter(max_identifiers=settings.rate_limit_max_identifiers)
+
+    if settings.rate_limit_backend == "redis" and settings.redis_url:
+        try:
+            from genonaut.worker.pubsub import get_redis_client
+            return RedisRateLimiter(
+                get_redis_client(),
+                key_prefix=f"{settings.redis_ns}:ratelimit",
+                fallback=fallback,
+            )
+        except Exception as exc:
+            logger.warning(f"Redis rate limiter unavailable, using in-process limiter: {exc}")
+
+    return fallback
+
+
 class SecurityService:
     """Service for security validation and content filtering."""
 
@@ -139,14 +368,15 @@ class SecurityService:
         re.compile(r'\$'),    # Environment variables
     ]
 
-    def __init__(self, config: Optional[Dict[str, Any]] = None):
+    def __init__(self, config: Optional[Dict[str, Any]] = None, rate_limiter: Optional[Any] = None):
         """Initialize security service.
 
         Args:
             config: Optional configuration dictionary
+            rate_limiter: Optional rate limiter backend (defaults to the configured one)
         """
         self.config = config or {}
-        self.rate_limiter = RateLimiter()
+        self.rate_limiter = rate_limiter or create_rate_limiter()
 
         # Content filtering configuration
         self.blocked_keywords = self.config.get('blocked_keywords', self.DEFAULT_BLOCKED_KEYWORDS)
@@ -310,8 +540,8 @@ class SecurityService:
         limit, window_minutes = operation_limits.get(operation, (60, 1))  # Default limit
 
         # Check user rate limit
-        user_allowed, user_remaining = self.rate_limiter.is_allowed(
-            f"user:{user_id}", limit, window_minutes, "user"
+        user_allowed, user_remaining, user_retry_after = self.rate_limiter.check(
+            f"user:{user_id}", limit, window_minutes * 60
         )
 
         if not user_allowed:
@@ -322,13 +552,13 @@ class SecurityService:
                 "limit": limit,
                 "window_minutes": window_minutes
             })
-            return False, f"Rate limit exceeded for operation '{operation}'", window_minutes * 60
+            return False, f"Rate limit exceeded for operation '{operation}'", max(1, math.ceil(user_retry_after))
 
         # Check IP rate limit if provided
         if ip_address:
             ip_limit = limit * 5  # More generous for IP-based limiting
-            ip_allowed, ip_remaining = self.rate_limiter.is_allowed(
-                f"ip:{ip_address}", ip_limit, window_minutes, "ip"
+            ip_allowed, ip_remaining, ip_retry_after = self.rate_limiter.check(
+                f"ip:{ip_address}", ip_limit, window_minutes * 60
             )
 
             if not ip_allowed:
@@ -339,7 +569,7 @@ class SecurityService:
                     "limit": ip_limit,
                     "window_minutes": window_minutes
                 })
-                return False, f"Rate limit exceeded for IP address", window_minutes * 60
+                return False, f"Rate limit exceeded for IP address", max(1, math.ceil(ip_retry_after))
 
         return True, f"Rate limit check passed ({user_remaining} remaining)", 0
 
@@ -0,0 +1,376 @@
+"""Sidecar SQLite index of the files under the generation output directory.
+
+``FileStorageService`` records every file it writes, moves or deletes here, so
+storage usage and statistics are read from running totals instead of walking
+the tree and calling ``stat`` on every file:
+
+- ``files`` has one row per file (path relative to the output directory, kind,
+  owning user and generation, size, mtime);
+- ``usage`` holds per (kind, user) file and byte counts, and ``generation_usage``
+  per-generation ones. SQLite triggers on ``files`` keep both up to date in the
+  same transaction as the change.
+
+Files that appear without going through the service (ComfyUI writes its outputs
+directly) are picked up by :meth:`StorageIndex.reconcile`, which the
+``cleanup_storage`` Celery task runs after its parallel ``scandir`` walk
+(:func:`scan_tree`).
+
+Paths are classified from the output directory layout: ``thumbnails/`` and
+``temp/`` hold thumbnails and temp files, anything else is a generation file.
+The user is the ``<user_id>/YYYY/MM/DD/`` directory (or a ``<user_id>_``
+thumbnail prefix) and the generation comes from the ``gen_<id>_`` /
+``gen_job_<id>_`` file name prefix. Attribution passed in by the caller takes
+precedence and survives reconciliation; thumbnails inherit the user of their
+generation.
+"""
+
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+from uuid import UUID
+
+logger = logging.getLogger(__name__)
+
+KINDS = ("generation", "thumbnail", "temp")
+INDEX_FILENAME = ".storage_index.sqlite3"
+
+_GENERATION_RE = re.compile(r"^gen_(?:job_)?(\d+)_")
+
+PathLike = Union[str, Path]
+# (path relative to the root, size in bytes, mtime in ns)
+IndexEntry = Tuple[str, int, int]
+
+
+def _apply_usage(row: str, sign: str) -> str:
+    """Trigger statements adding (``+``) or removing (``-``) ``row`` from the totals."""
+    return f"""
+        INSERT INTO usage (kind, user_id, files, bytes, generation_files)
+        VALUES ({row}.kind, COALESCE({row}.user_id, ''), {sign}1, {sign}{row}.size,
+                {sign}({row}.generation_id IS NOT NULL))
+        ON CONFLICT (kind, user_id) DO UPDATE SET
+            files = files + excluded.files,
+            bytes = bytes + excluded.bytes,
+            generation_files = generation_files + excluded.generation_files;
+        INSERT INTO generation_usage (generation_id, files, bytes)
+        SELECT {row}.generation_id, {sign}1, {sign}{row}.size WHERE {row}.generation_id IS NOT NULL
+        ON CONFLICT (generation_id) DO UPDATE SET
+            files = files + excluded.files,
+            bytes = bytes + excluded.bytes;
+    """
+
+
+_SCHEMA = f"""
+    CREATE TABLE IF NOT EXISTS files (
+        path TEXT PRIMARY KEY, kind TEXT NOT NULL, user_id TEXT, generation_id INTEGER,
+        size INTEGER NOT NULL, mtime_ns INTEGER NOT NULL, indexed_at REAL NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS files_generation ON files (generation_id) WHERE generation_id IS NOT NULL;
+    CREATE TABLE IF NOT EXISTS usage (
+        kind TEXT NOT NULL, user_id TEXT NOT NULL, files INTEGER NOT NULL, bytes INTEGER NOT NULL,
+        generation_files INTEGER NOT NULL, PRIMARY KEY (kind, user_id)
+    );
+    CREATE TABLE IF NOT EXISTS generation_usage (
+        generation_id INTEGER PRIMARY KEY, files INTEGER NOT NULL, bytes INTEGER NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+    CREATE TRIGGER IF NOT EXISTS files_insert AFTER INSERT ON files BEGIN
+        {_apply_usage("NEW", "+")}
+    END;
+    CREATE TRIGGER IF NOT EXISTS files_delete AFTER DELETE ON files BEGIN
+        {_apply_usage("OLD", "-")}
+    END;
+    CREATE TRIGGER IF NOT EXISTS files_update AFTER UPDATE OF kind, user_id, generation_id, size ON files BEGIN
+        {_apply_usage("OLD", "-")}
+        {_apply_usage("NEW", "+")}
+    END;
+"""
+
+
+def _parse_uuid(value: str) -> Optional[str]:
+    try:
+        return str(UUID(value))
+    except ValueError:
+        return None
+
+
+def classify(relative_path: str) -> Tuple[str, Optional[str], Optional[int]]:
+    """Derive (kind, user_id, generation_id) from a path relative to the output directory."""
+    parts = relative_path.split("/")
+    name = parts[-1]
+    match = _GENERATION_RE.match(name)
+    generation_id = int(match.group(1)) if match else None
+    if parts[0] in ("thumbnails", "temp") and len(parts) > 1:
+        kind = "thumbnail" if parts[0] == "thumbnails" else "temp"
+        user_id = _parse_uuid(name.split("_", 1)[0]) if kind == "thumbnail" and "_" in name else None
+        return kind, user_id, generation_id
+    user_id = _parse_uuid(parts[0]) if len(parts) > 1 else None
+    return "generation", user_id, generation_id
+
+
+@dataclass
+class ScannedTree:
+    """Result of :func:`scan_tree`."""
+
+    files: List[Tuple[str, int, int]] = field(default_factory=list)  # (relative path, size, mtime_ns)
+    directories: List[str] = field(default_factory=list)  # relative paths, parents before children
+    errors: int = 0
+
+
+def _scan_directory(root: str, relative: str, skip: frozenset) -> ScannedTree:
+    result = ScannedTree()
+    stack = [relative]
+    while stack:
+        current = stack.pop()
+        result.directories.append(current)
+        try:
+            with os.scandir(os.path.join(root, current) if current else root) as entries:
+                for entry in entries:
+                    entry_relative = f"{current}/{entry.name}" if current else entry.name
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry_relative)
+                        elif entry.is_file(follow_symlinks=False) and entry_relative not in skip:
+                            stat = entry.stat(follow_symlinks=False)
+                            result.files.append((entry_relative, stat.st_size, stat.st_mtime_ns))
+                    except OSError as exc:
+                        logger.warning(f"Cannot stat {entry.path}: {exc}")
+                        result.errors += 1
+        except OSError as exc:
+            logger.warning(f"Cannot list {os.path.join(root, current)}: {exc}")
+            result.errors += 1
+    return result
+
+
+def scan_tree(root: PathLike, max_workers: int = 8, skip: Iterable[str] = ()) -> ScannedTree:
+    """Walk ``root`` with ``os.scandir``, one top-level directory per worker thread.
+
+    Args:
+        root: Directory to walk
+        max_workers: Threads walking top-level subdirectories concurrently
+        skip: Relative file paths to leave out (e.g. the index itself)
+
+    Returns:
+        Every regular file (relative path, size, mtime) and directory below ``root``
+    """
+    root = str(root)
+    skip = frozenset(skip)
+    result = ScannedTree()
+    top_level = []
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        top_level.append(entry.name)
+                    elif entry.is_file(follow_symlinks=False) and entry.name not in skip:
+                        stat = entry.stat(follow_symlinks=False)
+                        result.files.append((entry.name, stat.st_size, stat.st_mtime_ns))
+                except OSError as exc:
+                    logger.warning(f"Cannot stat {entry.path}: {exc}")
+                    result.errors += 1
+    except FileNotFoundError:
+        return result
+
+    if top_level:
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(top_level)))) as executor:
+            for subtree in executor.map(lambda name: _scan_directory(root, name, skip), top_level):
+                result.files.extend(subtree.files)
+                result.directories.extend(subtree.directories)
+                result.errors += subtree.errors
+    return result
+
+
+class StorageIndex:
+    """Persistent file index with per-user and per-generation running totals."""
+
+    def __init__(self, path: PathLike):
+        """Open (creating if needed) the index database.
+
+        Args:
+            path: SQLite file for the index, or ``":memory:"``
+        """
+        self.path = path if path == ":memory:" else Path(path).expanduser()
+        if isinstance(self.path, Path):
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+    def is_built(self) -> bool:
+        """Whether the index has been reconciled with the directory at least once."""
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = 'reconciled_at'").fetchone()
+        return row is not None
+
+    def add(
+        self,
+        entries: Sequence[IndexEntry],
+        user_id: Optional[Union[UUID, str]] = None,
+        generation_id: Optional[int] = None,
+    ) -> None:
+        """Record new or changed files.
+
+        Args:
+            entries: (relative path, size, mtime_ns) per file
+            user_id: Owner of the files; derived from the path if not given
+            generation_id: Generation of the files; derived from the name if not given
+        """
+        now = time.time()
+        rows = []
+        for path, size, mtime_ns in entries:
+            kind, path_user, path_generation = classify(path)
+            owner = str(user_id) if user_id is not None else path_user
+            generation = generation_id if generation_id is not None else path_generation
+            rows.append((path, kind, owner, generation, size, mtime_ns, now))
+        if not rows:
+            return
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT INTO files (path, kind, user_id, generation_id, size, mtime_ns, indexed_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)"
+                " ON CONFLICT (path) DO UPDATE SET"
+                "  user_id = COALESCE(excluded.user_id, files.user_id),"
+                "  generation_id = COALESCE(excluded.generation_id, files.generation_id),"
+                "  size = excluded.size, mtime_ns = excluded.mtime_ns, indexed_at = excluded.indexed_at",
+                rows,
+            )
+            self._attribute_thumbnails(row[3] for row in rows if row[3] is not None)
+
+    def remove(self, paths: Iterable[str]) -> None:
+        """Forget deleted files."""
+        with self._lock, self._conn:
+            self._conn.executemany("DELETE FROM files WHERE path = ?", [(path,) for path in paths])
+
+    def generation_paths(self, generation_id: int) -> List[str]:
+        """Relative paths of all indexed files of a generation."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT path FROM files WHERE generation_id = ? ORDER BY path", (generation_id,)
+            ).fetchall()
+        return [path for (path,) in rows]
+
+    def generation_usage(self, generation_id: int) -> Dict[str, int]:
+        """File and byte counts of one generation."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT files, bytes FROM generation_usage WHERE generation_id = ?", (generation_id,)
+            ).fetchone()
+        files, size = row or (0, 0)
+        return {"files": files, "bytes": size}
+
+    def user_usage(self, user_id: Union[UUID, str]) -> Dict[str, Dict[str, int]]:
+        """Per-kind ``{"files", "bytes", "generation_files"}`` totals of one user."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT kind, files, bytes, generation_files FROM usage WHERE user_id = ?", (str(user_id),)
+            ).fetchall()
+        return self._by_kind(rows)
+
+    def totals(self) -> Dict[str, Dict[str, int]]:
+        """Per-kind totals over all users, plus ``users_with_data``."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT kind, SUM(files), SUM(bytes), SUM(generation_files) FROM usage GROUP BY kind"
+            ).fetchall()
+            (users,) = self._conn.execute(
+                "SELECT COUNT(DISTINCT user_id) FROM usage WHERE user_id != '' AND files > 0"
+            ).fetchone()
+        totals = self._by_kind(rows)
+        totals["users_with_data"] = users
+        return totals
+
+    @staticmethod
+    def _by_kind(rows) -> Dict[str, Dict[str, int]]:
+        totals = {kind: {"files": 0, "bytes": 0, "generation_files": 0} for kind in KINDS}
+        for kind, files, size, generation_files in rows:
+            totals[kind] = {"files": files or 0, "bytes": size or 0, "generation_files": generation_files or 0}
+        return totals
+
+    def reconcile(self, scanned: Sequence[IndexEntry], scan_started: float) -> Dict[str, int]:
+        """Make the index match a directory scan.
+
+        Rows recorded after ``scan_started`` are kept even if the scan missed
+        them, so files written during a long scan are not forgotten.
+
+        Args:
+            scanned: (relative path, size, mtime_ns) of every file found
+            scan_started: ``time.time()`` when the scan began
+
+        Returns:
+            Counts of added, updated and removed rows
+        """
+        with self._lock, self._conn:
+            conn = self._conn
+            conn.execute("CREATE TEMP TABLE IF NOT EXISTS scan (path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER)")
+            conn.execute("DELETE FROM scan")
+            conn.executemany("INSERT OR REPLACE INTO scan (path, size, mtime_ns) VALUES (?, ?, ?)", scanned)
+            removed = conn.execute(
+                "DELETE FROM files WHERE indexed_at < ? AND path NOT IN (SELECT path FROM scan)", (scan_started,)
+            ).rowcount
+            updated = conn.execute(
+                "UPDATE files SET size = scan.size, mtime_ns = scan.mtime_ns FROM scan"
+                " WHERE scan.path = files.path AND (files.size != scan.size OR files.mtime_ns != scan.mtime_ns)"
+            ).rowcount
+            new = conn.execute(
+                "SELECT path, size, mtime_ns FROM scan WHERE path NOT IN (SELECT path FROM files)"
+            ).fetchall()
+            now = time.time()
+            conn.executemany(
+                "INSERT INTO files (path, kind, user_id, generation_id, size, mtime_ns, indexed_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(path, *classify(path), size, mtime_ns, now) for path, size, mtime_ns in new],
+            )
+            self._attribute_thumbnails()
+            conn.execute("DELETE FROM scan")
+            conn.execute("DELETE FROM usage WHERE files = 0")
+            conn.execute("DELETE FROM generation_usage WHERE files = 0")
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('reconciled_at', ?)", (str(now),))
+        return {"added": len(new), "updated": updated, "removed": removed}
+
+    def _attribute_thumbnails(self, generation_ids: Optional[Iterable[int]] = None) -> None:
+        # Thumbnails are named after their source image, so they inherit its user via the generation
+        sql = (
+            "UPDATE files SET user_id = ("
+            "  SELECT owner.user_id FROM files AS owner"
+            "  WHERE owner.generation_id = files.generation_id AND owner.user_id IS NOT NULL LIMIT 1"
+            ") WHERE kind = 'thumbnail' AND user_id IS NULL AND generation_id IS NOT NULL"
+            "  AND EXISTS (SELECT 1 FROM files AS owner"
+            "   WHERE owner.generation_id = files.generation_id AND owner.user_id IS NOT NULL)"
+        )
+        if generation_ids is None:
+            self._conn.execute(sql)
+            return
+        generation_ids = sorted(set(generation_ids))
+        if generation_ids:
+            placeholders = ",".join("?" for _ in generation_ids)
+            self._conn.execute(f"{sql} AND generation_id IN ({placeholders})", generation_ids)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_INDEXES: Dict[str, StorageIndex] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+def get_storage_index(path: PathLike) -> Optional[StorageIndex]:
+    """Return the process-wide index stored at ``path``, or None if it cannot be opened."""
+    key = str(Path(path).expanduser().resolve())
+    with _INDEXES_LOCK:
+        if key not in _INDEXES:
+            try:
+                _INDEXES[key] = StorageIndex(key)
+            except (OSError, sqlite3.Error) as exc:
+                logger.warning(f"Storage index unavailable at {key}, scanning instead: {exc}")
+                return None
+        return _INDEXES[key]
@@ -8,6 +8,7 @@ from PIL import Image, ImageOps
 from PIL.Image import Resampling
 
 from genonaut.api.config import get_settings, get_cached_settings
+from genonaut.api.services.object_storage import get_object_storage
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +29,7 @@ class ThumbnailService:
         # Expand tilde (~) to absolute path
         self.thumbnail_dir = Path(self.settings.comfyui_output_dir).expanduser() / "thumbnails"
         self.thumbnail_dir.mkdir(parents=True, exist_ok=True)
+        self.storage = get_object_storage()
 
     def generate_thumbnails(
         self,
@@ -79,8 +81,16 @@ class ThumbnailService:
             logger.error(f"Failed to generate thumbnails for {source_image_path}: {e}")
             raise
 
+        self._store([path for paths in results.values() for path in paths])
         return results
 
+    def _store(self, thumbnail_paths: List[str]) -> None:
+        """Upload new thumbnails to a remote object storage backend (in parallel)."""
+        if not self.storage.remote:
+            return
+        items = [(path, self.storage.key_for(path)) for path in thumbnail_paths]
+        self.storage.put_files([(path, key) for path, key in items if key is not None])
+
     def _generate_single_thumbnail(
         self,
         img: Image.Image,
@@ -202,6 +212,10 @@ class ThumbnailService:
             except Exception as e:
                 logger.error(f"Failed to delete thumbnail {thumbnail_path}: {e}")
 
+        if self.storage.remote:
+            keys = [self.storage.key_for(path) for path in thumbnail_paths]
+            self.storage.delete([key for key in keys if key is not None])
+
         if deleted_count > 0:
             logger.info(f"Cleaned up {deleted_count} thumbnail files")
 
@@ -0,0 +1,102 @@
+"""Fast JSON response rendering with orjson.
+
+``FastJSONResponse`` is the application's default response class. Endpoints
+that return large pages can also return it directly with a plain ``dict`` to
+skip FastAPI's ``jsonable_encoder`` pass, and can embed JSON that was already
+built elsewhere (e.g. by PostgreSQL's ``json_agg``) as ``PreSerializedJSON``
+so it is copied into the body without being parsed.
+"""
+
+from decimal import Decimal
+from typing import Any, Dict, Mapping, Sequence
+
+import orjson
+from fastapi.responses import ORJSONResponse
+
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+# Columns of a unified content row, in RawSQLQueryExecutor / ORM select order
+CONTENT_ROW_FIELDS = (
+    "id",
+    "title",
+    "content_type",
+    "content_data",
+    "path_thumb",
+    "path_thumbs_alt_res",
+    "prompt",
+    "creator_id",
+    "item_metadata",
+    "is_private",
+    "quality_score",
+    "created_at",
+    "updated_at",
+    "source_type",
+    "creator_username",
+)
+
+
+class PreSerializedJSON:
+    """A JSON value that is already encoded, embedded verbatim by ``dumps``.
+
+    Args:
+        data: Encoded JSON (UTF-8)
+        length: Number of elements when ``data`` is an array, so callers can use
+            ``len()`` and truthiness as they would on a list
+    """
+
+    __slots__ = ("data", "length")
+
+    def __init__(self, data: bytes, length: int = 0):
+        self.data = data
+        self.length = length
+
+    def __len__(self) -> int:
+        return self.length
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    if isinstance(value, PreSerializedJSON):
+        return orjson.loads(value.data)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    """Encode ``content`` with orjson, splicing top-level ``PreSerializedJSON`` values in as-is."""
+    if isinstance(content, Mapping) and any(isinstance(value, PreSerializedJSON) for value in content.values()):
+        parts = [
+            orjson.dumps(str(key))
+            + b":"
+            + (value.data if isinstance(value, PreSerializedJSON) else orjson.dumps(value, default=_default, option=ORJSON_OPTIONS))
+            for key, value in content.items()
+        ]
+        return b"{" + b",".join(parts) + b"}"
+    return orjson.dumps(content, default=_default, option=ORJSON_OPTIONS)
+
+
+class FastJSONResponse(ORJSONResponse):
+    """``ORJSONResponse`` that also handles ``Decimal``, sets and ``PreSerializedJSON``."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def serialize_content_row(row: Sequence[Any], fields: Sequence[str] = CONTENT_ROW_FIELDS) -> Dict[str, Any]:
+    """Build the API dict for one unified content row without going through Pydantic.
+
+    Args:
+        row: SQLAlchemy ``Row`` (or tuple) with the columns of ``fields`` in order
+        fields: Column names matching the row positions
+
+    Returns:
+        Dict with ``creator_id`` as a string and timestamps in ISO 8601
+    """
+    item = dict(zip(fields, row))
+    item["creator_id"] = str(item["creator_id"])
+    for key in ("created_at", "updated_at"):
+        value = item.get(key)
+        item[key] = value.isoformat() if value else None
+    return item
@@ -0,0 +1,218 @@
+"""Request-scoped SQL profiling and N+1 detection (``sql-profiler`` config).
+
+While a :class:`QueryProfile` is active (see :func:`profile_queries`; the
+``QueryProfilerMiddleware`` opens one per API request), the
+``before/after_cursor_execute`` listeners installed by
+:func:`install_query_profiler` record every statement executed in that
+context: query count, total DB time, the slowest statements and a count per
+statement fingerprint. A fingerprint is the statement with literals and bind
+parameters replaced by ``?`` and IN / VALUES lists collapsed, so the same query
+issued for different ids counts as a repeat. A fingerprint executed
+``n-plus-one-threshold`` or more times in one request is flagged as a likely
+N+1 (typically a lazy load inside a loop).
+
+Statements executed without an active profile (Celery tasks, startup) cost one
+context variable lookup; with ``sql-profiler.enabled`` off, no profile is ever
+opened.
+"""
+
+import heapq
+import re
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+_current_profile: ContextVar[Optional["QueryProfile"]] = ContextVar("query_profile", default=None)
+_recent: Deque["QueryProfile"] = deque(maxlen=200)
+_install_lock = threading.Lock()
+_installed = False
+
+# Attribute set on the SQLAlchemy execution context between the two cursor events
+_START_ATTR = "_query_profiler_started"
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_PLACEHOLDER = re.compile(r"%\(\w+\)s|%s|\$\d+|\?")
+_NUMBER = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+_WHITESPACE = re.compile(r"\s+")
+_IN_LIST = re.compile(r"\(\?(?:, \?)+\)")
+_VALUES_LIST = re.compile(r"(\([?, ]+\))(?:, \1)+")
+
+
+@lru_cache(maxsize=4096)
+def fingerprint(statement: str) -> str:
+    """Normalize ``statement`` so executions that differ only in values compare equal."""
+    normalized = _STRING.sub("?", statement)
+    normalized = _PLACEHOLDER.sub("?", normalized)
+    normalized = _NUMBER.sub("?", normalized)
+    normalized = _WHITESPACE.sub(" ", normalized).strip()
+    normalized = re.sub(r"\s*,\s*", ", ", normalized)
+    normalized = re.sub(r"\(\s*", "(", re.sub(r"\s*\)", ")", normalized))
+    normalized = _VALUES_LIST.sub(r"\1", normalized)
+    return _IN_LIST.sub("(?)", normalized)
+
+
+@dataclass
+class StatementStats:
+    """Executions of one statement fingerprint within a request."""
+
+    fingerprint: str
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "fingerprint": self.fingerprint,
+            "count": self.count,
+            "total_ms": round(self.total_ms, 2),
+            "max_ms": round(self.max_ms, 2),
+        }
+
+
+@dataclass
+class QueryProfile:
+    """SQL statements executed while handling one request.
+
+    Args:
+        method: HTTP method
+        path: Request path
+        slowest_limit: Number of slowest statements to keep
+    """
+
+    method: str
+    path: str
+    slowest_limit: int = 5
+    started_at: float = field(default_factory=time.time)
+    query_count: int = 0
+    db_time_ms: float = 0.0
+    duration_ms: Optional[float] = None
+    status_code: Optional[int] = None
+    statements: Dict[str, StatementStats] = field(default_factory=dict)
+    slowest: List[Tuple[float, int, str]] = field(default_factory=list)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record(self, statement: str, elapsed_ms: float) -> None:
+        key = fingerprint(statement)
+        with self._lock:
+            self.query_count += 1
+            self.db_time_ms += elapsed_ms
+            stats = self.statements.get(key)
+            if stats is None:
+                stats = self.statements[key] = StatementStats(key)
+            stats.count += 1
+            stats.total_ms += elapsed_ms
+            stats.max_ms = max(stats.max_ms, elapsed_ms)
+            # Min-heap of the slowest statements; the query number breaks ties
+            entry = (elapsed_ms, self.query_count, statement)
+            if len(self.slowest) < self.slowest_limit:
+                heapq.heappush(self.slowest, entry)
+            elif elapsed_ms > self.slowest[0][0]:
+                heapq.heapreplace(self.slowest, entry)
+
+    def repeated(self, threshold: int) -> List[StatementStats]:
+        """Fingerprints executed at least ``threshold`` times, most frequent first."""
+        return sorted(
+            (stats for stats in self.statements.values() if stats.count >= threshold),
+            key=lambda stats: (-stats.count, -stats.total_ms),
+        )
+
+    def server_timing(self) -> str:
+        """``Server-Timing`` header value."""
+        return f'db;dur={self.db_time_ms:.1f};desc="{self.query_count} queries"'
+
+    def to_dict(self, n_plus_one_threshold: int = 5) -> Dict[str, Any]:
+        repeated = self.repeated(n_plus_one_threshold)
+        return {
+            "method": self.method,
+            "path": self.path,
+            "status_code": self.status_code,
+            "started_at": self.started_at,
+            "duration_ms": round(self.duration_ms, 2) if self.duration_ms is not None else None,
+            "query_count": self.query_count,
+            "db_time_ms": round(self.db_time_ms, 2),
+            "distinct_statements": len(self.statements),
+            "slowest": [
+                {"duration_ms": round(elapsed_ms, 2), "statement": statement}
+                for elapsed_ms, _, statement in sorted(self.slowest, reverse=True)
+            ],
+            "repeated": [stats.to_dict() for stats in repeated],
+            "n_plus_one": bool(repeated),
+        }
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None and _current_profile.get() is not None:
+        setattr(context, _START_ATTR, time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = getattr(context, _START_ATTR, None)
+    if started is None:
+        return
+    profile = _current_profile.get()
+    if profile is not None:
+        profile.record(statement, (time.perf_counter() - started) * 1000)
+
+
+def install_query_profiler() -> None:
+    """Register the cursor listeners on all engines (idempotent)."""
+    global _installed
+    with _install_lock:
+        if not _installed:
+            event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+            event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+            _installed = True
+
+
+def uninstall_query_profiler() -> None:
+    """Remove the cursor listeners."""
+    global _installed
+    with _install_lock:
+        if _installed:
+            event.remove(Engine, "before_cursor_execute", _before_cursor_execute)
+            event.remove(Engine, "after_cursor_execute", _after_cursor_execute)
+            _installed = False
+
+
+def get_current_profile() -> Optional[QueryProfile]:
+    """Profile of the current request, if one is being profiled."""
+    return _current_profile.get()
+
+
+@contextmanager
+def profile_queries(method: str = "", path: str = "", slowest_limit: int = 5) -> Iterator[QueryProfile]:
+    """Record the SQL executed in this context (and threads started from it) into a new profile."""
+    install_query_profiler()
+    profile = QueryProfile(method=method, path=path, slowest_limit=slowest_limit)
+    token = _current_profile.set(profile)
+    started = time.perf_counter()
+    try:
+        yield profile
+    finally:
+        profile.duration_ms = (time.perf_counter() - started) * 1000
+        _current_profile.reset(token)
+
+
+def remember_profile(profile: QueryProfile, limit: int = 200) -> None:
+    """Keep ``profile`` among the ``limit`` most recent ones for the debug endpoint."""
+    global _recent
+    if _recent.maxlen != limit:
+        _recent = deque(_recent, maxlen=limit)
+    _recent.append(profile)
+
+
+def recent_profiles() -> List[QueryProfile]:
+    """Most recent request profiles, newest first."""
+    return list(reversed(_recent))
+
+
+def clear_profiles() -> None:
+    _recent.clear()
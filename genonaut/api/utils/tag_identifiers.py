@@ -65,6 +65,21 @@ def get_uuid_for_slug(slug: str) -> Optional[str]:
     return slug_to_uuid.get(slug)
 
 
+def resolve_tag_uuid(tag: str) -> uuid.UUID:
+    """Return the UUID of a tag given as a UUID, a known legacy slug or a tag name.
+
+    Mirrors how ``ContentService`` resolves tag filters for the content_tags junction table.
+    """
+
+    if isinstance(tag, uuid.UUID):
+        return tag
+    try:
+        return uuid.UUID(str(tag))
+    except ValueError:
+        uuid_str = get_uuid_for_slug(str(tag))
+        return uuid.UUID(uuid_str) if uuid_str else uuid.uuid5(TAG_UUID_NAMESPACE, str(tag))
+
+
 def expand_tag_identifiers(tags: List[str]) -> List[str]:
     """Augment tag identifiers with their slug/UUID counterparts.
 
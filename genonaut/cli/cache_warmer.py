@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""CLI for the route-analytics-driven response cache warmer.
+
+By default this is a dry run: it lists the (route, normalized params) patterns
+the ``warm_response_cache`` task would render, according to the
+``cache-planning`` config, and projects the hit rate they would have had on
+the requests recorded in ``route_analytics`` over the lookback window. Pass
+``--execute`` to warm the cache once now.
+
+Usage:
+    python -m genonaut.cli.cache_warmer --count 20 --pages 2 --days 7
+    make cache-warm-dry-run n=20 pages=2
+"""
+
+import argparse
+import json
+
+from tabulate import tabulate
+
+from genonaut.api.dependencies import get_database_session
+from genonaut.api.services.cache_warmer import CacheWarmer, projected_hit_rate
+from genonaut.api.services.response_cache import get_response_cache
+
+
+def main():
+    """Main CLI entry point."""
+    parser = argparse.ArgumentParser(
+        description="Show the response cache warming plan and its projected hit rate"
+    )
+    parser.add_argument('-n', '--count', type=int, default=None,
+                        help="Route patterns to warm (default: cache-planning.top-n-routes)")
+    parser.add_argument('-p', '--pages', type=int, default=None,
+                        help="Pages per pattern (default: cache-planning.pages-to-cache-per-route)")
+    parser.add_argument('-d', '--days', type=int, default=None,
+                        help="Days of analytics to use (default: cache-planning.lookback-days)")
+    parser.add_argument('-f', '--format', choices=['table', 'json'], default='table',
+                        help="Output format (default: table)")
+    parser.add_argument('--execute', action='store_true',
+                        help="Warm the cache now instead of only reporting")
+
+    args = parser.parse_args()
+
+    session = next(get_database_session())
+    try:
+        warmer = CacheWarmer(
+            session,
+            get_response_cache() if args.execute else None,
+            top_n=args.count,
+            pages=args.pages,
+            lookback_days=args.days,
+        )
+        report = warmer.warm(dry_run=not args.execute)
+        hits, total = projected_hit_rate(report.targets, warmer.request_counts(), warmer.pages)
+    finally:
+        session.close()
+
+    projected = hits / total if total else None
+    if args.format == 'json':
+        print(json.dumps({
+            **report.to_dict(),
+            "patterns": [
+                {"route": t.route, "params": t.params, "requests": t.requests, "p95_ms": t.p95_ms}
+                for t in report.targets
+            ],
+            "projected_hits": hits,
+            "cacheable_requests": total,
+            "projected_hit_rate": projected,
+        }, indent=2))
+        return
+
+    if not report.targets:
+        print("No cacheable route patterns found in route_analytics_hourly.")
+        return
+
+    table = [
+        [i, t.route, json.dumps(t.params)[:60], t.requests, f"{t.p95_ms:.0f}ms" if t.p95_ms is not None else "-"]
+        for i, t in enumerate(report.targets, 1)
+    ]
+    print(f"Top {len(report.targets)} patterns, {warmer.pages} page(s) each, last {warmer.lookback_days} days:\n")
+    print(tabulate(table, headers=["Rank", "Route", "Normalized Params", "Requests", "Avg P95"], tablefmt="grid"))
+    print(f"\nCacheable requests in window: {total}")
+    if projected is not None:
+        print(f"Projected hit rate: {projected:.1%} ({hits} of {total})")
+    if args.execute:
+        print(f"\nWarmed {report.warmed} pages ({report.failed} failed, {report.bytes_written} bytes) "
+              f"in {report.duration_ms:.0f}ms")
+    else:
+        print("\nDry run: nothing was written. Use --execute to warm the cache.")
+
+
+if __name__ == '__main__':
+    main()
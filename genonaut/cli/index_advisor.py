@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""CLI for the gallery query index advisor.
+
+Explains the ``/api/v1/content/unified`` query shapes that spent the most DB
+time in ``route_analytics`` (plus, with ``--profile-url``, the statements the
+SQL profiler saw repeated), and proposes covering / partial indexes on the
+content partitions. ``--what-if`` builds the proposals in a transaction that is
+rolled back, to report the plans before and after; ``--write-migration``
+writes them as an Alembic migration.
+
+``--what-if`` really builds the indexes (blocking writes to the partitions while
+it does), so point it at a copy of production data, not production itself.
+
+Usage:
+    python -m genonaut.cli.index_advisor --count 10 --days 7 --what-if
+    python -m genonaut.cli.index_advisor --profile-url http://localhost:8001 --write-migration
+    make index-advisor n=10 what_if=1
+"""
+
+import argparse
+import json
+import sys
+import urllib.request
+import uuid
+from pathlib import Path
+
+from tabulate import tabulate
+
+from genonaut.api.dependencies import get_database_session
+from genonaut.api.services.index_advisor import IndexAdvisor, render_migration
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+SQL_PROFILE_PATH = "/api/v1/admin/sql-profile"
+
+
+def _fetch_profile(base_url: str, limit: int) -> dict:
+    url = f"{base_url.rstrip('/')}{SQL_PROFILE_PATH}?limit={limit}&n_plus_one_only=false"
+    with urllib.request.urlopen(url, timeout=30) as response:
+        return json.load(response)
+
+
+def _alembic_head() -> str:
+    from alembic.config import Config
+    from alembic.script import ScriptDirectory
+
+    return ScriptDirectory.from_config(Config(str(PROJECT_ROOT / "alembic.ini"))).get_current_head()
+
+
+def _write_migration(proposals) -> Path:
+    revision = uuid.uuid4().hex[:12]
+    path = PROJECT_ROOT / "genonaut" / "db" / "migrations" / "versions" / f"{revision}_add_advised_content_indexes.py"
+    path.write_text(render_migration(proposals, revision, _alembic_head()))
+    return path
+
+
+def _ms(value) -> str:
+    return f"{value:.1f}" if value is not None else "-"
+
+
+def _plan_row(candidate) -> list:
+    before, after = candidate.before, candidate.after
+    row = [
+        candidate.label[:70],
+        candidate.requests,
+        _ms(before.execution_ms if before else None),
+        before.shared_hit_blocks + before.shared_read_blocks if before else "-",
+        before.heap_fetches if before else "-",
+    ]
+    if after is not None:
+        row += [_ms(after.execution_ms), after.shared_hit_blocks + after.shared_read_blocks, after.heap_fetches]
+    return row
+
+
+def main():
+    """Main CLI entry point."""
+    parser = argparse.ArgumentParser(
+        description="Propose covering/partial indexes for the most expensive gallery queries"
+    )
+    parser.add_argument('-n', '--count', type=int, default=10,
+                        help="/unified query patterns to analyze (default: 10)")
+    parser.add_argument('-d', '--days', type=int, default=7,
+                        help="Days of route analytics to use (default: 7)")
+    parser.add_argument('--profile-url', default=None,
+                        help="API base URL to read SQL profiler fingerprints from (PostgreSQL 16+)")
+    parser.add_argument('--what-if', action='store_true',
+                        help="Build the proposed indexes in a rolled-back transaction and re-explain")
+    parser.add_argument('--write-migration', action='store_true',
+                        help="Write the proposals as an Alembic migration")
+    parser.add_argument('-f', '--format', choices=['table', 'json'], default='table',
+                        help="Output format (default: table)")
+
+    args = parser.parse_args()
+
+    session = next(get_database_session())
+    try:
+        advisor = IndexAdvisor(session, top_n=args.count, lookback_days=args.days)
+        candidates = advisor.route_candidates()
+        if args.profile_url:
+            candidates += advisor.profile_candidates(_fetch_profile(args.profile_url, 200), limit=args.count)
+        report = advisor.advise(candidates, what_if=args.what_if)
+    finally:
+        session.close()
+
+    migration = _write_migration(report.proposals) if args.write_migration and report.proposals else None
+
+    if args.format == 'json':
+        print(json.dumps({**report.to_dict(), "migration": str(migration) if migration else None}, indent=2))
+        return
+
+    if not report.candidates:
+        print("No /unified query patterns found in route_analytics.")
+        return
+
+    headers = ["Query", "Requests", "Before (ms)", "Buffers", "Heap Fetches"]
+    if report.what_if:
+        headers += ["After (ms)", "Buffers", "Heap Fetches"]
+    print(f"Top query shapes, last {args.days} days:\n")
+    print(tabulate([_plan_row(c) for c in report.candidates], headers=headers, tablefmt="grid"))
+
+    for candidate in report.candidates:
+        if candidate.error:
+            print(f"\nCould not explain {candidate.label[:70]}: {candidate.error}", file=sys.stderr)
+            continue
+        print(f"\n{candidate.label}")
+        print(f"  before: {', '.join(candidate.before.scans) or '-'} ({candidate.before.sorts} sorts)")
+        if candidate.after is not None:
+            print(f"  after:  {', '.join(candidate.after.scans) or '-'} ({candidate.after.sorts} sorts)")
+
+    if not report.proposals:
+        print("\nNo new indexes proposed: existing indexes already serve these queries.")
+        return
+    print("\nProposed indexes:")
+    for proposal in report.proposals:
+        print(f"  {proposal.create_sql(concurrently=True)};")
+    if migration:
+        print(f"\nWrote {migration.relative_to(PROJECT_ROOT)}")
+    elif not args.write_migration:
+        print("\nUse --write-migration to generate an Alembic migration for these.")
+
+
+if __name__ == '__main__':
+    main()
@@ -55,6 +55,7 @@ Examples:
   python -m genonaut.db.demo.seed_data_gen generate
   python -m genonaut.db.demo.seed_data_gen generate --target-rows-users 5000
   python -m genonaut.db.demo.seed_data_gen generate --batch-size 5000 --max-workers 8
+  python -m genonaut.db.demo.seed_data_gen generate --streaming --target-rows-content-items-auto 10000000
         """
     )
 
@@ -107,6 +108,10 @@ Examples:
     gen_parser.add_argument('--use-unmodified-wal-buffers', action='store_true',
                            help='Skip wal_buffers optimization (use current PostgreSQL settings)')
 
+    gen_parser.add_argument('--streaming', action='store_true', default=None,
+                           help='Generate content and jobs in worker processes and stream them with COPY '
+                                '(constant memory; reports rows/sec and peak RSS)')
+
     return parser
 
 
@@ -207,6 +212,7 @@ def main():
             'max_workers': args.max_workers,
             'images_dir': args.images_dir,
             'use_unmodified_wal_buffers': args.use_unmodified_wal_buffers,
+            'streaming': args.streaming,
         }
 
         for key, value in override_mapping.items():
@@ -367,6 +367,7 @@ class StatisticsCollector:
         self.table_counts = {}
         self.total_time = 0
         self.conflicts = {}
+        self.throughput = []
 
     def record_table_count(self, table_name: str, count: int):
         """Record final count for a table."""
@@ -379,6 +380,10 @@ class StatisticsCollector:
             'details': conflict_details or []
         }
 
+    def record_throughput(self, entries: List[Dict[str, Any]]):
+        """Record per-table streaming throughput (rows, seconds, rows_per_second, peak_rss_mb)."""
+        self.throughput.extend(entries)
+
     def record_total_time(self, seconds: float):
         """Record total execution time."""
         self.total_time = seconds
@@ -399,6 +404,13 @@ class StatisticsCollector:
                 if conflict_info['count'] > 0:
                     print(f"  {table_name}: {conflict_info['count']} conflicts")
 
+        if self.throughput:
+            print("\nStreaming Throughput:")
+            for entry in self.throughput:
+                rss = f"{entry['peak_rss_mb']:.0f} MiB" if entry['peak_rss_mb'] is not None else "n/a"
+                print(f"  {entry['phase']}: {entry['rows']:,} rows in {entry['seconds']:.1f}s "
+                      f"({entry['rows_per_second']:,.0f} rows/s), peak RSS {rss}")
+
         print(f"\nTotal Execution Time: {self.total_time:.2f} seconds")
 
         total_records = sum(self.table_counts.values())
@@ -23,8 +23,8 @@ class SeedDataConfig(BaseModel):
 
     # Target row counts
     target_rows_users: int = Field(default=1000, ge=1, le=100000)
-    target_rows_content_items: int = Field(default=20000, ge=1, le=1000000)
-    target_rows_content_items_auto: int = Field(default=100000, ge=1, le=1000000)
+    target_rows_content_items: int = Field(default=20000, ge=1, le=10000000)
+    target_rows_content_items_auto: int = Field(default=100000, ge=1, le=10000000)
 
     # Generation parameters
     max_workers: int = Field(default=4, ge=1, le=16)
@@ -42,6 +42,10 @@ class SeedDataConfig(BaseModel):
     # wal_buffers optimization control
     use_unmodified_wal_buffers: bool = Field(default=False)
 
+    # Stream content items and generation jobs with COPY from worker processes
+    # (see streaming.py) instead of ORM bulk inserts
+    streaming: bool = Field(default=False)
+
     @validator('admin_user_uuid')
     def validate_admin_uuid(cls, v):
         if v is not None:
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import argparse
 import csv
+import gzip
 import json
 import logging
 from collections import defaultdict
@@ -20,10 +21,11 @@ from pathlib import Path
 from typing import Any, Dict, Iterable, List, Mapping, MutableMapping, Optional, Sequence, Tuple
 from uuid import UUID
 
-from sqlalchemy import and_, create_engine, func, or_, select
+from sqlalchemy import and_, create_engine, func, or_, select, text
 from sqlalchemy.engine import Engine
 from sqlalchemy.engine.row import RowMapping
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.sql import sqltypes
 from sqlalchemy.sql.schema import Column, Table
 
 from genonaut.db.schema import Base
@@ -43,6 +45,7 @@ class ExportConfig:
     table_limits: Mapping[str, int]
     include_admin_user: bool
     admin_user_id: Optional[str]
+    compress: bool = False
 
 
 def parse_args() -> argparse.Namespace:
@@ -92,6 +95,16 @@ def parse_args() -> argparse.Namespace:
         default="121e194b-4caa-4b81-ad4f-86ca3919d5b9",
         help="Admin user ID to export with all dependencies (default: demo_admin user)",
     )
+    parser.add_argument(
+        "--streaming",
+        action="store_true",
+        help="Select the subset inside PostgreSQL and stream each table with COPY (constant memory)",
+    )
+    parser.add_argument(
+        "--compress",
+        action="store_true",
+        help="Write gzip-compressed <table>.tsv.gz files",
+    )
     return parser.parse_args()
 
 
@@ -591,14 +604,15 @@ def write_tsv(table: Table, rows: List[Mapping], config: ExportConfig) -> None:
     if not rows:
         return
     config.output_dir.mkdir(parents=True, exist_ok=True)
-    path = config.output_dir / f"{table.name}.tsv"
+    path = config.output_dir / f"{table.name}{'.tsv.gz' if config.compress else '.tsv'}"
     column_names = [col.name for col in table.columns]
     order_names = [col.name for col in order_columns(table)]
     rows_sorted = sorted(
         rows,
         key=lambda row: tuple(row.get(name) for name in order_names),
     )
-    with path.open("w", encoding="utf-8", newline="") as handle:
+    opener = gzip.open if config.compress else open
+    with opener(path, "wt", encoding="utf-8", newline="") as handle:
         writer = csv.writer(handle, delimiter="\t", quoting=csv.QUOTE_MINIMAL, lineterminator="\n")
         writer.writerow(column_names)
         for row in rows_sorted:
@@ -666,6 +680,213 @@ def export_tables(engine: Engine, table_order: Sequence[str], config: ExportConf
         write_tsv(table, table_rows, config)
 
 
+# Partitioned parents are exported through their partitions
+PARTITIONS = {"content_items_all": ("content_items", "content_items_auto")}
+
+
+class StreamingExporter:
+    """Exports a consistent, FK-closed subset without holding rows in Python.
+
+    Everything runs on one connection inside a single REPEATABLE READ
+    transaction, so all tables are read from the same snapshot. The selected
+    subset is tracked as primary keys in one temporary table per exported
+    table and grown with set-based ``INSERT ... SELECT`` statements:
+
+    1. the admin user and, breadth-first, every row that references an already
+       selected row (what ``seed_admin_user_data`` walks row by row)
+    2. up to the table limit of rows per table in dependency order, filtered to
+       rows whose parents are selected (as ``fetch_rows`` does)
+    3. after each step, the parent rows of everything selected, until closed
+
+    Each table is then written with ``COPY (SELECT ...) TO STDOUT`` straight
+    into the output file (optionally gzip-compressed), so memory use does not
+    depend on the size of the database or of the export.
+    """
+
+    def __init__(self, engine: Engine, table_order: Sequence[str], config: ExportConfig, max_depth: int = 10):
+        self.engine = engine
+        self.table_order = list(table_order)
+        self.tables = set(table_order)
+        self.config = config
+        self.max_depth = max_depth
+        self.edges = [
+            (name, fk.elements[0].column.table.name, [elem.parent for elem in fk.elements],
+             [elem.column.name for elem in fk.elements])
+            for name in self.table_order
+            for fk in Base.metadata.tables[name].foreign_key_constraints
+        ]
+
+    @staticmethod
+    def _keys(name: str) -> str:
+        return f"export_keys_{name}"
+
+    @staticmethod
+    def _pk(name: str) -> str:
+        return ", ".join(col.name for col in primary_key_columns(Base.metadata.tables[name]))
+
+    def _targets(self, name: str) -> List[str]:
+        return [target for target in PARTITIONS.get(name, (name,)) if target in self.tables]
+
+    def _selected(self, name: str) -> str:
+        """SQL selecting the full rows of ``name`` that are in the export so far."""
+        if name in PARTITIONS:
+            keys = " UNION ALL ".join(f"SELECT id FROM {self._keys(target)}" for target in self._targets(name))
+            return f"SELECT * FROM {name} WHERE " + (f"id IN ({keys})" if keys else "false")
+        if name not in self.tables:
+            return f"SELECT * FROM {name} WHERE false"
+        return f"SELECT * FROM {name} WHERE ({self._pk(name)}) IN (SELECT {self._pk(name)} FROM {self._keys(name)})"
+
+    def _has_selection(self, conn, name: str) -> bool:
+        return bool(conn.execute(text(f"SELECT EXISTS ({self._selected(name)})")).scalar())
+
+    def _create_key_tables(self, conn) -> None:
+        for name in self.table_order:
+            conn.execute(text(
+                f"CREATE TEMP TABLE {self._keys(name)} ON COMMIT DROP AS "
+                f"SELECT {self._pk(name)} FROM {name} WITH NO DATA"
+            ))
+            conn.execute(text(f"ALTER TABLE {self._keys(name)} ADD PRIMARY KEY ({self._pk(name)})"))
+
+    def _descend(self, conn) -> None:
+        """Add every row referencing a selected row, breadth-first up to ``max_depth`` levels."""
+        for depth in range(self.max_depth):
+            added = 0
+            for child, parent, child_cols, parent_cols in self.edges:
+                result = conn.execute(text(
+                    f"INSERT INTO {self._keys(child)} SELECT {self._pk(child)} FROM {child} "
+                    f"WHERE ({', '.join(col.name for col in child_cols)}) IN "
+                    f"(SELECT {', '.join(parent_cols)} FROM ({self._selected(parent)}) p) "
+                    f"ON CONFLICT DO NOTHING"
+                ))
+                added += result.rowcount
+            if not added:
+                return
+        LOGGER.warning("Maximum depth %d reached while collecting admin user rows", self.max_depth)
+
+    def _close_parents(self, conn) -> None:
+        """Add the parent rows of every selected row until no rows are missing."""
+        while True:
+            added = 0
+            for child, parent, child_cols, parent_cols in self.edges:
+                for target in self._targets(parent):
+                    result = conn.execute(text(
+                        f"INSERT INTO {self._keys(target)} SELECT {self._pk(target)} FROM {target} "
+                        f"WHERE ({', '.join(parent_cols)}) IN "
+                        f"(SELECT {', '.join(col.name for col in child_cols)} FROM ({self._selected(child)}) c) "
+                        f"ON CONFLICT DO NOTHING"
+                    ))
+                    added += result.rowcount
+            if not added:
+                return
+
+    def _fk_filter(self, conn, name: str) -> Optional[str]:
+        """Mirror ``build_fk_filter`` in SQL: keep rows whose parents are selected."""
+        clauses = []
+        for child, parent, child_cols, parent_cols in self.edges:
+            if child != name:
+                continue
+            if not self._has_selection(conn, parent):
+                if not all(col.nullable for col in child_cols):
+                    return None
+                clauses.append(" AND ".join(f"{col.name} IS NULL" for col in child_cols))
+                continue
+            clause = (
+                f"({', '.join(col.name for col in child_cols)}) IN "
+                f"(SELECT {', '.join(parent_cols)} FROM ({self._selected(parent)}) p)"
+            )
+            nullable = [col.name for col in child_cols if col.nullable]
+            if nullable:
+                clause = f"({' OR '.join(f'{col} IS NULL' for col in nullable)} OR {clause})"
+            clauses.append(clause)
+        return " AND ".join(clauses) or None
+
+    def _sample(self, conn, name: str, limit: int, filter_sql: Optional[str]) -> int:
+        table = Base.metadata.tables[name]
+        order = ", ".join(col.name for col in order_columns(table))
+        where = f"WHERE {filter_sql}" if filter_sql else ""
+        result = conn.execute(text(
+            f"INSERT INTO {self._keys(name)} SELECT {self._pk(name)} FROM "
+            f"(SELECT {self._pk(name)} FROM {name} {where} ORDER BY {order} LIMIT :limit) s "
+            f"ON CONFLICT DO NOTHING"
+        ), {"limit": limit})
+        return result.rowcount
+
+    def _column_sql(self, column: Column) -> str:
+        # Match serialize_value: ISO timestamps and true/false booleans
+        if isinstance(column.type, sqltypes.Boolean):
+            return f"CASE WHEN {column.name} THEN 'true' WHEN NOT {column.name} THEN 'false' END AS {column.name}"
+        if isinstance(column.type, (sqltypes.DateTime, sqltypes.Date, sqltypes.Time)):
+            return f"to_json({column.name}) #>> '{{}}' AS {column.name}"
+        # JSON and UUID[] columns as JSON text, like json.dumps
+        if isinstance(column.type, (sqltypes.JSON, sqltypes.ARRAY, sqltypes.TypeDecorator)):
+            return f"to_json({column.name})::text AS {column.name}"
+        return column.name
+
+    def _write(self, conn, name: str) -> int:
+        table = Base.metadata.tables[name]
+        order = ", ".join(col.name for col in order_columns(table))
+        query = (
+            f"SELECT {', '.join(self._column_sql(col) for col in table.columns)} FROM ({self._selected(name)}) t "
+            f"ORDER BY {order}"
+        )
+        suffix = ".tsv.gz" if self.config.compress else ".tsv"
+        path = self.config.output_dir / f"{name}{suffix}"
+        cursor = conn.connection.cursor()
+        try:
+            with (gzip.open(path, "wb", compresslevel=6) if self.config.compress else path.open("wb")) as handle:
+                cursor.copy_expert(
+                    f"COPY ({query}) TO STDOUT WITH (FORMAT csv, DELIMITER E'\\t', HEADER true, NULL '')",
+                    handle,
+                )
+            rows = cursor.rowcount
+        finally:
+            cursor.close()
+        if rows <= 0:
+            path.unlink(missing_ok=True)
+            return 0
+        LOGGER.info("Wrote %s (%d rows) -> %s", name, rows, path)
+        return rows
+
+    def run(self) -> Dict[str, int]:
+        """Select the subset and write one TSV per non-empty table; returns rows written per table."""
+        self.config.output_dir.mkdir(parents=True, exist_ok=True)
+        written: Dict[str, int] = {}
+        with self.engine.connect() as conn:
+            conn = conn.execution_options(isolation_level="REPEATABLE READ")
+            with conn.begin():
+                self._create_key_tables(conn)
+
+                if self.config.include_admin_user and self.config.admin_user_id and "users" in self.tables:
+                    found = conn.execute(text(
+                        f"INSERT INTO {self._keys('users')} SELECT id FROM users WHERE id = CAST(:id AS uuid)"
+                    ), {"id": self.config.admin_user_id}).rowcount
+                    if found:
+                        LOGGER.info("Seeding admin user %s with all dependencies", self.config.admin_user_id)
+                        self._descend(conn)
+                        self._close_parents(conn)
+                    else:
+                        LOGGER.warning("Admin user %s not found in source database", self.config.admin_user_id)
+
+                for name in self.table_order:
+                    limit = self.config.table_limits.get(name, self.config.default_limit)
+                    if limit <= 0:
+                        continue
+                    added = self._sample(conn, name, limit, self._fk_filter(conn, name))
+                    if not added and not self._has_selection(conn, name):
+                        if not conn.execute(text(f"SELECT EXISTS (SELECT 1 FROM {name})")).scalar():
+                            LOGGER.info("Skipping %s (0 rows to export)", name)
+                            continue
+                        LOGGER.info("%s: 0 rows matched FK filter; retrying without filter", name)
+                        self._sample(conn, name, limit, None)
+                    self._close_parents(conn)
+
+                for name in self.table_order:
+                    rows = self._write(conn, name)
+                    if rows:
+                        written[name] = rows
+        return written
+
+
 def main() -> None:
     args = parse_args()
     logging.basicConfig(level=getattr(logging, args.verbosity.upper()), format="%(levelname)s %(message)s")
@@ -677,6 +898,7 @@ def main() -> None:
         table_limits=table_limits,
         include_admin_user=not args.exclude_admin_user,
         admin_user_id=args.admin_user_id if not args.exclude_admin_user else None,
+        compress=args.compress,
     )
 
     metadata_tables = Base.metadata.tables
@@ -691,7 +913,10 @@ def main() -> None:
     database_url = get_database_url(environment=environment)
     engine = create_engine(database_url)
 
-    export_tables(engine, order, config)
+    if args.streaming:
+        StreamingExporter(engine, order, config).run()
+    else:
+        export_tables(engine, order, config)
     LOGGER.info("Export complete")
 
 
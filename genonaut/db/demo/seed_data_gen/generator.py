@@ -11,6 +11,7 @@ from .config import SeedDataConfig, ConfigManager
 from .generators import UserGenerator, ContentGenerator, GenerationJobGenerator
 from .bulk_inserter import BulkInserter, ProgressReporter, StatisticsCollector
 from .static_data_loader import seed_static_data
+from .streaming import StreamingSeeder
 
 
 logger = logging.getLogger(__name__)
@@ -51,11 +52,15 @@ class SyntheticDataGenerator:
             # Step 1: Generate Users (no dependencies)
             user_ids = self._generate_users()
 
-            # Step 2: Generate Content Items (depend on users)
-            content_items_data, content_items_auto_data = self._generate_content_items(user_ids)
+            if self.config.streaming:
+                # Steps 2 and 3: Stream content items and the jobs derived from them
+                self._stream_content_and_jobs(user_ids)
+            else:
+                # Step 2: Generate Content Items (depend on users)
+                content_items_data, content_items_auto_data = self._generate_content_items(user_ids)
 
-            # Step 3: Generate Generation Jobs (depend on content items)
-            self._generate_generation_jobs(user_ids, content_items_data, content_items_auto_data)
+                # Step 3: Generate Generation Jobs (depend on content items)
+                self._generate_generation_jobs(user_ids, content_items_data, content_items_auto_data)
 
             # Restore normal database settings (skip if using unmodified wal_buffers)
             if not self.config.use_unmodified_wal_buffers:
@@ -144,6 +149,17 @@ class SyntheticDataGenerator:
 
         return user_ids
 
+    def _stream_content_and_jobs(self, user_ids: List[str]):
+        """Stream content items and generation jobs with COPY (see ``streaming.py``)."""
+        print("\nGenerating record sets 2-3 of 3: Content Items and Generation Jobs (streaming)...")
+
+        seeder = StreamingSeeder(self.session, self.config.model_dump(), user_ids, self.admin_uuid)
+        throughput = seeder.run(
+            self.config.target_rows_content_items,
+            self.config.target_rows_content_items_auto
+        )
+        self.stats.record_throughput(throughput)
+
     def _generate_content_items(self, user_ids: List[str]) -> tuple:
         """Generate content items and content items auto."""
         print("\nGenerating record sets 2 of 3: Content Items...")
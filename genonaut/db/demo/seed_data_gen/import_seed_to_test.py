@@ -4,13 +4,14 @@ from __future__ import annotations
 
 import argparse
 import csv
+import gzip
 import json
 import logging
 from datetime import date, datetime, time
 from decimal import Decimal
 from graphlib import TopologicalSorter
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Mapping, MutableMapping, Optional, Sequence
+from typing import IO, Any, Dict, Iterable, List, Mapping, MutableMapping, Optional, Sequence
 from uuid import UUID
 
 from sqlalchemy import create_engine, text
@@ -84,10 +85,22 @@ def parse_args() -> argparse.Namespace:
 
 
 def available_tables(input_dir: Path) -> List[str]:
-    tables = []
-    for path in sorted(input_dir.glob("*.tsv")):
-        tables.append(path.stem)
-    return tables
+    tables = {path.stem for path in input_dir.glob("*.tsv")}
+    tables.update(path.name[: -len(".tsv.gz")] for path in input_dir.glob("*.tsv.gz"))
+    return sorted(tables)
+
+
+def table_path(input_dir: Path, name: str) -> Path:
+    """Return ``<name>.tsv``, or the gzip-compressed ``<name>.tsv.gz`` when only that exists."""
+    path = input_dir / f"{name}.tsv"
+    compressed = input_dir / f"{name}.tsv.gz"
+    return compressed if not path.exists() and compressed.exists() else path
+
+
+def open_tsv(path: Path) -> IO[str]:
+    if path.suffix == ".gz":
+        return gzip.open(path, "rt", encoding="utf-8", newline="")
+    return path.open("r", encoding="utf-8", newline="")
 
 
 def candidate_tables(
@@ -160,7 +173,7 @@ def load_rows(path: Path, table: Table) -> List[Dict[str, Any]]:
     if not path.exists():
         LOGGER.info("Skipping %s (missing %s)", table.name, path)
         return []
-    with path.open("r", encoding="utf-8", newline="") as handle:
+    with open_tsv(path) as handle:
         reader = csv.DictReader(handle, delimiter="\t")
         rows: List[Dict[str, Any]] = []
         for raw_row in reader:
@@ -219,7 +232,7 @@ def insert_rows(engine: Engine, table: Table, rows: List[Mapping[str, Any]]) ->
 def import_tables(engine: Engine, order: Sequence[str], input_dir: Path) -> None:
     for name in order:
         table = Base.metadata.tables[name]
-        path = input_dir / f"{name}.tsv"
+        path = table_path(input_dir, name)
         rows = load_rows(path, table)
         inserted, skipped = insert_rows(engine, table, rows)
         if skipped > 0:
@@ -236,14 +249,14 @@ def import_tables(engine: Engine, order: Sequence[str], input_dir: Path) -> None
 def file_row_count(path: Path) -> int:
     if not path.exists():
         return 0
-    with path.open("r", encoding="utf-8", newline="") as handle:
+    with open_tsv(path) as handle:
         return max(sum(1 for _ in handle) - 1, 0)
 
 
 def verify_counts(engine: Engine, tables: Sequence[str], input_dir: Path) -> None:
     with engine.connect() as conn:
         for name in tables:
-            path = input_dir / f"{name}.tsv"
+            path = table_path(input_dir, name)
             expected = file_row_count(path)
             if expected == 0:
                 continue
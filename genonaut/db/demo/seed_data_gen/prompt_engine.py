@@ -400,6 +400,8 @@ DOMAIN_PHRASES = {
     ]
 }
 
+DOMAIN_NAMES = list(DOMAIN_PHRASES.keys())
+
 
 class PromptEngine:
     """Generates diverse prompts using Jinja2 templates and domain-specific pools."""
@@ -410,23 +412,30 @@ class PromptEngine:
             "{{ general_phrases | join(', ') }}{% if general_phrases and domain_phrases %}, {% endif %}{{ domain_phrases | join(', ') }}"
         )
 
-    def generate_prompt(self, domain: str = None) -> str:
-        """Generate a single prompt with random phrases."""
+    def generate_prompt(self, domain: str = None, rng: random.Random = None) -> str:
+        """Generate a single prompt with random phrases.
+
+        Args:
+            domain: Domain to draw phrases from (random if None)
+            rng: Random source; pass a seeded ``random.Random`` to make the prompt
+                reproducible (defaults to the module-level generator)
+        """
+        rng = rng or random
         # Select random general phrases
         min_general = self.config.get('prompt_min_general_phrases', 0)
         max_general = self.config.get('prompt_max_general_phrases', 10)
-        num_general = random.randint(min_general, max_general)
-        general_phrases = random.sample(GENERAL_PHRASES, min(num_general, len(GENERAL_PHRASES)))
+        num_general = rng.randint(min_general, max_general)
+        general_phrases = rng.sample(GENERAL_PHRASES, min(num_general, len(GENERAL_PHRASES)))
 
         # Select domain and domain phrases
         if domain is None:
-            domain = random.choice(list(DOMAIN_PHRASES.keys()))
+            domain = rng.choice(DOMAIN_NAMES)
 
         domain_pool = DOMAIN_PHRASES[domain]
         min_domain = self.config.get('prompt_min_domain_phrases', 4)
         max_domain = self.config.get('prompt_max_domain_phrases', 30)
-        num_domain = random.randint(min_domain, max_domain)
-        domain_phrases = random.sample(domain_pool, min(num_domain, len(domain_pool)))
+        num_domain = rng.randint(min_domain, max_domain)
+        domain_phrases = rng.sample(domain_pool, min(num_domain, len(domain_pool)))
 
         # Generate prompt
         prompt = self.template.render(
@@ -479,10 +488,11 @@ class PromptEngine:
         return self.generate_prompts_batch(count)
 
     @staticmethod
-    def get_random_tags(min_count: int = 0, max_count: int = 200) -> List[str]:
+    def get_random_tags(min_count: int = 0, max_count: int = 200, rng: random.Random = None) -> List[str]:
         """Get random tags from the global tag pool."""
-        num_tags = random.randint(min_count, max_count)
-        return random.sample(GLOBAL_TAGS, min(num_tags, len(GLOBAL_TAGS)))
+        rng = rng or random
+        num_tags = rng.randint(min_count, max_count)
+        return rng.sample(GLOBAL_TAGS, min(num_tags, len(GLOBAL_TAGS)))
 
     @staticmethod
     def get_user_favorite_tags(min_count: int = 0, max_count: int = 10) -> List[str]:
@@ -0,0 +1,469 @@
+"""Streaming content and generation-job seeding via ``COPY ... FROM STDIN``.
+
+The default generator builds every content row as a dict, inserts it with
+``bulk_insert_mappings`` and keeps all of them in memory to derive generation
+jobs afterwards, so memory grows with the target row count and the ORM path
+caps throughput. Streaming mode instead:
+
+- reserves a contiguous id block from ``content_items_id_seq`` per table, so
+  worker processes can generate rows (explicit ids included) independently
+- renders rows to CSV in worker processes, in chunks, and streams the chunks
+  straight into a single ``COPY <table> FROM STDIN`` per table with a bounded
+  number of chunks in flight
+- keeps only a compact per-row (creator index, created_at offset) array per
+  table; ids are implicit in the reserved block
+- derives the completed generation jobs from those arrays. Each row's random
+  attributes come from a generator seeded by ``(seed, table, id)``, so the
+  job's prompt is regenerated exactly instead of being stored
+
+Generated rows match the dict path: same columns, value distributions and
+50 admin-owned items per table.
+"""
+
+import csv
+import io
+import json
+import logging
+import random
+import time
+import uuid
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+import numpy as np
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from .bulk_inserter import ProgressReporter
+from .prompt_engine import PromptEngine
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None
+
+
+logger = logging.getLogger(__name__)
+
+CONTENT_COLUMNS = (
+    "id", "title", "content_type", "content_data", "prompt", "item_metadata", "creator_id",
+    "created_at", "updated_at", "quality_score", "is_private", "source_type",
+)
+JOB_COLUMNS = (
+    "user_id", "job_type", "prompt", "params", "status", "content_id",
+    "created_at", "updated_at", "completed_at",
+)
+SOURCE_TYPES = {"content_items": "items", "content_items_auto": "auto"}
+# Keeps the two tables' per-row random streams disjoint
+TABLE_SEED_OFFSETS = {"content_items": 0, "content_items_auto": 1 << 40}
+ADMIN_ITEMS_PER_TABLE = 50
+STYLES = ["anime", "illustration", "photorealistic"]
+RESOLUTIONS = [
+    "1024x768", "1920x1080", "2560x1440", "1080x1920",
+    "1280x720", "3840x2160", "1366x768", "1024x1024"
+]
+
+# Same ET window as DataGenerator, as UTC epoch seconds
+_ET = ZoneInfo("America/New_York")
+DATE_RANGE_START = int(datetime(2025, 5, 1, 0, 0, 0, tzinfo=_ET).timestamp())
+DATE_RANGE_END = int(datetime(2025, 9, 21, 23, 59, 59, tzinfo=_ET).timestamp())
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process plus its (finished) workers, in MiB."""
+    if resource is None:
+        return None
+    self_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    children_kb = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return (self_kb + children_kb) / 1024
+
+
+def _format_timestamp(epoch_seconds: int) -> str:
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(epoch_seconds))
+
+
+def _row_rng(seed: int, table_name: str, row_id: int) -> random.Random:
+    return random.Random(seed + TABLE_SEED_OFFSETS[table_name] + row_id)
+
+
+# Worker-process state, set once per process by ``_init_worker``
+_WORKER: Dict[str, Any] = {}
+
+
+def _init_worker(config: Dict[str, Any], user_ids: List[str], seed: int) -> None:
+    _WORKER["config"] = config
+    _WORKER["user_ids"] = user_ids
+    _WORKER["seed"] = seed
+    _WORKER["prompt_engine"] = PromptEngine(config)
+
+
+def generate_content_chunk(
+    table_name: str,
+    first_id: int,
+    first_index: int,
+    count: int,
+    admin_index: int
+) -> Tuple[bytes, np.ndarray, np.ndarray]:
+    """Render ``count`` content rows as CSV.
+
+    Args:
+        table_name: ``content_items`` or ``content_items_auto``
+        first_id: Id of the first row (from the table's reserved block)
+        first_index: Position of the first row within the table
+        count: Number of rows
+        admin_index: Index of the admin user in the worker's ``user_ids``
+
+    Returns:
+        Tuple of (CSV bytes, creator indexes as uint32, created_at offsets from
+        ``DATE_RANGE_START`` as uint32)
+    """
+    config = _WORKER["config"]
+    user_ids = _WORKER["user_ids"]
+    seed = _WORKER["seed"]
+    prompt_engine = _WORKER["prompt_engine"]
+    images_dir = config.get("images_dir", "io/storage/images/")
+    source_type = SOURCE_TYPES[table_name]
+    span = DATE_RANGE_END - DATE_RANGE_START
+
+    creators = np.empty(count, dtype=np.uint32)
+    offsets = np.empty(count, dtype=np.uint32)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+
+    for i in range(count):
+        row_id = first_id + i
+        rng = _row_rng(seed, table_name, row_id)
+        # The prompt must be drawn first: generation jobs regenerate it from the same seed
+        prompt = prompt_engine.generate_prompt(rng=rng)
+        if first_index + i < ADMIN_ITEMS_PER_TABLE:
+            creator_index = admin_index
+        else:
+            creator_index = rng.randrange(len(user_ids))
+        offset = rng.randint(0, span)
+        tags = PromptEngine.get_random_tags(0, 200, rng=rng)
+        metadata = {
+            "style": rng.choice(STYLES),
+            "resolution": rng.choice(RESOLUTIONS),
+            "tags": tags,
+            "prompt": prompt,
+        }
+        created_at = _format_timestamp(DATE_RANGE_START + offset)
+        content_uuid = uuid.UUID(int=rng.getrandbits(128), version=4)
+        writer.writerow((
+            row_id,
+            prompt[:30],
+            "image",
+            f"{images_dir}/{content_uuid}.png",
+            prompt,
+            json.dumps(metadata),
+            user_ids[creator_index],
+            created_at,
+            created_at,
+            round(rng.random(), 2),
+            "t" if rng.random() < 0.1 else "f",
+            source_type,
+        ))
+        creators[i] = creator_index
+        offsets[i] = offset
+
+    return buffer.getvalue().encode("utf-8"), creators, offsets
+
+
+def generate_completed_jobs_chunk(
+    table_name: str,
+    first_id: int,
+    creators: np.ndarray,
+    offsets: np.ndarray
+) -> bytes:
+    """Render one completed generation job per content row as CSV.
+
+    Jobs are derived from the compact arrays; prompts are regenerated from each
+    row's seed. ``generation_jobs.content_id`` only references ``content_items``,
+    so jobs for ``content_items_auto`` rows are left unlinked.
+    """
+    user_ids = _WORKER["user_ids"]
+    seed = _WORKER["seed"]
+    prompt_engine = _WORKER["prompt_engine"]
+    link = table_name == "content_items"
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    for i in range(len(creators)):
+        row_id = first_id + i
+        prompt = prompt_engine.generate_prompt(rng=_row_rng(seed, table_name, row_id))
+        completed_at = _format_timestamp(DATE_RANGE_START + int(offsets[i]))
+        writer.writerow((
+            user_ids[creators[i]], "image", prompt, "{}", "completed",
+            row_id if link else None, completed_at, completed_at, completed_at,
+        ))
+    return buffer.getvalue().encode("utf-8")
+
+
+def generate_additional_jobs_chunk(chunk_seed: int, count: int) -> bytes:
+    """Render ``count`` unlinked jobs with the standard status distribution as CSV."""
+    user_ids = _WORKER["user_ids"]
+    prompt_engine = _WORKER["prompt_engine"]
+    span = DATE_RANGE_END - DATE_RANGE_START
+    rng = random.Random(chunk_seed)
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    for _ in range(count):
+        roll = rng.random()
+        if roll < 0.98:
+            status = "completed"
+        elif roll < 0.989:
+            status = "pending"
+        elif roll < 0.999:
+            status = "error"
+        else:
+            status = "canceled"
+        prompt = prompt_engine.generate_prompt(rng=rng)
+        created_at = _format_timestamp(DATE_RANGE_START + rng.randint(0, span))
+        completed_at = _format_timestamp(DATE_RANGE_START + rng.randint(0, span)) if status == "completed" else None
+        writer.writerow((
+            rng.choice(user_ids), "image", prompt, "{}", status, None, created_at, created_at, completed_at,
+        ))
+    return buffer.getvalue().encode("utf-8")
+
+
+def _call(fn: Callable, args: tuple) -> Any:
+    return fn(*args)
+
+
+class _InlineExecutor(Executor):
+    """Runs tasks in the calling process (``max_workers == 1``)."""
+
+    def __init__(self, initializer: Callable, initargs: tuple):
+        initializer(*initargs)
+
+    def submit(self, fn, /, *args, **kwargs):
+        future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as exc:
+            future.set_exception(exc)
+        return future
+
+
+def bounded_map(executor: Executor, fn: Callable, tasks: Iterable[tuple], window: int) -> Iterator[Any]:
+    """Like ``executor.map`` but with at most ``window`` tasks in flight.
+
+    Results are yielded in submission order, so finished chunks never pile up
+    in memory while the database is slower than the workers.
+    """
+    pending = []
+    for args in tasks:
+        pending.append(executor.submit(fn, *args))
+        if len(pending) >= window:
+            yield pending.pop(0).result()
+    for future in pending:
+        yield future.result()
+
+
+class CopyStream(io.RawIOBase):
+    """Read-only file object over an iterator of byte chunks, for ``copy_expert``."""
+
+    def __init__(self, chunks: Iterator[bytes]):
+        self._chunks = chunks
+        self._chunk = memoryview(b"")
+        self._offset = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        """Fill ``buffer`` from the current chunk onwards without re-copying what is left."""
+        target = memoryview(buffer).cast("B")
+        filled = 0
+        while filled < len(target):
+            if self._offset >= len(self._chunk):
+                chunk = next(self._chunks, None)
+                if chunk is None:
+                    break
+                self._chunk, self._offset = memoryview(chunk), 0
+                continue
+            count = min(len(target) - filled, len(self._chunk) - self._offset)
+            target[filled:filled + count] = self._chunk[self._offset:self._offset + count]
+            self._offset += count
+            filled += count
+        return filled
+
+
+@dataclass
+class ContentBlock:
+    """Compact record of one table's streamed rows (ids are ``first_id + position``)."""
+
+    table_name: str
+    first_id: int
+    creators: np.ndarray
+    offsets: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.creators)
+
+
+class StreamingSeeder:
+    """Streams content items and generation jobs into PostgreSQL with ``COPY``."""
+
+    def __init__(
+        self,
+        session: Session,
+        config: Dict[str, Any],
+        user_ids: List[str],
+        admin_uuid: str,
+        seed: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+        max_workers: Optional[int] = None
+    ):
+        """Initialize the seeder.
+
+        Args:
+            session: Database session (its connection is used for ``COPY``)
+            config: Seed data configuration (``SeedDataConfig.model_dump()``)
+            user_ids: Ids of all users; creators are drawn from these
+            admin_uuid: Admin user id (owns the first 50 items of each table)
+            seed: Seed for all random attributes (random if None)
+            chunk_size: Rows per worker chunk (defaults to ``config['batch_size']``)
+            max_workers: Worker processes (defaults to ``config['max_workers']``)
+        """
+        self.session = session
+        self.config = config
+        self.user_ids = list(user_ids)
+        if admin_uuid not in self.user_ids:
+            self.user_ids.append(admin_uuid)
+        self.admin_index = self.user_ids.index(admin_uuid)
+        self.seed = seed if seed is not None else random.randrange(1 << 62)
+        self.chunk_size = chunk_size or config.get("batch_size", 2000)
+        self.max_workers = max_workers or config.get("max_workers", 1)
+        self.throughput: List[Dict[str, Any]] = []
+
+    def _executor(self) -> Executor:
+        initargs = (self.config, self.user_ids, self.seed)
+        if self.max_workers <= 1:
+            return _InlineExecutor(_init_worker, initargs)
+        return ProcessPoolExecutor(max_workers=self.max_workers, initializer=_init_worker, initargs=initargs)
+
+    def _reserve_ids(self, count: int) -> int:
+        """Reserve ``count`` consecutive ids from the shared content sequence; returns the first.
+
+        ``ALTER SEQUENCE`` (a no-op here) locks the sequence until commit and
+        blocks concurrent ``nextval``/``setval`` calls, so no other writer can
+        draw an id between our ``nextval`` and ``setval``.
+        """
+        increment = self.session.execute(
+            text("SELECT seqincrement FROM pg_sequence WHERE seqrelid = 'content_items_id_seq'::regclass")
+        ).scalar()
+        self.session.execute(text(f"ALTER SEQUENCE content_items_id_seq INCREMENT BY {int(increment)}"))
+        first_id = self.session.execute(text("SELECT nextval('content_items_id_seq')")).scalar()
+        self.session.execute(
+            text("SELECT setval('content_items_id_seq', :last_id)"),
+            {"last_id": first_id + count - 1},
+        )
+        self.session.commit()
+        return first_id
+
+    def _copy(self, table_name: str, columns: Tuple[str, ...], chunks: Iterator[bytes]) -> None:
+        cursor = self.session.connection().connection.cursor()
+        try:
+            cursor.copy_expert(
+                f"COPY {table_name} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)",
+                CopyStream(chunks),
+            )
+        finally:
+            cursor.close()
+        self.session.commit()
+
+    def _record(self, phase: str, rows: int, started: float) -> None:
+        elapsed = time.perf_counter() - started
+        entry = {
+            "phase": phase,
+            "rows": rows,
+            "seconds": elapsed,
+            "rows_per_second": rows / elapsed if elapsed > 0 else 0.0,
+            "peak_rss_mb": peak_rss_mb(),
+        }
+        self.throughput.append(entry)
+        logger.info(
+            f"Streamed {rows} {phase} in {elapsed:.2f}s ({entry['rows_per_second']:.0f} rows/s, "
+            f"peak RSS {entry['peak_rss_mb'] or 0:.0f} MiB)"
+        )
+
+    def _chunks(self, total: int) -> List[Tuple[int, int]]:
+        return [(start, min(self.chunk_size, total - start)) for start in range(0, total, self.chunk_size)]
+
+    def stream_content(self, executor: Executor, table_name: str, target_count: int) -> ContentBlock:
+        """Stream ``target_count`` rows into ``table_name`` and return their compact record."""
+        print(f"\n   Streaming {table_name}...")
+        started = time.perf_counter()
+        first_id = self._reserve_ids(target_count)
+        creators = np.empty(target_count, dtype=np.uint32)
+        offsets = np.empty(target_count, dtype=np.uint32)
+        progress = ProgressReporter(table_name, target_count)
+        tasks = [
+            (table_name, first_id + start, start, count, self.admin_index)
+            for start, count in self._chunks(target_count)
+        ]
+
+        def chunks() -> Iterator[bytes]:
+            position = 0
+            results = bounded_map(executor, generate_content_chunk, tasks, self.max_workers * 2)
+            for payload, chunk_creators, chunk_offsets in results:
+                count = len(chunk_creators)
+                creators[position:position + count] = chunk_creators
+                offsets[position:position + count] = chunk_offsets
+                position += count
+                progress.update(count)
+                yield payload
+
+        self._copy(table_name, CONTENT_COLUMNS, chunks())
+        progress.complete(target_count)
+        self._record(table_name, target_count, started)
+        return ContentBlock(table_name, first_id, creators, offsets)
+
+    def stream_jobs(self, executor: Executor, blocks: List[ContentBlock]) -> Tuple[int, int]:
+        """Stream completed jobs for every content row plus additional jobs; returns both counts."""
+        started = time.perf_counter()
+        completed = sum(len(block) for block in blocks)
+        # Completed jobs are 98% of all jobs, as in the dict-based generator
+        additional = max(0, int(completed / 0.98) - completed)
+        progress = ProgressReporter("generation_jobs", completed + additional)
+
+        tasks: List[Tuple[Callable, tuple]] = []
+        for block in blocks:
+            for start, count in self._chunks(len(block)):
+                tasks.append((generate_completed_jobs_chunk, (
+                    block.table_name, block.first_id + start,
+                    block.creators[start:start + count], block.offsets[start:start + count],
+                )))
+        for index, (_, count) in enumerate(self._chunks(additional)):
+            tasks.append((generate_additional_jobs_chunk, (self.seed + index, count)))
+
+        def chunks() -> Iterator[bytes]:
+            results = bounded_map(executor, _call, tasks, self.max_workers * 2)
+            for (fn, args), payload in zip(tasks, results):
+                progress.update(len(args[2]) if fn is generate_completed_jobs_chunk else args[1])
+                yield payload
+
+        self._copy("generation_jobs", JOB_COLUMNS, chunks())
+        progress.complete(completed + additional)
+        self._record("generation_jobs", completed + additional, started)
+        return completed, additional
+
+    def run(self, target_content_items: int, target_content_items_auto: int) -> List[Dict[str, Any]]:
+        """Stream both content tables and the generation jobs.
+
+        Returns:
+            Throughput entries (phase, rows, seconds, rows_per_second, peak_rss_mb)
+        """
+        with self._executor() as executor:
+            blocks = [
+                self.stream_content(executor, "content_items", target_content_items),
+                self.stream_content(executor, "content_items_auto", target_content_items_auto),
+            ]
+            print("\nStreaming generation jobs...")
+            self.stream_jobs(executor, blocks)
+        return self.throughput
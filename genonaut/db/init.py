@@ -706,6 +706,91 @@ class DatabaseInitializer:
         finally:
             session.close()
 
+    @staticmethod
+    def _seed_tables_with_orm(session, paths: List[Path], table_to_model_map: Dict[str, Any], utils) -> None:
+        """Seed tables named after TSV files row by row (non-PostgreSQL fallback)."""
+        username_to_id = {user.username: user.id for user in session.query(User).all()}
+
+        for file_path in paths:
+            table_name = file_path.stem
+            try:
+                data = utils.load_tsv_data(str(file_path))
+                if data and 'creator_username' in data[0]:
+                    resolved = []
+                    for row in data:
+                        username = row.pop('creator_username', None)
+                        if username in username_to_id:
+                            row['creator_id'] = username_to_id[username]
+                            resolved.append(row)
+                        else:
+                            logging.warning(f"User '{username}' not found for data in '{file_path.name}'. Skipping row.")
+                    data = resolved
+
+                model_class = table_to_model_map.get(table_name)
+                if not model_class:
+                    logging.error(f"Could not find model for table '{table_name}'. Skipping...")
+                elif data:
+                    session.bulk_insert_mappings(model_class, data)
+                    session.commit()
+                    print(f"Successfully seeded table '{table_name}' from '{file_path.name}'")
+
+            except Exception as e:
+                logging.error(f"Failed to seed table '{table_name}' from '{file_path.name}': {e}")
+                session.rollback()
+
+    def _admin_user_id(self, users_path: Path, utils) -> Optional[str]:
+        """The fixed Admin user id for demo and test databases, if users.tsv has an Admin."""
+        if not self.database_name or not users_path.exists():
+            return None
+        import pandas as pd
+
+        users_df = pd.read_csv(users_path, sep='\t', usecols=['username'])
+        users_df = utils._handle_admin_user_for_demo_test_db(users_df, self.database_name)
+        if 'id' not in users_df.columns:
+            return None
+        admin_ids = users_df['id'].dropna()
+        return str(admin_ids.iloc[0]) if len(admin_ids) else None
+
+    def _seed_tables_with_copy(
+        self,
+        tsv_directory: Path,
+        core_files: List[str],
+        extra_files: List[str],
+        schema_name: Optional[str],
+        utils
+    ) -> None:
+        """Load TSVs with ``TSVCopyLoader``; the core fixture files must load cleanly."""
+        from genonaut.db.utils.tsv_loader import TSVCopyLoader
+
+        loader = TSVCopyLoader(
+            self.engine,
+            schema_name=schema_name,
+            admin_user_id=self._admin_user_id(tsv_directory / 'users.tsv', utils),
+        )
+        results = loader.load_files([tsv_directory / name for name in core_files + extra_files])
+
+        failed = []
+        for table_name, result in results.items():
+            if result.error is None:
+                print(f"Successfully seeded table '{table_name}' from '{result.path.name}' "
+                      f"({result.inserted} rows, {result.skipped} skipped)")
+            elif result.path.name in core_files:
+                failed.append(f"{result.path.name}: {result.error}")
+        if failed:
+            raise SQLAlchemyError(f"Failed to seed database from TSV files: {'; '.join(failed)}")
+
+    def _reconcile_interaction_summaries(self, session, schema_name: Optional[str] = None) -> None:
+        """Rebuild the interaction rollups, which bulk loads of user_interactions bypass."""
+        if self.engine.dialect.name != "postgresql":
+            return
+        from genonaut.api.repositories.interaction_repository import InteractionRepository
+
+        if schema_name:
+            session.execute(text(f"SET LOCAL search_path TO {schema_name}, public"))
+        counts = InteractionRepository(session).reconcile_summaries()
+        print(f"Rebuilt interaction summaries ({counts['user_summary_rows']} user rows, "
+              f"{counts['content_summary_rows']} content rows)")
+
     def seed_from_tsv_directory(self, tsv_directory: Path, schema_name: Optional[str] = None) -> None:
         """Seed database with data from TSV files in the specified directory.
         
@@ -719,6 +804,10 @@ class DatabaseInitializer:
         - UserInteraction -> user_interactions.tsv
         - Recommendation -> recommendations.tsv
         - GenerationJob -> generation_jobs1.tsv
+
+        Other TSVs named after a table are seeded too. On PostgreSQL every file is
+        bulk-loaded with ``COPY`` (see ``genonaut.db.utils.tsv_loader``); other
+        databases fall back to the row-by-row ORM seeder.
         
         Raises:
             SQLAlchemyError: If seeding fails
@@ -778,16 +867,9 @@ class DatabaseInitializer:
             # Seed the database only with available files
             session = self.session_factory()
             try:
-                # Only seed if we have at least one expected file
                 available_files = [f for f in expected_files.keys() if (tsv_directory / f).exists()]
-                if available_files:
-                    utils.seed_database_from_tsv(session, str(tsv_directory), schema_name, self.database_name)
-                    schema_info = f" in schema '{schema_name}'" if schema_name else ""
-                    print(f"Database seeded successfully from {tsv_directory}{schema_info} (processed {len(available_files)} files)")
-                else:
-                    logging.warning("No expected TSV files found for seeding")
 
-                # Fallback mechanism for tables not covered by the model-based seeding
+                # Other TSVs named after tables are seeded as well
                 all_table_names = Base.metadata.tables.keys()
                 table_to_model_map = {table.name: mapper.class_ for mapper in Base.registry.mappers for table in mapper.tables}
 
@@ -796,43 +878,31 @@ class DatabaseInitializer:
                     table_name = tsv_file.replace('.tsv', '')
                     if table_name in all_table_names:
                         unrecognized_and_matching_tsvs.append(tsv_file)
-
                 if unrecognized_and_matching_tsvs:
                     print(f"Found additional TSV files matching table names: {unrecognized_and_matching_tsvs}")
 
-                    # Fetch users for creator_id lookup
-                    users = session.query(User).all()
-                    username_to_id = {user.username: user.id for user in users}
+                if not available_files:
+                    logging.warning("No expected TSV files found for seeding")
 
-                    for tsv_file in unrecognized_and_matching_tsvs:
-                        table_name = tsv_file.replace('.tsv', '')
-                        file_path = tsv_directory / tsv_file
-                        # Dynamically load data into the table
-                        try:
-                            data = utils.load_tsv_data(str(file_path))
-                            if data:
-                                # Handle creator_id lookup
-                                if 'creator_username' in data[0]:
-                                    for row in data:
-                                        username = row.pop('creator_username', None)
-                                        if username in username_to_id:
-                                            row['creator_id'] = username_to_id[username]
-                                        else:
-                                            logging.warning(f"User '{username}' not found for data in '{tsv_file}'. Skipping row.")
-                                            data.remove(row)
-
-                                model_class = table_to_model_map.get(table_name)
-                                if model_class:
-                                    session.bulk_insert_mappings(model_class, data)
-                                    session.commit()
-                                    print(f"Successfully seeded table '{table_name}' from '{tsv_file}'")
-                                else:
-                                    logging.error(f"Could not find model for table '{table_name}'. Skipping...")
+                if self.engine.dialect.name == "postgresql":
+                    # Stream every file through COPY, resolving username/title references with
+                    # set-based UPDATEs and loading independent tables concurrently in FK order
+                    self._seed_tables_with_copy(
+                        tsv_directory, available_files, unrecognized_and_matching_tsvs, schema_name, utils
+                    )
+                else:
+                    if available_files:
+                        utils.seed_database_from_tsv(session, str(tsv_directory), schema_name, self.database_name)
+                    if unrecognized_and_matching_tsvs:
+                        paths = [tsv_directory / tsv_file for tsv_file in unrecognized_and_matching_tsvs]
+                        self._seed_tables_with_orm(session, paths, table_to_model_map, utils)
 
-                        except Exception as e:
-                            logging.error(f"Failed to seed table '{table_name}' from '{tsv_file}': {e}")
-                            session.rollback()
+                if available_files:
+                    schema_info = f" in schema '{schema_name}'" if schema_name else ""
+                    print(f"Database seeded successfully from {tsv_directory}{schema_info} (processed {len(available_files)} files)")
 
+                if (tsv_directory / 'user_interactions.tsv').exists():
+                    self._reconcile_interaction_summaries(session, schema_name)
             finally:
                 session.close()
                 
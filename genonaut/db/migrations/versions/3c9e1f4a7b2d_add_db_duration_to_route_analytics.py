@@ -0,0 +1,30 @@
+"""add db duration to route analytics
+
+Revision ID: 3c9e1f4a7b2d
+Revises: 59fc79a9b00d
+Create Date: 2026-10-18 23:41:07.512630
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c9e1f4a7b2d'
+down_revision: Union[str, Sequence[str], None] = '59fc79a9b00d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('route_analytics', sa.Column('db_duration_ms', sa.Float(), nullable=True))
+    op.add_column('route_analytics_hourly', sa.Column('avg_db_duration_ms', sa.Float(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('route_analytics_hourly', 'avg_db_duration_ms')
+    op.drop_column('route_analytics', 'db_duration_ms')
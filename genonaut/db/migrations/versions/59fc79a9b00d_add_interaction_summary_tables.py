@@ -0,0 +1,85 @@
+"""add interaction summary tables
+
+Revision ID: 59fc79a9b00d
+Revises: b4f6d6bbfb89
+Create Date: 2026-10-18 10:12:41.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '59fc79a9b00d'
+down_revision: Union[str, Sequence[str], None] = 'b4f6d6bbfb89'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('user_interaction_summary',
+    sa.Column('user_id', sa.UUID(), nullable=False),
+    sa.Column('interaction_type', sa.String(length=50), nullable=False),
+    sa.Column('content_type', sa.String(length=50), nullable=False),
+    sa.Column('interaction_count', sa.Integer(), nullable=False),
+    sa.Column('rating_sum', sa.BigInteger(), nullable=False),
+    sa.Column('rating_count', sa.Integer(), nullable=False),
+    sa.Column('duration_sum', sa.BigInteger(), nullable=False),
+    sa.Column('duration_count', sa.Integer(), nullable=False),
+    sa.Column('last_interaction_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id', 'interaction_type', 'content_type')
+    )
+    op.create_table('content_interaction_summary',
+    sa.Column('content_item_id', sa.Integer(), nullable=False),
+    sa.Column('interaction_type', sa.String(length=50), nullable=False),
+    sa.Column('interaction_count', sa.Integer(), nullable=False),
+    sa.Column('rating_sum', sa.BigInteger(), nullable=False),
+    sa.Column('rating_count', sa.Integer(), nullable=False),
+    sa.Column('duration_sum', sa.BigInteger(), nullable=False),
+    sa.Column('duration_count', sa.Integer(), nullable=False),
+    sa.Column('last_interaction_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['content_item_id'], ['content_items.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('content_item_id', 'interaction_type')
+    )
+
+    # Backfill from existing interactions
+    op.execute("""
+        INSERT INTO user_interaction_summary (
+            user_id, interaction_type, content_type, interaction_count,
+            rating_sum, rating_count, duration_sum, duration_count,
+            last_interaction_at, updated_at
+        )
+        SELECT ui.user_id, ui.interaction_type, COALESCE(ci.content_type, ''), COUNT(*),
+               COALESCE(SUM(ui.rating), 0), COUNT(ui.rating),
+               COALESCE(SUM(ui.duration), 0), COUNT(ui.duration),
+               MAX(ui.created_at), NOW()
+        FROM user_interactions ui
+        LEFT JOIN content_items ci ON ci.id = ui.content_item_id
+        GROUP BY ui.user_id, ui.interaction_type, COALESCE(ci.content_type, '')
+    """)
+    op.execute("""
+        INSERT INTO content_interaction_summary (
+            content_item_id, interaction_type, interaction_count,
+            rating_sum, rating_count, duration_sum, duration_count,
+            last_interaction_at, updated_at
+        )
+        SELECT ui.content_item_id, ui.interaction_type, COUNT(*),
+               COALESCE(SUM(ui.rating), 0), COUNT(ui.rating),
+               COALESCE(SUM(ui.duration), 0), COUNT(ui.duration),
+               MAX(ui.created_at), NOW()
+        FROM user_interactions ui
+        WHERE ui.content_item_id IS NOT NULL
+        GROUP BY ui.content_item_id, ui.interaction_type
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('content_interaction_summary')
+    op.drop_table('user_interaction_summary')
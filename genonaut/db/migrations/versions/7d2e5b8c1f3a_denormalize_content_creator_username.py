@@ -0,0 +1,106 @@
+"""denormalize content creator_username
+
+Revision ID: 7d2e5b8c1f3a
+Revises: 3c9e1f4a7b2d
+Create Date: 2026-10-18 09:12:44.318205
+
+Adds content_items_all.creator_username (inherited by the content_items and
+content_items_auto partitions) so gallery list queries no longer join users
+for every row. The column is kept in sync by triggers:
+- trg_set_creator_username_ci / _cia: fill it on insert and on creator_id change
+- trg_sync_creator_username: propagate users.username renames
+
+The triggers are installed first and existing rows are then backfilled in
+id ranges of BACKFILL_BATCH_SIZE, each committed on its own, so the
+backfill never holds row locks on a whole table. Those commits also commit the
+column and triggers before alembic_version is bumped, so every step is written
+to be repeatable (ADD COLUMN IF NOT EXISTS, CREATE OR REPLACE FUNCTION, DROP
+TRIGGER IF EXISTS before each CREATE TRIGGER, and a backfill that skips rows
+already filled). An interrupted upgrade can simply be run again.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7d2e5b8c1f3a'
+down_revision: Union[str, Sequence[str], None] = '3c9e1f4a7b2d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH_SIZE = 50_000
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Added on the partitioned parent, so both partitions get the column
+    op.execute("ALTER TABLE content_items_all ADD COLUMN IF NOT EXISTS creator_username VARCHAR(50)")
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION set_content_creator_username() RETURNS trigger AS $$
+        BEGIN
+          SELECT username INTO NEW.creator_username FROM users WHERE id = NEW.creator_id;
+          RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+    op.execute("""
+        CREATE OR REPLACE FUNCTION sync_content_creator_username() RETURNS trigger AS $$
+        BEGIN
+          UPDATE content_items SET creator_username = NEW.username WHERE creator_id = NEW.id;
+          UPDATE content_items_auto SET creator_username = NEW.username WHERE creator_id = NEW.id;
+          RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+    op.execute("DROP TRIGGER IF EXISTS trg_set_creator_username_ci ON content_items")
+    op.execute("""
+        CREATE TRIGGER trg_set_creator_username_ci
+        BEFORE INSERT OR UPDATE OF creator_id ON content_items
+        FOR EACH ROW EXECUTE FUNCTION set_content_creator_username();
+    """)
+    op.execute("DROP TRIGGER IF EXISTS trg_set_creator_username_cia ON content_items_auto")
+    op.execute("""
+        CREATE TRIGGER trg_set_creator_username_cia
+        BEFORE INSERT OR UPDATE OF creator_id ON content_items_auto
+        FOR EACH ROW EXECUTE FUNCTION set_content_creator_username();
+    """)
+    op.execute("DROP TRIGGER IF EXISTS trg_sync_creator_username ON users")
+    op.execute("""
+        CREATE TRIGGER trg_sync_creator_username
+        AFTER UPDATE OF username ON users
+        FOR EACH ROW WHEN (OLD.username IS DISTINCT FROM NEW.username)
+        EXECUTE FUNCTION sync_content_creator_username();
+    """)
+
+    # Rows written from here on are filled by the triggers
+    with op.get_context().autocommit_block():
+        bind = op.get_bind()
+        for table in ('content_items', 'content_items_auto'):
+            low, high = bind.execute(sa.text(f"SELECT min(id), max(id) FROM {table}")).one()
+            if low is None:
+                continue
+            for start in range(low, high + 1, BACKFILL_BATCH_SIZE):
+                bind.execute(
+                    sa.text(f"""
+                        UPDATE {table} c
+                        SET creator_username = u.username
+                        FROM users u
+                        WHERE u.id = c.creator_id
+                          AND c.id >= :start AND c.id < :stop
+                          AND c.creator_username IS DISTINCT FROM u.username
+                    """),
+                    {"start": start, "stop": start + BACKFILL_BATCH_SIZE},
+                )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS trg_sync_creator_username ON users")
+    op.execute("DROP TRIGGER IF EXISTS trg_set_creator_username_cia ON content_items_auto")
+    op.execute("DROP TRIGGER IF EXISTS trg_set_creator_username_ci ON content_items")
+    op.execute("DROP FUNCTION IF EXISTS sync_content_creator_username()")
+    op.execute("DROP FUNCTION IF EXISTS set_content_creator_username()")
+    op.drop_column('content_items_all', 'creator_username')
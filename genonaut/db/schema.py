@@ -246,6 +246,10 @@ class ContentItemColumns:
     prompt = Column(String(20000), nullable=False)  # Generation prompt (immutable via trigger)
     item_metadata = Column(JSONColumn, default=dict)
     creator_id = Column(UUID(as_uuid=True), ForeignKey('users.id'), nullable=False, index=True)
+    # Denormalized users.username so gallery lists skip the per-row join to users.
+    # Maintained by triggers on PostgreSQL (trg_set_creator_username_*, trg_sync_creator_username);
+    # NULL elsewhere, in which case readers fall back to the creator relationship.
+    cached_creator_username = Column('creator_username', String(50), nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     quality_score = Column(Float, default=0.0)
@@ -288,7 +292,7 @@ class ContentItem(ContentItemColumns, Base):
 
     @property
     def creator_username(self) -> Optional[str]:
-        return getattr(self.creator, 'username', None)
+        return self.cached_creator_username or getattr(self.creator, 'username', None)
     
     # Full-text search configuration and pagination optimization indexes for PostgreSQL
     @declared_attr
@@ -347,7 +351,7 @@ class ContentItemAuto(ContentItemColumns, Base):
 
     @property
     def creator_username(self) -> Optional[str]:
-        return getattr(self.creator, 'username', None)
+        return self.cached_creator_username or getattr(self.creator, 'username', None)
     creator = relationship("User", back_populates="auto_content_items")
 
     # Full-text search configuration and pagination optimization indexes for PostgreSQL
@@ -420,8 +424,8 @@ class ContentItemAll(ContentItemColumns, Base):
 
     @property
     def creator_username(self) -> Optional[str]:
-        """Get creator username (requires join with User table in query)."""
-        return getattr(self, '_creator_username', None)
+        """Get creator username (denormalized column, or set by queries joining User)."""
+        return getattr(self, '_creator_username', None) or self.cached_creator_username
 
     # Indexes for partitioned parent table
     # The partitioned unique index (id, source_type) is created in migrations
@@ -527,6 +531,71 @@ class UserInteraction(Base):
     )
 
 
+class UserInteractionSummary(Base):
+    """Per-user interaction rollup serving interaction analytics.
+
+    Maintained incrementally (one upsert per recorded, updated or deleted
+    interaction) and rebuilt periodically from ``user_interactions`` by the
+    ``reconcile_interaction_summaries`` worker task.
+
+    Attributes:
+        user_id: Foreign key to the user
+        interaction_type: Type of interaction
+        content_type: Content type of the interacted item ('' if the item was deleted)
+        interaction_count: Number of interactions
+        rating_sum: Sum of ratings given
+        rating_count: Number of interactions with a rating
+        duration_sum: Sum of durations in seconds
+        duration_count: Number of interactions with a duration
+        last_interaction_at: Timestamp of the latest interaction
+        updated_at: Timestamp of last rollup update
+    """
+    __tablename__ = 'user_interaction_summary'
+
+    user_id = Column(UUID(as_uuid=True), ForeignKey('users.id', ondelete='CASCADE'), primary_key=True, nullable=False)
+    interaction_type = Column(String(50), primary_key=True, nullable=False)
+    content_type = Column(String(50), primary_key=True, nullable=False, default='')
+    interaction_count = Column(Integer, nullable=False, default=0)
+    rating_sum = Column(BigInteger, nullable=False, default=0)
+    rating_count = Column(Integer, nullable=False, default=0)
+    duration_sum = Column(BigInteger, nullable=False, default=0)
+    duration_count = Column(Integer, nullable=False, default=0)
+    last_interaction_at = Column(DateTime, nullable=True)
+    updated_at = Column(DateTime, nullable=False, default=func.now(), onupdate=func.now())
+
+
+class ContentInteractionSummary(Base):
+    """Per-content interaction rollup serving interaction analytics.
+
+    Maintained alongside ``UserInteractionSummary``; rows are removed with
+    their content item.
+
+    Attributes:
+        content_item_id: Foreign key to the content item
+        interaction_type: Type of interaction
+        interaction_count: Number of interactions
+        rating_sum: Sum of ratings given
+        rating_count: Number of interactions with a rating
+        duration_sum: Sum of durations in seconds
+        duration_count: Number of interactions with a duration
+        last_interaction_at: Timestamp of the latest interaction
+        updated_at: Timestamp of last rollup update
+    """
+    __tablename__ = 'content_interaction_summary'
+
+    content_item_id = Column(
+        Integer, ForeignKey('content_items.id', ondelete='CASCADE'), primary_key=True, nullable=False
+    )
+    interaction_type = Column(String(50), primary_key=True, nullable=False)
+    interaction_count = Column(Integer, nullable=False, default=0)
+    rating_sum = Column(BigInteger, nullable=False, default=0)
+    rating_count = Column(Integer, nullable=False, default=0)
+    duration_sum = Column(BigInteger, nullable=False, default=0)
+    duration_count = Column(Integer, nullable=False, default=0)
+    last_interaction_at = Column(DateTime, nullable=True)
+    updated_at = Column(DateTime, nullable=False, default=func.now(), onupdate=func.now())
+
+
 class Recommendation(Base):
     """Recommendation model for storing AI-generated recommendations.
 
@@ -1224,8 +1293,9 @@ class RouteAnalytics(Base):
         request_size_bytes: Request payload size
         response_size_bytes: Response payload size
         error_type: Error category if failed (client_error, server_error)
-        db_query_count: Number of database queries made
-        cache_status: Cache hit/miss status (future use)
+        db_query_count: Number of database queries made (recorded when the SQL profiler is enabled)
+        db_duration_ms: Total database time of the request (recorded when the SQL profiler is enabled)
+        cache_status: Response cache outcome ('hit' / 'miss') on routes served by the cache warmer
         created_at: Timestamp of record creation
     """
     __tablename__ = 'route_analytics'
@@ -1243,6 +1313,7 @@ class RouteAnalytics(Base):
     response_size_bytes = Column(Integer, nullable=True)
     error_type = Column(Text, nullable=True)
     db_query_count = Column(Integer, nullable=True)
+    db_duration_ms = Column(Float, nullable=True)
     cache_status = Column(String(10), nullable=True)
     created_at = Column(DateTime, nullable=False, default=func.now())
 
@@ -1283,8 +1354,9 @@ class RouteAnalyticsHourly(Base):
         avg_request_size_bytes: Average request size
         avg_response_size_bytes: Average response size
         avg_db_query_count: Average DB queries per request
-        cache_hits: Cache hits (future use)
-        cache_misses: Cache misses (future use)
+        avg_db_duration_ms: Average database time per request
+        cache_hits: Requests served from the warmed response cache
+        cache_misses: Requests to cached routes that missed the response cache
         created_at: Timestamp of record creation
     """
     __tablename__ = 'route_analytics_hourly'
@@ -1306,6 +1378,7 @@ class RouteAnalyticsHourly(Base):
     avg_request_size_bytes = Column(Integer, nullable=True)
     avg_response_size_bytes = Column(Integer, nullable=True)
     avg_db_query_count = Column(Float, nullable=True)
+    avg_db_duration_ms = Column(Float, nullable=True)
     cache_hits = Column(Integer, nullable=False, default=0)
     cache_misses = Column(Integer, nullable=False, default=0)
     created_at = Column(DateTime, nullable=False, default=func.now())
@@ -1739,3 +1812,44 @@ event.listen(
     "after_create",
     _create_content_items_auto_trigger.execute_if(dialect="postgresql")
 )
+
+# Keep the denormalized content creator_username in sync with users.username (PostgreSQL only).
+# Registered on the metadata so the functions exist before the triggers reference them.
+_creator_username_ddl = [
+    DDL("""
+CREATE OR REPLACE FUNCTION set_content_creator_username() RETURNS trigger AS $$
+BEGIN
+  SELECT username INTO NEW.creator_username FROM users WHERE id = NEW.creator_id;
+  RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+"""),
+    DDL("""
+CREATE OR REPLACE FUNCTION sync_content_creator_username() RETURNS trigger AS $$
+BEGIN
+  UPDATE content_items SET creator_username = NEW.username WHERE creator_id = NEW.id;
+  UPDATE content_items_auto SET creator_username = NEW.username WHERE creator_id = NEW.id;
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""),
+    DDL("""
+CREATE TRIGGER trg_set_creator_username_ci
+BEFORE INSERT OR UPDATE OF creator_id ON content_items
+FOR EACH ROW EXECUTE FUNCTION set_content_creator_username();
+"""),
+    DDL("""
+CREATE TRIGGER trg_set_creator_username_cia
+BEFORE INSERT OR UPDATE OF creator_id ON content_items_auto
+FOR EACH ROW EXECUTE FUNCTION set_content_creator_username();
+"""),
+    DDL("""
+CREATE TRIGGER trg_sync_creator_username
+AFTER UPDATE OF username ON users
+FOR EACH ROW WHEN (OLD.username IS DISTINCT FROM NEW.username)
+EXECUTE FUNCTION sync_content_creator_username();
+"""),
+]
+
+for _ddl in _creator_username_ddl:
+    event.listen(Base.metadata, "after_create", _ddl.execute_if(dialect="postgresql"))
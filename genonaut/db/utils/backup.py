@@ -3,20 +3,43 @@
 
 This script provides functionality to backup PostgreSQL databases and migration history.
 It creates organized backups with timestamps and separate folders for database dumps and migration files.
+
+Besides the default plain SQL dump, ``--format directory`` writes a compressed
+``pg_dump`` directory archive with parallel jobs, and ``--incremental`` only
+dumps the day slices of the append-only analytics tables that were added since
+the previous backup's manifest. ``--restore`` restores either kind with
+parallel ``pg_restore``.
 """
 
 import argparse
+import gzip
 import json
 import os
 import re
 import shutil
 import subprocess
 import sys
+import time
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterator, List, Optional, Sequence
 from urllib.parse import urlparse
 
+import psycopg2
+from psycopg2 import extensions
+from tabulate import tabulate
+
+# Append-only tables dumped as day slices in incremental backups (table -> time column)
+TIME_SERIES_TABLES = {"route_analytics": "timestamp", "generation_events": "timestamp"}
+# Tables whose data --exclude-analytics leaves out (their schema is still dumped)
+ANALYTICS_TABLES = ("route_analytics", "route_analytics_hourly", "generation_events", "generation_metrics_hourly")
+MANIFEST_NAME = "manifest.json"
+# Ids below the previous watermark that incremental slices re-read. Ids are drawn
+# at insert time but rows become visible at commit, so a transaction in flight
+# during the previous backup can commit ids below its watermark.
+SLICE_OVERLAP_IDS = 100_000
+
 
 def load_config() -> dict:
     """Load configuration from config.json."""
@@ -113,6 +136,298 @@ def backup_database(database_url: str, output_dir: Path) -> bool:
         return False
 
 
+def libpq_url(database_url: str) -> str:
+    """Strip a SQLAlchemy driver suffix (``postgresql+psycopg2://``) so libpq tools accept the URL."""
+    return re.sub(r"^postgresql\+\w+://", "postgresql://", database_url)
+
+
+class TimingReport:
+    """Collects wall-clock timings of backup/restore phases."""
+
+    def __init__(self):
+        self.timings: Dict[str, float] = {}
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = round(time.perf_counter() - started, 3)
+
+    def print(self) -> None:
+        rows = [[name, f"{seconds:.2f}s"] for name, seconds in self.timings.items()]
+        rows.append(["total", f"{sum(self.timings.values()):.2f}s"])
+        print(tabulate(rows, headers=["Phase", "Time"], tablefmt="github"))
+
+
+def build_pg_dump_command(
+    database_url: str,
+    output_dir: Path,
+    jobs: int = 4,
+    compress: int = 6,
+    include_tables: Sequence[str] = (),
+    exclude_table_data: Sequence[str] = (),
+    snapshot: Optional[str] = None,
+) -> List[str]:
+    """Build a directory-format ``pg_dump`` command with parallel jobs and compression."""
+    cmd = [
+        "pg_dump",
+        libpq_url(database_url),
+        "--no-password",
+        "--format=directory",
+        f"--jobs={jobs}",
+        f"--compress={compress}",
+        "--file", str(output_dir),
+    ]
+    for table in include_tables:
+        cmd += ["--table", table]
+    for table in exclude_table_data:
+        cmd += ["--exclude-table-data", table]
+    if snapshot:
+        cmd.append(f"--snapshot={snapshot}")
+    return cmd
+
+
+def build_pg_restore_command(
+    database_url: str,
+    dump_dir: Path,
+    jobs: int = 4,
+    tables: Sequence[str] = (),
+    data_only: bool = False,
+    clean: bool = False,
+) -> List[str]:
+    """Build a parallel ``pg_restore`` command for a directory-format dump."""
+    cmd = ["pg_restore", "--dbname", libpq_url(database_url), "--no-password", "--no-owner", f"--jobs={jobs}"]
+    if clean:
+        cmd += ["--clean", "--if-exists"]
+    if data_only:
+        cmd.append("--data-only")
+    for table in tables:
+        cmd += ["--table", table]
+    cmd.append(str(dump_dir))
+    return cmd
+
+
+def read_manifest(backup_path: Path) -> dict:
+    """Read the manifest of a backup directory (``<backup_dir>/<db_name>/<timestamp>``)."""
+    manifest_path = backup_path / MANIFEST_NAME
+    if not manifest_path.exists():
+        raise FileNotFoundError(f"Backup manifest not found: {manifest_path}")
+    with open(manifest_path, 'r') as f:
+        return json.load(f)
+
+
+def write_manifest(backup_path: Path, manifest: dict) -> None:
+    with open(backup_path / MANIFEST_NAME, 'w') as f:
+        json.dump(manifest, f, indent=2)
+
+
+def find_latest_manifest(db_backup_root: Path) -> Optional[Path]:
+    """Return the newest backup directory under ``db_backup_root`` that has a manifest."""
+    if not db_backup_root.exists():
+        return None
+    # Timestamp directory names sort chronologically
+    for candidate in sorted(db_backup_root.iterdir(), reverse=True):
+        if (candidate / MANIFEST_NAME).exists():
+            return candidate
+    return None
+
+
+def backup_chain(backup_path: Path) -> List[Path]:
+    """Return the backups needed to restore ``backup_path``, from the full base to it."""
+    chain = [backup_path]
+    manifest = read_manifest(backup_path)
+    while manifest["mode"] == "incremental":
+        base = backup_path.parent / manifest["base"]
+        if base in chain:
+            raise ValueError(f"Backup manifest chain loops at {base}")
+        chain.insert(0, base)
+        manifest = read_manifest(base)
+    return chain
+
+
+def dump_time_slices(
+    cursor, table: str, time_column: str, after_id: int, output_dir: Path, overlap: int = SLICE_OVERLAP_IDS
+) -> dict:
+    """Dump the rows of ``table`` added since the ``after_id`` watermark as one gzip CSV file per day.
+
+    Rows with ids in the ``overlap`` below the watermark are dumped again, so
+    rows committed after the previous backup with lower ids are not lost;
+    restores skip the rows they already have. Rows with a NULL time column go
+    to an ``undated`` slice.
+
+    Returns the manifest entry: the new id watermark and the rows written per slice.
+    """
+    from_id = max(after_id - overlap, 0)
+    cursor.execute(f"SELECT COALESCE(max(id), 0) FROM {table}")
+    through_id = max(cursor.fetchone()[0], after_id)
+    slices = {}
+    if through_id > from_id:
+        cursor.execute(
+            f"SELECT DISTINCT {time_column}::date FROM {table} WHERE id > %s AND id <= %s ORDER BY 1 NULLS LAST",
+            (from_id, through_id),
+        )
+        days = [row[0] for row in cursor.fetchall()]
+        (output_dir / table).mkdir(parents=True, exist_ok=True)
+        for day in days:
+            if day is None:
+                name, condition, params = "undated", f"{time_column} IS NULL", ()
+            else:
+                name = day.isoformat()
+                condition = f"{time_column} >= %s::date AND {time_column} < %s::date + 1"
+                params = (day, day)
+            query = cursor.mogrify(
+                f"SELECT * FROM {table} WHERE id > %s AND id <= %s AND {condition} ORDER BY id",
+                (from_id, through_id) + params,
+            ).decode()
+            relative = f"{table}/{name}.csv.gz"
+            with gzip.open(output_dir / relative, "wb", compresslevel=6) as handle:
+                cursor.copy_expert(f"COPY ({query}) TO STDOUT WITH (FORMAT csv, HEADER true)", handle)
+            slices[name] = {"file": relative, "rows": cursor.rowcount}
+    return {"after_id": after_id, "from_id": from_id, "through_id": through_id, "slices": slices}
+
+
+def restore_time_slice(cursor, table: str, path: Path) -> None:
+    """Load one gzip CSV slice into ``table``, skipping rows that are already there."""
+    stage = f"restore_{table}"
+    cursor.execute(f"CREATE TEMP TABLE IF NOT EXISTS {stage} (LIKE {table}) ON COMMIT DROP")
+    with gzip.open(path, "rb") as handle:
+        cursor.copy_expert(f"COPY {stage} FROM STDIN WITH (FORMAT csv, HEADER true)", handle)
+    cursor.execute(f"INSERT INTO {table} SELECT * FROM {stage} ON CONFLICT DO NOTHING")
+    cursor.execute(f"TRUNCATE {stage}")
+
+
+def backup_database_directory(
+    database_url: str,
+    backup_path: Path,
+    jobs: int,
+    compress: int,
+    include_tables: Sequence[str] = (),
+    exclude_table_data: Sequence[str] = (),
+    base_backup: Optional[Path] = None,
+    report: Optional[TimingReport] = None,
+) -> dict:
+    """Back up with a parallel, compressed directory-format dump and return its manifest.
+
+    With a ``base_backup`` the backup is incremental: the time-series tables are
+    dumped as day slices of the rows added since the base's watermarks, and the
+    rest of the database is dumped in full. All parts are read from one exported
+    snapshot, so they are consistent with each other.
+    """
+    report = report or TimingReport()
+    db_dump_dir = backup_path / "db_dump"
+    exclusions = list(exclude_table_data)
+    base_watermarks: Dict[str, int] = {}
+    if base_backup is not None:
+        base_watermarks = read_manifest(base_backup).get("watermarks", {})
+        exclusions += [table for table in TIME_SERIES_TABLES if table not in exclusions]
+
+    manifest = {
+        "database": extract_db_name_from_url(database_url),
+        "created_at": datetime.now().isoformat(),
+        "mode": "incremental" if base_backup is not None else "full",
+        "base": base_backup.name if base_backup is not None else None,
+        "format": "directory",
+        "jobs": jobs,
+        "compress": compress,
+        "include_tables": list(include_tables),
+        "exclude_table_data": exclusions,
+        "watermarks": {},
+        "time_slices": {},
+    }
+
+    conn = psycopg2.connect(libpq_url(database_url))
+    try:
+        conn.set_session(isolation_level=extensions.ISOLATION_LEVEL_REPEATABLE_READ, readonly=True)
+        with conn.cursor() as cursor:
+            cursor.execute("SET TIME ZONE 'UTC'")
+            cursor.execute("SELECT pg_export_snapshot()")
+            snapshot = cursor.fetchone()[0]
+
+            cmd = build_pg_dump_command(
+                database_url, db_dump_dir, jobs, compress, include_tables, exclusions, snapshot
+            )
+            print(f"Running database backup: pg_dump [URL] {' '.join(cmd[2:])}")
+            with report.phase("pg_dump"):
+                result = subprocess.run(cmd, capture_output=True, text=True)
+            if result.returncode != 0:
+                raise RuntimeError(f"pg_dump failed: {result.stderr}")
+
+            for table, time_column in TIME_SERIES_TABLES.items():
+                if base_backup is not None:
+                    with report.phase(f"slices {table}"):
+                        entry = dump_time_slices(
+                            cursor, table, time_column, base_watermarks.get(table, 0), backup_path / "time_slices"
+                        )
+                    manifest["time_slices"][table] = entry
+                    manifest["watermarks"][table] = entry["through_id"]
+                    rows = sum(day["rows"] for day in entry["slices"].values())
+                    print(f"{table}: {rows} rows in {len(entry['slices'])} slice(s)")
+                elif table not in exclusions and (not include_tables or table in include_tables):
+                    cursor.execute(f"SELECT COALESCE(max(id), 0) FROM {table}")
+                    manifest["watermarks"][table] = cursor.fetchone()[0]
+    finally:
+        conn.rollback()
+        conn.close()
+
+    manifest["timings_seconds"] = dict(report.timings)
+    write_manifest(backup_path, manifest)
+    print(f"Database backup completed: {db_dump_dir}")
+    return manifest
+
+
+def restore_database(database_url: str, backup_path: Path, jobs: int, clean: bool = False,
+                     report: Optional[TimingReport] = None) -> bool:
+    """Restore a directory-format backup (and, for incremental ones, its chain) with parallel pg_restore."""
+    report = report or TimingReport()
+    try:
+        chain = backup_chain(backup_path)
+        manifest = read_manifest(backup_path)
+        if manifest.get("format") != "directory":
+            print(f"Backup {backup_path} is not a directory-format dump; restore plain dumps with psql")
+            return False
+
+        cmd = build_pg_restore_command(database_url, backup_path / "db_dump", jobs, clean=clean)
+        print(f"Running database restore: pg_restore --dbname [URL] {' '.join(cmd[3:])}")
+        with report.phase("pg_restore"):
+            result = subprocess.run(cmd, capture_output=True, text=True)
+        if result.returncode != 0:
+            print(f"Error during database restore: {result.stderr}")
+            return False
+
+        if manifest["mode"] == "incremental":
+            full_backup, increments = chain[0], chain[1:]
+            base_tables = list(read_manifest(full_backup).get("watermarks", {}))
+            if base_tables:
+                cmd = build_pg_restore_command(
+                    database_url, full_backup / "db_dump", jobs, tables=base_tables, data_only=True
+                )
+                with report.phase(f"pg_restore base {full_backup.name}"):
+                    result = subprocess.run(cmd, capture_output=True, text=True)
+                if result.returncode != 0:
+                    print(f"Error restoring time-series tables from {full_backup}: {result.stderr}")
+                    return False
+
+            conn = psycopg2.connect(libpq_url(database_url))
+            try:
+                with conn, conn.cursor() as cursor:
+                    for increment in increments:
+                        with report.phase(f"slices {increment.name}"):
+                            for table, entry in read_manifest(increment)["time_slices"].items():
+                                for day in entry["slices"].values():
+                                    restore_time_slice(cursor, table, increment / "time_slices" / day["file"])
+            finally:
+                conn.close()
+
+        print(f"Database restore completed from: {backup_path}")
+        return True
+
+    except Exception as e:
+        print(f"Database restore failed: {e}")
+        return False
+
+
 def backup_migration_history(output_dir: Path) -> bool:
     """Backup migration history files."""
     try:
@@ -184,8 +499,77 @@ def main():
         help="Skip migration history backup"
     )
 
+    parser.add_argument(
+        "--format",
+        choices=["plain", "directory"],
+        default="plain",
+        help="plain SQL dump (default) or parallel, compressed pg_dump directory archive"
+    )
+
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 4,
+        help="Parallel pg_dump/pg_restore jobs for directory format (default: CPU count)"
+    )
+
+    parser.add_argument(
+        "--compress",
+        type=int,
+        default=6,
+        help="Compression level 0-9 for directory format (default: 6)"
+    )
+
+    parser.add_argument(
+        "--include-table",
+        dest="include_tables",
+        action="append",
+        default=[],
+        help="Only dump this table (repeatable; directory format)"
+    )
+
+    parser.add_argument(
+        "--exclude-table-data",
+        action="append",
+        default=[],
+        help="Dump the schema but not the data of this table (repeatable; directory format)"
+    )
+
+    parser.add_argument(
+        "--exclude-analytics",
+        action="store_true",
+        help=f"Leave out the data of the analytics tables ({', '.join(ANALYTICS_TABLES)})"
+    )
+
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only dump analytics day slices added since the latest backup manifest (implies directory format)"
+    )
+
+    parser.add_argument(
+        "--restore",
+        metavar="BACKUP_PATH",
+        help="Restore the given directory-format backup into database_url instead of backing up"
+    )
+
+    parser.add_argument(
+        "--clean",
+        action="store_true",
+        help="With --restore, drop existing objects before recreating them"
+    )
+
     args = parser.parse_args()
 
+    if args.restore:
+        report = TimingReport()
+        success = restore_database(args.database_url, Path(args.restore), args.jobs, args.clean, report)
+        report.print()
+        sys.exit(0 if success else 1)
+
+    if args.incremental:
+        args.format = "directory"
+
     # Validate that at least one backup type is enabled
     if not args.db_dump and not args.history:
         print("Error: At least one backup type must be enabled (--db-dump or --history)")
@@ -208,10 +592,33 @@ def main():
 
         success = True
 
+        report = TimingReport()
+
         # Backup database if requested
-        if args.db_dump:
+        if args.db_dump and args.format == "plain":
             print("\n=== Database Backup ===")
-            if not backup_database(args.database_url, db_dump_dir):
+            with report.phase("pg_dump"):
+                if not backup_database(args.database_url, db_dump_dir):
+                    success = False
+        elif args.db_dump:
+            print("\n=== Database Backup (directory format) ===")
+            base_backup = None
+            if args.incremental:
+                base_backup = find_latest_manifest(db_dump_dir.parent.parent)
+                if base_backup is None:
+                    print("No previous backup manifest found; taking a full backup")
+                else:
+                    print(f"Incremental backup based on: {base_backup}")
+            exclusions = list(args.exclude_table_data)
+            if args.exclude_analytics:
+                exclusions += [table for table in ANALYTICS_TABLES if table not in exclusions]
+            try:
+                backup_database_directory(
+                    args.database_url, db_dump_dir.parent, args.jobs, args.compress,
+                    args.include_tables, exclusions, base_backup, report,
+                )
+            except Exception as e:
+                print(f"Database backup failed: {e}")
                 success = False
 
         # Backup migration history if requested
@@ -220,6 +627,10 @@ def main():
             if not backup_migration_history(history_dir):
                 success = False
 
+        if report.timings:
+            print()
+            report.print()
+
         if success:
             print(f"\n✅ Backup completed successfully!")
             print(f"Backup location: {db_dump_dir.parent}")
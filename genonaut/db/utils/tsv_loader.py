@@ -0,0 +1,481 @@
+"""Bulk-load TSV seed files into PostgreSQL with ``COPY``.
+
+Each TSV is streamed from disk straight into a temporary staging table with
+``COPY ... FROM STDIN`` (every column as text, named after the TSV header) and
+then moved into its target table with a single ``INSERT ... SELECT`` that casts
+each column to its real type. Username references (``creator_username``,
+``user_username``) are resolved with one set-based ``UPDATE ... FROM users``
+on the staging table; rows whose user does not exist are skipped and reported.
+Content title references (``content_title``, ``result_content_title``) are
+resolved the same way against ``content_items_all``, and rows whose foreign
+keys point at rows that do not exist are skipped and reported rather than
+failing the whole table.
+
+Tables are loaded in foreign-key dependency order. Tables whose dependencies
+are already loaded are independent of each other and are loaded concurrently,
+each on its own connection. For large files, the target's secondary indexes
+are dropped before loading and rebuilt afterwards (constraint-backing and
+partition-inherited indexes are kept).
+
+Cell semantics match ``load_tsv_data``: empty cells are NULL, booleans accept
+``true``/``false`` in any case, JSON columns take JSON text. Columns missing
+from a TSV get the model's defaults, legacy column names are renamed (see
+``COLUMN_ALIASES``), and other columns with no matching target column are
+ignored. A ``tags`` column on content files (a JSON array of tag UUIDs, slugs
+or names) is written to the ``content_tags`` junction table, creating any
+missing tags.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import logging
+import time
+import uuid
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from graphlib import TopologicalSorter
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.sql import sqltypes
+from sqlalchemy.sql.schema import Column, Table
+
+from genonaut.api.utils.tag_identifiers import resolve_tag_uuid
+from genonaut.db.schema import Base
+from genonaut.db.utils.sequences import reset_all_sequences
+
+LOGGER = logging.getLogger(__name__)
+
+# Reference column in the TSV -> (target column, referenced table, lookup column)
+USERNAME_REFERENCES = {
+    "creator_username": ("creator_id", "users", "username"),
+    "user_username": ("user_id", "users", "username"),
+}
+# Title reference in the TSV -> (target column, whether unresolved rows are skipped)
+TITLE_REFERENCES = {
+    "content_title": ("content_item_id", True),
+    "result_content_title": ("content_id", False),
+}
+# Legacy TSV column -> current column
+COLUMN_ALIASES = {"parameters": "params", "result_content_id": "content_id"}
+# Values for required columns that older seed files omit
+COLUMN_FALLBACKS = {
+    ("content_items", "prompt"): "Seeded content",
+    ("content_items_auto", "prompt"): "Auto-generated content",
+}
+# content_tags.content_source of each content table
+CONTENT_SOURCES = {"content_items": "regular", "content_items_auto": "auto"}
+# Load-order dependencies beyond foreign keys (content files may create tags)
+EXTRA_DEPENDENCIES = {"content_items": ("tags",), "content_items_auto": ("tags",)}
+# Files named after the model rather than the table
+TABLE_ALIASES = {"content_item_autos": "content_items_auto"}
+# Partitioned parents are loaded through their partitions
+PARTITIONS = {"content_items_all": ("content_items", "content_items_auto")}
+# Rebuilding indexes only pays off once the load itself is large
+DEFAULT_DEFER_INDEXES_MIN_BYTES = 16 * 1024 * 1024
+
+_DIALECT = postgresql.dialect()
+_CALLABLE_DEFAULTS = {
+    datetime.utcnow: "timezone('utc', now())",
+    uuid.uuid4: "gen_random_uuid()",
+}
+
+_SECONDARY_INDEXES_SQL = text(
+    """
+    SELECT c.relname, pg_get_indexdef(i.indexrelid)
+    FROM pg_index i
+    JOIN pg_class c ON c.oid = i.indexrelid
+    JOIN pg_class t ON t.oid = i.indrelid
+    WHERE t.oid = to_regclass(:table_name)
+      AND NOT EXISTS (SELECT 1 FROM pg_constraint k WHERE k.conindid = i.indexrelid)
+      AND NOT EXISTS (SELECT 1 FROM pg_inherits h WHERE h.inhrelid = i.indexrelid)
+      AND NOT EXISTS (SELECT 1 FROM pg_inherits h WHERE h.inhparent = i.indexrelid)
+    """
+)
+
+
+@dataclass
+class TableLoadResult:
+    """Outcome of loading one TSV file."""
+
+    table: str
+    path: Path
+    inserted: int = 0
+    skipped: int = 0
+    seconds: float = 0.0
+    error: Optional[str] = None
+    unresolved: List[str] = field(default_factory=list)
+
+
+def _quote(identifier: str) -> str:
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def _read_header(path: Path) -> List[str]:
+    with path.open("r", encoding="utf-8", newline="") as handle:
+        return next(csv.reader(handle, delimiter="\t"), [])
+
+
+def _is_json(column: Column) -> bool:
+    return column.type.compile(dialect=_DIALECT) in ("JSON", "JSONB")
+
+
+def _cast_expression(source: str, column: Column) -> str:
+    """SQL converting staged text ``source`` to ``column``'s type ('' -> NULL)."""
+    sql_type = column.type.compile(dialect=_DIALECT)
+    value = f"NULLIF({source}, '')"
+    if isinstance(column.type, sqltypes.Integer):
+        # Exporters may write integers as floats (e.g. "42.0")
+        return f"{value}::numeric::{sql_type}"
+    return f"{value}::{sql_type}"
+
+
+def _default_expression(column: Column, params: Dict[str, Any]) -> Optional[str]:
+    """SQL for the model-side default of ``column`` (None when the server applies its own)."""
+    default = column.default
+    if default is None or column.server_default is not None or default.is_sequence:
+        return None
+    if default.is_clause_element:
+        return str(default.arg.compile(dialect=_DIALECT))
+    if default.is_callable:
+        function = getattr(default.arg, "__wrapped__", default.arg)
+        if function in _CALLABLE_DEFAULTS:
+            return _CALLABLE_DEFAULTS[function]
+        value = function()
+    else:
+        value = default.arg
+    name = f"default_{column.name}"
+    params[name] = json.dumps(value) if _is_json(column) else value
+    return f"CAST(:{name} AS {column.type.compile(dialect=_DIALECT)})"
+
+
+def table_for_file(path: Path) -> Optional[Table]:
+    """Return the table a TSV file seeds (by file name), or None."""
+    name = TABLE_ALIASES.get(path.stem, path.stem)
+    return Base.metadata.tables.get(name)
+
+
+def dependency_levels(tables: Sequence[str]) -> List[List[str]]:
+    """Group tables into levels; each level only depends on earlier levels."""
+    table_set = set(tables)
+    sorter = TopologicalSorter()
+    for name in tables:
+        referenced = {
+            partition
+            for constraint in Base.metadata.tables[name].foreign_key_constraints
+            for element in constraint.elements
+            for partition in PARTITIONS.get(element.column.table.name, (element.column.table.name,))
+        }
+        referenced.update(EXTRA_DEPENDENCIES.get(name, ()))
+        sorter.add(name, *(referenced & table_set - {name}))
+    sorter.prepare()
+    levels = []
+    while sorter.is_active():
+        ready = sorted(sorter.get_ready())
+        levels.append(ready)
+        sorter.done(*ready)
+    return levels
+
+
+class TSVCopyLoader:
+    """Loads directories of TSV files into PostgreSQL using staged ``COPY``."""
+
+    def __init__(
+        self,
+        engine: Engine,
+        max_workers: int = 4,
+        schema_name: Optional[str] = None,
+        defer_indexes_min_bytes: int = DEFAULT_DEFER_INDEXES_MIN_BYTES,
+        admin_user_id: Optional[str] = None
+    ):
+        """Initialize the loader.
+
+        Args:
+            engine: Engine for the target PostgreSQL database
+            max_workers: Tables loaded concurrently (one connection each)
+            schema_name: Optional schema to load into (``search_path``)
+            defer_indexes_min_bytes: Drop and rebuild a table's secondary indexes
+                when its TSV is at least this large
+            admin_user_id: Id given to the user named ``admin`` (any case) in
+                ``users.tsv``; demo and test databases use a fixed admin id
+        """
+        self.engine = engine
+        self.max_workers = max(1, max_workers)
+        self.schema_name = schema_name
+        self.defer_indexes_min_bytes = defer_indexes_min_bytes
+        self.admin_user_id = admin_user_id
+
+    @contextmanager
+    def _transaction(self, conn: Connection) -> Iterator[Connection]:
+        with conn.begin():
+            if self.schema_name:
+                conn.execute(text(f"SET LOCAL search_path TO {_quote(self.schema_name)}, public"))
+            yield conn
+
+    def load_files(self, paths: Sequence[Path], reset_sequences: bool = True) -> Dict[str, TableLoadResult]:
+        """Load TSV files into the tables they are named after.
+
+        Args:
+            paths: TSV files (``<table>.tsv``); files matching no table are skipped
+            reset_sequences: Advance id sequences past any explicitly loaded ids
+
+        Returns:
+            Mapping of table name to its load result. Failures are logged and
+            recorded in ``error``; they do not abort the other tables.
+        """
+        files: Dict[str, Path] = {}
+        for path in paths:
+            table = table_for_file(Path(path))
+            if table is None or table.name in PARTITIONS:
+                LOGGER.warning("No table matches TSV file %s; skipping", path)
+                continue
+            files[table.name] = Path(path)
+
+        results: Dict[str, TableLoadResult] = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for level in dependency_levels(list(files)):
+                for result in executor.map(lambda name: self.load_table(name, files[name]), level):
+                    results[result.table] = result
+
+        loaded = [name for name, result in results.items() if result.error is None and result.inserted]
+        if reset_sequences and loaded:
+            reset_all_sequences(self.engine, tables=loaded)
+        return results
+
+    def load_table(self, table_name: str, path: Path) -> TableLoadResult:
+        """Load one TSV into ``table_name`` in its own transaction."""
+        result = TableLoadResult(table=table_name, path=path)
+        started = time.perf_counter()
+        table = Base.metadata.tables[table_name]
+        deferred: List[Tuple[str, str]] = []
+        try:
+            with self.engine.connect() as conn:
+                if path.stat().st_size >= self.defer_indexes_min_bytes:
+                    deferred = self._drop_secondary_indexes(conn, table_name)
+                try:
+                    with self._transaction(conn):
+                        self._load(conn, table, path, result)
+                finally:
+                    if deferred:
+                        self._create_indexes(conn, deferred)
+        except Exception as exc:
+            result.error = str(exc)
+            LOGGER.error("Failed to seed table '%s' from '%s': %s", table_name, path.name, exc)
+        result.seconds = time.perf_counter() - started
+        if result.error is None:
+            LOGGER.info(
+                "Seeded %s: %d rows from %s in %.2fs (%d skipped)",
+                table_name, result.inserted, path.name, result.seconds, result.skipped,
+            )
+        return result
+
+    def _load(self, conn: Connection, table: Table, path: Path, result: TableLoadResult) -> None:
+        header = _read_header(path)
+        if not header:
+            return
+        stage = _quote(f"stage_{table.name}")
+        columns = ", ".join(f"{_quote(name)} text" for name in header)
+        conn.execute(text(f"CREATE TEMP TABLE {stage} ({columns}) ON COMMIT DROP"))
+
+        cursor = conn.connection.cursor()
+        try:
+            with path.open("r", encoding="utf-8", newline="") as handle:
+                cursor.copy_expert(
+                    f"COPY {stage} FROM STDIN WITH (FORMAT csv, DELIMITER E'\\t', HEADER true, NULL '')",
+                    handle,
+                )
+        finally:
+            cursor.close()
+
+        staged = set(header)
+        for alias, name in COLUMN_ALIASES.items():
+            if alias in staged and name not in staged and name in table.columns:
+                conn.execute(text(f"ALTER TABLE {stage} RENAME COLUMN {_quote(alias)} TO {_quote(name)}"))
+                staged.add(name)
+
+        if table.name == "users" and self.admin_user_id and "username" in staged:
+            if "id" not in staged:
+                conn.execute(text(f"ALTER TABLE {stage} ADD COLUMN id text"))
+                conn.execute(text(f"UPDATE {stage} SET id = gen_random_uuid()::text"))
+                staged.add("id")
+            admins = conn.execute(
+                text(f"UPDATE {stage} SET id = :admin_id WHERE lower(username) = 'admin'"),
+                {"admin_id": str(self.admin_user_id)},
+            ).rowcount
+            if admins > 1:
+                raise ValueError(f"Expected at most one Admin user in {path.name}, found {admins}")
+
+        for reference, (target, referenced_table, lookup) in USERNAME_REFERENCES.items():
+            if reference not in staged or target not in table.columns:
+                continue
+            self._resolve(conn, stage, staged, reference, target, f"SELECT id, {lookup} AS key FROM {referenced_table}")
+            self._skip_unresolved(conn, stage, reference, target, path, result)
+
+        for reference, (target, required) in TITLE_REFERENCES.items():
+            if reference not in staged or target not in table.columns:
+                continue
+            # Prefer regular content when a title exists in both partitions
+            self._resolve(conn, stage, staged, reference, target,
+                          "SELECT DISTINCT ON (title) id, title AS key FROM content_items_all "
+                          "ORDER BY title, source_type <> 'items', id")
+            if required:
+                self._skip_unresolved(conn, stage, reference, target, path, result)
+
+        self._skip_dangling(conn, table, stage, staged, path, result)
+
+        tags = "tags" in staged and table.name in CONTENT_SOURCES and "tags" not in table.columns
+        if tags and "id" not in staged:
+            # Draw ids up front so the junction rows can refer to them
+            conn.execute(text(f"ALTER TABLE {stage} ADD COLUMN id text"))
+            staged.add("id")
+        if tags:
+            conn.execute(text(
+                f"UPDATE {stage} SET id = ({table.c.id.server_default.arg.text})::text WHERE NULLIF(id, '') IS NULL"
+            ))
+
+        target_columns: List[str] = []
+        expressions: List[str] = []
+        params: Dict[str, Any] = {}
+        for column in table.columns:
+            if column.name in staged:
+                expression = _cast_expression(f"s.{_quote(column.name)}", column)
+            elif (table.name, column.name) in COLUMN_FALLBACKS:
+                params[f"fallback_{column.name}"] = COLUMN_FALLBACKS[table.name, column.name]
+                expression = f":fallback_{column.name}"
+            else:
+                expression = _default_expression(column, params)
+            if expression is not None:
+                target_columns.append(_quote(column.name))
+                expressions.append(expression)
+
+        ignored = staged - set(table.columns.keys()) - set(USERNAME_REFERENCES) - set(TITLE_REFERENCES) - {"tags"}
+        if ignored:
+            LOGGER.debug("Ignoring columns %s in %s", sorted(ignored), path.name)
+
+        inserted = conn.execute(text(
+            f"INSERT INTO {_quote(table.name)} ({', '.join(target_columns)}) "
+            f"SELECT {', '.join(expressions)} FROM {stage} s"
+        ), params)
+        result.inserted = inserted.rowcount
+
+        if tags:
+            self._load_content_tags(conn, stage, CONTENT_SOURCES[table.name])
+
+    @staticmethod
+    def _resolve(conn: Connection, stage: str, staged: set, reference: str, target: str, lookup_sql: str) -> None:
+        """Fill ``target`` from ``reference`` with one ``UPDATE ... FROM`` against ``(id, key)`` rows."""
+        if target not in staged:
+            conn.execute(text(f"ALTER TABLE {stage} ADD COLUMN {_quote(target)} text"))
+            staged.add(target)
+        conn.execute(text(
+            f"UPDATE {stage} s SET {_quote(target)} = r.id::text FROM ({lookup_sql}) r "
+            f"WHERE r.key = s.{_quote(reference)} AND NULLIF(s.{_quote(target)}, '') IS NULL"
+        ))
+
+    @staticmethod
+    def _skip_unresolved(
+        conn: Connection, stage: str, reference: str, target: str, path: Path, result: TableLoadResult
+    ) -> None:
+        unresolved = conn.execute(text(
+            f"DELETE FROM {stage} WHERE NULLIF({_quote(target)}, '') IS NULL "
+            f"RETURNING {_quote(reference)}"
+        )).scalars().all()
+        if unresolved:
+            result.skipped += len(unresolved)
+            result.unresolved.extend(str(name) for name in unresolved)
+            LOGGER.warning(
+                "%d rows in '%s' have unresolved %s values (e.g. %s); skipping them",
+                len(unresolved), path.name, reference, ", ".join(sorted({str(n) for n in unresolved})[:10]),
+            )
+
+    @staticmethod
+    def _skip_dangling(
+        conn: Connection, table: Table, stage: str, staged: set, path: Path, result: TableLoadResult
+    ) -> None:
+        """Drop staged rows whose single-column foreign keys reference missing rows."""
+        for constraint in table.foreign_key_constraints:
+            if len(constraint.elements) != 1:
+                continue
+            element = constraint.elements[0]
+            column, referenced = element.parent, element.column
+            if column.name not in staged or referenced.table is table:
+                continue
+            dangling = conn.execute(text(
+                f"DELETE FROM {stage} s WHERE NULLIF(s.{_quote(column.name)}, '') IS NOT NULL "
+                f"AND NOT EXISTS (SELECT 1 FROM {_quote(referenced.table.name)} r "
+                f"WHERE r.{_quote(referenced.name)} = {_cast_expression(f's.{_quote(column.name)}', column)}) "
+                f"RETURNING s.{_quote(column.name)}"
+            )).scalars().all()
+            if dangling:
+                result.skipped += len(dangling)
+                result.unresolved.extend(str(value) for value in dangling)
+                LOGGER.warning(
+                    "%d rows in '%s' reference missing %s rows (e.g. %s); skipping them",
+                    len(dangling), path.name, referenced.table.name,
+                    ", ".join(sorted({str(v) for v in dangling})[:10]),
+                )
+
+    @staticmethod
+    def _load_content_tags(conn: Connection, stage: str, content_source: str) -> None:
+        """Write the staged ``tags`` arrays to ``content_tags``, creating unknown tags."""
+        elements = (
+            f"FROM {stage} s CROSS JOIN LATERAL jsonb_array_elements_text("
+            f"CASE WHEN s.tags LIKE '[%' THEN s.tags::jsonb ELSE '[]'::jsonb END) e(tag)"
+        )
+        names = conn.execute(text(f"SELECT DISTINCT e.tag {elements}")).scalars().all()
+        if not names:
+            return
+        conn.execute(text("CREATE TEMP TABLE stage_tag_ids (tag text PRIMARY KEY, tag_id uuid, name text) ON COMMIT DROP"))
+        conn.execute(
+            text("INSERT INTO stage_tag_ids (tag, tag_id, name) VALUES (:tag, :tag_id, :name)"),
+            [
+                {"tag": name, "tag_id": str(resolve_tag_uuid(name)), "name": name.replace("_", " ").title()}
+                for name in names
+            ],
+        )
+        # Both content tables load concurrently; inserting in id order keeps them from deadlocking
+        metadata_type = Base.metadata.tables["tags"].c.tag_metadata.type.compile(dialect=_DIALECT)
+        conn.execute(text(
+            "INSERT INTO tags (id, name, tag_metadata, created_at, updated_at) "
+            f"SELECT tag_id, name, CAST(json_build_object('slug', tag) AS {metadata_type}), "
+            "timezone('utc', now()), timezone('utc', now()) FROM stage_tag_ids ORDER BY tag_id "
+            "ON CONFLICT DO NOTHING"
+        ))
+        conn.execute(text(
+            "INSERT INTO content_tags (content_id, content_source, tag_id) "
+            f"SELECT DISTINCT s.id::integer, :source, m.tag_id {elements} "
+            "JOIN stage_tag_ids m ON m.tag = e.tag JOIN tags t ON t.id = m.tag_id "
+            "ON CONFLICT DO NOTHING"
+        ), {"source": content_source})
+
+    def _drop_secondary_indexes(self, conn: Connection, table_name: str) -> List[Tuple[str, str]]:
+        with self._transaction(conn):
+            indexes = [tuple(row) for row in conn.execute(_SECONDARY_INDEXES_SQL, {"table_name": table_name})]
+            for name, _ in indexes:
+                conn.execute(text(f"DROP INDEX {_quote(name)}"))
+        if indexes:
+            LOGGER.info("Deferred %d indexes on %s until after load", len(indexes), table_name)
+        return indexes
+
+    def _create_indexes(self, conn: Connection, indexes: Sequence[Tuple[str, str]]) -> None:
+        # Outside the load transaction so a failed load still restores the indexes
+        with self._transaction(conn):
+            for _, definition in indexes:
+                conn.execute(text(definition))
+
+
+def load_tsv_files(
+    engine: Engine,
+    paths: Sequence[Path],
+    max_workers: int = 4,
+    schema_name: Optional[str] = None
+) -> Mapping[str, TableLoadResult]:
+    """Convenience wrapper around ``TSVCopyLoader.load_files``."""
+    return TSVCopyLoader(engine, max_workers=max_workers, schema_name=schema_name).load_files(paths)
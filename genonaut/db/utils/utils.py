@@ -247,18 +247,18 @@ def get_image_metadata(image_id: int, environment: Optional[str] = None) -> None
 def _calculate_md5(file_path: Path) -> str:
     """Calculate MD5 hash of a file.
 
+    Uses the shared file hasher, so unchanged files are answered from the
+    persistent digest cache instead of being re-read.
+
     Args:
         file_path: Path to file
 
     Returns:
         MD5 hash as hexadecimal string
     """
-    md5 = hashlib.md5()
-    # Use 1MB chunks for faster I/O
-    with open(file_path, 'rb') as f:
-        for chunk in iter(lambda: f.read(1024 * 1024), b''):
-            md5.update(chunk)
-    return md5.hexdigest()
+    from genonaut.utils.file_hashing import get_file_hasher
+
+    return get_file_hasher().hash_file(file_path, "md5")
 
 
 def sync_models_from_fs(environment: Optional[str] = None) -> None:
@@ -454,6 +454,19 @@ def _sync_model_type(
 
     print(f"  Found {len(file_paths)} files in {models_dir}")
 
+    # Hash all model files up front: cached digests are reused and the rest
+    # are hashed concurrently
+    from genonaut.utils.file_hashing import get_file_hasher
+
+    model_paths = [path for path in file_paths if path.suffix.lower() in valid_extensions]
+    hasher = get_file_hasher()
+    hits_before, hashed_before = hasher.stats['cache_hits'], hasher.stats['hashed']
+    digests = hasher.hash_files(model_paths, ("md5",))
+    print(
+        f"  Hashed {hasher.stats['hashed'] - hashed_before} files "
+        f"({hasher.stats['cache_hits'] - hits_before} unchanged, served from hash cache)"
+    )
+
     # Process each file
     for file_path in file_paths:
         # Check if extension is valid
@@ -472,11 +485,9 @@ def _sync_model_type(
         filename = file_path.name
         name = file_path.stem  # filename without extension
 
-        # Calculate MD5 hash
-        try:
-            md5_hash = _calculate_md5(file_path)
-        except Exception as e:
-            print(f"Warning: Failed to calculate MD5 for {file_path}: {e}")
+        md5_hash = digests.get(file_path, {}).get('md5')
+        if md5_hash is None:
+            print(f"Warning: Failed to calculate MD5 for {file_path}")
             continue
 
         # Try to find matching record
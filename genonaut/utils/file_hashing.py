@@ -0,0 +1,245 @@
+"""Parallel, cached hashing of large files (model checkpoints, LoRAs).
+
+Digests are cached persistently in a small SQLite database keyed by absolute
+path and algorithm and validated against the file's size, mtime (ns) and inode,
+so unchanged files are never re-read. Files that do need hashing are read
+through ``mmap`` and hashed on a thread pool; hashlib releases the GIL while
+digesting large buffers, so hashing scales with cores and disk bandwidth.
+Several algorithms can be computed in a single pass over a file.
+
+``blake2b`` is the recommended full-file hash (cryptographically strong and
+faster than SHA-256); ``md5`` is kept for compatibility with digests already
+stored in model metadata. Computing both in one pass costs one read.
+"""
+
+import hashlib
+import logging
+import mmap
+import os
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Sequence, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+SUPPORTED_ALGORITHMS = ("md5", "sha256", "blake2b")
+# Size of each slice handed to hashlib; large enough to amortize per-call overhead
+DEFAULT_CHUNK_SIZE = 8 * 1024 * 1024
+
+PathLike = Union[str, Path]
+Signature = Tuple[int, int, int]
+
+
+def _new_hash(algorithm: str):
+    if algorithm not in SUPPORTED_ALGORITHMS:
+        raise ValueError(f"Unsupported hash algorithm '{algorithm}'. Must be one of: {SUPPORTED_ALGORITHMS}")
+    if algorithm == "blake2b":
+        return hashlib.blake2b(digest_size=32)
+    return hashlib.new(algorithm)
+
+
+def _signature(stat: os.stat_result) -> Signature:
+    return stat.st_size, stat.st_mtime_ns, stat.st_ino
+
+
+def hash_file(
+    path: PathLike,
+    algorithms: Sequence[str] = ("md5",),
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Dict[str, str]:
+    """Hash a whole file with one or more algorithms in a single pass.
+
+    Args:
+        path: File to hash
+        algorithms: Algorithms to compute (see ``SUPPORTED_ALGORITHMS``)
+        chunk_size: Bytes passed to each ``update`` call
+
+    Returns:
+        Dictionary mapping algorithm to hexadecimal digest
+    """
+    hashers = {algorithm: _new_hash(algorithm) for algorithm in algorithms}
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                if hasattr(mapped, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+                    mapped.madvise(mmap.MADV_SEQUENTIAL)
+                view = memoryview(mapped)
+                try:
+                    for offset in range(0, size, chunk_size):
+                        chunk = view[offset:offset + chunk_size]
+                        for hasher in hashers.values():
+                            hasher.update(chunk)
+                        chunk.release()
+                finally:
+                    view.release()
+    return {algorithm: hasher.hexdigest() for algorithm, hasher in hashers.items()}
+
+
+class FileHashCache:
+    """Persistent (path, algorithm) -> digest cache validated by size, mtime and inode."""
+
+    def __init__(self, path: PathLike):
+        """Open (creating if needed) the cache database.
+
+        Args:
+            path: SQLite file for the cache
+        """
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS file_hashes ("
+            " path TEXT NOT NULL, algorithm TEXT NOT NULL,"
+            " size INTEGER NOT NULL, mtime_ns INTEGER NOT NULL, inode INTEGER NOT NULL,"
+            " digest TEXT NOT NULL, PRIMARY KEY (path, algorithm))"
+        )
+        self._conn.commit()
+
+    def get(self, path: str, signature: Signature, algorithms: Sequence[str]) -> Dict[str, str]:
+        """Return cached digests for ``path`` that are still valid for ``signature``."""
+        placeholders = ",".join("?" for _ in algorithms)
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT algorithm, digest FROM file_hashes WHERE path = ? AND algorithm IN ({placeholders})"
+                " AND size = ? AND mtime_ns = ? AND inode = ?",
+                (path, *algorithms, *signature),
+            ).fetchall()
+        return dict(rows)
+
+    def put(self, path: str, signature: Signature, digests: Dict[str, str]) -> None:
+        """Store digests for ``path`` at ``signature``."""
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO file_hashes (path, algorithm, size, mtime_ns, inode, digest)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                [(path, algorithm, *signature, digest) for algorithm, digest in digests.items()],
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class FileHasher:
+    """Hashes many files concurrently, skipping files whose cached digest is still valid."""
+
+    def __init__(
+        self,
+        cache: Optional[FileHashCache] = None,
+        max_workers: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+    ):
+        """Initialize the hasher.
+
+        Args:
+            cache: Persistent digest cache, or None to always hash
+            max_workers: Hashing threads (defaults to min(8, CPU count))
+            chunk_size: Bytes passed to each ``update`` call
+        """
+        self.cache = cache
+        self.max_workers = max_workers or min(8, os.cpu_count() or 1)
+        self.chunk_size = chunk_size
+        self.stats = {"cache_hits": 0, "hashed": 0, "bytes_hashed": 0, "errors": 0}
+
+    def hash_file(self, path: PathLike, algorithm: str = "md5") -> str:
+        """Hash one file, using the cache when possible.
+
+        Raises:
+            OSError: If the file cannot be read
+        """
+        result = self.hash_files([path], (algorithm,), raise_errors=True)
+        return result[Path(path)][algorithm]
+
+    def hash_files(
+        self,
+        paths: Iterable[PathLike],
+        algorithms: Sequence[str] = ("md5",),
+        raise_errors: bool = False
+    ) -> Dict[Path, Dict[str, str]]:
+        """Hash files concurrently.
+
+        Args:
+            paths: Files to hash
+            algorithms: Algorithms to compute for every file
+            raise_errors: Re-raise the first read error instead of skipping the file
+
+        Returns:
+            Dictionary mapping each input path to ``{algorithm: digest}``; files
+            that could not be read are omitted (and logged)
+        """
+        for algorithm in algorithms:
+            _new_hash(algorithm)  # Validate up front
+
+        results: Dict[Path, Dict[str, str]] = {}
+        pending = []
+        for path in paths:
+            path = Path(path)
+            try:
+                signature = _signature(path.stat())
+            except OSError as exc:
+                if raise_errors:
+                    raise
+                logger.warning(f"Cannot stat {path}: {exc}")
+                self.stats["errors"] += 1
+                continue
+            key = str(path.resolve())
+            cached = self.cache.get(key, signature, algorithms) if self.cache else {}
+            if len(cached) == len(algorithms):
+                results[path] = cached
+                self.stats["cache_hits"] += 1
+            else:
+                pending.append((path, key, signature))
+
+        if not pending:
+            return results
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(pending))) as executor:
+            futures = {
+                executor.submit(hash_file, path, algorithms, self.chunk_size): (path, key, signature)
+                for path, key, signature in pending
+            }
+            for future in as_completed(futures):
+                path, key, signature = futures[future]
+                try:
+                    digests = future.result()
+                except OSError as exc:
+                    if raise_errors:
+                        raise
+                    logger.warning(f"Failed to hash {path}: {exc}")
+                    self.stats["errors"] += 1
+                    continue
+                results[path] = digests
+                self.stats["hashed"] += 1
+                self.stats["bytes_hashed"] += signature[0]
+                if self.cache:
+                    self.cache.put(key, signature, digests)
+
+        return results
+
+
+_HASHER: Optional[FileHasher] = None
+_HASHER_LOCK = threading.Lock()
+
+
+def get_file_hasher() -> FileHasher:
+    """Return the process-wide hasher configured from settings."""
+    global _HASHER
+    with _HASHER_LOCK:
+        if _HASHER is None:
+            from genonaut.api.config import get_settings
+
+            settings = get_settings()
+            cache = None
+            if settings.file_hash_cache_path:
+                try:
+                    cache = FileHashCache(settings.file_hash_cache_path)
+                except (OSError, sqlite3.Error) as exc:
+                    logger.warning(f"File hash cache unavailable, hashing without it: {exc}")
+            _HASHER = FileHasher(cache=cache, max_workers=settings.file_hash_workers)
+        return _HASHER
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+import os
+import threading
+from typing import Any, Dict, List, Optional, Tuple
 
 from genonaut.api.services.comfyui_client import (
     ComfyUIClient,
@@ -67,8 +69,51 @@ class ComfyUIWorkerClient(ComfyUIClient):
         return self.read_output_file(filename, subfolder=subfolder)
 
 
+_WORKER_CLIENTS: Dict[Tuple[int, Optional[str], Optional[str], Optional[str]], ComfyUIWorkerClient] = {}
+_WORKER_CLIENTS_LOCK = threading.Lock()
+
+
+def get_worker_client(
+    *,
+    settings: Optional[Settings] = None,
+    backend_url: Optional[str] = None,
+    output_dir: Optional[str] = None,
+    models_dir: Optional[str] = None
+) -> ComfyUIWorkerClient:
+    """Return a ComfyUI worker client cached per backend for this process.
+
+    Reusing the client keeps its ``requests`` session, and therefore its
+    keep-alive connections to ComfyUI, across jobs. The cache is keyed by
+    process ID so forked Celery workers never share sockets with their parent.
+
+    Args:
+        settings: Optional settings instance used when creating a new client.
+        backend_url: Backend URL override.
+        output_dir: Output directory override.
+        models_dir: Models directory override.
+
+    Returns:
+        Shared ComfyUIWorkerClient for the given backend configuration.
+    """
+    key = (os.getpid(), backend_url, output_dir, models_dir)
+    with _WORKER_CLIENTS_LOCK:
+        client = _WORKER_CLIENTS.get(key)
+        if client is None:
+            for stale_key in [k for k in _WORKER_CLIENTS if k[0] != key[0]]:
+                del _WORKER_CLIENTS[stale_key]
+            client = ComfyUIWorkerClient(
+                settings=settings,
+                backend_url=backend_url,
+                output_dir=output_dir,
+                models_dir=models_dir
+            )
+            _WORKER_CLIENTS[key] = client
+        return client
+
+
 __all__ = [
     "ComfyUIWorkerClient",
+    "get_worker_client",
     "ComfyUIConnectionError",
     "ComfyUIWorkflowError",
 ]
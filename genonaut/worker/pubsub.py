@@ -1,7 +1,9 @@
 """Redis Pub/Sub utilities for job progress updates.
 
 This module provides functions to publish job status updates to Redis channels,
-enabling real-time notifications via WebSocket connections.
+enabling real-time notifications via WebSocket and Server-Sent Events
+connections. Each update is also appended to a short, expiring per-job Redis
+stream so that SSE clients can resume from their ``Last-Event-ID``.
 """
 
 import json
@@ -62,6 +64,35 @@ def get_job_channel(job_id: int) -> str:
     return f"{settings.redis_ns}:job:{job_id}"
 
 
+def get_job_history_key(job_id: int) -> str:
+    """Get the Redis stream key holding recent updates for a job.
+
+    Args:
+        job_id: The generation job ID
+
+    Returns:
+        Namespaced stream key (e.g., "genonaut_dev:job:123:history")
+    """
+    return f"{get_job_channel(job_id)}:history"
+
+
+def _record_job_history(client: Any, job_id: int, payload: str) -> Optional[str]:
+    """Append an update to the job's history stream and return its entry ID."""
+    try:
+        key = get_job_history_key(job_id)
+        pipe = client.pipeline()
+        pipe.xadd(key, {"data": payload}, maxlen=settings.job_status_history_length, approximate=True)
+        pipe.expire(key, settings.job_status_history_ttl_seconds)
+        event_id = pipe.execute()[0]
+    except Exception as e:
+        logger.warning(f"Failed to record job history for job {job_id}: {e}")
+        return None
+
+    if isinstance(event_id, bytes):
+        event_id = event_id.decode()
+    return event_id if isinstance(event_id, str) else None
+
+
 def publish_job_update(
     job_id: int,
     status: str,
@@ -93,6 +124,11 @@ def publish_job_update(
             message.update(data)
 
         payload = json.dumps(message)
+        event_id = _record_job_history(client, job_id, payload)
+        if event_id:
+            message["event_id"] = event_id
+            payload = json.dumps(message)
+
         subscribers = client.publish(channel, payload)
 
         logger.info(f"Published update to {channel}: {status} (subscribers: {subscribers})")
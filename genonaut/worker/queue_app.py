@@ -140,7 +140,13 @@ def _load_beat_schedule():
             task_path = task_config.get('task')
             schedule_config = task_config.get('schedule', {})
 
-            if task_path and schedule_config:
+            if task_path and schedule_config and 'seconds' in schedule_config:
+                # Fixed interval, for tasks that run more often than once a minute
+                beat_schedule[task_name] = {
+                    'task': task_path,
+                    'schedule': float(schedule_config['seconds']),
+                }
+            elif task_path and schedule_config:
                 # Build crontab from config
                 # Only pass parameters that are explicitly specified
                 # Unspecified parameters default to '*' (every) in crontab
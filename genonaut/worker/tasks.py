@@ -21,6 +21,7 @@ from genonaut.worker.comfyui_client import (
     ComfyUIWorkerClient,
     ComfyUIConnectionError,
     ComfyUIWorkflowError,
+    get_worker_client,
 )
 from genonaut.api.services.workflow_builder import (
     WorkflowBuilder,
@@ -32,6 +33,7 @@ from genonaut.api.services.file_storage_service import FileStorageService
 from genonaut.api.services.thumbnail_service import ThumbnailService
 from genonaut.api.services.content_service import ContentService
 from genonaut.api.services.notification_service import NotificationService
+from genonaut.api.services.response_cache import invalidate_content_pages_sync
 from genonaut.worker.pubsub import (
     publish_job_started,
     publish_job_processing,
@@ -111,7 +113,7 @@ def process_comfy_job(
             logger.info("Job %s: Using KernieGen backend URL: %s", job_id, backend_url)
             logger.info("Job %s: Using KernieGen output dir: %s", job_id, output_dir)
 
-    comfy_client = comfy_client or ComfyUIWorkerClient(
+    comfy_client = comfy_client or get_worker_client(
         settings=active_settings,
         backend_url=backend_url,
         output_dir=output_dir,
@@ -218,6 +220,7 @@ def process_comfy_job(
                     organized_paths,
                     job.id,
                 )
+                file_service.record_thumbnails(thumbnail_summary, job.user_id, job.id)
             except Exception as thumb_err:  # pragma: no cover - defensive
                 logger.warning(
                     "Thumbnail generation failed for job %s: %s", job_id, thumb_err
@@ -258,6 +261,7 @@ def process_comfy_job(
 
         db.commit()
         db.refresh(job)
+        invalidate_content_pages_sync()
         logger.info("Job %s completed successfully", job_id)
 
         # Publish "completed" status update
@@ -382,6 +386,81 @@ def cancel_job(job_id: int) -> Dict[str, Any]:
         db.close()
 
 
+@celery_app.task(bind=True, name="genonaut.worker.tasks.scan_flagged_content")
+def scan_flagged_content(
+    self,
+    content_types: Optional[List[str]] = None,
+    force_rescan: bool = False,
+    resume_from: Optional[Dict[str, int]] = None,
+    batch_size: int = 1000,
+    max_workers: int = 1,
+) -> Dict[str, Any]:
+    """Scan all existing content for problematic words.
+
+    Progress is published as a ``PROGRESS`` task state after every batch. The
+    ``last_scanned_ids`` in the progress (and in the result, including on
+    failure) can be passed back as ``resume_from`` to continue an interrupted scan.
+
+    Args:
+        content_types: Content types to scan ('regular', 'auto'); defaults to both
+        force_rescan: Rescan items that are already flagged
+        resume_from: Mapping of content type -> last scanned ID to resume after
+        batch_size: Number of items fetched and persisted per batch
+        max_workers: Processes used for analysis. Prefork worker processes are
+            daemonic and can't start a pool, so values above 1 only take effect
+            under a non-daemonic pool (e.g. ``--pool=threads`` or ``solo``)
+
+    Returns:
+        Dict with scan results
+    """
+    from genonaut.api.services.flagged_content_service import FlaggedContentService
+
+    logger.info("Starting flagged content scan (resume_from=%s)", resume_from)
+
+    db = next(get_database_session())
+    latest_progress: Dict[str, Any] = {"last_scanned_ids": dict(resume_from or {})}
+
+    def report_progress(progress: Dict[str, Any]) -> None:
+        latest_progress.update(progress)
+        if getattr(self.request, "id", None):
+            self.update_state(state="PROGRESS", meta=progress)
+
+    try:
+        service = FlaggedContentService(db)
+        result = service.scan_content_items(
+            content_types=content_types,
+            force_rescan=force_rescan,
+            resume_from=resume_from,
+            batch_size=batch_size,
+            max_workers=max_workers,
+            progress_callback=report_progress,
+        )
+
+        logger.info(
+            "Flagged content scan finished: %s scanned, %s flagged",
+            result["items_scanned"],
+            result["items_flagged"],
+        )
+
+        return {
+            "status": "success",
+            **result,
+            "timestamp": datetime.utcnow().isoformat(),
+        }
+
+    except Exception as e:
+        logger.error(f"Failed to scan content for flags: {str(e)}", exc_info=True)
+        db.rollback()
+        return {
+            "status": "error",
+            "error": str(e),
+            "last_scanned_ids": latest_progress["last_scanned_ids"],
+            "timestamp": datetime.utcnow().isoformat(),
+        }
+    finally:
+        db.close()
+
+
 # Scheduled Tasks
 
 @celery_app.task(name="genonaut.worker.tasks.refresh_tag_cardinality_stats")
@@ -465,6 +544,223 @@ def refresh_gen_source_stats() -> Dict[str, Any]:
         db.close()
 
 
+@celery_app.task(name="genonaut.worker.tasks.generate_recommendations_batch")
+def generate_recommendations_batch(
+    top_k: int = 20,
+    batch_size: int = 256,
+    algorithm_version: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Regenerate stored recommendations for all active users.
+
+    Fits the vectorized recommender on every active user's interactions and
+    replaces each user's unserved recommendations with their top-K candidates.
+
+    Args:
+        top_k: Recommendations stored per user
+        batch_size: Users scored per matrix product
+        algorithm_version: Algorithm version recorded on the rows
+
+    Returns:
+        Dict with generation results
+    """
+    logger.info("Starting batch recommendation generation")
+
+    db = next(get_database_session())
+
+    try:
+        from genonaut.api.services.recommendation_service import (
+            BATCH_ALGORITHM_VERSION,
+            RecommendationService,
+        )
+
+        result = RecommendationService(db).generate_batch_recommendations(
+            algorithm_version=algorithm_version or BATCH_ALGORITHM_VERSION,
+            top_k=top_k,
+            batch_size=batch_size,
+        )
+
+        logger.info(
+            f"Generated {result['recommendations_created']} recommendations "
+            f"for {result['users']} users ({result['timings']})"
+        )
+
+        return {
+            "status": "success",
+            **result,
+            "timestamp": datetime.utcnow().isoformat(),
+        }
+
+    except Exception as e:
+        logger.error(f"Failed to generate batch recommendations: {str(e)}", exc_info=True)
+        return {
+            "status": "error",
+            "error": str(e),
+            "timestamp": datetime.utcnow().isoformat(),
+        }
+    finally:
+        db.close()
+
+
+@celery_app.task(name="genonaut.worker.tasks.update_content_similarity_index")
+def update_content_similarity_index(full_rebuild: bool = False) -> Dict[str, Any]:
+    """Add new content to the "more like this" similarity index.
+
+    Builds the index from scratch if it does not exist yet (or when
+    ``full_rebuild`` is set); otherwise appends public content created since the
+    last run. IVF centroids are retrained once the index has doubled in size
+    since they were last trained.
+
+    Args:
+        full_rebuild: Rebuild the index from scratch
+
+    Returns:
+        Dict with index update results
+    """
+    logger.info("Starting content similarity index update")
+
+    db = next(get_database_session())
+
+    try:
+        from genonaut.api.repositories.content_repository import ContentRepository
+        from genonaut.api.services.content_similarity_index import (
+            ContentSimilarityIndex,
+            discard_staged_index,
+            get_similarity_index_dir,
+            publish_index,
+            rebuild_index,
+            stage_index,
+        )
+
+        repo = ContentRepository(db)
+        directory = get_similarity_index_dir()
+        index = ContentSimilarityIndex(directory)
+
+        if full_rebuild or not index.exists():
+            index = rebuild_index(directory, repo.iter_similarity_documents)
+            added, retrained = index.count, True
+        else:
+            # Changes go to a staging copy so API processes never map a half-updated index
+            index = stage_index(directory)
+            try:
+                added = 0
+                for chunk in repo.iter_similarity_documents(after_ids=dict(index.max_ids)):
+                    added += index.add(chunk)
+                retrained = index.count >= 2 * max(index.trained_count, 1)
+                if retrained:
+                    index.train()
+            except Exception:
+                discard_staged_index(index)
+                raise
+            if added:
+                index = publish_index(index, directory)
+            else:
+                discard_staged_index(index)
+
+        logger.info(f"Similarity index updated: {added} items added, {index.count} total")
+
+        return {
+            "status": "success",
+            "items_added": added,
+            "items_indexed": index.count,
+            "retrained": retrained,
+            "timestamp": datetime.utcnow().isoformat(),
+        }
+
+    except Exception as e:
+        logger.error(f"Failed to update content similarity index: {str(e)}", exc_info=True)
+        return {
+            "status": "error",
+            "error": str(e),
+            "timestamp": datetime.utcnow().isoformat(),
+        }
+    finally:
+        db.close()
+
+
+@celery_app.task(name="genonaut.worker.tasks.reconcile_interaction_summaries")
+def reconcile_interaction_summaries() -> Dict[str, Any]:
+    """Rebuild the user/content interaction summary rollups from user_interactions.
+
+    The rollups are maintained incrementally on every interaction write; this
+    periodic pass corrects drift from writes that bypass the repository.
+
+    Returns:
+        Dict with the number of summary rows written
+    """
+    logger.info("Starting interaction summary reconciliation")
+
+    db = next(get_database_session())
+
+    try:
+        from genonaut.api.repositories.interaction_repository import InteractionRepository
+
+        result = InteractionRepository(db).reconcile_summaries()
+
+        logger.info(
+            f"Interaction summaries reconciled: {result['user_summary_rows']} user rows, "
+            f"{result['content_summary_rows']} content rows"
+        )
+
+        return {
+            "status": "success",
+            **result,
+            "timestamp": datetime.utcnow().isoformat(),
+        }
+
+    except Exception as e:
+        logger.error(f"Failed to reconcile interaction summaries: {str(e)}", exc_info=True)
+        return {
+            "status": "error",
+            "error": str(e),
+            "timestamp": datetime.utcnow().isoformat(),
+        }
+    finally:
+        db.close()
+
+
+@celery_app.task(name="genonaut.worker.tasks.flush_interaction_events")
+def flush_interaction_events(max_batches: int = 20) -> Dict[str, Any]:
+    """Write buffered view/like events from the Redis stream in multi-row batches.
+
+    Args:
+        max_batches: Maximum batches (of ``interaction_ingest_batch_size`` events) per run
+
+    Returns:
+        Dict with counts of events read, collapsed, inserted and invalid
+    """
+    try:
+        from genonaut.api.services.interaction_ingest import get_interaction_ingestor
+
+        ingestor = get_interaction_ingestor()
+        if ingestor.primary is None:
+            return {
+                "status": "skipped",
+                "reason": "interaction ingestion is not using Redis",
+                "timestamp": datetime.utcnow().isoformat(),
+            }
+
+        totals = ingestor.flush(ingestor.primary, max_batches=max_batches)
+        if totals["read"]:
+            logger.info(
+                f"Flushed buffered interactions: {totals['inserted']} inserted, "
+                f"{totals['collapsed']} collapsed, {totals['invalid']} invalid"
+            )
+
+        return {
+            "status": "success",
+            **totals,
+            "timestamp": datetime.utcnow().isoformat(),
+        }
+
+    except Exception as e:
+        logger.error(f"Failed to flush buffered interactions: {str(e)}", exc_info=True)
+        return {
+            "status": "error",
+            "error": str(e),
+            "timestamp": datetime.utcnow().isoformat(),
+        }
+
+
 @celery_app.task(name="genonaut.worker.tasks.transfer_route_analytics_to_postgres")
 def transfer_route_analytics_to_postgres() -> Dict[str, Any]:
     """Transfer route analytics events from Redis to PostgreSQL.
@@ -514,12 +810,12 @@ def transfer_route_analytics_to_postgres() -> Dict[str, Any]:
                 route, method, user_id, timestamp, duration_ms, status_code,
                 query_params, query_params_normalized,
                 request_size_bytes, response_size_bytes,
-                error_type, cache_status, created_at
+                error_type, cache_status, db_query_count, db_duration_ms, created_at
             ) VALUES (
                 :route, :method, :user_id, :timestamp, :duration_ms, :status_code,
                 :query_params, :query_params_normalized,
                 :request_size_bytes, :response_size_bytes,
-                :error_type, :cache_status, :created_at
+                :error_type, :cache_status, :db_query_count, :db_duration_ms, :created_at
             )
         """)
 
@@ -543,6 +839,9 @@ def transfer_route_analytics_to_postgres() -> Dict[str, Any]:
                     'response_size_bytes': int(event_data.get('response_size_bytes', 0)) or None,
                     'error_type': event_data.get('error_type') or None,
                     'cache_status': event_data.get('cache_status') or None,
+                    # Present when the SQL profiler is enabled
+                    'db_query_count': int(event_data['db_query_count']) if event_data.get('db_query_count') else None,
+                    'db_duration_ms': float(event_data['db_duration_ms']) if event_data.get('db_duration_ms') else None,
                     'created_at': timestamp,  # Use event timestamp as created_at
                 }
 
@@ -587,6 +886,108 @@ def transfer_route_analytics_to_postgres() -> Dict[str, Any]:
             redis_client.close()
 
 
+@celery_app.task(name="genonaut.worker.tasks.warm_response_cache")
+def warm_response_cache(dry_run: bool = False) -> Dict[str, Any]:
+    """Pre-populate the response cache with the most requested route patterns.
+
+    Runs every 10 minutes. Targets come from ``route_analytics_hourly``
+    according to the ``cache-planning`` config; see
+    :mod:`genonaut.api.services.cache_warmer`. The hit rate observed over the
+    last hour (from ``route_analytics.cache_status``) is included in the result.
+
+    Args:
+        dry_run: Select targets without rendering or writing anything
+
+    Returns:
+        Dict with warming results
+    """
+    from genonaut.api.services.cache_warmer import CacheWarmer
+    from genonaut.api.services.response_cache import get_response_cache
+
+    logger.info("Starting response cache warming")
+
+    db = next(get_database_session())
+
+    try:
+        cache = get_response_cache()
+        if cache is None and not dry_run:
+            logger.info("Response cache disabled or Redis not configured; skipping warming")
+            return {
+                "status": "skipped",
+                "timestamp": datetime.utcnow().isoformat(),
+            }
+
+        warmer = CacheWarmer(db, cache)
+        report = warmer.warm(dry_run=dry_run)
+        observed = warmer.observed_hit_rate(hours=1)
+
+        logger.info(
+            f"Warmed {report.warmed} pages for {len(report.targets)} route patterns "
+            f"({report.failed} failed, {report.duration_ms:.0f}ms); "
+            f"last hour hit rate: {observed['hit_rate']}"
+        )
+
+        return {
+            "status": "success",
+            **report.to_dict(),
+            "observed_hit_rate": observed,
+            "timestamp": datetime.utcnow().isoformat(),
+        }
+
+    except Exception as e:
+        logger.error(f"Failed to warm response cache: {str(e)}", exc_info=True)
+        db.rollback()
+        return {
+            "status": "error",
+            "error": str(e),
+            "timestamp": datetime.utcnow().isoformat(),
+        }
+    finally:
+        db.close()
+
+
+@celery_app.task(name="genonaut.worker.tasks.cleanup_storage")
+def cleanup_storage(days_old: Optional[int] = None, dry_run: bool = False) -> Dict[str, Any]:
+    """Delete expired files from the generation output directory.
+
+    Runs daily. Walks the output directory with parallel ``scandir``, unlinks
+    temp files and (with a retention period) expired generation files and
+    thumbnails in batches, and reconciles the storage index with what is on
+    disk. See :meth:`FileStorageService.cleanup_old_files`.
+
+    Args:
+        days_old: Retention period in days; defaults to ``file-storage.retention-days``
+            (None keeps generations and thumbnails)
+        dry_run: Report what would be deleted without deleting anything
+
+    Returns:
+        Dict with cleanup results
+    """
+    from genonaut.api.services.file_storage_service import file_storage_settings
+
+    if days_old is None:
+        days_old = file_storage_settings()["retention_days"]
+
+    logger.info(f"Starting storage cleanup (days_old={days_old}, dry_run={dry_run})")
+
+    try:
+        stats = FileStorageService().cleanup_old_files(days_old=days_old, dry_run=dry_run)
+        return {
+            "status": "success",
+            **stats,
+            "days_old": days_old,
+            "timestamp": datetime.utcnow().isoformat(),
+        }
+
+    except Exception as e:
+        logger.error(f"Failed to clean up storage: {str(e)}", exc_info=True)
+        return {
+            "status": "error",
+            "error": str(e),
+            "timestamp": datetime.utcnow().isoformat(),
+        }
+
+
 @celery_app.task(name="genonaut.worker.tasks.aggregate_route_analytics_hourly")
 def aggregate_route_analytics_hourly(reference_time: Optional[str] = None) -> Dict[str, Any]:
     """Aggregate route analytics into hourly metrics.
@@ -621,7 +1022,7 @@ def aggregate_route_analytics_hourly(reference_time: Optional[str] = None) -> Di
                     total_requests, successful_requests, client_errors, server_errors,
                     avg_duration_ms, p50_duration_ms, p95_duration_ms, p99_duration_ms,
                     unique_users, avg_request_size_bytes, avg_response_size_bytes,
-                    cache_hits, cache_misses, created_at
+                    cache_hits, cache_misses, avg_db_query_count, avg_db_duration_ms, created_at
                 )
                 SELECT
                     DATE_TRUNC('hour', timestamp) as hour,
@@ -641,6 +1042,8 @@ def aggregate_route_analytics_hourly(reference_time: Optional[str] = None) -> Di
                     AVG(response_size_bytes)::INTEGER as avg_response_size_bytes,
                     COALESCE(SUM(CASE WHEN cache_status = 'hit' THEN 1 ELSE 0 END), 0) as cache_hits,
                     COALESCE(SUM(CASE WHEN cache_status = 'miss' THEN 1 ELSE 0 END), 0) as cache_misses,
+                    AVG(db_query_count) as avg_db_query_count,
+                    AVG(db_duration_ms) as avg_db_duration_ms,
                     CURRENT_TIMESTAMP as created_at
                 FROM route_analytics
                 WHERE timestamp >= DATE_TRUNC('hour', CAST(:reference_time AS timestamptz) - INTERVAL '1 hour')
@@ -659,7 +1062,9 @@ def aggregate_route_analytics_hourly(reference_time: Optional[str] = None) -> Di
                     avg_request_size_bytes = EXCLUDED.avg_request_size_bytes,
                     avg_response_size_bytes = EXCLUDED.avg_response_size_bytes,
                     cache_hits = EXCLUDED.cache_hits,
-                    cache_misses = EXCLUDED.cache_misses
+                    cache_misses = EXCLUDED.cache_misses,
+                    avg_db_query_count = EXCLUDED.avg_db_query_count,
+                    avg_db_duration_ms = EXCLUDED.avg_db_duration_ms
             """)
             result = db.execute(aggregation_query, {"reference_time": reference_time})
         else:
@@ -670,7 +1075,7 @@ def aggregate_route_analytics_hourly(reference_time: Optional[str] = None) -> Di
                     total_requests, successful_requests, client_errors, server_errors,
                     avg_duration_ms, p50_duration_ms, p95_duration_ms, p99_duration_ms,
                     unique_users, avg_request_size_bytes, avg_response_size_bytes,
-                    cache_hits, cache_misses, created_at
+                    cache_hits, cache_misses, avg_db_query_count, avg_db_duration_ms, created_at
                 )
                 SELECT
                     DATE_TRUNC('hour', timestamp) as hour,
@@ -690,6 +1095,8 @@ def aggregate_route_analytics_hourly(reference_time: Optional[str] = None) -> Di
                     AVG(response_size_bytes)::INTEGER as avg_response_size_bytes,
                     COALESCE(SUM(CASE WHEN cache_status = 'hit' THEN 1 ELSE 0 END), 0) as cache_hits,
                     COALESCE(SUM(CASE WHEN cache_status = 'miss' THEN 1 ELSE 0 END), 0) as cache_misses,
+                    AVG(db_query_count) as avg_db_query_count,
+                    AVG(db_duration_ms) as avg_db_duration_ms,
                     CURRENT_TIMESTAMP as created_at
                 FROM route_analytics
                 WHERE timestamp >= DATE_TRUNC('hour', NOW() - INTERVAL '1 hour')
@@ -708,7 +1115,9 @@ def aggregate_route_analytics_hourly(reference_time: Optional[str] = None) -> Di
                     avg_request_size_bytes = EXCLUDED.avg_request_size_bytes,
                     avg_response_size_bytes = EXCLUDED.avg_response_size_bytes,
                     cache_hits = EXCLUDED.cache_hits,
-                    cache_misses = EXCLUDED.cache_misses
+                    cache_misses = EXCLUDED.cache_misses,
+                    avg_db_query_count = EXCLUDED.avg_db_query_count,
+                    avg_db_duration_ms = EXCLUDED.avg_db_duration_ms
             """)
             result = db.execute(aggregation_query)
         db.commit()
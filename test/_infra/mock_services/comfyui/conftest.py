@@ -139,27 +139,21 @@ def mock_comfyui_url_dynamic(mock_comfyui_server_dynamic: str) -> str:
 def mock_comfyui_client(mock_comfyui_url: str):
     """Create a ComfyUIClient configured to use mock server (static return mode)."""
     from genonaut.api.services.comfyui_client import ComfyUIClient
-    from genonaut.api.config import get_settings
+    from genonaut.api.config import override_settings
 
     # Temporarily override the ComfyUI URL
-    settings = get_settings()
-    original_url = settings.comfyui_url
-    settings.comfyui_url = mock_comfyui_url
+    with override_settings(comfyui_url=mock_comfyui_url):
+        client = ComfyUIClient()
 
-    client = ComfyUIClient()
+        # Clear any cached health status
+        if hasattr(client, 'cache_service'):
+            try:
+                # Clear the health cache key
+                client.cache_service.redis_client.delete('comfyui:health')
+            except:
+                pass  # Ignore if cache not available
 
-    # Clear any cached health status
-    if hasattr(client, 'cache_service'):
-        try:
-            # Clear the health cache key
-            client.cache_service.redis_client.delete('comfyui:health')
-        except:
-            pass  # Ignore if cache not available
-
-    yield client
-
-    # Restore original URL
-    settings.comfyui_url = original_url
+        yield client
 
 
 @pytest.fixture
@@ -169,28 +163,22 @@ def mock_comfyui_client_dynamic(mock_comfyui_url_dynamic: str):
     Use this fixture for tests that verify unique file generation per job.
     """
     from genonaut.api.services.comfyui_client import ComfyUIClient
-    from genonaut.api.config import get_settings
+    from genonaut.api.config import override_settings
     from pathlib import Path
 
     # Temporarily override the ComfyUI URL
-    settings = get_settings()
-    original_url = settings.comfyui_url
-    settings.comfyui_url = mock_comfyui_url_dynamic
-
-    client = ComfyUIClient()
-
-    # Clear any cached health status
-    if hasattr(client, 'cache_service'):
-        try:
-            # Clear the health cache key
-            client.cache_service.redis_client.delete('comfyui:health')
-        except:
-            pass  # Ignore if cache not available
-
-    yield client
-
-    # Restore original URL
-    settings.comfyui_url = original_url
+    with override_settings(comfyui_url=mock_comfyui_url_dynamic):
+        client = ComfyUIClient()
+
+        # Clear any cached health status
+        if hasattr(client, 'cache_service'):
+            try:
+                # Clear the health cache key
+                client.cache_service.redis_client.delete('comfyui:health')
+            except:
+                pass  # Ignore if cache not available
+
+        yield client
 
 
 @pytest.fixture
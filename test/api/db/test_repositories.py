@@ -391,6 +391,20 @@ class TestInteractionRepository:
         like_interactions = repo.get_by_interaction_type("like")
         assert len(like_interactions) >= 1
         assert like_interaction.id in [i.id for i in like_interactions]
+    
+    def test_bulk_record_interactions(self, test_db_session, sample_user, sample_content):
+        """Test multi-row interaction insert with bulk validation and summary upserts."""
+        repo = InteractionRepository(test_db_session)
+        
+        result = repo.bulk_record_interactions([
+            {"user_id": sample_user.id, "content_item_id": sample_content.id, "interaction_type": "view", "duration": 10},
+            {"user_id": sample_user.id, "content_item_id": sample_content.id, "interaction_type": "view", "duration": 20},
+            {"user_id": sample_user.id, "content_item_id": 999999999, "interaction_type": "view"},
+        ])
+        
+        assert result == {"inserted": 2, "invalid": 1}
+        stats = repo.get_interaction_stats_by_content(sample_content.id)
+        assert stats["view"] == {"count": 2, "avg_rating": None, "avg_duration": 15.0}
 
 
 class TestRecommendationRepository:
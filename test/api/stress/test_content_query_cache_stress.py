@@ -0,0 +1,119 @@
+"""Compile and planning time of unified content queries with and without the query-shape cache.
+
+Measures, per query shape of ``RawSQLQueryExecutor``:
+- Python-side SQL assembly: uncached (``compile_content_query.__wrapped__``) vs cached lookup
+- PostgreSQL planning: ad-hoc statement vs prepared statement (``EXPLAIN (ANALYZE) EXECUTE``)
+  after enough executions for PostgreSQL to consider a generic plan
+
+Usage:
+    pytest test/api/stress/test_content_query_cache_stress.py -m stress -s
+"""
+
+import json
+import time
+import uuid
+from typing import Any, Dict, List, Tuple
+
+import pytest
+from sqlalchemy import text
+from tabulate import tabulate
+
+from genonaut.api.models.requests import PaginationRequest
+from genonaut.api.services.content_query_strategies import (
+    compile_content_query,
+    content_query_shape,
+    prepared_query,
+)
+
+ASSEMBLY_ITERATIONS = 2000
+PLANNING_ITERATIONS = 20
+# PostgreSQL considers a generic plan after 5 custom-planned executions
+PREPARED_WARMUP = 6
+
+SHAPES = {
+    "all content": dict(content_source_types=["user-regular", "user-auto", "community-regular", "community-auto"]),
+    "user regular, page 3": dict(content_source_types=["user-regular"], page=3),
+    "search 2 words": dict(content_source_types=["user-regular", "community-regular"], search_term="cat dog"),
+    "1 tag": dict(content_source_types=["community-regular"], tags=1),
+    "3 tags, all": dict(content_source_types=["community-regular", "community-auto"], tags=3, tag_match="all"),
+}
+
+
+def build(user_id: uuid.UUID, content_source_types: List[str], page: int = 1, search_term: str = None,
+          tags: int = 0, tag_match: str = "any") -> Tuple[Any, Dict[str, Any]]:
+    return content_query_shape(
+        PaginationRequest(page=page, page_size=25),
+        content_source_types,
+        user_id,
+        [uuid.uuid4() for _ in range(tags)],
+        tag_match,
+        search_term,
+        "created_at",
+        "desc",
+    )
+
+
+def planning_ms(session, sql: str, params: Dict[str, Any]) -> float:
+    plan = session.execute(text(f"EXPLAIN (ANALYZE, FORMAT JSON) {sql}"), params).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return float(plan[0]["Planning Time"])
+
+
+def measure_shape(session, name: str, options: Dict[str, Any]) -> List[Any]:
+    user_id = uuid.uuid4()
+    shape, params = build(user_id, **options)
+
+    started = time.perf_counter()
+    for _ in range(ASSEMBLY_ITERATIONS):
+        compile_content_query.__wrapped__(shape)
+    uncached_us = (time.perf_counter() - started) / ASSEMBLY_ITERATIONS * 1e6
+
+    compile_content_query(shape)
+    started = time.perf_counter()
+    for _ in range(ASSEMBLY_ITERATIONS):
+        compile_content_query(build(user_id, **options)[0])
+    cached_us = (time.perf_counter() - started) / ASSEMBLY_ITERATIONS * 1e6
+
+    page_sql = compile_content_query(shape).page_sql.text
+    adhoc = [planning_ms(session, page_sql, params) for _ in range(PLANNING_ITERATIONS)]
+
+    query = prepared_query(page_sql)
+    connection = session.connection()
+    connection.exec_driver_sql("DEALLOCATE ALL")
+    connection.exec_driver_sql(query.prepare_sql, execution_options={"no_parameters": True})
+    args = {arg: params[arg] for arg in query.arg_names}
+    for _ in range(PREPARED_WARMUP):
+        connection.exec_driver_sql(query.execute_sql, args)
+    explain_execute = query.execute_sql.replace("EXECUTE", "EXPLAIN (ANALYZE, FORMAT JSON) EXECUTE", 1)
+    prepared = []
+    for _ in range(PLANNING_ITERATIONS):
+        plan = connection.exec_driver_sql(explain_execute, args).scalar()
+        plan = json.loads(plan) if isinstance(plan, str) else plan
+        prepared.append(float(plan[0]["Planning Time"]))
+    connection.exec_driver_sql("DEALLOCATE ALL")
+
+    return [
+        name,
+        f"{uncached_us:.1f}",
+        f"{cached_us:.1f}",
+        f"{sum(adhoc) / len(adhoc):.3f}",
+        f"{sum(prepared) / len(prepared):.3f}",
+    ]
+
+
+@pytest.mark.stress
+@pytest.mark.longrunning
+def test_query_shape_cache_saves_compile_and_planning_time(db_session):
+    """Report assembly and planning time per query shape, ad hoc vs cached/prepared."""
+    rows = [measure_shape(db_session, name, options) for name, options in SHAPES.items()]
+
+    print()
+    print(tabulate(
+        rows,
+        headers=["Shape", "Assemble (us)", "Cached (us)", "Plan ad hoc (ms)", "Plan prepared (ms)"],
+        tablefmt="grid",
+    ))
+
+    for row in rows:
+        assert float(row[2]) < float(row[1]), f"Cached lookup slower than assembly for {row[0]}"
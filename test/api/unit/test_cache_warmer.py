@@ -0,0 +1,203 @@
+"""Unit tests for the response cache and the route-analytics-driven cache warmer."""
+
+import asyncio
+from typing import Optional
+
+from fastapi import Depends, FastAPI, Request, Response
+from fastapi.testclient import TestClient
+
+from genonaut.api.services import cache_warmer, response_cache
+from genonaut.api.services.cache_warmer import CacheWarmer, WarmTarget, projected_hit_rate
+from genonaut.api.services.response_cache import (
+    AsyncResponseCache,
+    ResponseCache,
+    cached_response,
+    invalidate_content_pages,
+    invalidate_content_pages_sync,
+)
+
+
+class FakePipeline:
+    """Queues commands and runs them against the fake client on ``execute``."""
+
+    def __init__(self, client):
+        self.client = client
+        self.commands = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.commands.append((getattr(self.client, name), args, kwargs))
+            return self
+        return queue
+
+    def execute(self):
+        return [command(*args, **kwargs) for command, args, kwargs in self.commands]
+
+
+class FakeRedis:
+    def __init__(self):
+        self.store = {}
+        self.expiry = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def set(self, key, value, ex=None):
+        self.store[key] = value
+        self.expiry[key] = ex
+
+    def sadd(self, key, *members):
+        self.store.setdefault(key, set()).update(members)
+
+    def smembers(self, key):
+        return set(self.store.get(key, ()))
+
+    def expire(self, key, seconds):
+        self.expiry[key] = seconds
+
+    def delete(self, *keys):
+        return self.unlink(*keys)
+
+    def unlink(self, *keys):
+        return sum(self.store.pop(key, None) is not None for key in keys)
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+
+class FakeAsyncPipeline(FakePipeline):
+    async def execute(self):
+        return super().execute()
+
+
+class FakeAsyncRedis:
+    """``redis.asyncio`` flavour of :class:`FakeRedis` over the same store."""
+
+    def __init__(self, sync_client):
+        self.sync_client = sync_client
+
+    async def get(self, key):
+        return self.sync_client.get(key)
+
+    async def unlink(self, *keys):
+        return self.sync_client.unlink(*keys)
+
+    def pipeline(self):
+        return FakeAsyncPipeline(self.sync_client)
+
+
+def test_cache_key_ignores_param_order_and_default_page():
+    cache = ResponseCache(FakeRedis(), "genonaut_test")
+    route = "/api/v1/content/unified"
+
+    assert cache.key(route, {"page_size": "25", "sort_field": "created_at"}) == cache.key(
+        route, {"sort_field": "created_at", "page": "1", "page_size": "25"}
+    )
+    assert cache.key(route, {"page_size": "25"}) != cache.key(route, {"page_size": "25", "page": "2"})
+    assert cache.key(route, {"tag_names": ["a", "b"]}) == cache.key(route, {"tag_names": ("a", "b")})
+
+
+def test_cached_response_serves_warmed_entries_and_records_status(monkeypatch):
+    redis_client = FakeRedis()
+    cache = ResponseCache(redis_client, "genonaut_test")
+    cache.set("/items", {"page_size": "25"}, b'{"items":[1]}')
+    monkeypatch.setattr(
+        response_cache,
+        "get_async_response_cache",
+        lambda: AsyncResponseCache(FakeAsyncRedis(redis_client), "genonaut_test"),
+    )
+
+    app = FastAPI()
+
+    @app.get("/items")
+    async def items(request: Request, cached: Optional[Response] = Depends(cached_response)):
+        if cached is not None:
+            return cached
+        return {"items": [], "cache_status": request.state.cache_status}
+
+    client = TestClient(app)
+    hit = client.get("/items?page=1&page_size=25")
+    miss = client.get("/items?page=2&page_size=25")
+
+    assert hit.headers["X-Cache"] == "hit"
+    assert hit.json() == {"items": [1]}
+    assert miss.json() == {"items": [], "cache_status": "miss"}
+
+
+def test_content_writes_invalidate_every_cached_page_of_content_routes(monkeypatch):
+    redis_client = FakeRedis()
+    cache = ResponseCache(redis_client, "genonaut_test")
+    route = response_cache.UNIFIED_CONTENT_ROUTE
+    cache.set(route, {"page_size": "25"}, "{}")
+    cache.set(route, {"page_size": "25", "page": "2"}, "{}")
+    cache.set("/api/v1/tags/hierarchy", {}, "{}")
+    monkeypatch.setattr(
+        response_cache,
+        "get_async_response_cache",
+        lambda: AsyncResponseCache(FakeAsyncRedis(redis_client), "genonaut_test"),
+    )
+
+    asyncio.run(invalidate_content_pages())
+
+    assert set(redis_client.store) == {
+        cache.key("/api/v1/tags/hierarchy", {}), cache.index_key("/api/v1/tags/hierarchy"),
+    }
+
+    cache.set(route, {"page_size": "25"}, "{}")
+    monkeypatch.setattr(response_cache, "get_response_cache", lambda: cache)
+    invalidate_content_pages_sync()
+
+    assert cache.get(route, {"page_size": "25"}) is None
+
+
+def test_warm_renders_each_page_into_the_cache(monkeypatch):
+    redis_client = FakeRedis()
+    cache = ResponseCache(redis_client, "genonaut_test", ttl_seconds=600)
+    rendered = []
+
+    def render(session, params):
+        rendered.append(params)
+        return {"page": params.get("page", "1")}
+
+    monkeypatch.setitem(cache_warmer.RENDERERS, "/items", render)
+
+    class DummySession:
+        def rollback(self):
+            pass
+
+    warmer = CacheWarmer(DummySession(), cache, top_n=1, pages=2, lookback_days=7)
+    monkeypatch.setattr(
+        warmer, "select_targets", lambda: [WarmTarget("/items", {"page_size": "25"}, requests=40)]
+    )
+
+    report = warmer.warm()
+
+    assert rendered == [{"page_size": "25"}, {"page_size": "25", "page": "2"}]
+    assert (report.warmed, report.failed) == (2, 0)
+    assert cache.get("/items", {"page": "2", "page_size": "25"}) == '{"page":"2"}'
+    assert set(redis_client.expiry.values()) == {600}
+
+
+def test_dry_run_selects_targets_without_writing(monkeypatch):
+    warmer = CacheWarmer(None, ResponseCache(FakeRedis(), "genonaut_test"), top_n=1, pages=1, lookback_days=7)
+    monkeypatch.setattr(warmer, "select_targets", lambda: [WarmTarget("/items", {}, requests=3)])
+
+    report = warmer.warm(dry_run=True)
+
+    assert report.dry_run is True
+    assert report.warmed == 0
+    assert warmer.cache.redis_client.store == {}
+
+
+def test_projected_hit_rate_counts_warmed_pages_only():
+    targets = [WarmTarget("/items", {"page_size": "25", "sort": "new"}, requests=0)]
+    request_counts = [
+        ("/items", {"sort": "new", "page_size": "25"}, None, False, 50),
+        ("/items", {"sort": "new", "page_size": "25"}, "2", False, 30),
+        ("/items", {"sort": "new", "page_size": "25"}, "3", False, 10),
+        ("/items", {"sort": "new", "page_size": "25"}, None, True, 5),
+        ("/items", {"sort": "old", "page_size": "25"}, None, False, 5),
+    ]
+
+    assert projected_hit_rate(targets, request_counts, pages=2) == (80, 100)
+    assert projected_hit_rate(targets, request_counts, pages=1) == (50, 100)
@@ -0,0 +1,179 @@
+"""Unit tests for the pooled async ComfyUI client and circuit breaker."""
+
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from genonaut.api.config import Settings
+from genonaut.api.services import comfyui_client, comfyui_generation_service
+from genonaut.api.services.comfyui_client import (
+    AsyncComfyUIClient,
+    ComfyUICircuitOpenError,
+    ComfyUIConnectionError,
+    get_async_comfyui_client,
+)
+from genonaut.api.services.retry_service import CircuitBreaker, CircuitState, RetryConfig, RetryService
+
+
+OBJECT_INFO = {
+    "CheckpointLoaderSimple": {"input": {"required": {"ckpt_name": [["base.safetensors"]]}}},
+    "LoraLoader": {"input": {"required": {"lora_name": [["detail.safetensors"]]}}},
+}
+
+
+def _client(handler, **overrides):
+    settings = Settings(
+        comfyui_circuit_failure_threshold=overrides.get("threshold", 2),
+        comfyui_circuit_reset_seconds=overrides.get("reset", 60.0),
+        comfyui_max_connections=overrides.get("max_connections", 4),
+    )
+    client = AsyncComfyUIClient(
+        settings=settings,
+        backend_url=f"http://comfy-{id(handler)}.test",
+        transport=httpx.MockTransport(handler),
+    )
+    # Isolate from other tests: fresh breaker and no retry delays
+    client.retry_service = RetryService()
+    client.retry_config = RetryConfig(
+        max_attempts=2,
+        base_delay=0,
+        retryable_exceptions=[ComfyUIConnectionError],
+        non_retryable_exceptions=RetryService.DEFAULT_NON_RETRYABLE_EXCEPTIONS,
+    )
+    client.circuit_breaker = client.retry_service.get_circuit_breaker(
+        "test", settings.comfyui_circuit_failure_threshold, settings.comfyui_circuit_reset_seconds
+    )
+    client.cache_service.clear_all_cache()
+    return client
+
+
+def test_get_available_models_parses_object_info():
+    def handler(request):
+        assert request.url.path == "/object_info"
+        return httpx.Response(200, json=OBJECT_INFO)
+
+    async def scenario():
+        client = _client(handler)
+        try:
+            return await client.get_available_models()
+        finally:
+            await client.aclose()
+
+    assert asyncio.run(scenario()) == {"checkpoints": ["base.safetensors"], "loras": ["detail.safetensors"]}
+
+
+def test_circuit_opens_after_failures_and_short_circuits():
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.path)
+        raise httpx.ConnectError("connection refused")
+
+    async def scenario():
+        client = _client(handler, threshold=2)
+        try:
+            with pytest.raises(ComfyUIConnectionError):
+                await client.get_available_models()
+            with pytest.raises(ComfyUICircuitOpenError):
+                await client.get_available_models()
+            return client.circuit_breaker.state, await client.health_check()
+        finally:
+            await client.aclose()
+
+    state, healthy = asyncio.run(scenario())
+
+    # Two attempts (one retry) opened the circuit; the open-circuit error is not
+    # retried and later calls never hit the network
+    assert len(calls) == 2
+    assert state == CircuitState.OPEN
+    assert healthy is False
+
+
+def test_concurrent_requests_are_bounded():
+    in_flight = 0
+    peak = 0
+
+    async def handler(request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json={})
+
+    async def scenario():
+        client = _client(handler, max_connections=3)
+        try:
+            await asyncio.gather(*(client.get_available_models() for _ in range(12)))
+        finally:
+            await client.aclose()
+
+    asyncio.run(scenario())
+
+    assert peak == 3
+
+
+def test_half_open_trial_closes_circuit(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("genonaut.api.services.retry_service.time.monotonic", lambda: now[0])
+    breaker = CircuitBreaker("backend", failure_threshold=1, reset_timeout=10)
+
+    breaker.record_failure()
+    assert breaker.allow_request() is False
+
+    now[0] += 11
+    assert breaker.allow_request() is True
+    # Only one trial call at a time while half-open
+    assert breaker.allow_request() is False
+
+    breaker.record_success()
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.allow_request() is True
+
+
+def test_shared_client_per_backend_and_loop():
+    async def scenario():
+        first = get_async_comfyui_client("http://backend-a:8000/")
+        second = get_async_comfyui_client("http://backend-a:8000")
+        other = get_async_comfyui_client("http://backend-b:8000")
+        await comfyui_client.close_async_comfyui_clients()
+        return first, second, other
+
+    first, second, other = asyncio.run(scenario())
+
+    assert first is second
+    assert first is not other
+
+
+def test_generation_service_queries_comfyui_through_async_client(monkeypatch):
+    def handler(request):
+        if request.url.path == "/system_stats":
+            return httpx.Response(200, json={"system": {}})
+        return httpx.Response(200, json=OBJECT_INFO)
+
+    backends = []
+
+    def shared_client(backend_url):
+        backends.append(backend_url)
+        return client
+
+    client = _client(handler)
+    monkeypatch.setattr(comfyui_generation_service, "get_async_comfyui_client", shared_client)
+    service = comfyui_generation_service.ComfyUIGenerationService.__new__(
+        comfyui_generation_service.ComfyUIGenerationService
+    )
+    service.comfyui_client = SimpleNamespace(base_url="http://comfy.test")
+
+    async def scenario():
+        try:
+            return await service.health_check(), await service.get_available_models()
+        finally:
+            await client.aclose()
+
+    healthy, models = asyncio.run(scenario())
+
+    assert healthy is True
+    assert models["checkpoints"] == ["base.safetensors"]
+    assert backends == ["http://comfy.test", "http://comfy.test"]
@@ -0,0 +1,178 @@
+"""Unit tests for the query-shape cache and prepared statements of RawSQLQueryExecutor."""
+
+from contextlib import contextmanager
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+
+from genonaut.api.models.requests import PaginationRequest
+from genonaut.api.services.content_query_strategies import (
+    PREPARED_STATEMENTS_KEY,
+    compile_content_query,
+    content_query_shape,
+    execute_prepared,
+    prepared_query,
+)
+
+
+def shape_of(page=1, user_id=None, tags=(), search=None, sort_order="desc"):
+    return content_query_shape(
+        PaginationRequest(page=page, page_size=25),
+        ["user-regular", "community-regular"],
+        user_id,
+        list(tags),
+        "any",
+        search,
+        "created_at",
+        sort_order,
+    )
+
+
+def test_requests_differing_only_in_values_share_a_compiled_query():
+    first, first_params = shape_of(page=2, user_id=uuid4(), tags=[uuid4(), uuid4()], search='cat "dog house"')
+    second, second_params = shape_of(page=3, user_id=uuid4(), tags=[uuid4(), uuid4()], search='bird "fish tank"')
+
+    assert first == second
+    assert first_params != second_params
+    assert compile_content_query(first) is compile_content_query(second)
+
+    assert shape_of(tags=[uuid4()])[0] != shape_of(tags=[uuid4(), uuid4()])[0]
+    assert shape_of(page=1)[0] != shape_of(page=2)[0]  # OFFSET only appears past page 1
+    assert shape_of(sort_order="asc")[0] != shape_of()[0]
+
+
+def test_compiled_query_binds_every_param():
+    shape, params = shape_of(page=2, user_id=uuid4(), tags=[uuid4(), uuid4()], search='cat "dog house"')
+    compiled = compile_content_query(shape)
+
+    page_args = set(prepared_query(compiled.page_sql.text).arg_names)
+    count_args = set(prepared_query(compiled.count_sql.text).arg_names)
+
+    assert page_args <= set(params) and count_args <= set(params)
+    assert {"user_id", "search_phrase_0", "search_word_0", "tag_any_0", "tag_any_1", "page_size", "offset"} <= page_args
+    assert {"tag0", "tag1", "user_id"} <= count_args
+
+
+def test_prepared_query_uses_positional_params_and_keeps_casts():
+    query = prepared_query("SELECT x::text FROM t WHERE a = :a AND b = :b OR c = :a LIMIT :n")
+
+    assert query.prepare_sql == f"PREPARE {query.name} AS SELECT x::text FROM t WHERE a = $1 AND b = $2 OR c = $1 LIMIT $3"
+    assert query.execute_sql == f"EXECUTE {query.name}(%(a)s, %(b)s, %(n)s)"
+    assert prepared_query("SELECT 1").execute_sql.endswith("EXECUTE " + prepared_query("SELECT 1").name)
+
+
+def db_error(pgcode):
+    return DBAPIError("statement", {}, SimpleNamespace(pgcode=pgcode))
+
+
+class FakeConnection:
+    def __init__(self, driver, errors=None):
+        self.dialect = SimpleNamespace(driver=driver)
+        self.info = {}
+        self.calls = []
+        self.errors = dict(errors or {})  # Statement keyword -> error raised once
+
+    @contextmanager
+    def begin_nested(self):
+        self.calls.append(("SAVEPOINT", None))
+        try:
+            yield
+        except Exception:
+            self.calls.append(("ROLLBACK TO SAVEPOINT", None))
+            raise
+        self.calls.append(("RELEASE SAVEPOINT", None))
+
+    def exec_driver_sql(self, sql, params=None, execution_options=None):
+        keyword = sql.split()[0]
+        self.calls.append((keyword, params))
+        if keyword in self.errors:
+            raise self.errors.pop(keyword)
+        return sql
+
+
+class FakeSession:
+    def __init__(self, connection):
+        self._connection = connection
+        self.executed = []
+
+    def connection(self, bind_arguments=None):
+        return self._connection
+
+    def execute(self, clause, params):
+        self.executed.append(clause)
+        return clause
+
+
+def test_execute_prepared_prepares_once_per_connection():
+    connection = FakeConnection("psycopg2")
+    session = FakeSession(connection)
+    clause = text("SELECT * FROM t WHERE id = :id")
+
+    execute_prepared(session, clause, {"id": 1, "unused": 2})
+    execute_prepared(session, clause, {"id": 2})
+
+    assert connection.calls == [
+        ("SAVEPOINT", None), ("PREPARE", None), ("RELEASE SAVEPOINT", None),
+        ("EXECUTE", {"id": 1}), ("EXECUTE", {"id": 2}),
+    ]
+    assert connection.info[PREPARED_STATEMENTS_KEY] == {prepared_query(clause.text).name}
+    assert session.executed == []
+
+
+def test_execute_prepared_keeps_the_statement_when_only_execute_fails():
+    connection = FakeConnection("psycopg2", errors={"EXECUTE": db_error("57014")})  # Statement timeout
+    session = FakeSession(connection)
+    clause = text("SELECT * FROM t WHERE id = :id")
+
+    with pytest.raises(DBAPIError):
+        execute_prepared(session, clause, {"id": 1})
+    execute_prepared(session, clause, {"id": 2})
+
+    assert [call for call, _ in connection.calls].count("PREPARE") == 1
+    assert connection.calls[-1] == ("EXECUTE", {"id": 2})
+    assert connection.info[PREPARED_STATEMENTS_KEY] == {prepared_query(clause.text).name}
+
+    # A statement the server no longer has is prepared again next time
+    connection.errors["EXECUTE"] = db_error("26000")
+    with pytest.raises(DBAPIError):
+        execute_prepared(session, clause, {"id": 3})
+    assert connection.info[PREPARED_STATEMENTS_KEY] == set()
+
+
+def test_execute_prepared_executes_statements_already_prepared_on_the_connection():
+    connection = FakeConnection("psycopg2", errors={"PREPARE": db_error("42P05")})
+    session = FakeSession(connection)
+    clause = text("SELECT * FROM t WHERE id = :id")
+
+    execute_prepared(session, clause, {"id": 1})
+
+    assert connection.calls == [
+        ("SAVEPOINT", None), ("PREPARE", None), ("ROLLBACK TO SAVEPOINT", None), ("EXECUTE", {"id": 1}),
+    ]
+    assert connection.info[PREPARED_STATEMENTS_KEY] == {prepared_query(clause.text).name}
+
+
+def test_execute_prepared_forgets_statements_whose_prepare_failed():
+    connection = FakeConnection("psycopg2", errors={"PREPARE": db_error("42601")})
+    session = FakeSession(connection)
+    clause = text("SELECT * FROM t WHERE id = :id")
+
+    with pytest.raises(DBAPIError):
+        execute_prepared(session, clause, {"id": 1})
+
+    assert ("EXECUTE", {"id": 1}) not in connection.calls
+    assert connection.info[PREPARED_STATEMENTS_KEY] == set()
+
+
+def test_execute_prepared_runs_directly_on_other_drivers_or_when_disabled():
+    clause = text("SELECT 1")
+    session = FakeSession(FakeConnection("pysqlite"))
+    execute_prepared(session, clause, {})
+    assert session.executed == [clause]
+
+    session = FakeSession(FakeConnection("psycopg2"))
+    execute_prepared(session, clause, {}, prepare=False)
+    assert session.executed == [clause] and session._connection.calls == []
@@ -0,0 +1,95 @@
+"""Unit tests for the content similarity ("more like this") index."""
+
+import numpy as np
+
+from genonaut.api.services.content_similarity_index import (
+    APPEND_ONLY_FILES,
+    ContentSimilarityIndex,
+    publish_index,
+    rebuild_index,
+    stage_index,
+)
+
+DOCUMENTS = [
+    (1, "items", "Sunset over the ocean", "golden sunset over calm ocean waves, beach", ["landscape"]),
+    (2, "items", "Ocean sunset", "vivid sunset above ocean waves and sandy beach", ["landscape"]),
+    (3, "auto", "Cyberpunk city", "neon cyberpunk city street at night, rain", ["scifi"]),
+    (4, "auto", "Neon streets", "rainy neon city streets, cyberpunk night", ["scifi"]),
+    (5, "items", "Portrait of a cat", "fluffy orange cat portrait, studio lighting", ["animals"]),
+    (6, "auto", "Kitten portrait", "orange kitten portrait with soft studio light", ["animals"]),
+]
+
+
+def _chunks(documents, size=2):
+    return lambda: (documents[i:i + size] for i in range(0, len(documents), size))
+
+
+def test_similar_items_share_topic(tmp_path):
+    index = ContentSimilarityIndex(str(tmp_path / "index"), dim=128, writable=True)
+    index.build(_chunks(DOCUMENTS), n_lists=2)
+    index.n_probe = 2
+
+    assert index.similar(1, k=1)[0][:2] == (2, "items")
+    assert index.similar(3, k=1)[0][:2] == (4, "auto")
+    assert index.similar(6, k=1)[0][:2] == (5, "items")
+    assert all(item_id != 1 for item_id, _, _ in index.similar(1, k=5))
+    assert index.similar(999) is None
+
+
+def test_index_persists_and_grows_incrementally(tmp_path):
+    directory = str(tmp_path / "index")
+    rebuild_index(directory, _chunks(DOCUMENTS[:4]), dim=128)
+
+    index = ContentSimilarityIndex.load(directory, writable=True)
+    assert index.max_ids == {"items": 2, "auto": 4}
+
+    added = index.add(DOCUMENTS[3:])  # Document 4 is already indexed
+    index.save()
+    assert added == 2
+
+    reloaded = ContentSimilarityIndex.load(directory, n_probe=4)
+    assert reloaded.count == 6
+    assert reloaded.max_ids == {"items": 5, "auto": 6}
+    assert reloaded.similar(5, k=1)[0][0] == 6
+
+
+def test_staged_updates_leave_the_live_index_untouched_until_published(tmp_path):
+    directory = tmp_path / "index"
+    rebuild_index(str(directory), _chunks(DOCUMENTS[:4]), dim=128)
+    live = ContentSimilarityIndex.load(str(directory), n_probe=4)
+    def snapshot():
+        # Append-only files may grow past the live count, but their first rows never change
+        files = {path.name: path.read_bytes() for path in directory.iterdir() if path.name not in APPEND_ONLY_FILES}
+        return files, np.fromfile(directory / "ids.i64", dtype=np.int64)[:4].tolist()
+
+    live_files = snapshot()
+
+    staged = stage_index(str(directory))
+    staged.add(DOCUMENTS[4:])
+    staged.train(n_lists=3)
+
+    assert snapshot() == live_files
+    assert live.similar(1, k=1)[0][0] == 2
+
+    published = publish_index(staged, str(directory))
+    assert published.count == 6 and len(published.centroids) == 3
+    assert ContentSimilarityIndex.load(str(directory), n_probe=3).similar(5, k=1)[0][0] == 6
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["index"]
+    # Processes that mapped the old files keep a consistent view of them
+    assert live.count == 4 and live.similar(3, k=1)[0][0] == 4
+
+
+def test_ivf_search_matches_brute_force_when_probing_all_lists(tmp_path):
+    rng = np.random.default_rng(0)
+    vectors = rng.standard_normal((3000, 16)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+
+    index = ContentSimilarityIndex(str(tmp_path / "index"), dim=16, writable=True)
+    index.append_vectors(list(range(10, 3010)), ["auto"] * 3000, vectors)  # Grows capacity past 1024
+    index.train(n_lists=20)
+
+    exact = np.argsort(-(vectors @ vectors[7]))[1:6] + 10
+    approximate = [item_id for item_id, _, _ in index.similar(17, k=5, n_probe=20)]
+
+    assert approximate == list(exact)
+    assert index.capacity >= 3000
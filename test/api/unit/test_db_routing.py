@@ -0,0 +1,153 @@
+"""Unit tests for read-replica routing (two SQLite databases stand in for primary and replica)."""
+
+import pytest
+from sqlalchemy import Column, Integer, String, create_engine, select, text
+from sqlalchemy.orm import declarative_base, sessionmaker
+
+from genonaut.api.db_routing import (
+    REPLICA_KEY,
+    RecentWriters,
+    Replica,
+    ReplicaSet,
+    RoutingSession,
+    is_read_statement,
+)
+
+Base = declarative_base()
+
+
+class Note(Base):
+    __tablename__ = "notes"
+
+    id = Column(Integer, primary_key=True)
+    user_id = Column(String)
+    body = Column(String)
+
+
+@pytest.fixture
+def databases(tmp_path):
+    primary = create_engine(f"sqlite:///{tmp_path / 'primary.db'}")
+    replica = create_engine(f"sqlite:///{tmp_path / 'replica.db'}")
+    for engine, body in ((primary, "from primary"), (replica, "from replica")):
+        Base.metadata.create_all(engine)
+        with engine.begin() as conn:
+            conn.execute(Note.__table__.insert().values(id=1, user_id="u1", body=body))
+    yield primary, replica
+    primary.dispose()
+    replica.dispose()
+
+
+def make_session(primary, replica=None, on_write_commit=None):
+    info = {"environment": "test"}
+    if on_write_commit is not None:
+        info["on_write_commit"] = on_write_commit
+    session = sessionmaker(bind=primary, class_=RoutingSession, autoflush=False, info=info)()
+    if replica is not None:
+        session.info[REPLICA_KEY] = replica
+    return session
+
+
+def test_reads_use_replica_and_writes_pin_session_to_primary(databases):
+    primary, replica = databases
+    session = make_session(primary, replica)
+
+    assert session.execute(select(Note.body)).scalar() == "from replica"
+    assert session.execute(text("SELECT body FROM notes")).scalar() == "from replica"
+
+    session.add(Note(id=2, user_id="u2", body="new"))
+    session.flush()
+
+    # The session has written: later reads must see that write
+    assert session.execute(select(Note.body).where(Note.id == 2)).scalar() == "new"
+    assert session.execute(select(Note.body).where(Note.id == 1)).scalar() == "from primary"
+    session.commit()
+    session.close()
+
+    with replica.connect() as conn:
+        assert conn.execute(text("SELECT COUNT(*) FROM notes")).scalar() == 1
+
+
+def test_sessions_without_replica_use_primary(databases):
+    primary, _ = databases
+    session = make_session(primary)
+
+    assert session.execute(select(Note.body)).scalar() == "from primary"
+    session.close()
+
+
+def test_commit_reports_writers(databases):
+    primary, _ = databases
+    reported = []
+    session = make_session(primary, on_write_commit=reported.append)
+
+    session.execute(select(Note)).scalars().all()
+    session.commit()
+    assert reported == []
+
+    session.add(Note(id=3, user_id="u3", body="x"))
+    session.commit()
+    session.close()
+
+    assert reported == [{"u3"}]
+
+
+def test_is_read_statement():
+    assert is_read_statement(select(Note))
+    assert not is_read_statement(select(Note).with_for_update())
+    assert is_read_statement(text("WITH x AS (SELECT 1) SELECT * FROM x"))
+    assert not is_read_statement(text("WITH x AS (DELETE FROM notes RETURNING id) SELECT * FROM x"))
+    assert not is_read_statement(text("SELECT nextval('notes_id_seq')"))
+    assert not is_read_statement(Note.__table__.update())
+
+
+def test_recent_writers_window(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("genonaut.api.db_routing.time.monotonic", lambda: now[0])
+    writers = RecentWriters(window_seconds=5)
+
+    writers.record(["u1"])
+    assert writers.is_recent("u1")
+    assert not writers.is_recent("u2")
+    assert not writers.is_recent(None)
+
+    now[0] += 6
+    assert not writers.is_recent("u1")
+
+
+def test_recent_writers_fall_back_to_primary_when_redis_fails():
+    class BrokenRedis:
+        def exists(self, key):
+            raise ConnectionError("down")
+
+    assert RecentWriters(window_seconds=5, redis_client=BrokenRedis()).is_recent("u1")
+
+
+def test_replica_set_skips_lagging_and_failing_replicas(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr("genonaut.api.db_routing.time.monotonic", lambda: now[0])
+    lags = {"a": 0.5, "b": 30.0}
+
+    def probe(replica):
+        lag = lags[replica.name]
+        if lag is None:
+            raise ConnectionError("unreachable")
+        return lag
+
+    replica_set = ReplicaSet(
+        [Replica("a", engine=None), Replica("b", engine=None)],
+        max_lag_seconds=5,
+        check_interval_seconds=2,
+        probe=probe,
+    )
+
+    assert {replica_set.choose() for _ in range(4)} == {0}
+
+    # Lag is re-checked only after the interval
+    lags.update(a=None, b=1.0)
+    assert replica_set.choose() == 0
+    now[0] += 3
+    assert {replica_set.choose() for _ in range(4)} == {1}
+
+    lags["b"] = 10.0
+    now[0] += 3
+    assert replica_set.choose() is None
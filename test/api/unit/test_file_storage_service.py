@@ -0,0 +1,144 @@
+"""Unit tests for the storage index and file organization/cleanup in FileStorageService."""
+
+import asyncio
+import os
+import time
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+
+from genonaut.api.config import override_settings
+from genonaut.api.services.file_storage_service import FileStorageService
+from genonaut.api.services.storage_index import StorageIndex, classify, scan_tree
+
+
+@pytest.fixture
+def service(tmp_path):
+    output_dir = tmp_path / "output"
+    with override_settings(
+        comfyui_output_dir=str(output_dir),
+        file_storage={"index_path": str(tmp_path / "index.sqlite3"), "workers": 4, "cleanup_batch_size": 2},
+    ):
+        yield FileStorageService()
+
+
+def write(path, size=10, age_days=0):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"x" * size)
+    if age_days:
+        old = time.time() - age_days * 86400
+        os.utime(path, (old, old))
+    return path
+
+
+def test_index_totals_follow_inserts_updates_and_deletes(tmp_path):
+    user = str(uuid4())
+    index = StorageIndex(tmp_path / "index.sqlite3")
+    assert classify(f"{user}/2026/01/02/gen_7_a.png") == ("generation", user, 7)
+    assert classify("thumbnails/gen_job_7_00001__150x150.webp") == ("thumbnail", None, 7)
+    assert classify("temp/upload.bin") == ("temp", None, None)
+
+    index.add([("gen_job_7_00001_.png", 100, 1), ("gen_job_7_00002_.png", 50, 1)], user_id=user, generation_id=7)
+    index.add([("thumbnails/gen_job_7_00001__150x150.webp", 5, 1), ("temp/upload.bin", 3, 1)])
+    index.add([("gen_job_7_00002_.png", 70, 2)])  # Rewritten: size changes, attribution is kept
+
+    assert index.user_usage(user)["generation"] == {"files": 2, "bytes": 170, "generation_files": 2}
+    assert index.user_usage(user)["thumbnail"]["files"] == 1  # Inherited from the generation
+    assert index.generation_usage(7) == {"files": 3, "bytes": 175}
+
+    index.remove(["gen_job_7_00001_.png"])
+    totals = index.totals()
+    assert totals["generation"]["bytes"] == 70 and totals["temp"]["files"] == 1
+    assert totals["users_with_data"] == 1
+    assert index.generation_paths(7) == ["gen_job_7_00002_.png", "thumbnails/gen_job_7_00001__150x150.webp"]
+
+    # Files that disappeared are dropped; ones recorded after the scan started are kept
+    result = index.reconcile([("temp/upload.bin", 3, 1), ("other.png", 9, 1)], scan_started=time.time())
+    assert result == {"added": 1, "updated": 0, "removed": 2}
+    assert index.totals()["generation"] == {"files": 1, "bytes": 9, "generation_files": 0}
+    assert index.generation_usage(7) == {"files": 0, "bytes": 0}
+
+
+def test_organize_moves_in_parallel_and_updates_usage(service):
+    user = uuid4()
+    sources = [str(write(service.base_output_dir / f"gen_job_3_{i:05d}_.png", size=100)) for i in range(5)]
+
+    organized = service.organize_generation_files(3, user, sources + ["/nowhere/missing.png"], organize=True)
+
+    assert len(organized) == 5
+    assert all(os.path.basename(path).startswith("gen_3_gen_job_3_") and os.path.exists(path) for path in organized)
+    assert not any(os.path.exists(path) for path in sources)
+    thumbnail = write(service.thumbnails_dir / "gen_3_gen_job_3_00000__150x150.webp", size=7)
+    service.record_thumbnails({"gen_job_3_00000_.png": {"webp": [str(thumbnail)]}}, user, 3)
+
+    usage = service.get_user_storage_usage(user)
+    assert usage == {
+        "total_files": 5, "total_size_bytes": 500, "total_size_mb": 0.0, "generations": 5, "thumbnails": 1,
+    }
+    assert service.get_storage_statistics()["total_size_bytes"] == 507
+
+    assert service.cleanup_generation_files(3) == 6
+    assert service.get_user_storage_usage(user)["total_files"] == 0
+
+
+def test_cleanup_generation_files_catches_files_missing_from_the_index(service):
+    user = uuid4()
+    organized = service.organize_generation_files(
+        8, user, [str(write(service.base_output_dir / "gen_job_8_00001_.png"))], organize=True
+    )
+    # Written directly by ComfyUI/the thumbnailer after the index was last reconciled
+    unindexed = [
+        write(service.base_output_dir / "gen_job_8_00002_.png"),
+        write(service.thumbnails_dir / "gen_job_8_00002__150x150.webp"),
+        write(Path(organized[0]).parent / "gen_8_extra.png"),
+    ]
+    other = write(service.base_output_dir / "gen_job_80_00001_.png")
+
+    assert service.cleanup_generation_files(8) == 4
+    assert not any(path.exists() for path in unindexed + [Path(organized[0])])
+    assert other.exists()
+
+
+def test_organize_async_matches_sync(service):
+    user = uuid4()
+    sources = [str(write(service.base_output_dir / f"gen_job_4_{i:05d}_.png")) for i in range(3)]
+
+    organized = asyncio.run(service.organize_generation_files_async(4, user, sources, organize=True))
+
+    assert [os.path.basename(path) for path in organized] == [f"gen_4_gen_job_4_{i:05d}_.png" for i in range(3)]
+    assert service.get_user_storage_usage(user)["total_files"] == 3
+
+
+def test_cleanup_dry_run_reports_then_deletes_in_batches(service):
+    user = uuid4()
+    old_generation = write(service.base_output_dir / str(user) / "2025" / "01" / "01" / "gen_1_a.png", 100, age_days=60)
+    new_generation = write(service.base_output_dir / str(user) / "2026" / "01" / "01" / "gen_2_a.png", 100)
+    old_thumbnail = write(service.thumbnails_dir / "gen_1_a_150x150.webp", 10, age_days=60)
+    temp_files = [write(service.temp_dir / f"part_{i}.bin", 1) for i in range(3)]
+
+    report = service.cleanup_old_files(days_old=30, dry_run=True)
+
+    assert report["dry_run"] is True and report["files_scanned"] == 6
+    assert (report["generations_deleted"], report["thumbnails_deleted"], report["temp_files_deleted"]) == (1, 1, 3)
+    assert report["bytes_freed"] == 113
+    assert old_generation.exists() and all(path.exists() for path in temp_files)
+
+    stats = service.cleanup_old_files(days_old=30)
+
+    assert stats == {**report, "dry_run": False, "directories_removed": 3}
+    assert not old_generation.exists() and not old_thumbnail.exists() and new_generation.exists()
+    assert not (service.base_output_dir / str(user) / "2025").exists()
+    # The walk also reconciled the index with the disk
+    assert service.get_storage_statistics()["total_generations"] == 1
+    assert service.get_user_storage_usage(user)["total_size_bytes"] == 100
+
+
+def test_scan_tree_skips_the_index(tmp_path):
+    write(tmp_path / "a" / "b" / "file.png", 4)
+    write(tmp_path / ".storage_index.sqlite3", 8)
+
+    scanned = scan_tree(tmp_path, max_workers=2, skip=[".storage_index.sqlite3"])
+
+    assert [(path, size) for path, size, _ in scanned.files] == [("a/b/file.png", 4)]
+    assert scanned.directories == ["a", "a/b"]
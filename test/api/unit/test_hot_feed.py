@@ -0,0 +1,270 @@
+"""Unit tests for the materialized hot feed of the default gallery views."""
+
+import asyncio
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from genonaut.api.dependencies import ReadSession
+from genonaut.api.models.requests import PaginationRequest
+from genonaut.api.services import hot_feed
+from genonaut.api.services.hot_feed import COUNT_MEMBER, HotFeed, feed_scope
+
+ALL_SOURCES = ["user-regular", "user-auto", "community-regular", "community-auto"]
+BASE_TIME = datetime(2026, 1, 1, 12, 0, 0)
+
+
+class FakeRedis:
+    """Sorted-set subset of redis-py, with pipelines that run on execute()."""
+
+    def __init__(self):
+        self.zsets = {}
+        self.values = {}
+        self.expiry = {}
+
+    def get(self, key):
+        value = self.values.get(key)
+        return None if value is None else str(value)
+
+    def incr(self, key):
+        self.values[key] = self.values.get(key, 0) + 1
+        return self.values[key]
+
+    def zadd(self, key, mapping, xx=False, incr=False):
+        zset = self.zsets.get(key)
+        if incr:
+            (member, delta), = mapping.items()
+            if xx and (zset is None or member not in zset):
+                return None
+            zset = self.zsets.setdefault(key, {})
+            zset[member] = zset.get(member, 0.0) + delta
+            return zset[member]
+        zset = self.zsets.setdefault(key, {})
+        added = sum(1 for member in mapping if member not in zset)
+        zset.update(mapping)
+        return added
+
+    def _ordered(self, key):
+        return sorted(self.zsets.get(key, {}).items(), key=lambda item: (item[1], item[0]))
+
+    def zrevrange(self, key, start, stop):
+        members = [member for member, _ in reversed(self._ordered(key))]
+        return members[start:stop + 1]
+
+    def zscore(self, key, member):
+        return self.zsets.get(key, {}).get(member)
+
+    def zrem(self, key, member):
+        return int(self.zsets.get(key, {}).pop(member, None) is not None)
+
+    def zremrangebyrank(self, key, start, stop):
+        ordered = self._ordered(key)
+        stop = len(ordered) + stop if stop < 0 else stop
+        doomed = [member for member, _ in ordered[start:stop + 1]]
+        for member in doomed:
+            del self.zsets[key][member]
+        return len(doomed)
+
+    def delete(self, *keys):
+        return sum(1 for key in keys if (self.zsets.pop(key, None), self.values.pop(key, None)) != (None, None))
+
+    def expire(self, key, seconds):
+        self.expiry[key] = seconds
+
+    def scan_iter(self, match):
+        prefix = match.rstrip("*")
+        return [key for key in [*self.zsets, *self.values] if key.startswith(prefix)]
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, redis_client):
+        self.redis_client = redis_client
+        self.calls = []
+        self.immediate = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.calls = []
+
+    def watch(self, *keys):
+        # Like redis-py, commands run right away between WATCH and MULTI
+        self.immediate = True
+
+    def multi(self):
+        self.immediate = False
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            if self.immediate:
+                return getattr(self.redis_client, name)(*args, **kwargs)
+            self.calls.append((name, args, kwargs))
+        return queue
+
+    def execute(self):
+        return [getattr(self.redis_client, name)(*args, **kwargs) for name, args, kwargs in self.calls]
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE users (id TEXT PRIMARY KEY, username TEXT)"))
+        conn.execute(text("""
+            CREATE TABLE content_items_all (
+                id INTEGER, title TEXT, content_type TEXT, content_data TEXT, path_thumb TEXT,
+                path_thumbs_alt_res TEXT, prompt TEXT, creator_id TEXT, item_metadata TEXT,
+                is_private BOOLEAN, quality_score FLOAT, created_at DATETIME, updated_at DATETIME,
+                source_type TEXT, creator_username TEXT
+            )
+        """))
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+def page(feed, session, page, page_size, content_source_types, user_id):
+    pagination = PaginationRequest(page=page, page_size=page_size)
+    return asyncio.run(feed.page(ReadSession(session), pagination, content_source_types, user_id))
+
+
+def insert(session, content_id, source_type, creator_id, minutes, username=None):
+    created_at = BASE_TIME + timedelta(minutes=minutes)
+    session.execute(text("""
+        INSERT INTO content_items_all (id, title, content_type, content_data, prompt, creator_id,
+            is_private, quality_score, created_at, updated_at, source_type, creator_username)
+        VALUES (:id, :title, 'image', 'data', 'prompt', :creator_id, 0, 0.5, :created_at, :created_at,
+            :source_type, :username)
+    """), {"id": content_id, "title": f"item {content_id}", "creator_id": str(creator_id),
+           "created_at": created_at, "source_type": source_type, "username": username})
+    session.commit()
+    return created_at
+
+
+def test_feed_scope_covers_default_views_only():
+    user = uuid4()
+    assert feed_scope(ALL_SOURCES, user) == (("items", "auto"), None)
+    assert feed_scope(["user-regular", "community-regular"], user) == (("items",), None)
+    assert feed_scope(["user-regular", "user-auto"], user) == (("items", "auto"), user)
+    assert feed_scope(["community-regular", "community-auto"], user) is None
+    assert feed_scope(["user-regular", "community-regular", "community-auto"], user) is None
+    assert feed_scope(ALL_SOURCES, None) is None
+
+    feed = HotFeed(FakeRedis(), "test", depth=100)
+    page = PaginationRequest(page=4, page_size=25)
+    assert feed.serves(page, ALL_SOURCES, None, "created_at", "desc", None)
+    assert not feed.serves(PaginationRequest(page=5, page_size=25), ALL_SOURCES, None, "created_at", "desc", None)
+    assert not feed.serves(page, ALL_SOURCES, "cat", "created_at", "desc", None)
+    assert not feed.serves(page, ALL_SOURCES, None, "created_at", "desc", ["tag"])
+    assert not feed.serves(page, ALL_SOURCES, None, "quality_score", "desc", None)
+
+
+def test_page_rebuilds_missing_feed_then_serves_it(session):
+    user, other = uuid4(), uuid4()
+    for content_id, source_type, creator, minutes in [
+        (1, "items", user, 1), (2, "auto", other, 2), (3, "items", other, 2), (4, "auto", user, 4),
+    ]:
+        insert(session, content_id, source_type, creator, minutes, username="alice")
+    redis_client = FakeRedis()
+    feed = HotFeed(redis_client, "test", depth=3)
+
+    items, total = page(feed, session, 1, 2, ALL_SOURCES, user)
+
+    # created_at DESC, id DESC, like the SQL path
+    assert [item["id"] for item in items] == [4, 3]
+    assert total == 4
+    assert items[0]["creator_username"] == "alice" and items[0]["created_at"] == "2026-01-01T12:04:00"
+    key = feed.key(("items", "auto"))
+    assert redis_client.zscore(key, COUNT_MEMBER) == -4.0
+    assert len(redis_client.zsets[key]) == 4  # depth 3 plus the sentinel
+
+    # Served from Redis now: rows missing from the database mean "ask SQL"
+    session.execute(text("DELETE FROM content_items_all WHERE id = 3"))
+    assert page(feed, session, 1, 2, ALL_SOURCES, user) is None
+    # The second page reaches past the depth of the feed
+    assert page(feed, session, 2, 2, ALL_SOURCES, user) is None
+
+    own, own_total = page(feed, session, 1, 10, ["user-regular", "user-auto"], user)
+    assert [item["id"] for item in own] == [4, 1] and own_total == 2
+
+
+def test_add_and_remove_update_only_materialized_feeds(session):
+    user = uuid4()
+    insert(session, 1, "items", user, 1)
+    redis_client = FakeRedis()
+    feed = HotFeed(redis_client, "test", depth=2)
+    feed.rebuild(session, feed.key(("items", "auto")), ("items", "auto"))
+
+    created_at = insert(session, 2, "items", user, 5)
+    feed.add(2, "items", user, created_at)
+    created_at = insert(session, 3, "auto", user, 6)
+    feed.add(3, "auto", user, created_at)
+
+    key = feed.key(("items", "auto"))
+    assert redis_client.zrevrange(key, 0, 10) == ["000000000003:auto", "000000000002:items", COUNT_MEMBER]
+    assert redis_client.zscore(key, COUNT_MEMBER) == -3.0
+    # Feeds that were never built are not left behind half-filled
+    assert set(redis_client.zsets) == {key}
+
+    feed.remove(3, "auto", user)
+    assert redis_client.zrevrange(key, 0, 10) == ["000000000002:items", COUNT_MEMBER]
+    assert redis_client.zscore(key, COUNT_MEMBER) == -2.0
+
+
+def test_rebuild_never_overwrites_items_created_while_loading(session):
+    user = uuid4()
+    insert(session, 1, "items", user, 1)
+    redis_client = FakeRedis()
+    feed = HotFeed(redis_client, "test", depth=10)
+    key = feed.key(("items", "auto"))
+
+    # The rebuild reads its snapshot, then an item is created before the snapshot is stored
+    version = redis_client.get(feed.version_key(key))
+    snapshot = feed._load(session, ("items", "auto"))
+    created_at = insert(session, 2, "items", user, 5)
+    feed.add(2, "items", user, created_at)
+
+    assert feed._store(key, *snapshot, version) is False
+    assert key not in redis_client.zsets
+
+    # The next read rebuilds from a snapshot that includes the new item
+    items, total = page(feed, session, 1, 10, ALL_SOURCES, user)
+    assert [item["id"] for item in items] == [2, 1] and total == 2
+
+
+def test_update_failures_invalidate_feeds(monkeypatch):
+    redis_client = FakeRedis()
+    feed = HotFeed(redis_client, "test")
+    redis_client.zadd(feed.key(("items",)), {COUNT_MEMBER: -1.0})
+    monkeypatch.setattr(hot_feed, "get_hot_feed", lambda: feed)
+
+    def broken(*args, **kwargs):
+        raise ConnectionError("lost connection")
+
+    monkeypatch.setattr(feed, "remove", broken)
+    hot_feed.record_deleted(1, "items", uuid4())
+
+    assert redis_client.zsets == {}
+
+
+def test_hot_feed_page_only_serves_default_views(session, monkeypatch):
+    user = uuid4()
+    insert(session, 1, "items", user, 1)
+    feed = HotFeed(FakeRedis(), "test", depth=10)
+    monkeypatch.setattr(hot_feed, "get_hot_feed", lambda: feed)
+    query = dict(
+        pagination=PaginationRequest(page=1, page_size=10), content_source_types=ALL_SOURCES, user_id=user,
+        search_term=None, sort_field="created_at", sort_order="desc", tags=None,
+    )
+
+    items, total = asyncio.run(hot_feed.hot_feed_page(ReadSession(session), query))
+    assert [item["id"] for item in items] == [1] and total == 1
+    assert asyncio.run(hot_feed.hot_feed_page(ReadSession(session), {**query, "search_term": "cat"})) is None
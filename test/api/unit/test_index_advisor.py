@@ -0,0 +1,123 @@
+"""Unit tests for the gallery query index advisor."""
+
+from datetime import datetime
+from uuid import uuid4
+
+from genonaut.api.models.requests import PaginationRequest
+from genonaut.api.services.content_query_strategies import compile_content_query, content_query_shape
+from genonaut.api.services.index_advisor import (
+    IndexAdvisor,
+    PlanSummary,
+    dedupe_proposals,
+    is_served_by,
+    pattern_for_shape,
+    pattern_for_statement,
+    propose_indexes,
+    render_migration,
+)
+
+COMMUNITY = ["community-regular", "community-auto"]
+
+
+def test_deep_pages_select_keys_first_and_read_denormalized_username():
+    shape, _ = content_query_shape(
+        PaginationRequest(page=5, page_size=25), COMMUNITY, uuid4(), [], "any", None, "created_at", "desc",
+    )
+    page_sql = compile_content_query(shape).page_sql.text
+
+    assert ") AS page_keys" in page_sql
+    assert "COALESCE(\n                content_items_all.creator_username" in page_sql
+    assert "JOIN users" not in page_sql
+
+    first_page, _ = content_query_shape(
+        PaginationRequest(page=1, page_size=25), COMMUNITY, uuid4(), [], "any", None, "created_at", "desc",
+    )
+    assert "page_keys" not in compile_content_query(first_page).page_sql.text
+
+
+def test_proposals_cover_deep_community_pages_and_skip_served_ones():
+    pattern = pattern_for_shape(COMMUNITY, tuple(COMMUNITY), "created_at", "desc", deferred_join=True)
+    proposals = propose_indexes(pattern, reason="community feed")
+
+    assert [p.create_sql() for p in proposals] == [
+        "CREATE INDEX idx_content_items_created_at_id_cov ON content_items "
+        "(created_at DESC, id DESC) INCLUDE (creator_id, source_type)",
+        "CREATE INDEX idx_content_items_auto_created_at_id_cov ON content_items_auto "
+        "(created_at DESC, id DESC) INCLUDE (creator_id, source_type)",
+    ]
+    keyset = "CREATE INDEX idx_content_items_created_id_desc ON public.content_items USING btree (created_at DESC, id DESC)"
+    assert not is_served_by(proposals[0], keyset)
+    assert is_served_by(
+        proposals[0],
+        "CREATE INDEX x ON public.content_items USING btree (created_at, id, quality_score) INCLUDE (creator_id, source_type)",
+    )
+
+    # A first page returns the wide columns, so only the (already existing) sort key is proposed
+    first_page = propose_indexes(pattern_for_shape(COMMUNITY, tuple(COMMUNITY), "created_at", "desc", False))
+    assert first_page[0].include == () and is_served_by(first_page[0], keyset)
+    assert dedupe_proposals(proposals + first_page) == proposals
+
+
+def test_profiled_public_statement_gets_partial_index():
+    pattern = pattern_for_statement(
+        "SELECT content_items.id, content_items.title FROM content_items "
+        "WHERE content_items.is_private = false AND content_items.creator_id = ? "
+        "ORDER BY content_items.created_at DESC LIMIT ?"
+    )
+    (proposal,) = propose_indexes(pattern)
+
+    assert proposal.create_sql() == (
+        "CREATE INDEX idx_content_items_creator_id_created_at_pub ON content_items "
+        "(creator_id, created_at DESC) WHERE is_private = false"
+    )
+    assert is_served_by(
+        proposal,
+        "CREATE INDEX y ON public.content_items USING btree (creator_id, created_at DESC) WHERE (is_private = false)",
+    )
+    assert not is_served_by(proposal, "CREATE INDEX y ON public.content_items USING btree (creator_id, created_at DESC)")
+    assert pattern_for_statement("SELECT * FROM users WHERE id = ?") is None
+
+
+def test_profile_candidates_use_generic_plans():
+    report = {
+        "profiles": [{"repeated": [
+            {"fingerprint": "SELECT * FROM content_items WHERE content_items.creator_id = ?", "count": 8, "total_ms": 40.0},
+            {"fingerprint": "UPDATE content_items SET title = ? WHERE id = ?", "count": 6, "total_ms": 90.0},
+        ]}],
+    }
+    (candidate,) = IndexAdvisor(session=None).profile_candidates(report)
+
+    assert candidate.sql == "SELECT * FROM content_items WHERE content_items.creator_id = $1"
+    assert candidate.analyze is False and candidate.requests == 8 and candidate.avg_db_ms == 5.0
+
+
+def test_plan_summary_and_migration():
+    summary = PlanSummary.from_explain([{
+        "Planning Time": 0.4,
+        "Execution Time": 12.5,
+        "Plan": {
+            "Node Type": "Limit", "Shared Hit Blocks": 90, "Shared Read Blocks": 10,
+            "Plans": [{"Node Type": "Merge Append", "Plans": [
+                {"Node Type": "Index Only Scan", "Relation Name": "content_items",
+                 "Index Name": "idx_content_items_created_at_id_cov", "Heap Fetches": 3},
+                {"Node Type": "Sort", "Plans": [{"Node Type": "Seq Scan", "Relation Name": "content_items_auto"}]},
+            ]}],
+        },
+    }])
+    assert summary.execution_ms == 12.5
+    assert summary.shared_hit_blocks + summary.shared_read_blocks == 100
+    assert summary.heap_fetches == 3 and summary.sorts == 1
+    assert summary.scans == [
+        "Index Only Scan on content_items using idx_content_items_created_at_id_cov",
+        "Seq Scan on content_items_auto",
+    ]
+
+    proposals = propose_indexes(pattern_for_statement(
+        "SELECT id FROM content_items WHERE is_private = false ORDER BY created_at DESC, id DESC LIMIT ?"
+    ), reason="public feed")
+    source = render_migration(proposals, "abc123def456", "7d2e5b8c1f3a", created_at=datetime(2026, 1, 1))
+    compile(source, "migration.py", "exec")
+    assert "down_revision: Union[str, Sequence[str], None] = '7d2e5b8c1f3a'" in source
+    assert "postgresql_include=['id']" not in source
+    assert "postgresql_where=sa.text('is_private = false')" in source
+    assert "op.drop_index('idx_content_items_created_at_id_pub', table_name='content_items'" in source
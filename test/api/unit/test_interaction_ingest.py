@@ -0,0 +1,114 @@
+"""Unit tests for buffered view/like interaction ingestion."""
+
+import asyncio
+from uuid import uuid4
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from pydantic import ValidationError as PydanticValidationError
+
+from genonaut.api.models.requests import InteractionEventRequest
+from genonaut.api.routes import interactions
+from genonaut.api.services.interaction_ingest import InteractionIngestor, MemoryInteractionBuffer
+
+
+def _event(user_id, content_item_id, interaction_type="view"):
+    return {"user_id": user_id, "content_item_id": content_item_id, "interaction_type": interaction_type}
+
+
+class _RecordingWriter:
+    def __init__(self, fail_times=0):
+        self.batches = []
+        self.fail_times = fail_times
+
+    def __call__(self, events):
+        if self.fail_times:
+            self.fail_times -= 1
+            raise RuntimeError("database unavailable")
+        self.batches.append(events)
+        return {"inserted": len(events), "invalid": 0}
+
+
+class _BrokenRedisBuffer:
+    def enqueue_many(self, events):
+        raise ConnectionError("redis down")
+
+
+def test_repeat_views_are_collapsed_within_window_but_likes_are_not():
+    buffer = MemoryInteractionBuffer(dedupe_window_seconds=60)
+    user = str(uuid4())
+
+    accepted, duplicates = buffer.enqueue_many(
+        [_event(user, 1), _event(user, 1), _event(user, 2), _event(user, 1, "like"), _event(user, 1, "like")]
+    )
+
+    assert (accepted, duplicates) == (4, 1)
+    assert buffer.enqueue_many([_event(user, 1)]) == (0, 1)
+
+
+def test_flush_writes_in_batches_and_requeues_failed_batch():
+    user = str(uuid4())
+    writer = _RecordingWriter(fail_times=1)
+    ingestor = InteractionIngestor(batch_size=2, write_batch=writer)
+    ingestor.fallback.enqueue_many([dict(_event(user, i), ts=0.0) for i in range(5)])
+
+    with pytest.raises(RuntimeError):
+        ingestor.flush()
+    assert len(ingestor.fallback) == 5
+
+    totals = ingestor.flush()
+
+    assert totals["inserted"] == 5
+    assert totals["batches"] == 3
+    assert [len(batch) for batch in writer.batches] == [2, 2, 1]
+    assert [event["content_item_id"] for batch in writer.batches for event in batch] == [0, 1, 2, 3, 4]
+    assert all("created_at" in event and "ts" not in event for batch in writer.batches for event in batch)
+
+
+def test_submit_falls_back_to_memory_when_redis_is_down():
+    writer = _RecordingWriter()
+    ingestor = InteractionIngestor(
+        primary=_BrokenRedisBuffer(), write_batch=writer, flush_interval_seconds=60
+    )
+    user = uuid4()
+
+    try:
+        assert ingestor.submit([_event(user, 7, "like")]) == (1, 0)
+        assert len(ingestor.fallback) == 1
+    finally:
+        ingestor.stop()
+
+    assert writer.batches[0][0]["user_id"] == str(user)
+    assert len(ingestor.fallback) == 0
+
+
+def test_event_request_rejects_ratings():
+    with pytest.raises(PydanticValidationError):
+        InteractionEventRequest(user_id=uuid4(), content_item_id=1, interaction_type="rate")
+
+
+def test_events_route_submits_off_the_event_loop(monkeypatch):
+    submitted = []
+
+    class _Ingestor:
+        def submit(self, events):
+            try:
+                asyncio.get_running_loop()
+                on_loop = True
+            except RuntimeError:
+                on_loop = False
+            submitted.append((list(events), on_loop))
+            return len(submitted[-1][0]), 0
+
+    monkeypatch.setattr(interactions, "get_interaction_ingestor", lambda: _Ingestor())
+    app = FastAPI()
+    app.include_router(interactions.router)
+    user = uuid4()
+
+    response = TestClient(app).post("/api/v1/interactions/events", json={"events": [_event(str(user), 3)]})
+
+    assert response.status_code == 202 and response.json()["accepted"] == 1
+    (events, on_loop), = submitted
+    assert on_loop is False
+    assert events[0]["user_id"] == str(user) and events[0]["content_item_id"] == 3
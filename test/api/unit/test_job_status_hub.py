@@ -0,0 +1,145 @@
+"""Unit tests for the shared job status pub/sub hub."""
+
+import asyncio
+import fnmatch
+import json
+
+from genonaut.api.services.job_status_hub import JobStatusHub, JobStatusSubscription
+
+
+class FakePubSub:
+    def __init__(self, broker):
+        self.broker = broker
+        self.patterns = []
+        self.messages = asyncio.Queue()
+
+    async def psubscribe(self, *patterns):
+        self.patterns.extend(patterns)
+        self.broker.pubsubs.append(self)
+
+    async def listen(self):
+        while True:
+            yield await self.messages.get()
+
+    async def aclose(self):
+        self.broker.pubsubs.remove(self)
+
+
+class FakeAsyncRedis:
+    """In-memory stand-in for an async Redis client with pattern pub/sub."""
+
+    def __init__(self):
+        self.pubsubs = []
+        self.connections = 0
+        self.streams = {}
+        self._sequence = 0
+
+    def xadd(self, key, fields):
+        self._sequence += 1
+        event_id = f"1000-{self._sequence}"
+        self.streams.setdefault(key, []).append((event_id, dict(fields)))
+        return event_id
+
+    async def xrange(self, key, min="-", max="+"):
+        entries = self.streams.get(key, [])
+        if min == "-":
+            return list(entries)
+        floor = tuple(int(part) for part in min.split("-"))
+        return [entry for entry in entries if tuple(int(part) for part in entry[0].split("-")) >= floor]
+
+    def pubsub(self, ignore_subscribe_messages=False):
+        self.connections += 1
+        return FakePubSub(self)
+
+    def publish(self, channel, data):
+        receivers = 0
+        for pubsub in self.pubsubs:
+            for pattern in pubsub.patterns:
+                if fnmatch.fnmatchcase(channel, pattern):
+                    pubsub.messages.put_nowait(
+                        {"type": "pmessage", "pattern": pattern, "channel": channel, "data": data}
+                    )
+                    receivers += 1
+        return receivers
+
+
+def _update(job_id, status):
+    return json.dumps({"job_id": job_id, "status": status})
+
+
+def test_hub_uses_one_pattern_subscription_for_many_subscribers():
+    redis = FakeAsyncRedis()
+
+    async def scenario():
+        hub = JobStatusHub(redis_factory=lambda: redis, namespace="test")
+        subs = [await hub.subscribe([index % 10]) for index in range(200)]
+
+        redis.publish("test:job:3", _update(3, "processing"))
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        received = [sub.queue.qsize() for sub in subs]
+        await hub.stop()
+        return hub, received
+
+    hub, received = asyncio.run(scenario())
+
+    assert redis.connections == 1
+    assert redis.pubsubs == []
+    assert sum(received) == 20
+    assert all(count == 1 for index, count in enumerate(received) if index % 10 == 3)
+
+
+def test_multi_job_subscription_receives_each_job_once():
+    redis = FakeAsyncRedis()
+
+    async def scenario():
+        hub = JobStatusHub(redis_factory=lambda: redis, namespace="test")
+        sub = await hub.subscribe([1, 2])
+        redis.publish("test:job:1", _update(1, "started"))
+        redis.publish("test:job:2", _update(2, "completed"))
+        redis.publish("test:job:3", _update(3, "failed"))
+        redis.publish("other:job:1", _update(1, "ignored"))
+        first = await asyncio.wait_for(sub.get(), 1)
+        second = await asyncio.wait_for(sub.get(), 1)
+        pending = sub.queue.qsize()
+        await hub.stop()
+        return first, second, pending
+
+    first, second, pending = asyncio.run(scenario())
+
+    assert first == (1, _update(1, "started"))
+    assert second == (2, _update(2, "completed"))
+    assert pending == 0
+
+
+def test_slow_consumer_drops_oldest_updates():
+    async def scenario():
+        sub = JobStatusSubscription([7], queue_size=3)
+        for progress in range(10):
+            sub.deliver(7, str(progress))
+        return sub, [sub.queue.get_nowait()[1] for _ in range(sub.queue.qsize())]
+
+    sub, pending = asyncio.run(scenario())
+
+    assert pending == ["7", "8", "9"]
+    assert sub.dropped == 7
+
+
+def test_unsubscribe_discards_empty_job_sets():
+    async def scenario():
+        hub = JobStatusHub(redis_factory=FakeAsyncRedis, namespace="test")
+        first = await hub.subscribe([1, 2])
+        second = await hub.subscribe([2])
+        hub.unsubscribe(first)
+        remaining = dict(hub.subscribers)
+        delivered = hub.dispatch("test:job:2", _update(2, "processing"))
+        hub.unsubscribe(second)
+        await hub.stop()
+        return remaining, delivered, hub
+
+    remaining, delivered, hub = asyncio.run(scenario())
+
+    assert set(remaining) == {2}
+    assert delivered == 1
+    assert hub.subscriber_count == 0
@@ -0,0 +1,42 @@
+"""Unit tests for orjson response rendering and the content row serializer."""
+
+import json
+from datetime import datetime
+from decimal import Decimal
+from uuid import uuid4
+
+from genonaut.api.utils.json_response import (
+    CONTENT_ROW_FIELDS,
+    FastJSONResponse,
+    PreSerializedJSON,
+    dumps,
+    serialize_content_row,
+)
+
+
+def test_dumps_splices_pre_serialized_values_verbatim():
+    items = PreSerializedJSON(b'[{"id":1,"created_at":"2024-01-02T03:04:05.12"}]', length=1)
+
+    body = dumps({"items": items, "pagination": {"page": 1, "score": Decimal("0.5")}})
+
+    assert len(items) == 1
+    assert body.startswith(b'{"items":[{"id":1,"created_at":"2024-01-02T03:04:05.12"}],')
+    assert json.loads(body)["pagination"] == {"page": 1, "score": 0.5}
+
+
+def test_serialize_content_row_matches_previous_dict_format():
+    creator_id = uuid4()
+    created_at = datetime(2024, 1, 2, 3, 4, 5, 120000)
+    row = (
+        7, "Title", "image", "/img.png", "/thumb.png", {"512x768": "/t.png"}, "a prompt", creator_id,
+        {"style": "x"}, False, 0.75, created_at, None, "auto", "alice",
+    )
+
+    item = serialize_content_row(row)
+
+    assert set(item) == set(CONTENT_ROW_FIELDS)
+    assert item["creator_id"] == str(creator_id)
+    assert item["created_at"] == created_at.isoformat()
+    assert item["updated_at"] is None
+    assert (item["source_type"], item["creator_username"]) == ("auto", "alice")
+    assert json.loads(FastJSONResponse({"items": [item]}).body)["items"][0] == item
@@ -0,0 +1,133 @@
+"""Unit tests for the object storage backends and image serving through them.
+
+The S3 backend runs against moto's in-process S3 stand-in.
+"""
+
+import os
+
+import boto3
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from moto import mock_aws
+from PIL import Image
+
+from genonaut.api.config import override_settings
+from genonaut.api.dependencies import get_database_session, get_read_session
+from genonaut.api.routes import images
+from genonaut.api.services.object_storage import LocalObjectStorage, ObjectStorage, S3ObjectStorage
+
+BUCKET = "genonaut-images"
+MB = 1024 * 1024
+
+
+@pytest.fixture
+def s3_client(monkeypatch):
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    with mock_aws():
+        client = boto3.client("s3", region_name="us-east-1")
+        client.create_bucket(Bucket=BUCKET)
+        yield client
+
+
+def s3_storage(root, client, **kwargs):
+    return S3ObjectStorage(root, BUCKET, prefix="outputs", client=client, **kwargs)
+
+
+def write_image(path, color="red"):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    Image.new("RGB", (400, 300), color=color).save(path, "PNG")
+    return path
+
+
+def test_local_backend_keys_urls_and_deletes(tmp_path):
+    storage = LocalObjectStorage(tmp_path)
+    image = write_image(tmp_path / "user" / "gen_1_a.png")
+    outside = write_image(tmp_path.parent / f"{tmp_path.name}-outside.png")
+
+    assert storage.key_for(image) == "user/gen_1_a.png"
+    assert storage.key_for(outside) is None
+    assert storage.key_for(tmp_path / ".." / outside.name) is None
+    storage.put_file(image, "user/gen_1_a.png")  # Already in place: no copy
+    assert storage.stat("user/gen_1_a.png").size == image.stat().st_size
+    assert storage.url("user/gen_1_a.png") is None  # Served by the API
+
+    public = LocalObjectStorage(tmp_path, public_url="https://cdn.example.com/images/")
+    assert public.url("user/gen 1.png") == "https://cdn.example.com/images/user/gen%201.png"
+
+    storage.put_file(outside, "thumbnails/gen_1_a_150x150.webp")
+    assert storage.list("thumbnails/gen_1_a_") == ["thumbnails/gen_1_a_150x150.webp"]
+    assert storage.delete(["thumbnails/gen_1_a_150x150.webp", "thumbnails/missing.webp"]) == 1
+    assert storage.list("thumbnails/") == []
+
+    with pytest.raises(TypeError):
+        ObjectStorage(tmp_path)
+
+
+def test_s3_backend_uploads_large_files_in_parallel_parts(tmp_path, s3_client):
+    storage = s3_storage(tmp_path, s3_client, multipart_threshold_mb=5, multipart_chunk_mb=5, upload_workers=4)
+    data = os.urandom(11 * MB)
+    (tmp_path / "gen_2_big.png").write_bytes(data)
+    small = write_image(tmp_path / "thumbnails" / "gen_2_big_150x150.webp")
+
+    assert storage.put_files([(tmp_path / "gen_2_big.png", "gen_2_big.png"), (small, "thumbnails/gen_2_big_150x150.webp")]) == 2
+
+    head = s3_client.head_object(Bucket=BUCKET, Key="outputs/gen_2_big.png")
+    assert head["ContentLength"] == len(data) and head["ContentType"] == "image/png"
+    assert head["ETag"].strip('"').endswith("-3")  # Three 5 MB parts
+    assert storage.list("thumbnails/") == ["thumbnails/gen_2_big_150x150.webp"]
+
+    assert storage.download("gen_2_big.png", tmp_path / "copy" / "big.png")
+    assert (tmp_path / "copy" / "big.png").read_bytes() == data
+    assert not storage.download("missing.png", tmp_path / "copy" / "missing.png")
+    assert storage.stat("missing.png") is None
+
+    url = storage.url("gen_2_big.png")
+    assert f"{BUCKET}.s3.amazonaws.com/outputs/gen_2_big.png?" in url and "Signature=" in url
+
+    assert storage.delete(["gen_2_big.png", "thumbnails/gen_2_big_150x150.webp"]) == 2
+    assert storage.list("") == []
+    assert not storage.exists("gen_2_big.png")
+
+
+def test_serve_image_redirects_to_s3_and_builds_missing_thumbnails(tmp_path, s3_client, monkeypatch):
+    output_dir = tmp_path / "output"
+    remote_only = write_image(tmp_path / "staging" / "gen_3_a.png", color="blue")
+    storage = s3_storage(output_dir, s3_client, presign_expires_seconds=600)
+    storage.put_file(remote_only, "gen_3_a.png")
+
+    app = FastAPI()
+    app.include_router(images.router)
+    app.dependency_overrides[get_read_session] = lambda: None
+    app.dependency_overrides[get_database_session] = lambda: None
+
+    with override_settings(comfyui_output_dir=str(output_dir)):
+        monkeypatch.setattr("genonaut.api.services.thumbnail_service.get_object_storage", lambda: storage)
+        client = TestClient(app)
+
+        response = client.get("/api/v1/images/gen_3_a.png", follow_redirects=False)
+        assert response.status_code == 307
+        assert "outputs/gen_3_a.png" in response.headers["location"]
+        assert response.headers["cache-control"] == "private, max-age=300"
+
+        # The original only exists in the bucket: it is fetched, thumbnailed, and the thumbnail uploaded
+        response = client.get("/api/v1/images/gen_3_a.png?thumbnail=small", follow_redirects=False)
+        assert response.status_code == 307
+        assert "outputs/thumbnails/gen_3_a_150x150.webp" in response.headers["location"]
+        assert storage.stat("thumbnails/gen_3_a_150x150.webp") is not None
+
+        # Files not in the bucket are still served from disk
+        write_image(output_dir / "local_only.png")
+        response = client.get("/api/v1/images/local_only.png", follow_redirects=False)
+        assert response.status_code == 200 and response.headers["content-type"] == "image/png"
+
+        assert client.get("/api/v1/images/nothing.png", follow_redirects=False).status_code == 404
+
+        # Deleting thumbnails removes the local copy and the uploaded and remote-only objects
+        storage.put_file(write_image(tmp_path / "staging" / "large.webp"), "thumbnails/gen_3_a_600x600.webp")
+        response = client.delete("/api/v1/images/thumbnails/gen_3_a.png")
+        assert response.json() == {"success": True, "message": "Deleted 2 thumbnails for gen_3_a.png"}
+        assert storage.list("thumbnails/gen_3_a_") == []
+        assert not (output_dir / "thumbnails" / "gen_3_a_150x150.webp").exists()
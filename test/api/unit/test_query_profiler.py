@@ -0,0 +1,98 @@
+"""Unit tests for the request-scoped SQL profiler."""
+
+import asyncio
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import StaticPool
+
+from genonaut.api.config import override_settings
+from genonaut.api.middleware import query_profiler as profiler_middleware
+from genonaut.api.middleware.query_profiler import QueryProfilerMiddleware
+from genonaut.api.routes.system import get_sql_profile
+from genonaut.api.utils import query_profiler
+from genonaut.api.utils.query_profiler import fingerprint, profile_queries
+
+
+def make_engine():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)"))
+        conn.execute(text("INSERT INTO items (id, name) VALUES (1, 'a'), (2, 'b'), (3, 'c')"))
+    return engine
+
+
+def test_fingerprint_ignores_values():
+    assert fingerprint("SELECT * FROM items WHERE id = %(id_1)s") == fingerprint(
+        "SELECT *  FROM items\n WHERE id = 42"
+    )
+    assert fingerprint("SELECT * FROM t WHERE name = 'x' AND id IN (%(id_1_1)s, %(id_1_2)s)") == (
+        "SELECT * FROM t WHERE name = ? AND id IN (?)"
+    )
+    assert fingerprint("INSERT INTO t (a, b) VALUES ($1, $2), ($3, $4), ($5, $6)") == (
+        "INSERT INTO t (a, b) VALUES (?)"
+    )
+    assert fingerprint("SELECT t1.id FROM t1") == "SELECT t1.id FROM t1"
+
+
+def test_profile_records_queries_in_context_only():
+    engine = make_engine()
+
+    with profile_queries("GET", "/items", slowest_limit=2) as profile:
+        with engine.connect() as conn:
+            for item_id in (1, 2, 3):
+                conn.execute(text("SELECT name FROM items WHERE id = :id"), {"id": item_id})
+            conn.execute(text("SELECT COUNT(*) FROM items"))
+
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+    assert profile.query_count == 4
+    assert profile.db_time_ms > 0
+    assert len(profile.slowest) == 2
+    repeated = profile.repeated(3)
+    assert [stats.count for stats in repeated] == [3]
+    assert repeated[0].fingerprint == "SELECT name FROM items WHERE id = ?"
+    assert profile.server_timing().startswith("db;dur=")
+    assert profile.to_dict(3)["n_plus_one"] is True
+
+
+def test_middleware_adds_server_timing_and_keeps_profiles(monkeypatch):
+    engine = make_engine()
+    query_profiler.clear_profiles()
+    app = FastAPI()
+    app.add_middleware(QueryProfilerMiddleware)
+
+    @app.get("/api/items")
+    def list_items():
+        with engine.connect() as conn:
+            return [conn.execute(text("SELECT name FROM items WHERE id = :id"), {"id": i}).scalar() for i in (1, 2, 3)]
+
+    client = TestClient(app)
+
+    with override_settings(sql_profiler={"enabled": False}):
+        assert "server-timing" not in client.get("/api/items").headers
+    assert query_profiler.recent_profiles() == []
+
+    with override_settings(sql_profiler={"enabled": True, "n_plus_one_threshold": 3}):
+        response = client.get("/api/items")
+        assert response.json() == ["a", "b", "c"]
+        assert response.headers["server-timing"].endswith('desc="3 queries"')
+
+        report = asyncio.run(get_sql_profile(limit=10, path=None, n_plus_one_only=True))
+
+    assert report.enabled is True
+    assert [profile["path"] for profile in report.profiles] == ["/api/items"]
+    assert report.profiles[0]["status_code"] == 200
+    assert report.n_plus_one_statements[0]["executions"] == 3
+    assert report.n_plus_one_statements[0]["routes"] == ["GET /api/items"]
+    query_profiler.clear_profiles()
+
+
+def test_profiler_settings_defaults():
+    with override_settings(sql_profiler=None):
+        config = profiler_middleware.profiler_settings()
+
+    assert config["enabled"] is False
+    assert config["n_plus_one_threshold"] == 5
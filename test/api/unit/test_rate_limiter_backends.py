@@ -0,0 +1,165 @@
+"""Unit tests for the in-process and Redis-backed rate limiters."""
+
+import time
+from types import SimpleNamespace
+
+import fakeredis
+import pytest
+
+from genonaut.api.services import security_service
+from genonaut.api.services.security_service import (
+    RateLimiter,
+    RedisRateLimiter,
+    SecurityService,
+    create_rate_limiter,
+)
+
+
+class FakeClock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(security_service.time, "time", fake.time)
+    return fake
+
+
+class FakeRedis:
+    """Minimal Redis stand-in that evaluates the limiter script in Python."""
+
+    def __init__(self, clock, fail=False):
+        self.clock = clock
+        self.fail = fail
+        self.calls = 0
+        self.store = {}
+
+    def register_script(self, script):
+        def run(keys, args):
+            self.calls += 1
+            if self.fail:
+                raise ConnectionError("redis down")
+            interval, window = int(args[0]), int(args[1])
+            now = int(self.clock.now * 1000)
+            tat = max(self.store.get(keys[0], now), now)
+            new_tat = tat + interval
+            allow_at = new_tat - window
+            if now < allow_at:
+                return [0, 0, allow_at - now]
+            self.store[keys[0]] = new_tat
+            return [1, (window - (new_tat - now)) // interval, 0]
+
+        return run
+
+
+def test_in_process_limiter_enforces_limit_within_window(clock):
+    limiter = RateLimiter()
+
+    results = [limiter.check("ip:1", limit=3, window_seconds=60) for _ in range(4)]
+
+    assert [allowed for allowed, _, _ in results] == [True, True, True, False]
+    assert [remaining for _, remaining, _ in results[:3]] == [2, 1, 0]
+    assert results[3][2] > 0
+
+
+def test_in_process_limiter_frees_capacity_after_window(clock):
+    limiter = RateLimiter()
+    for _ in range(3):
+        limiter.check("ip:1", limit=3, window_seconds=60)
+
+    clock.now += 61
+
+    assert limiter.check("ip:1", limit=3, window_seconds=60)[0] is True
+
+
+def test_in_process_limiter_memory_is_bounded(clock):
+    limiter = RateLimiter(max_identifiers=100)
+
+    for index in range(1000):
+        limiter.is_allowed(f"ip:{index}", limit=10, window_minutes=1)
+
+    assert len(limiter.requests) == 100
+    assert "ip:999" in limiter.requests
+    assert "ip:0" not in limiter.requests
+
+
+def test_in_process_limiter_stats(clock):
+    limiter = RateLimiter()
+    for _ in range(5):
+        limiter.is_allowed("user:a", limit=100, window_minutes=60)
+
+    stats = limiter.get_stats("user:a")
+
+    assert stats["requests_last_1hour"] == 5
+    assert stats["total_tracked_requests"] == 5
+
+
+def test_redis_limiter_uses_single_script_call_per_check(clock):
+    redis_client = FakeRedis(clock)
+    limiter = RedisRateLimiter(redis_client, key_prefix="test:ratelimit")
+
+    results = [limiter.check("ip:1", limit=2, window_seconds=60) for _ in range(3)]
+
+    assert [allowed for allowed, _, _ in results] == [True, True, False]
+    assert redis_client.calls == 3
+    assert results[2][2] == pytest.approx(30.0)
+
+
+def test_redis_limiter_script_enforces_limit_and_resets_after_window():
+    redis_client = fakeredis.FakeRedis()
+    limiter = RedisRateLimiter(redis_client, key_prefix="test:ratelimit")
+
+    results = [limiter.check("ip:1", limit=2, window_seconds=0.4) for _ in range(3)]
+
+    assert [(allowed, remaining) for allowed, remaining, _ in results] == [(True, 1), (True, 0), (False, 0)]
+    assert 0 < results[2][2] <= 0.2
+    assert limiter.check("ip:2", limit=2, window_seconds=0.4)[0] is True
+    # The limiter state expires on its own once the identifier goes idle
+    assert 0 < redis_client.pttl("test:ratelimit:ip:1:400") <= 400
+
+    time.sleep(0.45)
+
+    assert limiter.check("ip:1", limit=2, window_seconds=0.4)[:2] == (True, 1)
+
+
+def test_redis_limiter_falls_back_when_redis_fails(clock):
+    redis_client = FakeRedis(clock, fail=True)
+    limiter = RedisRateLimiter(redis_client, fallback=RateLimiter(), retry_interval_seconds=30)
+
+    first = limiter.check("ip:1", limit=1, window_seconds=60)
+    second = limiter.check("ip:1", limit=1, window_seconds=60)
+
+    assert first[0] is True
+    assert second[0] is False
+    # Redis is not retried until the retry interval passes
+    assert redis_client.calls == 1
+
+    redis_client.fail = False
+    clock.now += 31
+    assert limiter.check("ip:2", limit=1, window_seconds=60)[0] is True
+    assert redis_client.calls == 2
+
+
+def test_create_rate_limiter_without_redis_url_uses_in_process():
+    settings = SimpleNamespace(rate_limit_backend="redis", redis_url=None, redis_ns="test", rate_limit_max_identifiers=5)
+
+    limiter = create_rate_limiter(settings)
+
+    assert isinstance(limiter, RateLimiter)
+    assert limiter.max_identifiers == 5
+
+
+def test_security_service_reports_retry_after_from_backend(clock):
+    service = SecurityService(rate_limiter=RedisRateLimiter(FakeRedis(clock)))
+
+    for _ in range(60):
+        service.check_rate_limit("u1", "api_request")
+    allowed, _, retry_after = service.check_rate_limit("u1", "api_request")
+
+    assert allowed is False
+    assert retry_after == 1
@@ -0,0 +1,153 @@
+"""Unit tests for the vectorized recommendation engine."""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from genonaut.api.services import recommendation_service
+from genonaut.api.services.recommendation_engine import CSRMatrix, fit_model, interaction_weights
+from genonaut.api.services.recommendation_service import RecommendationService
+
+
+def test_csr_matrix_sums_duplicates_and_multiplies():
+    matrix = CSRMatrix.from_coo([0, 0, 2, 0], [1, 1, 0, 2], [1.0, 2.0, 3.0, 4.0], (3, 3))
+    dense = np.array([[0, 3, 4], [0, 0, 0], [3, 0, 0]], dtype=np.float32)
+
+    np.testing.assert_array_equal(matrix.rows_dense(np.arange(3)), dense)
+    np.testing.assert_array_equal(matrix.transpose().rows_dense(np.arange(3)), dense.T)
+
+    vectors = np.arange(6, dtype=np.float32).reshape(3, 2)
+    np.testing.assert_allclose(matrix.dot(vectors), dense @ vectors)
+    # Row blocks bound the temporary products without changing the result
+    for max_products in (1, 2, 5):
+        np.testing.assert_allclose(matrix.dot(vectors, max_products=max_products), dense @ vectors)
+
+    other = CSRMatrix.from_coo([0, 1, 2], [1, 0, 1], [2.0, 1.0, 5.0], (3, 2))
+    np.testing.assert_allclose(matrix.sparse_dot(other).rows_dense(np.arange(3)), dense @ other.rows_dense(np.arange(3)))
+
+
+def test_interaction_weights_use_ratings_for_rate_rows():
+    weights = interaction_weights(["view", "like", "rate", "rate", "unknown"], [2, 1, 1, 1, 3], [None, None, 5, 1, None])
+
+    np.testing.assert_allclose(weights, [2.0, 3.0, 3.0, 0.0, 0.0])
+
+
+def _fit(**kwargs):
+    # Users 0/1 share taste (items 1-3), user 2 likes items 4-6, user 3 is new
+    interactions = (
+        [0, 0, 1, 1, 1, 2, 2],
+        [1, 2, 1, 2, 3, 4, 5],
+        [3.0] * 7,
+    )
+    item_tags = ([1, 2, 3, 4, 5, 6], ["cats", "cats", "cats", "dogs", "dogs", "dogs"])
+    return fit_model([0, 1, 2, 3], [1, 2, 3, 4, 5, 6], interactions, item_tags, rank=2, **kwargs)
+
+
+def test_recommendations_exclude_seen_items_and_follow_taste():
+    model = _fit()
+
+    results = {row: (list(items), scores) for row, items, scores in model.recommend(top_k=2, batch_size=2)}
+
+    assert set(results) == {0, 1, 2, 3}
+    assert results[0][0][0] == 3  # co-liked by the similar user and same tag
+    assert not {1, 2} & set(results[0][0])
+    assert results[2][0][0] == 6
+    for items, scores in results.values():
+        assert np.all((scores >= 0.0) & (scores <= 1.0))
+        assert list(scores) == sorted(scores, reverse=True)
+
+
+def test_favorite_tags_steer_cold_start_users():
+    model = _fit(favorite_tags={3: ["dogs"]})
+
+    (row, items, _), = model.recommend(top_k=3, user_rows=np.array([3]))
+
+    assert row == 3
+    assert set(items) == {4, 5, 6}
+
+
+def test_top_k_is_capped_by_unseen_candidates():
+    model = _fit()
+
+    (_, items, scores), = model.recommend(top_k=10, user_rows=np.array([0]))
+
+    assert sorted(items) == [3, 4, 5, 6]
+    assert np.all(np.isfinite(scores))
+
+
+class FakeRecommendationRepository:
+    """In-memory stand-in for the repository calls made when fitting and storing."""
+
+    def __init__(self):
+        self.aggregates = [(0, 1, "like", 1, None), (0, 2, "like", 1, None), (1, 1, "like", 1, None),
+                           (1, 2, "like", 1, None), (1, 3, "like", 1, None), (2, 4, "like", 1, None)]
+        self.fits = 0
+        self.stored = {}
+
+    def get_active_user_profiles(self):
+        self.fits += 1
+        return [(0, None), (1, None), (2, ["dogs"])]
+
+    def get_interaction_aggregates(self):
+        return self.aggregates
+
+    def get_candidate_content_ids(self):
+        return [1, 2, 3, 4, 5, 6]
+
+    def stream_candidate_content_tags(self, batch_size=50000):
+        yield [(1, "cats"), (2, "cats"), (3, "cats")]
+        yield [(4, "dogs"), (5, "dogs"), (6, "dogs")]
+
+    def get_interacted_content_ids(self, user_id):
+        return sorted({item for user, item, *_ in self.aggregates if user == user_id})
+
+    def replace_unserved_recommendations(self, user_ids, algorithm_version, rows):
+        for user_id in user_ids:
+            self.stored[user_id] = [row["content_item_id"] for row in rows if row["user_id"] == user_id]
+        return len(rows)
+
+    def get_unserved_recommendations(self, user_id, limit, algorithm_version):
+        return self.stored.get(user_id, [])[:limit]
+
+
+@pytest.fixture
+def service(monkeypatch):
+    monkeypatch.setattr(recommendation_service, "_MODEL", None)
+    service = RecommendationService.__new__(RecommendationService)
+    service.repository = FakeRecommendationRepository()
+    service.user_repository = SimpleNamespace(get_or_404=lambda user_id: SimpleNamespace(is_active=True))
+    return service
+
+
+def test_single_user_requests_reuse_the_fitted_model(service):
+    assert service.generate_recommendations_for_user(0, "v1", limit=2)[0] == 3
+    assert service.repository.fits == 1
+
+    # Interactions recorded after the fit are excluded without refitting
+    service.repository.aggregates.append((0, 3, "view", 1, None))
+    recommended = service.generate_recommendations_for_user(0, "v1", limit=2)
+
+    assert service.repository.fits == 1
+    assert 3 not in recommended and len(recommended) == 2
+
+
+def test_single_user_requests_refit_a_stale_model(service, monkeypatch):
+    service.generate_recommendations_for_user(2, "v1", limit=2)
+    monkeypatch.setattr(recommendation_service, "get_settings", lambda: SimpleNamespace(recommendation_model_ttl_seconds=0))
+
+    service.generate_recommendations_for_user(2, "v1", limit=2)
+
+    assert service.repository.fits == 2
+    assert set(service.repository.stored[2]) <= {5, 6}
+
+
+def test_users_missing_from_the_model_get_popular_items_without_a_refit(service):
+    service.generate_recommendations_for_user(0, "v1", limit=2)
+    # User 9 signed up after the fit
+    service.repository.aggregates.append((9, 1, "view", 1, None))
+
+    recommended = service.generate_recommendations_for_user(9, "v1", limit=2)
+
+    assert service.repository.fits == 1
+    assert recommended == [2, 3]
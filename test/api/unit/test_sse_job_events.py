@@ -0,0 +1,95 @@
+"""Unit tests for the Server-Sent Events job status stream."""
+
+import asyncio
+import json
+
+from genonaut.api.routes import sse
+from genonaut.api.services import job_status_hub
+from genonaut.api.services.job_status_hub import JobStatusHub
+from test.api.unit.test_job_status_hub import FakeAsyncRedis
+
+
+class FakeRequest:
+    async def is_disconnected(self):
+        return False
+
+
+def _publish(redis, job_id, status):
+    """Mirror publish_job_update: record history, then publish with the event ID."""
+    message = {"job_id": job_id, "status": status}
+    event_id = redis.xadd(f"test:job:{job_id}:history", {"data": json.dumps(message)})
+    redis.publish(f"test:job:{job_id}", json.dumps({**message, "event_id": event_id}))
+    return event_id
+
+
+def _collect(redis, job_ids, last_event_id=None, publish=None):
+    async def scenario():
+        hub = JobStatusHub(redis_factory=lambda: redis, namespace="test")
+        job_status_hub._HUB = hub
+        frames = []
+        stream = sse.job_event_stream(FakeRequest(), job_ids, last_event_id)
+        frames.append(await stream.__anext__())
+        if publish:
+            publish()
+
+        async def drain():
+            async for frame in stream:
+                frames.append(frame)
+
+        await asyncio.wait_for(drain(), 1)
+        await hub.stop()
+        return frames, hub
+
+    try:
+        return asyncio.run(scenario())
+    finally:
+        job_status_hub._HUB = None
+
+
+def _events(frames):
+    events = []
+    for frame in frames:
+        fields = dict(line.split(": ", 1) for line in frame.strip().splitlines() if not line.startswith(":"))
+        if "data" in fields:
+            events.append((fields.get("id"), json.loads(fields["data"])))
+    return events
+
+
+def test_event_cursor_round_trip():
+    cursor = sse.parse_event_cursor("2:1000-5, 1:1000-3,bogus")
+
+    assert cursor == {1: "1000-3", 2: "1000-5"}
+    assert sse.format_event_cursor(cursor) == "1:1000-3,2:1000-5"
+
+
+def test_stream_relays_live_updates_until_jobs_finish():
+    redis = FakeAsyncRedis()
+
+    def publish():
+        _publish(redis, 1, "processing")
+        _publish(redis, 2, "completed")
+        _publish(redis, 1, "completed")
+
+    frames, hub = _collect(redis, [1, 2], publish=publish)
+    events = _events(frames)
+
+    assert frames[0].startswith("retry:")
+    assert [(payload["job_id"], payload["status"]) for _, payload in events] == [
+        (1, "processing"), (2, "completed"), (1, "completed"),
+    ]
+    assert events[-1][0] == "1:1000-3,2:1000-2"
+    assert hub.subscriber_count == 0
+    assert redis.connections == 1
+
+
+def test_stream_resumes_from_last_event_id_without_duplicates():
+    redis = FakeAsyncRedis()
+    first = _publish(redis, 5, "started")
+    _publish(redis, 5, "processing")
+
+    def publish():
+        _publish(redis, 5, "completed")
+
+    frames, _ = _collect(redis, [5], last_event_id=f"5:{first}", publish=publish)
+
+    assert [payload["status"] for _, payload in _events(frames)] == ["processing", "completed"]
@@ -0,0 +1,130 @@
+"""Tests for the interaction summary rollups: incremental updates and rebuilds under concurrent writes."""
+
+import threading
+import time
+from uuid import uuid4
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from genonaut.api.repositories.interaction_repository import InteractionRepository
+from genonaut.db.schema import ContentItem, User, UserInteraction
+
+
+def _summary_count(engine, content_id):
+    with engine.connect() as conn:
+        return conn.execute(
+            text("SELECT interaction_count FROM content_interaction_summary "
+                 "WHERE content_item_id = :id AND interaction_type = 'view'"),
+            {"id": content_id},
+        ).scalar()
+
+
+def test_reconcile_waits_for_in_flight_deltas_and_counts_them_once(postgres_engine):
+    suffix = uuid4().hex[:8]
+    with Session(postgres_engine) as setup:
+        user = User(username=f"reconcile-{suffix}", email=f"reconcile-{suffix}@example.com")
+        setup.add(user)
+        setup.flush()
+        content = ContentItem(
+            title=f"Reconcile {suffix}", content_type="image", content_data="/images/r.png",
+            prompt="a prompt", creator_id=user.id,
+        )
+        setup.add(content)
+        setup.commit()
+        user_id, content_id = user.id, content.id
+
+    try:
+        with Session(postgres_engine) as session:
+            InteractionRepository(session).record_interaction(user_id, content_id, "view")
+
+        # A writer has inserted an interaction and upserted its delta but not committed yet
+        writer = Session(postgres_engine)
+        interaction = UserInteraction(user_id=user_id, content_item_id=content_id, interaction_type="view")
+        writer.add(interaction)
+        writer.flush()
+        InteractionRepository(writer)._apply_summary_delta(
+            interaction, content_type="image", interaction_count=1, rating_sum=0, rating_count=0,
+            duration_sum=0, duration_count=0, last_interaction_at=interaction.created_at,
+        )
+
+        results = []
+
+        def reconcile():
+            with Session(postgres_engine) as session:
+                results.append(InteractionRepository(session).reconcile_summaries())
+
+        thread = threading.Thread(target=reconcile)
+        thread.start()
+        time.sleep(0.5)
+        assert thread.is_alive()  # Waiting for the writer's summary lock
+
+        writer.commit()
+        writer.close()
+        thread.join(timeout=30)
+        assert results and results[0]["content_summary_rows"] >= 1
+
+        with Session(postgres_engine) as session:
+            InteractionRepository(session).record_interaction(user_id, content_id, "view")
+
+        assert _summary_count(postgres_engine, content_id) == 3
+    finally:
+        with postgres_engine.begin() as conn:
+            conn.execute(text("DELETE FROM user_interactions WHERE user_id = :id"), {"id": user_id})
+            conn.execute(text("DELETE FROM content_interaction_summary WHERE content_item_id = :id"), {"id": content_id})
+            conn.execute(text("DELETE FROM user_interaction_summary WHERE user_id = :id"), {"id": user_id})
+            conn.execute(text("DELETE FROM content_items WHERE id = :id"), {"id": content_id})
+            conn.execute(text("DELETE FROM users WHERE id = :id"), {"id": user_id})
+
+
+def _summary_rows(engine, user_id):
+    with engine.connect() as conn:
+        content_rows = conn.execute(
+            text("SELECT content_item_id, interaction_type, interaction_count, rating_sum, rating_count "
+                 "FROM content_interaction_summary WHERE content_item_id IN "
+                 "(SELECT id FROM content_items WHERE creator_id = :id) AND interaction_count <> 0"),
+            {"id": user_id},
+        ).all()
+        user_rows = conn.execute(
+            text("SELECT interaction_type, interaction_count, rating_sum FROM user_interaction_summary "
+                 "WHERE user_id = :id AND interaction_count <> 0"),
+            {"id": user_id},
+        ).all()
+    return sorted(map(tuple, content_rows)), sorted(map(tuple, user_rows))
+
+
+def test_update_moves_the_interaction_between_summary_rows(postgres_engine):
+    suffix = uuid4().hex[:8]
+    with Session(postgres_engine) as setup:
+        user = User(username=f"rollup-{suffix}", email=f"rollup-{suffix}@example.com")
+        setup.add(user)
+        setup.flush()
+        contents = [
+            ContentItem(
+                title=f"Rollup {suffix} {n}", content_type="image", content_data=f"/images/r{n}.png",
+                prompt="a prompt", creator_id=user.id,
+            )
+            for n in range(2)
+        ]
+        setup.add_all(contents)
+        setup.commit()
+        user_id, first, second = user.id, contents[0].id, contents[1].id
+
+    try:
+        with Session(postgres_engine) as session:
+            repository = InteractionRepository(session)
+            interaction = repository.record_interaction(user_id, first, "view")
+            repository.update(interaction.id, {"interaction_type": "like", "content_item_id": second, "rating": 4})
+
+        assert _summary_rows(postgres_engine, user_id) == (
+            [(second, "like", 1, 4, 1)],
+            [("like", 1, 4)],
+        )
+    finally:
+        with postgres_engine.begin() as conn:
+            conn.execute(text("DELETE FROM user_interactions WHERE user_id = :id"), {"id": user_id})
+            conn.execute(text("DELETE FROM content_interaction_summary WHERE content_item_id IN (:a, :b)"),
+                         {"a": first, "b": second})
+            conn.execute(text("DELETE FROM user_interaction_summary WHERE user_id = :id"), {"id": user_id})
+            conn.execute(text("DELETE FROM content_items WHERE id IN (:a, :b)"), {"a": first, "b": second})
+            conn.execute(text("DELETE FROM users WHERE id = :id"), {"id": user_id})
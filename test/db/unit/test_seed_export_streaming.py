@@ -0,0 +1,81 @@
+"""Tests for the streaming seed exporter against PostgreSQL."""
+
+import csv
+import gzip
+from uuid import uuid4
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from genonaut.db.demo.seed_data_gen import import_seed_to_test
+from genonaut.db.demo.seed_data_gen.export_seed_from_demo import ExportConfig, StreamingExporter
+from genonaut.db.schema import Base, ContentItem, User, UserInteraction
+
+
+def _read(path):
+    with gzip.open(path, "rt", encoding="utf-8", newline="") as handle:
+        return list(csv.DictReader(handle, delimiter="\t"))
+
+
+def test_streaming_export_writes_fk_closed_filtered_subset(postgres_engine, tmp_path):
+    suffix = uuid4().hex[:8]
+    with Session(postgres_engine) as setup:
+        admin, other, viewer = (
+            User(username=f"export-{role}-{suffix}", email=f"export-{role}-{suffix}@example.com")
+            for role in ("admin", "other", "viewer")
+        )
+        setup.add_all([admin, other, viewer])
+        setup.flush()
+        admin_item, other_item = (
+            ContentItem(title=f"Export {user.username}", content_type="image", content_data="/images/e.png",
+                        prompt="a prompt", creator_id=user.id, is_private=False)
+            for user in (admin, other)
+        )
+        setup.add_all([admin_item, other_item])
+        setup.flush()
+        on_admin_item, on_other_item, without_item = (
+            UserInteraction(user_id=viewer.id, content_item_id=content_id, interaction_type="view")
+            for content_id in (admin_item.id, other_item.id, None)
+        )
+        setup.add_all([on_admin_item, on_other_item, without_item])
+        setup.commit()
+        user_ids = [admin.id, other.id, viewer.id]
+        ids = {
+            "admin": str(admin.id), "viewer": str(viewer.id), "admin_item": str(admin_item.id),
+            "on_admin_item": str(on_admin_item.id), "without_item": str(without_item.id),
+        }
+
+    try:
+        # Only the admin's closure is selected; interactions are sampled through the FK filter
+        config = ExportConfig(
+            tmp_path, 0, {"user_interactions": 1000}, True, ids["admin"], compress=True,
+        )
+        written = StreamingExporter(postgres_engine, ["users", "content_items", "user_interactions"], config).run()
+
+        users = _read(tmp_path / "users.tsv.gz")
+        content = _read(tmp_path / "content_items.tsv.gz")
+        interactions = _read(tmp_path / "user_interactions.tsv.gz")
+
+        # Viewer is pulled in as the parent of an interaction on the admin's item
+        assert {row["id"] for row in users} == {ids["admin"], ids["viewer"]}
+        assert [row["id"] for row in content] == [ids["admin_item"]]
+        # The interaction on the other user's (unselected) item fails the filter; a NULL reference passes
+        assert {row["id"] for row in interactions} == {ids["on_admin_item"], ids["without_item"]}
+        assert written == {"users": 2, "content_items": 1, "user_interactions": 2}
+
+        assert content[0]["is_private"] == "false"
+        assert "T" in content[0]["created_at"]
+        assert [row["content_item_id"] for row in interactions if row["id"] == ids["without_item"]] == [""]
+
+        rows = import_seed_to_test.load_rows(
+            import_seed_to_test.table_path(tmp_path, "content_items"), Base.metadata.tables["content_items"]
+        )
+        assert [(row["id"], row["is_private"], row["title"]) for row in rows] == [
+            (int(ids["admin_item"]), False, f"Export export-admin-{suffix}")
+        ]
+    finally:
+        with postgres_engine.begin() as conn:
+            params = {"ids": user_ids}
+            conn.execute(text("DELETE FROM user_interactions WHERE user_id = ANY(:ids)"), params)
+            conn.execute(text("DELETE FROM content_items WHERE creator_id = ANY(:ids)"), params)
+            conn.execute(text("DELETE FROM users WHERE id = ANY(:ids)"), params)
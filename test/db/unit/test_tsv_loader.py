@@ -0,0 +1,125 @@
+"""Tests for the COPY-based TSV seed loader."""
+
+from uuid import uuid4
+
+from sqlalchemy import text
+
+from genonaut.db.utils.tsv_loader import TSVCopyLoader, dependency_levels
+
+
+def test_dependency_levels_load_parents_first_and_group_independent_tables():
+    levels = dependency_levels(["generation_jobs", "bookmarks", "content_items_auto", "content_items", "users"])
+
+    assert levels[0] == ["users"]
+    assert levels[1] == ["content_items", "content_items_auto"]
+    assert set(levels[2]) == {"bookmarks", "generation_jobs"}
+
+
+def test_copy_loader_resolves_usernames_and_skips_unknown_users(postgres_engine, tmp_path):
+    suffix = uuid4().hex[:8]
+    username = f"tsv-loader-{suffix}"
+    user_id = uuid4()
+    (tmp_path / "users.tsv").write_text(
+        "id\tusername\temail\tpreferences\tis_active\n"
+        f"{user_id}\t{username}\t{username}@example.com\t\"{{\"\"theme\"\": \"\"dark\"\"}}\"\tTrue\n",
+        encoding="utf-8",
+    )
+    (tmp_path / "content_items_auto.tsv").write_text(
+        "title\tcontent_type\tcontent_data\tprompt\titem_metadata\tcreator_username\tquality_score\tis_private\n"
+        f"Loaded {suffix}\timage\t/images/a.png\ta prompt\t{{}}\t{username}\t0.5\tfalse\n"
+        f"Orphan {suffix}\timage\t/images/b.png\ta prompt\t{{}}\tmissing-{suffix}\t0.5\tfalse\n",
+        encoding="utf-8",
+    )
+
+    try:
+        results = TSVCopyLoader(postgres_engine, max_workers=2).load_files(
+            [tmp_path / "content_items_auto.tsv", tmp_path / "users.tsv"]
+        )
+
+        assert results["users"].inserted == 1
+        assert results["content_items_auto"].inserted == 1
+        assert results["content_items_auto"].unresolved == [f"missing-{suffix}"]
+        with postgres_engine.connect() as conn:
+            row = conn.execute(
+                text("SELECT creator_id, is_private, source_type FROM content_items_auto WHERE title = :title"),
+                {"title": f"Loaded {suffix}"},
+            ).one()
+            preferences = conn.execute(text("SELECT preferences FROM users WHERE id = :id"), {"id": user_id}).scalar()
+        assert (row.creator_id, row.is_private, row.source_type) == (user_id, False, "auto")
+        assert preferences == {"theme": "dark"}
+    finally:
+        with postgres_engine.begin() as conn:
+            conn.execute(text("DELETE FROM content_items_auto WHERE creator_id = :id"), {"id": user_id})
+            conn.execute(text("DELETE FROM users WHERE id = :id"), {"id": user_id})
+
+
+def test_copy_loader_seeds_core_fixture_files(postgres_engine, tmp_path):
+    suffix = uuid4().hex[:8]
+    username = f"tsv-core-{suffix}"
+    title = f"Core {suffix}"
+    tag = f"tsv-tag-{suffix}"
+    (tmp_path / "users.tsv").write_text(
+        "username\temail\tpreferences\tis_active\n"
+        f"{username}\t{username}@example.com\t{{}}\ttrue\n",
+        encoding="utf-8",
+    )
+    (tmp_path / "content_items.tsv").write_text(
+        "title\tcontent_type\tcontent_data\titem_metadata\tcreator_username\ttags\tquality_score\tis_private\n"
+        f"{title}\timage\t/images/c.png\t{{}}\t{username}\t\"[\"\"{tag}\"\"]\"\t0.5\tfalse\n",
+        encoding="utf-8",
+    )
+    (tmp_path / "user_interactions.tsv").write_text(
+        "user_username\tcontent_title\tinteraction_type\trating\tduration\tinteraction_metadata\n"
+        f"{username}\t{title}\tview\t5\t120\t{{}}\n"
+        f"{username}\tMissing {suffix}\tview\t5\t120\t{{}}\n",
+        encoding="utf-8",
+    )
+    (tmp_path / "generation_jobs.tsv").write_text(
+        "user_username\tjob_type\tprompt\tparameters\tstatus\tresult_content_title\tcontent_id\n"
+        f"{username}\timage\ta prompt\t{{\"\"steps\"\": 20}}\tcompleted\t{title}\t\n"
+        f"{username}\timage\ta prompt\t{{}}\tcompleted\t\t999999999\n",
+        encoding="utf-8",
+    )
+
+    try:
+        results = TSVCopyLoader(postgres_engine).load_files(sorted(tmp_path.glob("*.tsv")))
+
+        assert all(result.error is None for result in results.values())
+        assert results["user_interactions"].unresolved == [f"Missing {suffix}"]
+        assert (results["generation_jobs"].inserted, results["generation_jobs"].skipped) == (1, 1)
+        with postgres_engine.connect() as conn:
+            content = conn.execute(
+                text("SELECT id, prompt FROM content_items WHERE title = :title"), {"title": title}
+            ).one()
+            interaction = conn.execute(
+                text("SELECT i.content_item_id FROM user_interactions i JOIN users u ON u.id = i.user_id "
+                     "WHERE u.username = :username"),
+                {"username": username},
+            ).scalar_one()
+            job = conn.execute(
+                text("SELECT j.content_id, j.params FROM generation_jobs j JOIN users u ON u.id = j.user_id "
+                     "WHERE u.username = :username"),
+                {"username": username},
+            ).one()
+            tagged = conn.execute(
+                text("SELECT t.name FROM content_tags ct JOIN tags t ON t.id = ct.tag_id "
+                     "WHERE ct.content_id = :id AND ct.content_source = 'regular'"),
+                {"id": content.id},
+            ).scalars().all()
+        assert content.prompt == "Seeded content"
+        assert interaction == content.id
+        assert (job.content_id, job.params) == (content.id, {"steps": 20})
+        assert tagged == [tag.replace("_", " ").title()]
+    finally:
+        with postgres_engine.begin() as conn:
+            user_ids = "SELECT id FROM users WHERE username = :username"
+            params = {"username": username}
+            conn.execute(text(f"DELETE FROM generation_jobs WHERE user_id IN ({user_ids})"), params)
+            conn.execute(text(f"DELETE FROM user_interactions WHERE user_id IN ({user_ids})"), params)
+            conn.execute(text("DELETE FROM content_tags WHERE content_id IN "
+                              f"(SELECT id FROM content_items WHERE creator_id IN ({user_ids}))"), params)
+            conn.execute(text(f"DELETE FROM content_items WHERE creator_id IN ({user_ids})"), params)
+            conn.execute(text("DELETE FROM tags WHERE name = :name"), {"name": tag.replace("_", " ").title()})
+            conn.execute(text("DELETE FROM user_interaction_summary WHERE user_id IN "
+                              f"({user_ids})"), params)
+            conn.execute(text("DELETE FROM users WHERE username = :username"), params)
@@ -36,59 +36,31 @@ def db_session(postgres_session):
 
 
 @pytest.fixture
-def mock_comfyui_config(mock_comfyui_url: str, monkeypatch):
+def mock_comfyui_config(mock_comfyui_url: str):
     """Configure settings to use mock ComfyUI server with correct paths."""
-    from genonaut.api.config import get_settings
-
-    settings = get_settings()
-    original_url = settings.comfyui_url
-    original_output_dir = settings.comfyui_output_dir
+    from genonaut.api.config import override_settings
 
     mock_output_dir = str(Path(__file__).parent.parent.parent / "_infra/mock_services/comfyui/output")
 
-    monkeypatch.setattr(settings, 'comfyui_url', mock_comfyui_url)
-    monkeypatch.setattr(settings, 'comfyui_output_dir', mock_output_dir)
-
-    yield {
-        "url": mock_comfyui_url,
-        "output_dir": mock_output_dir
-    }
-
-    # Restore original settings
-    monkeypatch.setattr(settings, 'comfyui_url', original_url)
-    monkeypatch.setattr(settings, 'comfyui_output_dir', original_output_dir)
+    with override_settings(comfyui_url=mock_comfyui_url, comfyui_output_dir=mock_output_dir):
+        yield {
+            "url": mock_comfyui_url,
+            "output_dir": mock_output_dir
+        }
 
 
 @pytest.fixture
-def mock_comfyui_config_dynamic(mock_comfyui_url_dynamic: str, monkeypatch):
+def mock_comfyui_config_dynamic(mock_comfyui_url_dynamic: str):
     """Configure settings to use mock ComfyUI server in dynamic generation mode with correct paths."""
-    from genonaut.api import config as config_module
-    from genonaut.api.config import get_settings
-
-    # Clear settings cache to ensure monkeypatch takes effect
-    config_module._LAST_SETTINGS = None
-
-    settings = get_settings()
-    original_url = settings.comfyui_url
-    original_output_dir = settings.comfyui_output_dir
+    from genonaut.api.config import override_settings
 
     mock_output_dir = str(Path(__file__).parent.parent.parent / "_infra/mock_services/comfyui/output")
 
-    monkeypatch.setattr(settings, 'comfyui_url', mock_comfyui_url_dynamic)
-    monkeypatch.setattr(settings, 'comfyui_output_dir', mock_output_dir)
-
-    # Clear cache again after monkeypatching to force re-read on next get_settings()
-    config_module._LAST_SETTINGS = None
-
-    yield {
-        "url": mock_comfyui_url_dynamic,
-        "output_dir": mock_output_dir
-    }
-
-    # Restore original settings
-    monkeypatch.setattr(settings, 'comfyui_url', original_url)
-    monkeypatch.setattr(settings, 'comfyui_output_dir', original_output_dir)
-    config_module._LAST_SETTINGS = None
+    with override_settings(comfyui_url=mock_comfyui_url_dynamic, comfyui_output_dir=mock_output_dir):
+        yield {
+            "url": mock_comfyui_url_dynamic,
+            "output_dir": mock_output_dir
+        }
 
 
 __all__ = [
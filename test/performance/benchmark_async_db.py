@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Concurrency benchmark for the hot read routes: sync session on the event loop vs async reads.
+
+Runs the API in-process (httpx ``ASGITransport``, one event loop, like one
+uvicorn worker) and fires ``--clients`` concurrent clients at each endpoint,
+``--requests`` requests per client. Modes:
+
+- ``blocking``: the pre-async behaviour, sync session called directly from the
+  ``async def`` route, so each query blocks the event loop
+- ``threadpool``: the sync session from Starlette's threadpool (the fallback
+  when asyncpg is not installed)
+- ``async``: asyncpg session via ``AsyncSession.run_sync`` (needs asyncpg)
+
+Needs a reachable database; pick it with ENV_TARGET as for the API (e.g.
+``local-demo``). Pool size and timeouts come from the usual settings.
+
+Usage:
+    ENV_TARGET=local-demo PYTHONPATH=. python test/performance/benchmark_async_db.py
+    ENV_TARGET=local-demo PYTHONPATH=. python test/performance/benchmark_async_db.py --clients 200 --requests 5 \\
+        --modes blocking async --endpoints "/api/v1/content/unified?page_size=25" /api/v1/tags/hierarchy
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import List
+
+import httpx
+import numpy as np
+from fastapi import Depends
+from sqlalchemy.orm import Session
+from tabulate import tabulate
+
+from genonaut.api.config import override_settings
+from genonaut.api.dependencies import (
+    ReadSession,
+    async_driver_available,
+    get_database_manager,
+    get_database_session,
+    get_read_session,
+)
+from genonaut.api.main import create_app
+
+DEFAULT_ENDPOINTS = [
+    "/api/v1/content/unified?page=1&page_size=25",
+    "/api/v1/tags/hierarchy",
+    "/api/v1/tags/search?q=a&page_size=20",
+]
+
+
+async def blocking_read_session(session: Session = Depends(get_database_session)):
+    """``get_read_session`` replacement that runs service code on the event loop, as before."""
+    reader = ReadSession(session)
+    reader._in_threadpool = False
+    yield reader
+
+
+async def run_clients(app, endpoint: str, clients: int, requests: int) -> List[float]:
+    latencies: List[float] = []
+    errors = 0
+
+    async def client_loop(client: httpx.AsyncClient) -> None:
+        nonlocal errors
+        for _ in range(requests):
+            started = time.perf_counter()
+            response = await client.get(endpoint)
+            latencies.append((time.perf_counter() - started) * 1000)
+            if response.status_code != 200:
+                errors += 1
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark", timeout=None) as client:
+        await client.get(endpoint)  # warm pools and caches
+        await asyncio.gather(*(client_loop(client) for _ in range(clients)))
+    if errors:
+        print(f"  {endpoint}: {errors} non-200 responses")
+    return latencies
+
+
+async def run_mode(mode: str, args) -> List[list]:
+    with override_settings(db_async_reads=(mode == "async")):
+        app = create_app()
+        if mode == "blocking":
+            app.dependency_overrides[get_read_session] = blocking_read_session
+        rows = []
+        try:
+            for endpoint in args.endpoints:
+                started = time.perf_counter()
+                latencies = await run_clients(app, endpoint, args.clients, args.requests)
+                elapsed = time.perf_counter() - started
+                rows.append([
+                    mode,
+                    endpoint,
+                    len(latencies),
+                    f"{statistics.median(latencies):.1f}",
+                    f"{np.percentile(latencies, 95):.1f}",
+                    f"{np.percentile(latencies, 99):.1f}",
+                    f"{len(latencies) / elapsed:.0f}",
+                ])
+        finally:
+            await get_database_manager().dispose_async_engines()
+        return rows
+
+
+async def main_async(args) -> None:
+    rows = []
+    for mode in args.modes:
+        if mode == "async" and not async_driver_available():
+            print("Skipping async mode: asyncpg is not installed")
+            continue
+        rows.extend(await run_mode(mode, args))
+    print(f"\n{args.clients} concurrent clients x {args.requests} requests per endpoint\n")
+    print(tabulate(rows, headers=["Mode", "Endpoint", "Requests", "p50 ms", "p95 ms", "p99 ms", "Req/s"], tablefmt="github"))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=200)
+    parser.add_argument("--requests", type=int, default=5, help="Requests per client per endpoint")
+    parser.add_argument("--modes", nargs="+", choices=["blocking", "threadpool", "async"],
+                        default=["blocking", "threadpool", "async"])
+    parser.add_argument("--endpoints", nargs="+", default=DEFAULT_ENDPOINTS)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Load script for interaction ingestion throughput.
+
+Fires view events at a running API with ``--concurrency`` concurrent clients
+and compares:
+- ``sync``: one ``POST /api/v1/interactions`` per event (validated, inserted and
+  committed inline)
+- ``buffered``: ``POST /api/v1/interactions/events`` with ``--batch`` events per
+  request (appended to the ingest buffer and written in multi-row batches)
+
+For the buffered mode the script also waits for the events to be flushed (via
+the user's interaction summary) and reports end-to-end throughput.
+
+Usage:
+    PYTHONPATH=. python test/performance/benchmark_interaction_ingest.py \\
+        --user-id <uuid> --content-ids 1-5000 --events 20000
+    PYTHONPATH=. python test/performance/benchmark_interaction_ingest.py \\
+        --user-id <uuid> --content-ids 1-5000 --modes buffered --batch 200 --concurrency 32
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from typing import List, Tuple
+
+import httpx
+from tabulate import tabulate
+
+
+def parse_range(value: str) -> Tuple[int, int]:
+    start, _, end = value.partition("-")
+    return int(start), int(end or start)
+
+
+async def _total_interactions(client: httpx.AsyncClient, user_id: str) -> int:
+    response = await client.get(f"/api/v1/interactions/analytics/user-behavior/{user_id}")
+    response.raise_for_status()
+    return response.json()["total_interactions"]
+
+
+async def run_mode(args, mode: str) -> List:
+    low, high = args.content_ids
+    rng = random.Random(args.seed)
+    payloads = []
+    for start in range(0, args.events, args.batch if mode == "buffered" else 1):
+        count = min(args.batch if mode == "buffered" else 1, args.events - start)
+        events = [
+            {
+                "user_id": args.user_id,
+                "content_item_id": rng.randint(low, high),
+                "interaction_type": "view",
+                "duration": rng.randint(1, 60),
+            }
+            for _ in range(count)
+        ]
+        payloads.append(events)
+
+    queue: asyncio.Queue = asyncio.Queue()
+    for payload in payloads:
+        queue.put_nowait(payload)
+
+    latencies: List[float] = []
+    errors = 0
+    accepted = 0
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=30.0, limits=limits) as client:
+        before = await _total_interactions(client, args.user_id)
+
+        async def worker():
+            nonlocal errors, accepted
+            while not queue.empty():
+                events = queue.get_nowait()
+                tick = time.perf_counter()
+                try:
+                    if mode == "buffered":
+                        response = await client.post("/api/v1/interactions/events", json={"events": events})
+                        response.raise_for_status()
+                        accepted += response.json()["accepted"]
+                    else:
+                        response = await client.post("/api/v1/interactions/", json=events[0])
+                        response.raise_for_status()
+                        accepted += 1
+                except httpx.HTTPError:
+                    errors += 1
+                latencies.append((time.perf_counter() - tick) * 1000)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+        submitted = time.perf_counter() - started
+
+        # Wait for buffered events to reach the database (or the timeout)
+        stored = await _total_interactions(client, args.user_id) - before
+        while mode == "buffered" and stored < accepted and time.perf_counter() - started < submitted + args.flush_timeout:
+            await asyncio.sleep(0.5)
+            stored = await _total_interactions(client, args.user_id) - before
+        end_to_end = time.perf_counter() - started
+
+    latencies.sort()
+    return [
+        mode,
+        args.events,
+        accepted,
+        stored,
+        errors,
+        f"{args.events / submitted:.0f}",
+        f"{stored / end_to_end:.0f}",
+        f"{statistics.median(latencies):.1f}",
+        f"{latencies[max(0, int(len(latencies) * 0.99) - 1)]:.1f}",
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://localhost:8001")
+    parser.add_argument("--user-id", required=True, help="Existing active user to attribute events to")
+    parser.add_argument("--content-ids", type=parse_range, default=(1, 1000), help="Content id range, e.g. 1-5000")
+    parser.add_argument("--events", type=int, default=10000)
+    parser.add_argument("--batch", type=int, default=100, help="Events per request in buffered mode")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--modes", nargs="+", choices=["sync", "buffered"], default=["sync", "buffered"])
+    parser.add_argument("--flush-timeout", type=float, default=60.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rows = [asyncio.run(run_mode(args, mode)) for mode in args.modes]
+    print(tabulate(
+        rows,
+        headers=["Mode", "Sent", "Accepted", "Stored", "Errors", "Submit ev/s", "End-to-end ev/s", "p50 ms", "p99 ms"],
+        tablefmt="github",
+    ))
+    print("\nAccepted < Sent in buffered mode means repeat views were collapsed within the dedupe window.")
+
+
+if __name__ == "__main__":
+    main()
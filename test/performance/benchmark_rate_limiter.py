@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Benchmark rate limiter overhead per request.
+
+Measures the cost of a single rate limit check for:
+- the in-process limiter (ring counters, bounded LRU of identifiers)
+- the Redis GCRA limiter (one EVALSHA round trip), if Redis is reachable
+- a full request through RateLimitMiddleware vs. the same app without it
+
+Usage:
+    PYTHONPATH=. python test/performance/benchmark_rate_limiter.py --iterations 20000 --identifiers 5000
+    PYTHONPATH=. python test/performance/benchmark_rate_limiter.py --redis-url redis://localhost:6379/15
+"""
+
+import argparse
+import os
+import statistics
+import time
+from typing import Callable, Dict, List
+
+from tabulate import tabulate
+
+
+def _time_calls(func: Callable[[int], None], iterations: int) -> Dict[str, float]:
+    """Call ``func(i)`` for each iteration and summarize per-call latency in microseconds."""
+    samples: List[float] = []
+    for index in range(iterations):
+        start = time.perf_counter()
+        func(index)
+        samples.append((time.perf_counter() - start) * 1_000_000)
+
+    samples.sort()
+    return {
+        "mean_us": statistics.fmean(samples),
+        "p50_us": samples[len(samples) // 2],
+        "p99_us": samples[int(len(samples) * 0.99) - 1],
+    }
+
+
+def benchmark_in_process(iterations: int, identifiers: int) -> Dict[str, float]:
+    from genonaut.api.services.security_service import RateLimiter
+
+    limiter = RateLimiter(max_identifiers=identifiers)
+    return _time_calls(lambda i: limiter.check(f"ip:{i % identifiers}", 1000, 60), iterations)
+
+
+def benchmark_redis(iterations: int, identifiers: int, redis_url: str) -> Dict[str, float]:
+    import redis
+
+    from genonaut.api.services.security_service import RedisRateLimiter
+
+    client = redis.Redis.from_url(redis_url, decode_responses=True)
+    client.ping()
+    limiter = RedisRateLimiter(client, key_prefix="benchmark:ratelimit", retry_interval_seconds=3600)
+    try:
+        return _time_calls(lambda i: limiter.check(f"ip:{i % identifiers}", 1000, 60), iterations)
+    finally:
+        keys = list(client.scan_iter("benchmark:ratelimit:*", count=1000))
+        if keys:
+            client.delete(*keys)
+
+
+def benchmark_middleware(iterations: int, identifiers: int) -> Dict[str, Dict[str, float]]:
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from genonaut.api.middleware.security_middleware import RateLimitMiddleware
+    from genonaut.api.services.security_service import RateLimiter, get_security_service
+
+    # Keep every request under the limit so both apps do the same work
+    get_security_service().rate_limiter = RateLimiter(max_identifiers=identifiers)
+    get_security_service().rate_limits["api_requests_per_minute"] = iterations * 10
+
+    def build_app(with_limiter: bool) -> TestClient:
+        app = FastAPI()
+
+        @app.get("/api/v1/ping")
+        async def ping():
+            return {"ok": True}
+
+        if with_limiter:
+            app.add_middleware(RateLimitMiddleware)
+        return TestClient(app)
+
+    results = {}
+    for label, with_limiter in (("without middleware", False), ("with RateLimitMiddleware", True)):
+        client = build_app(with_limiter)
+        results[label] = _time_calls(
+            lambda i: client.get("/api/v1/ping", headers={"X-Forwarded-For": f"10.0.{i % identifiers // 256}.{i % 256}"}),
+            iterations,
+        )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark rate limiter overhead per request")
+    parser.add_argument("--iterations", type=int, default=20000)
+    parser.add_argument("--identifiers", type=int, default=5000, help="Distinct client identifiers to rotate through")
+    parser.add_argument("--redis-url", default=os.getenv("REDIS_URL"), help="Redis URL for the shared limiter")
+    parser.add_argument("--skip-middleware", action="store_true")
+    args = parser.parse_args()
+
+    rows = [["in-process check", *benchmark_in_process(args.iterations, args.identifiers).values()]]
+
+    if args.redis_url:
+        try:
+            rows.append(["redis GCRA check", *benchmark_redis(args.iterations, args.identifiers, args.redis_url).values()])
+        except Exception as exc:  # pragma: no cover - depends on local Redis
+            print(f"Skipping Redis benchmark: {exc}")
+
+    if not args.skip_middleware:
+        middleware_iterations = min(args.iterations, 2000)
+        for label, stats in benchmark_middleware(middleware_iterations, args.identifiers).items():
+            rows.append([f"request {label}", *stats.values()])
+
+    print(tabulate(rows, headers=["case", "mean (us)", "p50 (us)", "p99 (us)"], floatfmt=".1f"))
+
+
+if __name__ == "__main__":
+    main()
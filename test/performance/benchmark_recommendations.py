@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Benchmark for batch recommendation generation.
+
+Compares the vectorized recommender against a per-user, per-item Python
+scoring loop (the shape of the previous implementation) on synthetic data
+sized like the demo database, and reports fit time, scoring throughput and
+peak resident memory. The Python loop is timed on a sample of users and
+extrapolated.
+
+Pass ``--db`` to instead run the full ``generate_batch_recommendations`` pipeline
+(load, fit, score, bulk insert) against the configured database.
+
+Usage:
+    PYTHONPATH=. python test/performance/benchmark_recommendations.py --users 500 --items 20000
+    PYTHONPATH=. python test/performance/benchmark_recommendations.py --db --top-k 20
+"""
+
+import argparse
+import math
+import os
+import time
+from collections import defaultdict
+
+import numpy as np
+import psutil
+from tabulate import tabulate
+
+from genonaut.api.services.recommendation_engine import INTERACTION_WEIGHTS, fit_model
+
+
+def synthetic_dataset(users: int, items: int, interactions: int, tags: int, seed: int):
+    rng = np.random.default_rng(seed)
+    # Zipf-like item popularity so a few items dominate, as in real usage
+    popularity = 1.0 / np.arange(1, items + 1) ** 0.8
+    popularity /= popularity.sum()
+    inter_users = rng.integers(0, users, interactions)
+    inter_items = rng.choice(items, interactions, p=popularity) + 1
+    types = rng.choice(list(INTERACTION_WEIGHTS), interactions)
+    weights = np.array([INTERACTION_WEIGHTS[t] for t in types], dtype=np.float32)
+
+    tags_per_item = rng.integers(1, 6, items)
+    tag_items = np.repeat(np.arange(1, items + 1), tags_per_item)
+    tag_ids = rng.integers(0, tags, tag_items.size).astype(str)
+    favorites = {user: list(rng.integers(0, tags, 3).astype(str)) for user in range(0, users, 2)}
+    return (inter_users, inter_items, weights), (tag_items, tag_ids), favorites
+
+
+def python_loop_seconds_per_user(user_items, item_tags, user_tags, items: int, top_k: int, sample_users) -> float:
+    """Score every item for each sampled user with plain Python loops."""
+    started = time.perf_counter()
+    for user in sample_users:
+        seen = user_items.get(user, set())
+        profile = user_tags.get(user, {})
+        norm = math.sqrt(sum(v * v for v in profile.values())) or 1.0
+        scores = []
+        for item in range(1, items + 1):
+            if item in seen:
+                continue
+            tags = item_tags.get(item, ())
+            overlap = sum(profile.get(tag, 0.0) for tag in tags)
+            scores.append((overlap / (norm * math.sqrt(len(tags) or 1)), item))
+        scores.sort(reverse=True)
+        scores[:top_k]
+    return (time.perf_counter() - started) / max(len(sample_users), 1)
+
+
+def run_synthetic(args) -> None:
+    process = psutil.Process(os.getpid())
+    interactions, item_tags, favorites = synthetic_dataset(
+        args.users, args.items, args.interactions, args.tags, args.seed
+    )
+    rss_before = process.memory_info().rss
+
+    started = time.perf_counter()
+    model = fit_model(range(args.users), np.arange(1, args.items + 1), interactions, item_tags, favorites, rank=args.rank)
+    fitted = time.perf_counter()
+    recommended = sum(len(items) for _, items, _ in model.recommend(args.top_k, batch_size=args.batch_size))
+    scored = time.perf_counter()
+    rss_after = process.memory_info().rss
+
+    user_items = defaultdict(set)
+    for user, item in zip(interactions[0], interactions[1]):
+        user_items[int(user)].add(int(item))
+    tags_by_item = defaultdict(list)
+    for item, tag in zip(*item_tags):
+        tags_by_item[int(item)].append(tag)
+    user_tags = defaultdict(lambda: defaultdict(float))
+    for user, items in user_items.items():
+        for item in items:
+            for tag in tags_by_item[item]:
+                user_tags[user][tag] += 1.0
+    sample = list(range(min(args.loop_sample, args.users)))
+    loop_per_user = python_loop_seconds_per_user(user_items, tags_by_item, user_tags, args.items, args.top_k, sample)
+
+    vectorized_per_user = (scored - fitted) / args.users
+    rows = [
+        ["Users x items", f"{args.users} x {args.items}"],
+        ["Interactions", args.interactions],
+        ["Fit (SVD + tag profiles)", f"{fitted - started:.3f}s"],
+        ["Score + top-K (all users)", f"{scored - fitted:.3f}s"],
+        ["Recommendations", recommended],
+        ["Vectorized per user", f"{vectorized_per_user * 1000:.2f}ms"],
+        [f"Python loop per user (n={len(sample)})", f"{loop_per_user * 1000:.2f}ms"],
+        ["Python loop, extrapolated", f"{loop_per_user * args.users:.1f}s"],
+        ["Speedup (scoring)", f"{loop_per_user / vectorized_per_user:.0f}x" if vectorized_per_user else "n/a"],
+        ["RSS growth", f"{(rss_after - rss_before) / 1024 / 1024:.1f} MiB"],
+    ]
+    print(tabulate(rows, headers=["Metric", "Value"], tablefmt="github"))
+
+
+def run_database(args) -> None:
+    from genonaut.api.dependencies import get_database_session
+    from genonaut.api.services.recommendation_service import RecommendationService
+
+    db = next(get_database_session())
+    try:
+        result = RecommendationService(db).generate_batch_recommendations(
+            top_k=args.top_k, batch_size=args.batch_size, rank=args.rank
+        )
+    finally:
+        db.close()
+
+    rows = [[key, value] for key, value in result.items() if key != "timings"]
+    rows += [[key, f"{value}s"] for key, value in result["timings"].items()]
+    print(tabulate(rows, headers=["Metric", "Value"], tablefmt="github"))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=500)
+    parser.add_argument("--items", type=int, default=20000)
+    parser.add_argument("--interactions", type=int, default=50000)
+    parser.add_argument("--tags", type=int, default=100)
+    parser.add_argument("--top-k", type=int, default=20)
+    parser.add_argument("--batch-size", type=int, default=256)
+    parser.add_argument("--rank", type=int, default=32)
+    parser.add_argument("--loop-sample", type=int, default=20, help="Users timed with the Python loop")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--db", action="store_true", help="Run the full pipeline against the configured database")
+    args = parser.parse_args()
+
+    if args.db:
+        run_database(args)
+    else:
+        run_synthetic(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Benchmark for serializing a page of unified content items.
+
+Compares the time per page of:
+- ``before``: dict per row with ``isoformat()``/``str()``, FastAPI's
+  ``jsonable_encoder`` and stdlib JSON (``JSONResponse``), as the unified
+  endpoint did before it returned ``FastJSONResponse``
+- ``orjson``: ``serialize_content_row`` + ``FastJSONResponse`` (no encoder pass)
+- ``db_json``: the items array pre-built by PostgreSQL (``content-json-in-db``);
+  only splicing it into the response body happens in Python, so the number
+  excludes the extra work PostgreSQL does
+
+Rows are synthetic, with metadata shaped like generated images.
+
+Usage:
+    PYTHONPATH=. python test/performance/benchmark_response_serialization.py
+    PYTHONPATH=. python test/performance/benchmark_response_serialization.py --page-size 1000 --iterations 50
+"""
+
+import argparse
+import random
+import time
+import uuid
+from collections import namedtuple
+from datetime import datetime, timedelta
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from tabulate import tabulate
+
+from genonaut.api.utils.json_response import (
+    CONTENT_ROW_FIELDS,
+    FastJSONResponse,
+    PreSerializedJSON,
+    dumps,
+    serialize_content_row,
+)
+
+ContentRow = namedtuple("ContentRow", CONTENT_ROW_FIELDS)
+
+
+def make_rows(count, rng):
+    started = datetime(2025, 1, 1)
+    rows = []
+    for index in range(count):
+        metadata = {
+            "model": f"sdxl-{rng.randint(1, 9)}",
+            "sampler": "euler_a",
+            "steps": rng.randint(20, 60),
+            "cfg_scale": round(rng.uniform(4, 12), 2),
+            "seed": rng.randint(0, 2**32),
+            "width": 832,
+            "height": 1216,
+            "loras": [{"name": f"lora-{i}", "strength": round(rng.random(), 2)} for i in range(3)],
+            "tags": [f"tag-{rng.randint(1, 500)}" for _ in range(12)],
+            "negative_prompt": "blurry, low quality, " * 4,
+        }
+        rows.append(ContentRow(
+            3000000 + index,
+            f"Generated image {index}",
+            "image",
+            f"/io/storage/images/{uuid.UUID(int=rng.getrandbits(128))}.png",
+            f"/io/storage/thumbs/{index}.png",
+            {f"{w}x{w * 3 // 2}": f"/io/storage/thumbs/{index}_{w}.png" for w in (128, 256, 384, 512, 768)},
+            "a detailed prompt describing a scene " * 6,
+            uuid.UUID(int=rng.getrandbits(128)),
+            metadata,
+            False,
+            round(rng.random(), 4),
+            started + timedelta(seconds=index, microseconds=rng.randint(0, 999999)),
+            started + timedelta(seconds=index + 5),
+            "auto",
+            f"user{rng.randint(1, 1000)}",
+        ))
+    return rows
+
+
+def pagination(page_size):
+    return {"page": 1, "page_size": page_size, "total_count": 1000000, "total_pages": 10000,
+            "has_next": True, "has_previous": False, "next_cursor": "abc", "prev_cursor": None}
+
+
+def render_before(rows, page_size):
+    items = []
+    for row in rows:
+        items.append({
+            "id": row.id,
+            "title": row.title,
+            "content_type": row.content_type,
+            "content_data": row.content_data,
+            "path_thumb": row.path_thumb,
+            "path_thumbs_alt_res": row.path_thumbs_alt_res,
+            "prompt": row.prompt,
+            "creator_id": str(row.creator_id),
+            "creator_username": row.creator_username,
+            "item_metadata": row.item_metadata,
+            "is_private": row.is_private,
+            "quality_score": row.quality_score,
+            "created_at": row.created_at.isoformat() if row.created_at else None,
+            "updated_at": row.updated_at.isoformat() if row.updated_at else None,
+            "source_type": row.source_type,
+        })
+    return JSONResponse(jsonable_encoder({"items": items, "pagination": pagination(page_size)})).body
+
+
+def render_orjson(rows, page_size):
+    items = [serialize_content_row(row) for row in rows]
+    return FastJSONResponse({"items": items, "pagination": pagination(page_size)}).body
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    rows = make_rows(args.page_size, random.Random(7))
+    # What PostgreSQL would hand back for the page in content-json-in-db mode
+    items_json = dumps([serialize_content_row(row) for row in rows])
+
+    def render_db_json(rows, page_size):
+        items = PreSerializedJSON(items_json, len(rows))
+        return FastJSONResponse({"items": items, "pagination": pagination(page_size)}).body
+
+    results = []
+    baseline = None
+    for name, render in [("before", render_before), ("orjson", render_orjson), ("db_json", render_db_json)]:
+        body = render(rows, args.page_size)
+        started = time.perf_counter()
+        for _ in range(args.iterations):
+            render(rows, args.page_size)
+        per_page = (time.perf_counter() - started) / args.iterations * 1000
+        baseline = baseline or per_page
+        results.append([name, f"{per_page:.3f}", f"{baseline / per_page:.1f}x", f"{len(body) / 1024:.0f}"])
+
+    print(f"{args.page_size} items per page, {args.iterations} iterations\n")
+    print(tabulate(results, headers=["Mode", "ms/page", "Speedup", "Body KiB"], tablefmt="github"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Benchmark for synthetic seed generation: dict/ORM path vs streaming COPY mode.
+
+Each mode runs in a fresh process so peak RSS is measured independently:
+- ``dict``: ``ContentGenerator`` batches kept in memory (as ``generator.py``
+  does to build jobs), then completed jobs built from them
+- ``streaming``: ``StreamingSeeder`` with ``--workers`` worker processes and
+  only the compact (creator, created_at) arrays kept
+
+Without ``--database-url`` rows are generated and serialized but the COPY
+stream is drained into a null sink, so the numbers are generator-bound. With a
+``--database-url`` (must end in _demo or _test) the streaming mode writes to
+the database for real; users must already exist there.
+
+Usage:
+    PYTHONPATH=. python test/performance/benchmark_seed_streaming.py --rows 100000
+    PYTHONPATH=. python test/performance/benchmark_seed_streaming.py --rows 1000000 --modes streaming --workers 8
+    PYTHONPATH=. python test/performance/benchmark_seed_streaming.py --rows 10000000 --modes streaming \\
+        --workers 8 --database-url postgresql://localhost/genonaut_demo
+"""
+
+import argparse
+import multiprocessing
+import os
+import time
+import uuid
+
+from tabulate import tabulate
+
+from genonaut.db.demo.seed_data_gen.config import SeedDataConfig
+from genonaut.db.demo.seed_data_gen.generators import ContentGenerator, GenerationJobGenerator
+from genonaut.db.demo.seed_data_gen.streaming import StreamingSeeder, peak_rss_mb
+
+
+class NullSinkSeeder(StreamingSeeder):
+    """Streaming seeder that drains the COPY stream instead of sending it to PostgreSQL."""
+
+    next_id = 3000000
+
+    def _reserve_ids(self, count):
+        first_id, NullSinkSeeder.next_id = NullSinkSeeder.next_id, NullSinkSeeder.next_id + count
+        return first_id
+
+    def _copy(self, table_name, columns, chunks):
+        for _ in chunks:
+            pass
+
+
+def run_dict(args, user_ids, admin_uuid):
+    config = SeedDataConfig(batch_size=args.chunk_size).model_dump()
+    generator = ContentGenerator(config, user_ids, admin_uuid, "content_items")
+    started = time.perf_counter()
+    content = []
+    for start in range(0, args.rows, args.chunk_size):
+        content.extend(generator.generate_batch(min(args.chunk_size, args.rows - start)))
+    jobs = GenerationJobGenerator(config, content).generate_completed_jobs_batch(len(content))
+    return time.perf_counter() - started, len(content) + len(jobs)
+
+
+def run_streaming(args, user_ids, admin_uuid):
+    config = SeedDataConfig(batch_size=args.chunk_size, max_workers=args.workers).model_dump()
+    if args.database_url:
+        from sqlalchemy import create_engine, text
+        from sqlalchemy.orm import sessionmaker
+
+        session = sessionmaker(bind=create_engine(args.database_url))()
+        user_ids = [str(row[0]) for row in session.execute(text("SELECT id FROM users"))]
+        admin_uuid = user_ids[0]
+        seeder = StreamingSeeder(session, config, user_ids, admin_uuid)
+    else:
+        seeder = NullSinkSeeder(None, config, user_ids, admin_uuid)
+    started = time.perf_counter()
+    with seeder._executor() as executor:
+        block = seeder.stream_content(executor, "content_items", args.rows)
+        completed, additional = seeder.stream_jobs(executor, [block])
+    return time.perf_counter() - started, args.rows + completed + additional
+
+
+def _child(mode, args, queue):
+    user_ids = [str(uuid.uuid4()) for _ in range(args.users)]
+    runner = run_dict if mode == "dict" else run_streaming
+    elapsed, rows = runner(args, user_ids, user_ids[0])
+    queue.put((elapsed, rows, peak_rss_mb()))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100000, help="Content rows to generate")
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--chunk-size", type=int, default=2000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--modes", nargs="+", choices=["dict", "streaming"], default=["dict", "streaming"])
+    parser.add_argument("--database-url", default=None)
+    args = parser.parse_args()
+    if args.database_url and not args.database_url.rstrip("/").endswith(("_demo", "_test")):
+        parser.error("--database-url must point to a database ending in _demo or _test")
+
+    context = multiprocessing.get_context("spawn")
+    rows = []
+    for mode in args.modes:
+        queue = context.Queue()
+        process = context.Process(target=_child, args=(mode, args, queue))
+        process.start()
+        elapsed, total_rows, rss = queue.get()
+        process.join()
+        rows.append([
+            mode, f"{args.rows:,}", f"{total_rows:,}", f"{elapsed:.1f}s",
+            f"{total_rows / elapsed:,.0f}", f"{rss:.0f}" if rss is not None else "n/a",
+        ])
+
+    sink = "PostgreSQL" if args.database_url else "null sink"
+    print(f"{args.rows:,} content rows + jobs, {args.workers} workers, {os.cpu_count()} CPUs, {sink}\n")
+    print(tabulate(rows, headers=["Mode", "Content", "Total rows", "Time", "Rows/s", "Peak RSS MiB"], tablefmt="github"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for ``get_settings()``.
+
+Compares the memoized snapshot (what every caller gets now) with a full load
+from config files, ``.env`` files and the environment (what every call used to
+cost, and what ``reload_settings()`` still costs), with and without the mtime
+watch enabled.
+
+Usage:
+    PYTHONPATH=. python test/performance/benchmark_settings.py
+    PYTHONPATH=. python test/performance/benchmark_settings.py --iterations 100000
+"""
+
+import argparse
+import time
+
+from tabulate import tabulate
+
+from genonaut.api import config
+
+
+def measure(fn, iterations):
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - started) / iterations * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=20000, help="get_settings() calls per memoized case")
+    parser.add_argument("--reloads", type=int, default=200, help="Full loads to time")
+    args = parser.parse_args()
+
+    config.reload_settings()
+    loads_before = config.config_load_count()
+    memoized = measure(config.get_settings, args.iterations)
+    memoized_loads = config.config_load_count() - loads_before
+
+    with config.override_settings(config_watch_interval_seconds=1e-9):
+        config._SNAPSHOT.next_check = 0
+        watched = measure(config.get_settings, args.iterations)
+
+    reload = measure(config.reload_settings, args.reloads)
+
+    rows = [
+        ["get_settings() memoized", f"{memoized:.2f}", memoized_loads],
+        ["get_settings() + mtime check every call", f"{watched:.2f}", "-"],
+        ["full load (reload_settings / old get_settings)", f"{reload:.1f}", args.reloads],
+    ]
+    print(tabulate(rows, headers=["Case", "µs/call", "Config loads"], tablefmt="github"))
+    print(f"\nSpeedup of memoized get_settings() over a full load: {reload / memoized:,.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the content similarity ("more like this") index.
+
+Builds an index of ``--items`` synthetic, clustered vectors in a temporary
+directory, then reports:
+- build and IVF training time, and index size on disk
+- ``similar()`` latency percentiles for random items (target: p99 < 10ms at 1M)
+- recall@k against exact brute-force search
+- featurization throughput (TF-IDF + tags -> vectors) on synthetic prompts
+
+Usage:
+    PYTHONPATH=. python test/performance/benchmark_similarity_index.py --items 1000000
+    PYTHONPATH=. python test/performance/benchmark_similarity_index.py --items 200000 --n-probe 16
+"""
+
+import argparse
+import os
+import shutil
+import statistics
+import tempfile
+import time
+
+import numpy as np
+from tabulate import tabulate
+
+from genonaut.api.services.content_similarity_index import DEFAULT_DIM, ContentSimilarityIndex
+
+WORDS = (
+    "sunset ocean city neon forest portrait cat dog castle dragon robot galaxy river mountain "
+    "winter desert flower garden street rain night studio cinematic watercolor oil sketch"
+).split()
+
+
+def clustered_vectors(rng, count: int, dim: int, clusters: int, centers: np.ndarray) -> np.ndarray:
+    labels = rng.integers(0, clusters, count)
+    vectors = centers[labels] + 0.6 * rng.standard_normal((count, dim), dtype=np.float32) / np.sqrt(dim)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors.astype(np.float32)
+
+
+def synthetic_documents(rng, count: int):
+    for content_id in range(count):
+        words = rng.choice(WORDS, 12)
+        yield (content_id, "auto", " ".join(words[:3]), " ".join(words), [f"tag-{rng.integers(0, 50)}"])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=1_000_000)
+    parser.add_argument("--dim", type=int, default=DEFAULT_DIM)
+    parser.add_argument("--n-probe", type=int, default=8)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--queries", type=int, default=1000)
+    parser.add_argument("--recall-queries", type=int, default=100)
+    parser.add_argument("--featurize-docs", type=int, default=20000)
+    parser.add_argument("--chunk", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    directory = tempfile.mkdtemp(prefix="similarity_index_")
+    try:
+        index = ContentSimilarityIndex(directory, dim=args.dim, n_probe=args.n_probe, writable=True)
+        clusters = max(1, args.items // 500)
+        centers = rng.standard_normal((clusters, args.dim)).astype(np.float32)
+        centers /= np.linalg.norm(centers, axis=1, keepdims=True)
+
+        started = time.perf_counter()
+        for start in range(0, args.items, args.chunk):
+            count = min(args.chunk, args.items - start)
+            ids = np.arange(start, start + count) + 1
+            index.append_vectors(ids, ["auto"] * count, clustered_vectors(rng, count, args.dim, clusters, centers))
+        appended = time.perf_counter()
+        index.train()
+        index.save()
+        trained = time.perf_counter()
+
+        # Reopen read-only, as the API does
+        index = ContentSimilarityIndex.load(directory, n_probe=args.n_probe)
+        query_ids = rng.integers(1, args.items + 1, args.queries)
+        index.similar(int(query_ids[0]), k=args.k)  # Warm up
+        latencies = []
+        for content_id in query_ids:
+            tick = time.perf_counter()
+            index.similar(int(content_id), k=args.k)
+            latencies.append((time.perf_counter() - tick) * 1000)
+        latencies.sort()
+
+        vectors = np.asarray(index.vectors[: index.count])
+        hits = 0
+        for content_id in query_ids[: args.recall_queries]:
+            row = int(content_id) - 1
+            exact_scores = vectors @ vectors[row]
+            exact_scores[row] = -np.inf
+            exact = set(np.argpartition(-exact_scores, args.k)[: args.k] + 1)
+            hits += len(exact & {item_id for item_id, _, _ in index.similar(int(content_id), k=args.k)})
+        recall = hits / (args.k * min(args.recall_queries, args.queries))
+
+        documents = list(synthetic_documents(rng, args.featurize_docs))
+        featurizer = ContentSimilarityIndex(os.path.join(directory, "featurize"), dim=args.dim, writable=True)
+        tick = time.perf_counter()
+        featurizer.build(lambda: [documents])
+        featurize_seconds = time.perf_counter() - tick
+
+        size_mb = sum(
+            os.path.getsize(os.path.join(directory, name))
+            for name in os.listdir(directory)
+            if os.path.isfile(os.path.join(directory, name))
+        ) / 1024 / 1024
+
+        rows = [
+            ["Items x dim", f"{args.items} x {args.dim}"],
+            ["IVF lists / n_probe", f"{len(index.centroids)} / {args.n_probe}"],
+            ["Append vectors", f"{appended - started:.2f}s"],
+            ["Train + assign", f"{trained - appended:.2f}s"],
+            ["Index size on disk", f"{size_mb:.0f} MiB"],
+            ["similar() p50", f"{statistics.median(latencies):.2f}ms"],
+            ["similar() p95", f"{latencies[int(len(latencies) * 0.95) - 1]:.2f}ms"],
+            ["similar() p99", f"{latencies[int(len(latencies) * 0.99) - 1]:.2f}ms"],
+            [f"Recall@{args.k}", f"{recall:.3f}"],
+            ["Featurize + build (docs/s)", f"{args.featurize_docs / featurize_seconds:.0f}"],
+        ]
+        print(tabulate(rows, headers=["Metric", "Value"], tablefmt="github"))
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Load test for the job status WebSocket fan-out.
+
+Opens thousands of simulated WebSocket connections through the real
+``/ws/jobs`` handler code, all sharing the process-wide job status hub, then
+publishes job updates and reports:
+- Redis connections used (the hub should hold exactly one)
+- time to connect all sockets and resident memory per socket
+- publish -> socket delivery latency
+- updates dropped for deliberately slow consumers
+
+By default an in-memory Redis stand-in is used; pass ``--redis-url`` to run
+against a real Redis server instead.
+
+Usage:
+    PYTHONPATH=. python test/performance/benchmark_websocket_fanout.py --sockets 5000 --jobs 500
+    PYTHONPATH=. python test/performance/benchmark_websocket_fanout.py --redis-url redis://localhost:6379/15
+"""
+
+import argparse
+import asyncio
+import fnmatch
+import json
+import os
+import statistics
+import time
+from typing import List, Optional
+
+import psutil
+from fastapi import WebSocketDisconnect
+from tabulate import tabulate
+
+from genonaut.api.routes import websocket as websocket_routes
+from genonaut.api.services import job_status_hub
+
+
+class LocalPubSub:
+    def __init__(self, server: "LocalRedis"):
+        self.server = server
+        self.patterns: List[str] = []
+        self.messages: asyncio.Queue = asyncio.Queue()
+
+    async def psubscribe(self, *patterns: str) -> None:
+        self.patterns.extend(patterns)
+        self.server.pubsubs.append(self)
+
+    async def listen(self):
+        while True:
+            yield await self.messages.get()
+
+    async def aclose(self) -> None:
+        self.server.pubsubs.remove(self)
+
+
+class LocalRedis:
+    """In-memory Redis stand-in supporting pattern subscriptions."""
+
+    def __init__(self):
+        self.pubsubs: List[LocalPubSub] = []
+        self.connections = 0
+
+    def pubsub(self, ignore_subscribe_messages: bool = False) -> LocalPubSub:
+        self.connections += 1
+        return LocalPubSub(self)
+
+    async def publish(self, channel: str, data: str) -> int:
+        receivers = 0
+        for pubsub in self.pubsubs:
+            for pattern in pubsub.patterns:
+                if fnmatch.fnmatchcase(channel, pattern):
+                    pubsub.messages.put_nowait({"type": "pmessage", "channel": channel, "data": data})
+                    receivers += 1
+        return receivers
+
+
+class SimulatedWebSocket:
+    """Accepts everything the handler sends and records delivery latency."""
+
+    def __init__(self, latencies: List[float], send_delay: float = 0.0):
+        self.latencies = latencies
+        self.send_delay = send_delay
+        self.received = 0
+        self._closed = asyncio.Event()
+
+    async def send_json(self, payload) -> None:
+        pass
+
+    async def send_text(self, data: str) -> None:
+        if self.send_delay:
+            await asyncio.sleep(self.send_delay)
+        self.latencies.append(time.perf_counter() - json.loads(data)["sent_at"])
+        self.received += 1
+
+    async def receive_text(self) -> str:
+        await self._closed.wait()
+        raise WebSocketDisconnect(code=1000)
+
+    def disconnect(self) -> None:
+        self._closed.set()
+
+
+async def run(args: argparse.Namespace) -> None:
+    namespace = "benchmark_fanout"
+    if args.redis_url:
+        import redis.asyncio as aioredis
+
+        publisher = aioredis.from_url(args.redis_url, decode_responses=True)
+        redis_factory = lambda: aioredis.from_url(args.redis_url, decode_responses=True)
+        connection_count = None
+    else:
+        local = LocalRedis()
+        publisher = local
+        redis_factory = lambda: local
+        connection_count = lambda: local.connections
+
+    hub = job_status_hub.JobStatusHub(redis_factory=redis_factory, namespace=namespace, queue_size=args.queue_size)
+    job_status_hub._HUB = hub
+
+    process = psutil.Process(os.getpid())
+    rss_before = process.memory_info().rss
+    latencies: List[float] = []
+    sockets: List[SimulatedWebSocket] = []
+    handlers = []
+
+    start = time.perf_counter()
+    for index in range(args.sockets):
+        slow = index < args.sockets * args.slow_fraction
+        ws = SimulatedWebSocket(latencies, send_delay=args.slow_delay if slow else 0.0)
+        job_ids = [index % args.jobs, (index * 7 + 1) % args.jobs][: args.jobs_per_socket]
+        sockets.append(ws)
+        handlers.append(asyncio.create_task(
+            websocket_routes._serve_subscription(ws, job_ids, {"type": "connection"}, f"socket {index}")
+        ))
+    while hub.subscriber_count < args.sockets:
+        await asyncio.sleep(0.01)
+    connect_seconds = time.perf_counter() - start
+    rss_after = process.memory_info().rss
+
+    publish_start = time.perf_counter()
+    for round_index in range(args.rounds):
+        for job_id in range(args.jobs):
+            payload = json.dumps({
+                "job_id": job_id,
+                "status": "processing",
+                "progress": round_index,
+                "sent_at": time.perf_counter(),
+            })
+            await publisher.publish(f"{namespace}:job:{job_id}", payload)
+        await asyncio.sleep(0)
+
+    expected_fast = sum(
+        1 for index in range(args.sockets) if index >= args.sockets * args.slow_fraction
+    )
+    deadline = time.perf_counter() + args.timeout
+    while time.perf_counter() < deadline:
+        fast_done = sum(
+            1 for index, ws in enumerate(sockets)
+            if index >= args.sockets * args.slow_fraction and ws.received >= args.rounds * args.jobs_per_socket
+        )
+        if fast_done >= expected_fast:
+            break
+        await asyncio.sleep(0.01)
+    deliver_seconds = time.perf_counter() - publish_start
+
+    dropped = sum(sub.dropped for sub in {sub for subs in hub.subscribers.values() for sub in subs})
+    for ws in sockets:
+        ws.disconnect()
+    await asyncio.gather(*handlers)
+    await hub.stop()
+    if args.redis_url:
+        await publisher.aclose()
+
+    latencies.sort()
+    rows = [
+        ["simulated sockets", args.sockets],
+        ["jobs", args.jobs],
+        ["redis pubsub connections", connection_count() if connection_count else "1 (hub)"],
+        ["connect all (s)", f"{connect_seconds:.2f}"],
+        ["RSS per socket (KiB)", f"{(rss_after - rss_before) / args.sockets / 1024:.1f}"],
+        ["updates published", args.rounds * args.jobs],
+        ["updates delivered", len(latencies)],
+        ["delivery wall time (s)", f"{deliver_seconds:.2f}"],
+        ["latency p50 (ms)", _percentile(latencies, 0.50)],
+        ["latency p99 (ms)", _percentile(latencies, 0.99)],
+        ["latency mean (ms)", f"{statistics.fmean(latencies) * 1000:.2f}" if latencies else "-"],
+        ["slow sockets", int(args.sockets * args.slow_fraction)],
+        ["updates dropped", dropped],
+        ["subscribers after disconnect", hub.subscriber_count],
+    ]
+    print(tabulate(rows, headers=["metric", "value"]))
+
+
+def _percentile(samples: List[float], fraction: float) -> Optional[str]:
+    if not samples:
+        return "-"
+    return f"{samples[min(len(samples) - 1, int(len(samples) * fraction))] * 1000:.2f}"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load test the job status WebSocket fan-out")
+    parser.add_argument("--sockets", type=int, default=5000)
+    parser.add_argument("--jobs", type=int, default=500)
+    parser.add_argument("--jobs-per-socket", type=int, default=1, choices=[1, 2])
+    parser.add_argument("--rounds", type=int, default=5, help="Updates published per job")
+    parser.add_argument("--queue-size", type=int, default=100)
+    parser.add_argument("--slow-fraction", type=float, default=0.05, help="Fraction of sockets with slow sends")
+    parser.add_argument("--slow-delay", type=float, default=0.5, help="Seconds each slow socket takes per send")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--redis-url", default=None, help="Use a real Redis server instead of the in-memory stand-in")
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
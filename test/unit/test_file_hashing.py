@@ -0,0 +1,48 @@
+"""Unit tests for parallel, cached file hashing."""
+
+import hashlib
+import os
+
+import pytest
+
+from genonaut.utils.file_hashing import FileHashCache, FileHasher, hash_file
+
+
+def test_hash_file_matches_hashlib_in_one_pass(tmp_path):
+    data = os.urandom(3 * 1024 * 1024 + 17)
+    path = tmp_path / "model.safetensors"
+    path.write_bytes(data)
+    (tmp_path / "empty.pt").write_bytes(b"")
+
+    digests = hash_file(path, ("md5", "blake2b", "sha256"), chunk_size=1024 * 1024)
+
+    assert digests["md5"] == hashlib.md5(data).hexdigest()
+    assert digests["sha256"] == hashlib.sha256(data).hexdigest()
+    assert digests["blake2b"] == hashlib.blake2b(data, digest_size=32).hexdigest()
+    assert hash_file(tmp_path / "empty.pt")["md5"] == hashlib.md5(b"").hexdigest()
+
+
+def test_unchanged_files_are_served_from_persistent_cache(tmp_path):
+    paths = []
+    for index in range(4):
+        path = tmp_path / f"lora_{index}.safetensors"
+        path.write_bytes(os.urandom(4096))
+        paths.append(path)
+    cache_path = tmp_path / "cache" / "hashes.sqlite3"
+
+    first = FileHasher(cache=FileHashCache(cache_path), max_workers=2)
+    digests = first.hash_files(paths, ("md5",))
+    assert first.stats["hashed"] == 4
+
+    paths[0].write_bytes(os.urandom(8192))  # Size and mtime change
+    second = FileHasher(cache=FileHashCache(cache_path), max_workers=2)
+    again = second.hash_files(paths + [tmp_path / "missing.ckpt"], ("md5",))
+
+    assert second.stats == {"cache_hits": 3, "hashed": 1, "bytes_hashed": 8192, "errors": 1}
+    assert again[paths[1]] == digests[paths[1]]
+    assert again[paths[0]]["md5"] == hashlib.md5(paths[0].read_bytes()).hexdigest()
+
+
+def test_unsupported_algorithm_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        FileHasher().hash_files([tmp_path], ("crc32",))
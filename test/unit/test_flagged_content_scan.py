@@ -0,0 +1,167 @@
+"""Unit tests for the streaming content scan in FlaggedContentService."""
+
+import multiprocessing
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from genonaut.api.exceptions import ValidationError
+from genonaut.api.services.flagged_content_service import FlaggedContentService
+
+
+CREATOR_ID = uuid4()
+
+
+def _row(item_id, prompt):
+    return SimpleNamespace(id=item_id, title=f"title {item_id}", item_metadata={"prompt": prompt}, creator_id=CREATOR_ID)
+
+
+class FakeFlaggedContentRepository:
+    """In-memory stand-in for the scan-related repository methods."""
+
+    def __init__(self, rows_by_source, existing_flags=None):
+        self.rows_by_source = rows_by_source
+        self.existing_flags = existing_flags or {}
+        self.created = []
+        self.refreshed = []
+        self.stream_calls = []
+
+    def stream_scan_candidates(self, content_source, after_id=0, include_flagged=False, batch_size=1000):
+        self.stream_calls.append((content_source, after_id, include_flagged))
+        rows = [
+            row for row in self.rows_by_source.get(content_source, [])
+            if row.id > after_id and (include_flagged or row.id not in self.existing_flags)
+        ]
+        for start in range(0, len(rows), batch_size):
+            yield rows[start:start + batch_size]
+
+    def get_flag_ids_for_items(self, content_source, item_ids):
+        return {item_id: self.existing_flags[item_id] for item_id in item_ids if item_id in self.existing_flags}
+
+    def bulk_create(self, records):
+        self.created.extend(records)
+        return len(records)
+
+    def bulk_refresh(self, records):
+        self.refreshed.extend(records)
+        return len(records)
+
+
+@pytest.fixture
+def flag_words_file(tmp_path):
+    path = tmp_path / "flag-words.txt"
+    path.write_text("violence\nhatred\n")
+    return str(path)
+
+
+def _service(flag_words_file, repository):
+    service = FlaggedContentService(MagicMock(), flag_words_path=flag_words_file)
+    service.repository = repository
+    return service
+
+
+def test_scan_streams_all_batches_and_bulk_creates_flags(flag_words_file):
+    rows = [_row(i, "violence everywhere" if i % 2 else "a calm lake") for i in range(1, 8)]
+    repository = FakeFlaggedContentRepository({"regular": rows})
+    service = _service(flag_words_file, repository)
+
+    result = service.scan_content_items(content_types=["regular"], batch_size=3)
+
+    assert result["items_scanned"] == 7
+    assert result["items_flagged"] == 4
+    assert result["last_scanned_ids"] == {"regular": 7}
+    assert [record["content_item_id"] for record in repository.created] == [1, 3, 5, 7]
+    assert all(record["content_item_auto_id"] is None for record in repository.created)
+    assert repository.created[0]["flagged_words"] == ["violence"]
+
+
+def test_scan_resumes_after_last_scanned_id(flag_words_file):
+    rows = [_row(i, "hatred") for i in range(1, 6)]
+    repository = FakeFlaggedContentRepository({"auto": rows})
+    service = _service(flag_words_file, repository)
+
+    result = service.scan_content_items(content_types=["auto"], resume_from={"auto": 3})
+
+    assert repository.stream_calls == [("auto", 3, False)]
+    assert result["items_scanned"] == 2
+    assert [record["content_item_auto_id"] for record in repository.created] == [4, 5]
+
+
+def test_scan_reports_progress_per_batch(flag_words_file):
+    rows = [_row(i, "violence") for i in range(1, 6)]
+    repository = FakeFlaggedContentRepository({"regular": rows})
+    service = _service(flag_words_file, repository)
+    updates = []
+
+    service.scan_content_items(content_types=["regular"], batch_size=2, progress_callback=updates.append)
+
+    assert [update["items_scanned"] for update in updates] == [2, 4, 5]
+    assert [update["last_scanned_ids"]["regular"] for update in updates] == [2, 4, 5]
+
+
+def test_force_rescan_refreshes_existing_flags(flag_words_file):
+    rows = [_row(1, "violence hatred"), _row(2, "violence")]
+    repository = FakeFlaggedContentRepository({"regular": rows}, existing_flags={1: 99})
+    service = _service(flag_words_file, repository)
+
+    result = service.scan_content_items(content_types=["regular"], force_rescan=True)
+
+    assert result["items_flagged"] == 2
+    assert [record["id"] for record in repository.refreshed] == [99]
+    assert [record["content_item_id"] for record in repository.created] == [2]
+
+
+def test_scan_skips_already_flagged_without_force(flag_words_file):
+    rows = [_row(1, "violence"), _row(2, "violence")]
+    repository = FakeFlaggedContentRepository({"regular": rows}, existing_flags={1: 99})
+    service = _service(flag_words_file, repository)
+
+    result = service.scan_content_items(content_types=["regular"])
+
+    assert result["items_scanned"] == 1
+    assert repository.refreshed == []
+
+
+def test_parallel_analysis_matches_inline(flag_words_file):
+    rows = [_row(i, "violence hatred calm" if i % 3 else "calm") for i in range(1, 30)]
+    inline_repo = FakeFlaggedContentRepository({"regular": rows})
+    parallel_repo = FakeFlaggedContentRepository({"regular": rows})
+
+    _service(flag_words_file, inline_repo).scan_content_items(content_types=["regular"], batch_size=10)
+    _service(flag_words_file, parallel_repo).scan_content_items(
+        content_types=["regular"], batch_size=10, max_workers=2
+    )
+
+    assert parallel_repo.created == inline_repo.created
+
+
+def _scan_in_daemon(flag_words_file, results):
+    rows = [_row(i, "violence" if i % 2 else "calm") for i in range(1, 12)]
+    repository = FakeFlaggedContentRepository({"regular": rows})
+    try:
+        result = _service(flag_words_file, repository).scan_content_items(
+            content_types=["regular"], batch_size=4, max_workers=4
+        )
+        results.put(("ok", result["items_flagged"], multiprocessing.current_process().daemon))
+    except Exception as exc:  # Reported back to the test process
+        results.put(("error", repr(exc), None))
+
+
+def test_parallel_scan_falls_back_inline_in_daemonic_process(flag_words_file):
+    context = multiprocessing.get_context("fork")
+    results = context.Queue()
+    process = context.Process(target=_scan_in_daemon, args=(flag_words_file, results), daemon=True)
+    process.start()
+    outcome = results.get(timeout=30)
+    process.join(timeout=30)
+
+    assert outcome == ("ok", 6, True)
+
+
+def test_scan_rejects_unknown_content_type(flag_words_file):
+    service = _service(flag_words_file, FakeFlaggedContentRepository({}))
+
+    with pytest.raises(ValidationError):
+        service.scan_content_items(content_types=["bogus"])
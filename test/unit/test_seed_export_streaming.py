@@ -0,0 +1,58 @@
+"""Unit tests for the streaming seed exporter and compressed fixture import."""
+
+import gzip
+
+from genonaut.db.demo.seed_data_gen import import_seed_to_test
+from genonaut.db.demo.seed_data_gen.export_seed_from_demo import ExportConfig, StreamingExporter, write_tsv
+from genonaut.db.schema import Base
+
+
+def _exporter(tables, tmp_path):
+    config = ExportConfig(tmp_path, 100, {}, True, None, compress=True)
+    return StreamingExporter(None, tables, config)
+
+
+def test_partition_parent_selection_unions_exported_partitions(tmp_path):
+    exporter = _exporter(["users", "content_items", "content_items_auto", "bookmarks"], tmp_path)
+
+    selected = exporter._selected("content_items_all")
+
+    assert "SELECT id FROM export_keys_content_items UNION ALL SELECT id FROM export_keys_content_items_auto" in selected
+    assert _exporter(["users"], tmp_path)._selected("content_items_all").endswith("WHERE false")
+    bookmark_edges = [(parent, parent_cols) for child, parent, _, parent_cols in exporter.edges if child == "bookmarks"]
+    assert ("content_items_all", ["id", "source_type"]) in bookmark_edges
+
+
+def test_column_sql_matches_python_serializer_formats(tmp_path):
+    exporter = _exporter(["users"], tmp_path)
+    users = Base.metadata.tables["users"]
+
+    assert exporter._column_sql(users.c.is_active).startswith("CASE WHEN is_active THEN 'true'")
+    assert exporter._column_sql(users.c.created_at) == "to_json(created_at) #>> '{}' AS created_at"
+    assert exporter._column_sql(users.c.preferences) == "to_json(preferences)::text AS preferences"
+    assert exporter._column_sql(users.c.username) == "username"
+
+
+def test_import_reads_compressed_fixtures(tmp_path):
+    with gzip.open(tmp_path / "tags.tsv.gz", "wt", encoding="utf-8") as handle:
+        handle.write('id\tname\ttag_metadata\n5a1c2f0e-4d0b-4e55-9d8e-0c7f9b9a6a11\tsky\t"{""a"": 1}"\n')
+    table = Base.metadata.tables["tags"]
+
+    path = import_seed_to_test.table_path(tmp_path, "tags")
+    rows = import_seed_to_test.load_rows(path, table)
+
+    assert import_seed_to_test.available_tables(tmp_path) == ["tags"]
+    assert import_seed_to_test.file_row_count(path) == 1
+    assert rows[0]["name"] == "sky" and rows[0]["tag_metadata"] == {"a": 1}
+
+
+def test_row_by_row_export_honours_compress(tmp_path):
+    table = Base.metadata.tables["tags"]
+    rows = [{"id": "5a1c2f0e-4d0b-4e55-9d8e-0c7f9b9a6a11", "name": "sky", "tag_metadata": {"a": 1}}]
+
+    write_tsv(table, rows, ExportConfig(tmp_path, 100, {}, True, None, compress=True))
+
+    assert not (tmp_path / "tags.tsv").exists()
+    with gzip.open(tmp_path / "tags.tsv.gz", "rt", encoding="utf-8") as handle:
+        assert handle.readline().rstrip("\n").split("\t") == [column.name for column in table.columns]
+        assert "sky" in handle.readline()
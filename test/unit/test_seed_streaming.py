@@ -0,0 +1,54 @@
+"""Unit tests for streaming (COPY-based) synthetic seed generation."""
+
+import csv
+import io
+import json
+import uuid
+
+from genonaut.db.demo.seed_data_gen import streaming
+from genonaut.db.demo.seed_data_gen.config import SeedDataConfig
+
+
+def _rows(payload):
+    return list(csv.reader(io.StringIO(payload.decode("utf-8"))))
+
+
+def test_jobs_derived_from_compact_arrays_match_streamed_content():
+    user_ids = [str(uuid.uuid4()) for _ in range(20)]
+    streaming._init_worker(SeedDataConfig().model_dump(), user_ids, 1234)
+
+    payload, creators, offsets = streaming.generate_content_chunk("content_items", 3000000, 0, 60, admin_index=3)
+    again, _, _ = streaming.generate_content_chunk("content_items", 3000000, 0, 60, admin_index=3)
+    jobs = _rows(streaming.generate_completed_jobs_chunk("content_items", 3000000, creators, offsets))
+    auto_jobs = _rows(streaming.generate_completed_jobs_chunk("content_items_auto", 3000000, creators, offsets))
+    content = _rows(payload)
+
+    assert payload == again
+    assert [row[0] for row in content] == [str(3000000 + i) for i in range(60)]
+    assert all(row[6] == user_ids[3] for row in content[:streaming.ADMIN_ITEMS_PER_TABLE])
+    assert all(json.loads(row[5])["prompt"] == row[4] and row[1] == row[4][:30] for row in content)
+    for item, job in zip(content, jobs):
+        assert job[:3] == [item[6], "image", item[4]]
+        assert job[5] == item[0] and job[8] == item[7]
+    assert all(job[5] == "" for job in auto_jobs)
+
+
+def test_copy_stream_and_bounded_map_preserve_order():
+    executor = streaming._InlineExecutor(streaming._init_worker, ({}, ["u"], 0))
+    chunks = streaming.bounded_map(executor, lambda value: value.encode() * 3, [("a",), ("b",), ("c",)], window=2)
+    stream = streaming.CopyStream(chunks)
+
+    assert stream.read(4) == b"aaab"
+    assert stream.read() == b"bbccc"
+    assert stream.read(10) == b""
+
+
+def test_copy_stream_reads_across_chunk_boundaries():
+    stream = streaming.CopyStream(iter([b"ab", b"", b"cdef", b"g"]))
+    buffer = bytearray(3)
+
+    assert stream.readinto(buffer) == 3 and bytes(buffer) == b"abc"
+    assert stream.read(2) == b"de"
+    assert stream.read(1) == b"f"
+    assert stream.read() == b"g"
+    assert stream.readinto(buffer) == 0
@@ -5,7 +5,7 @@ from unittest.mock import MagicMock
 
 import pytest
 
-from genonaut.worker.comfyui_client import ComfyUIWorkerClient
+from genonaut.worker.comfyui_client import ComfyUIWorkerClient, get_worker_client
 
 
 def test_worker_client_method_delegation():
@@ -45,3 +45,14 @@ def test_worker_client_download_image_reads_bytes(tmp_path):
 
     with pytest.raises(FileNotFoundError):
         client.download_image("missing.png")
+
+
+def test_get_worker_client_reuses_client_per_backend():
+    first = get_worker_client(backend_url="http://localhost:8189", output_dir="/tmp/a")
+    second = get_worker_client(backend_url="http://localhost:8189", output_dir="/tmp/a")
+    other = get_worker_client(backend_url="http://localhost:8000", output_dir="/tmp/b")
+
+    assert first is second
+    assert first.session is second.session
+    assert other is not first
+    assert other.base_url == "http://localhost:8000"
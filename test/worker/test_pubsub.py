@@ -62,6 +62,24 @@ class TestPubSubFunctions:
         # Verify publish was attempted
         mock_client.publish.assert_called_once()
 
+    @patch('genonaut.worker.pubsub.get_redis_client')
+    def test_publish_job_update_records_history(self, mock_get_client):
+        """Test that updates are appended to the job's history stream and carry its ID."""
+        mock_client = MagicMock()
+        mock_client.pipeline.return_value.execute.return_value = ["1700000000000-0", True]
+        mock_get_client.return_value = mock_client
+
+        publish_job_update(123, "processing", {"progress": 10})
+
+        pipe = mock_client.pipeline.return_value
+        key = pipe.xadd.call_args[0][0]
+        assert key.endswith("job:123:history")
+        assert json.loads(pipe.xadd.call_args[0][1]["data"])["progress"] == 10
+        pipe.expire.assert_called_once()
+
+        message = json.loads(mock_client.publish.call_args[0][1])
+        assert message["event_id"] == "1700000000000-0"
+
     @patch('genonaut.worker.pubsub.publish_job_update')
     def test_publish_job_started(self, mock_publish):
         """Test publishing 'started' status."""
@@ -57,6 +57,9 @@ class DummyFileStorageService:
     def organize_generation_files(self, generation_id, user_id, file_paths):
         return [f"/organized/{generation_id}/{idx}.png" for idx, _ in enumerate(file_paths, start=1)]
 
+    def record_thumbnails(self, thumbnail_results, user_id, generation_id):
+        pass
+
 
 class DummyThumbnailService:
     """Stub thumbnail generation service."""